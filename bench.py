@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+오프라인 파이프라인 벤치마크 (카세트 녹화/재생, utils/cassette.py)
+
+process_keyword 1회의 모든 HTTP/LLM 교환을 카세트로 녹화한 뒤
+네트워크 없이 재생하며 단계(스팬)별 wall / CPU 시간과 최대 메모리를 측정
+→ 네트워크·API 편차 없이 CPU 측 최적화 전후를 비교
+
+사용법:
+  python3 bench.py record "연말정산"                      # data/cassettes/연말정산.json 녹화 (dry-run)
+  python3 bench.py replay "연말정산"                      # 재생 + 단계별 리포트
+  python3 bench.py replay "연말정산" --repeat 3           # 3회 반복 (단계별 중앙값)
+  python3 bench.py replay "연말정산" --latency recorded   # 녹화 당시 응답 시간만큼 지연 주입
+  python3 bench.py replay "연말정산" --latency 0.05       # 교환마다 고정 지연 (초)
+  python3 bench.py replay "연말정산" --no-memory          # tracemalloc 없이 CPU 시간만 (오버헤드 없음)
+  python3 bench.py html                                   # 본문 후처리: 정규식 체인 vs 1회 순회 파이프라인
+  python3 bench.py html --corpus posts/ --repeat 20       # 카세트 본문 + 디렉터리의 *.html
+  python3 bench.py humanize --chars 10000                 # 인간화: 규칙별 순차 치환 vs 컴파일된 1회 순회
+
+- 실제 DB / 캐시 / 트레이스 / LLM 사용량·예산 기록은 건드리지 않음
+  (임시 디렉터리 사용, HTTP·LLM 캐시와 리서치 메모 SQLite 비활성화)
+- --publish: 발행 단계까지 포함 (draft로 실제 발행 — 녹화 시에만 의미 있음)
+- html: 카세트에 녹화된 본문 응답(<h2 포함, 1500자 이상)을 코퍼스로 후처리 단계별 시간 / 결과 일치 비교
+- humanize: 같은 코퍼스를 --chars 길이로 맞춰 인간화 규칙 적용 횟수(문서 순회 수) / 시간 비교
+"""
+import os
+import sys
+import json
+import time
+import logging
+import random
+import io
+import argparse
+import contextlib
+import resource
+import statistics
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+CASSETTE_DIR = ROOT / "data" / "cassettes"
+
+# 재생 시 녹화 당시 설정되어 있던 키는 더미 값으로 채움 (키 유무에 따라 호출 경로가 달라짐)
+KEY_ENV_VARS = [
+    "CLAUDE_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY", "PEXELS_API_KEY",
+    "GOOGLE_SEARCH_API_KEY", "GOOGLE_SEARCH_ENGINE_ID", "UNSPLASH_ACCESS_KEY",
+    "PIXABAY_API_KEY", "GOOGLE_SHEETS_SPREADSHEET_ID",
+    "WP_USER", "WP_APP_PASSWORD", "COUPANG_PARTNER_ID",
+]
+# 호출 경로/URL에 영향을 주는 일반 설정 (값 그대로 보관)
+PLAIN_ENV_VARS = ["WP_URL", "AI_PROVIDER", "GEMINI_MODEL", "CLAUDE_MODEL"]
+
+
+def cassette_path(keyword: str, path: str = None) -> Path:
+    if path:
+        return Path(path)
+    safe = "".join(ch if ch.isalnum() else "_" for ch in keyword)
+    return CASSETTE_DIR / f"{safe}.json"
+
+
+def isolate_state(workdir: Path):
+    """settings import 전에 상태 경로(SQLite 전부)를 임시 디렉터리로 돌림"""
+    os.environ["DATABASE_PATH"] = str(workdir / "blog_publisher.db")
+    os.environ["TRACE_PATH"] = str(workdir / "traces.db")
+    os.environ["TRACE_ENABLED"] = "true"
+    os.environ["TOPIC_SIGNAL_CACHE_PATH"] = str(workdir / "topic_signals.db")
+    os.environ["RESEARCH_MEMO_PATH"] = str(workdir / "research_memo.db")
+    os.environ["RESEARCH_MEMO_TTL_HOURS"] = "0"
+    os.environ["HTTP_CACHE_PATH"] = str(workdir / "http_cache.db")
+    os.environ["LLM_CACHE_PATH"] = str(workdir / "llm_cache.db")
+    os.environ["LLM_GOVERNOR_PATH"] = str(workdir / "llm_governor.db")
+    os.environ["LLM_USAGE_PATH"] = str(workdir / "llm_usage.db")
+    # 녹화는 실제 응답을, 재생은 카세트만 사용 (캐시 적중 여부로 결과가 달라지지 않도록)
+    os.environ["HTTP_CACHE_ENABLED"] = "false"
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    # max_tokens는 카세트 키의 일부 → 기록 학습 없이 고정값 (녹화 / 재생에서 같은 요청이 되도록)
+    os.environ["OUTPUT_BUDGET_ENABLED"] = "false"
+
+
+def collect_env_meta() -> dict:
+    from config.settings import settings
+    return {
+        "keys": [name for name in KEY_ENV_VARS if os.getenv(name)],
+        "plain": {name: os.getenv(name) or getattr(settings, name.lower(), "") for name in PLAIN_ENV_VARS},
+    }
+
+
+def apply_env_meta(meta: dict):
+    """녹화 당시 설정 재현 (.env 값이 있으면 그대로 사용)"""
+    from dotenv import load_dotenv
+    load_dotenv(ROOT / ".env")
+    env = meta.get("env", {})
+    for name, value in env.get("plain", {}).items():
+        if value:
+            os.environ[name] = value
+    for name in env.get("keys", []):
+        os.environ.setdefault(name, "cassette-replay")
+    for name in ("WP_URL", "WP_USER", "WP_APP_PASSWORD", "CLAUDE_API_KEY", "COUPANG_PARTNER_ID"):
+        os.environ.setdefault(name, "cassette-replay")
+
+
+def run_once(keyword: str, publish: bool, seed: int) -> dict:
+    """process_keyword 1회 실행 → 스팬 목록과 전체 측정값"""
+    from main import process_keyword
+    from crawlers import NaverNewsCrawler
+    from crawlers.research_memo import research_memo
+    from generators import ContentGenerator
+    from publishers import WordPressPublisher
+    from utils.tracing import tracer
+    import tracemalloc
+
+    research_memo.clear()
+    random.seed(seed)
+
+    news_crawler = NaverNewsCrawler()
+    content_generator = ContentGenerator()
+    wp_publisher = WordPressPublisher()
+
+    run_id = tracer.start_run("bench")
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    try:
+        with tracer.span("process_keyword", keyword=keyword):
+            success = process_keyword(
+                keyword, news_crawler, content_generator, wp_publisher,
+                dry_run=not publish, status="draft"
+            )
+    finally:
+        wall = time.perf_counter() - wall_started
+        cpu = time.process_time() - cpu_started
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        tracer.end_run()
+
+    return {
+        "success": success,
+        "wall": wall,
+        "cpu": cpu,
+        "mem_peak_kb": peak // 1024,
+        "spans": tracer.run_spans(run_id),
+    }
+
+
+def summarize(results: list) -> list:
+    """반복 실행의 단계별 중앙값 (같은 실행 안의 동일 이름 스팬은 합산, 메모리는 최대)"""
+    per_stage = {}
+    for result in results:
+        totals = {}
+        for span in result["spans"]:
+            row = totals.setdefault(span["name"], {"count": 0, "wall": 0.0, "cpu": 0.0, "mem": 0})
+            row["count"] += 1
+            row["wall"] += span["duration"]
+            row["cpu"] += span["attrs"].get("cpu", 0.0)
+            row["mem"] = max(row["mem"], span["attrs"].get("mem_peak_kb", 0))
+        for name, row in totals.items():
+            per_stage.setdefault(name, []).append(row)
+
+    rows = []
+    for name, samples in per_stage.items():
+        rows.append((
+            name,
+            samples[0]["count"],
+            statistics.median(s["wall"] for s in samples),
+            statistics.median(s["cpu"] for s in samples),
+            max(s["mem"] for s in samples),
+        ))
+    rows.sort(key=lambda r: r[2], reverse=True)
+    return rows
+
+
+def print_report(results: list, cassette_stats: dict):
+    rows = summarize(results)
+    width = max([len(r[0]) for r in rows] + [5])
+    print(f"\n{'stage':<{width}}  {'count':>5}  {'wall':>8}  {'cpu':>8}  {'mem peak':>10}")
+    print("-" * (width + 41))
+    for name, count, wall, cpu, mem in rows:
+        mem_text = f"{mem / 1024:>8.1f}MB" if mem else f"{'-':>10}"
+        print(f"{name:<{width}}  {count:>5}  {wall:>7.3f}s  {cpu:>7.3f}s  {mem_text}")
+
+    walls = [r["wall"] for r in results]
+    cpus = [r["cpu"] for r in results]
+    print(f"\n실행 {len(results)}회 (중앙값): wall {statistics.median(walls):.3f}s, "
+          f"process CPU {statistics.median(cpus):.3f}s, "
+          f"peak traced {max(r['mem_peak_kb'] for r in results) / 1024:.1f}MB, "
+          f"maxrss {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MB")
+    print(f"성공: {sum(1 for r in results if r['success'])}/{len(results)}, "
+          f"카세트 교환 {cassette_stats['exchanges']}, 사용 {cassette_stats['used']}, 누락 {cassette_stats['misses']}")
+    if cassette_stats["misses"]:
+        print("⚠️ 녹화되지 않은 요청이 있습니다 (해당 단계는 실패 경로로 측정됨) — 다시 녹화하세요.")
+
+
+def cmd_record(args, workdir: Path):
+    path = cassette_path(args.keyword, args.cassette)
+    isolate_state(workdir)
+
+    from utils.cassette import cassette
+    from utils.tracing import tracer
+
+    tracer.enable_profiling(memory=False)  # 녹화는 네트워크가 지배적이라 CPU만
+    cassette.record(str(path), keyword=args.keyword, publish=args.publish, seed=args.seed,
+                    env=collect_env_meta())
+    try:
+        result = run_once(args.keyword, args.publish, args.seed)
+    finally:
+        stats = cassette.get_stats()
+        cassette.stop()
+
+    print(f"\n녹화 완료: {path} ({stats['exchanges']})")
+    print_report([result], stats)
+
+
+def cmd_replay(args, workdir: Path):
+    path = cassette_path(args.keyword, args.cassette)
+    if not path.exists():
+        print(f"카세트가 없습니다: {path} (먼저 record 실행)")
+        sys.exit(1)
+    with open(path, encoding="utf-8") as f:
+        meta = json.load(f).get("meta", {})
+
+    isolate_state(workdir)
+    apply_env_meta(meta)
+
+    from utils.cassette import cassette
+    from utils.tracing import tracer
+
+    latency = args.latency
+    if latency not in (None, "recorded"):
+        latency = float(latency)
+
+    tracer.enable_profiling(memory=not args.no_memory)
+    cassette.replay(str(path), latency=latency, latency_scale=args.latency_scale)
+
+    results = []
+    for i in range(args.repeat):
+        cassette.rewind()
+        results.append(run_once(args.keyword, meta.get("publish", False), meta.get("seed", args.seed)))
+        print(f"  run {i + 1}/{args.repeat}: {results[-1]['wall']:.3f}s")
+    stats = cassette.get_stats()
+    cassette.stop()
+
+    print(f"\n재생: {path} (녹화 {meta.get('recorded_at', '?')})")
+    print_report(results, stats)
+
+
+def load_html_corpus(corpus_dir: str = None) -> list:
+    """카세트의 본문 응답 + 디렉터리의 *.html → [(이름, HTML)]"""
+    docs = []
+    for path in sorted(CASSETTE_DIR.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            exchanges = json.load(f).get("exchanges", [])
+        for i, exchange in enumerate(exchanges):
+            value = exchange.get("value")
+            if exchange.get("kind") == "llm" and isinstance(value, str) and "<h2" in value and len(value) > 1500:
+                docs.append((f"{path.stem}#{i}", value))
+    if corpus_dir:
+        for path in sorted(Path(corpus_dir).glob("*.html")):
+            docs.append((path.name, path.read_text(encoding="utf-8")))
+    return docs
+
+
+def first_diff(a: str, b: str) -> str:
+    """두 결과의 첫 차이 위치와 앞뒤 문맥"""
+    index = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+    start = max(0, index - 30)
+    return f"@{index}: 체인 {a[start:index + 50]!r}\n{' ' * (len(str(index)) + 3)}1회 {b[start:index + 50]!r}"
+
+
+def cmd_html(args, workdir: Path):
+    isolate_state(workdir)
+    from generators.content_generator import (
+        ContentGenerator, POSTPROCESS_PIPELINE, FINALIZE_PIPELINE, PUBLISH_PIPELINE,
+        clean_html_styles, fix_html_tag_balance,
+    )
+
+    docs = load_html_corpus(args.corpus)
+    if not docs:
+        print(f"코퍼스가 없습니다: {CASSETTE_DIR} 에 카세트를 녹화하거나 --corpus로 *.html 디렉터리 지정")
+        sys.exit(1)
+
+    generator = ContentGenerator.__new__(ContentGenerator)  # API 클라이언트 없이 후처리 메서드만 사용
+
+    def finalize_regex(html):
+        html = generator.clean_meta_tags(html)
+        return html, [s.html for s in generator.parse_content_to_sections(html)]
+
+    def finalize_pipeline(html):
+        result = FINALIZE_PIPELINE.run(html)
+        return result.html, result.sections if result.section_matches else ([result.html] if result.html else [])
+
+    # (단계, 정규식 체인, 파이프라인) — 단계 입력은 앞 단계의 체인 결과
+    stages = [
+        ("postprocess", lambda html: generator._postprocess_regex(html, ""), lambda html: POSTPROCESS_PIPELINE.run(html).html),
+        ("finalize+sections", finalize_regex, finalize_pipeline),
+        ("publish", lambda html: fix_html_tag_balance(clean_html_styles(html)), lambda html: PUBLISH_PIPELINE.run(html).html),
+    ]
+
+    def timed(func, html):
+        times = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = func(html)
+            times.append(time.perf_counter() - started)
+        return result, statistics.median(times)
+
+    totals = {name: [0.0, 0.0, 0] for name, _, _ in stages}
+    diffs = {}
+    chars = 0
+    quiet = contextlib.redirect_stdout(io.StringIO())  # humanize_full 진행 출력 숨김
+    logging.disable(logging.WARNING)  # 태그 밸런스 경고 (두 쪽 모두 같은 내용)
+    for name, html in docs:
+        chars += len(html)
+        current = html
+        for stage, regex, pipeline in stages:
+            with quiet:
+                expected, regex_time = timed(regex, current)
+                actual, pipeline_time = timed(pipeline, current)
+            totals[stage][0] += regex_time
+            totals[stage][1] += pipeline_time
+            if expected == actual:
+                totals[stage][2] += 1
+            elif stage not in diffs:
+                a, b = (expected[0], actual[0]) if isinstance(expected, tuple) else (expected, actual)
+                diffs[stage] = (name, first_diff(a, b) if a != b else "본문 같음, 섹션 목록 다름")
+            current = expected[0] if isinstance(expected, tuple) else expected
+    logging.disable(logging.NOTSET)
+
+    print(f"\n코퍼스 {len(docs)}개 (평균 {chars // len(docs)}자), 반복 {args.repeat}회 중앙값, 글당 평균")
+    print(f"{'stage':<18}  {'regex':>9}  {'1-pass':>9}  {'speedup':>7}  {'same':>7}")
+    print("-" * 58)
+    regex_sum = pipeline_sum = 0.0
+    for stage, (regex_time, pipeline_time, same) in totals.items():
+        regex_sum += regex_time
+        pipeline_sum += pipeline_time
+        print(f"{stage:<18}  {regex_time / len(docs) * 1000:>7.2f}ms  {pipeline_time / len(docs) * 1000:>7.2f}ms  "
+              f"{regex_time / pipeline_time if pipeline_time else 0:>6.2f}x  {same:>3}/{len(docs)}")
+    print(f"{'total':<18}  {regex_sum / len(docs) * 1000:>7.2f}ms  {pipeline_sum / len(docs) * 1000:>7.2f}ms  "
+          f"{regex_sum / pipeline_sum if pipeline_sum else 0:>6.2f}x")
+    for stage, (name, diff) in diffs.items():
+        print(f"\n[{stage}] 첫 불일치: {name}\n  {diff}")
+
+
+def fit_length(html: str, chars: int) -> str:
+    """문서를 반복해 chars 길이로 맞춤 (태그 중간에서 자르지 않음)"""
+    text = html * (chars // max(len(html), 1) + 1)
+    cut = text.rfind(">", 0, chars)
+    return text[:cut + 1] if cut > 0 else text[:chars]
+
+
+def cmd_humanize(args, workdir: Path):
+    isolate_state(workdir)
+    import re
+    from utils import humanizer as base
+    from generators import humanizer as casual
+    from generators.html_pipeline import tokenize, TEXT
+
+    docs = [fit_length(html, args.chars) for _, html in load_html_corpus(args.corpus)]
+    if not docs:
+        print(f"코퍼스가 없습니다: {CASSETTE_DIR} 에 카세트를 녹화하거나 --corpus로 *.html 디렉터리 지정")
+        sys.exit(1)
+    markup = re.compile(base.MARKUP_PATTERN, re.DOTALL)
+
+    # 기존 방식: 규칙마다 문서 전체 순회 (utils: str.replace, generators: re.sub)
+    def replace_each(html):
+        for old, new in base.FORMAL_TO_CASUAL:
+            html = html.replace(old, new)
+        return html
+
+    def sub_each(html):
+        for old, new in casual.FORMAL_TO_CASUAL:
+            html = re.sub(old, new, html)
+        return html
+
+    texts = [[t.text for t in tokenize(html) if t.kind == TEXT] for html in docs]
+    # (이름, 순차 치환 순회 수, 순차, 컴파일, 입력 목록) — 본문 파이프라인은 텍스트 노드 단위로 호출
+    entries = [
+        ("utils.humanize_content", len(base.FORMAL_TO_CASUAL), replace_each, base.casual_rules.apply, docs),
+        ("generators.apply_casual_tone", len(casual.FORMAL_TO_CASUAL), sub_each, casual.casual_tone_rules.apply, docs),
+        ("pipeline text nodes", len(base.FORMAL_TO_CASUAL),
+         lambda nodes: [replace_each(t) for t in nodes],
+         lambda nodes: [base.casual_rules.replace_text(t) for t in nodes], texts),
+    ]
+
+    def timed(func, value):
+        times = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            result = func(value)
+            times.append(time.perf_counter() - started)
+        return result, statistics.median(times)
+
+    print(f"\n코퍼스 {len(docs)}개 × {args.chars}자, 반복 {args.repeat}회 중앙값, 글당 평균")
+    print(f"{'entry':<30}  {'passes':>9}  {'sequential':>10}  {'compiled':>9}  {'speedup':>7}  {'changed':>7}  {'markup':>6}")
+    print("-" * 92)
+    for name, passes, sequential, compiled, inputs in entries:
+        seq_total = compiled_total = 0.0
+        changed = markup_edits = 0
+        for value in inputs:
+            expected, seq_time = timed(sequential, value)
+            actual, compiled_time = timed(compiled, value)
+            seq_total += seq_time
+            compiled_total += compiled_time
+            changed += expected != actual
+            if isinstance(value, str):
+                # 순차 치환이 태그 속성 / 주석 / 대괄호 태그를 바꾼 글 수
+                markup_edits += markup.findall(expected) != markup.findall(value)
+        count = len(inputs)
+        print(f"{name:<30}  {passes:>4} → 1  {seq_total / count * 1000:>8.3f}ms  {compiled_total / count * 1000:>7.3f}ms  "
+              f"{seq_total / compiled_total if compiled_total else 0:>6.2f}x  {changed:>3}/{count}  "
+              f"{markup_edits if isinstance(inputs[0], str) else '-':>6}")
+    print("\nchanged: 결과가 달라진 글 (가장 긴 규칙 우선 / 마크업 제외), markup: 순차 치환이 마크업 안을 바꾼 글")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카세트 기반 오프라인 process_keyword 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record = sub.add_parser("record", help="실제 네트워크로 1회 실행하며 카세트 녹화")
+    record.add_argument("keyword", help="처리할 키워드")
+    record.add_argument("--cassette", type=str, default=None, help="카세트 경로 (기본: data/cassettes/<키워드>.json)")
+    record.add_argument("--publish", action="store_true", help="발행 단계 포함 (draft로 실제 발행)")
+    record.add_argument("--seed", type=int, default=0, help="random 시드 (재생 시 동일 값 사용)")
+
+    replay = sub.add_parser("replay", help="카세트 재생으로 단계별 CPU/wall/메모리 측정")
+    replay.add_argument("keyword", help="녹화한 키워드")
+    replay.add_argument("--cassette", type=str, default=None, help="카세트 경로 (기본: data/cassettes/<키워드>.json)")
+    replay.add_argument("--repeat", type=int, default=1, help="반복 횟수 (기본: 1)")
+    replay.add_argument("--latency", type=str, default=None,
+                        help="교환마다 주입할 지연: 초 단위 숫자 또는 recorded (녹화 당시 응답 시간)")
+    replay.add_argument("--latency-scale", type=float, default=1.0, help="--latency recorded 배율 (기본: 1.0)")
+    replay.add_argument("--seed", type=int, default=0, help="카세트에 시드가 없을 때 사용")
+    replay.add_argument("--no-memory", action="store_true",
+                        help="tracemalloc 끄기 (메모리 대신 부풀려지지 않은 CPU 시간 측정)")
+
+    html = sub.add_parser("html", help="본문 후처리 정규식 체인 vs 1회 순회 파이프라인 (시간 / 결과 일치)")
+    html.add_argument("--corpus", type=str, default=None, help="추가 코퍼스 디렉터리 (*.html)")
+    html.add_argument("--repeat", type=int, default=5, help="문서별 반복 횟수 (기본: 5)")
+
+    humanize = sub.add_parser("humanize", help="인간화 규칙: 규칙별 순차 치환 vs 컴파일된 1회 순회 (순회 수 / 시간)")
+    humanize.add_argument("--corpus", type=str, default=None, help="추가 코퍼스 디렉터리 (*.html)")
+    humanize.add_argument("--chars", type=int, default=10000, help="글 길이 (코퍼스 문서를 반복해 맞춤, 기본: 10000)")
+    humanize.add_argument("--repeat", type=int, default=20, help="문서별 반복 횟수 (기본: 20)")
+
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        if args.command == "record":
+            cmd_record(args, Path(tmp))
+        elif args.command == "html":
+            cmd_html(args, Path(tmp))
+        elif args.command == "humanize":
+            cmd_humanize(args, Path(tmp))
+        else:
+            cmd_replay(args, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
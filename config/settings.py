@@ -71,6 +71,109 @@ class Settings(BaseSettings):
     # Pexels API URL
     pexels_api_url: str = "https://api.pexels.com/v1/search"
 
+    # 블로그 참조 분석 메모 (0이면 SQLite 계층 비활성화, 메모리 계층만 사용)
+    research_memo_ttl_hours: float = 6.0
+    research_memo_path: str = str(BASE_DIR / "data" / "research_memo.db")
+
+    # 블로그 참조 동시 분석 (workers 1이면 순차 분석)
+    blog_reference_workers: int = 6
+    blog_reference_per_host: int = 2
+    blog_reference_deadline: float = 25.0  # 참조 분석 단계 전체 마감 (초)
+
+    # generate_full_post 리서치 단계 동시 실행 수 (1이면 선언 순서대로 순차 실행)
+    research_stage_workers: int = 6
+
+    # 공유 HTTP 클라이언트 (utils/http_client.py)
+    http_pool_connections: int = 20  # 연결 풀을 유지할 호스트 수
+    http_pool_maxsize: int = 10  # 호스트당 keep-alive 연결 수
+    http_retries: int = 2  # 연결 오류, 429/5xx 재시도 (GET/HEAD)
+    http_backoff: float = 0.5
+    http_timeout: float = 15.0  # 호출부에서 timeout 미지정 시
+    http2_enabled: bool = False  # httpx[http2] 설치 시에만 적용
+
+    # 크롤러 GET 응답 캐시 (도메인별 TTL 규칙은 utils/response_cache.py)
+    http_cache_enabled: bool = True
+    http_cache_path: str = str(BASE_DIR / "data" / "http_cache.db")
+    http_cache_max_mb: int = 200  # 초과 시 LRU 삭제
+
+    # 크롤러 호스트별 속도 제한 (토큰 버킷, 프로세스 전체 공유)
+    crawl_rate_per_host: float = 2.0  # 초당 요청 수
+    crawl_burst_per_host: int = 3  # 순간 허용 요청 수
+
+    # 주제 선정 신호 수집 (자동완성/연관검색어/블로그 경쟁도, 신호별 TTL 캐시)
+    topic_signal_workers: int = 8
+    topic_signal_cache_path: str = str(BASE_DIR / "data" / "topic_signals.db")
+
+    # 단계별 스팬 트레이싱 (리포트: python trace_report.py)
+    trace_enabled: bool = True
+    trace_path: str = str(BASE_DIR / "data" / "traces.db")
+    trace_keep_runs: int = 200  # 보관할 최근 실행 수
+
+    # LLM 응답 캐시 (같은 프롬프트 재전송 시 재사용, 기본 꺼짐 — 우회: main.py --no-llm-cache)
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = str(BASE_DIR / "data" / "llm_cache.db")
+    llm_cache_ttl_hours: float = 72.0
+    llm_cache_max_mb: int = 100  # 초과 시 LRU 삭제
+
+    # 본문 프롬프트 참고 자료 토큰 예산 (우선순위·중복 제거·문장 단위 축소, 템플릿별 context_tokens 우선)
+    context_budget_enabled: bool = True  # False면 기존처럼 전부 이어붙인 뒤 글자 수로 자름
+    context_budget_tokens: int = 2400  # 템플릿에 context_tokens가 없을 때
+
+    # 본문이 짧을 때 전체 재생성 대신 얇은 섹션만 병렬 보강 (False면 기존 전체 재생성)
+    expand_short_sections: bool = True
+    expand_max_sections: int = 4  # 한 번에 보강할 최대 섹션 수 (= 동시 호출 수)
+
+    # 본문 후처리를 토큰 스트림 1회 순회로 (generators/html_pipeline.py, False면 기존 정규식 체인 — 비교: python bench.py html)
+    html_pipeline_enabled: bool = True
+
+    # 본문 생성 방식: single(한 번에 전체) / outline(개요 1회 → 섹션 동시 생성) / outline_evergreen(에버그린만 outline)
+    content_generation_mode: str = "single"
+    outline_section_workers: int = 6  # 섹션 동시 생성 수
+    # 출력 예산: max_tokens를 목표 분량 + 기록에서 학습한 글자당 토큰 / 잘림 비율로 산정 (False면 기존 고정값)
+    output_budget_enabled: bool = True
+    output_budget_margin: float = 1.25  # 기본 안전 여유 (잘림 비율에 따라 1.1 ~ 2.0 사이로 자동 조정)
+    output_budget_target_truncation: float = 0.03  # 목표 잘림 비율
+    llm_max_continuations: int = 2  # max_tokens에서 잘린 응답 이어쓰기 최대 횟수 (0이면 잘린 그대로)
+    # 글 계획 호출 1회로 제목 / 메타 / 개요 / 이미지 검색어 / 블로그 요약 호출을 대체 (인물 키워드 제외, 실패 시 기존 경로)
+    post_plan_enabled: bool = True
+
+    # LLM 공급자 라우터 (utils/llm_router.py): 오류 / 시간 초과 시 다른 공급자로 장애 조치
+    llm_failover_enabled: bool = True  # 두 공급자 키가 모두 있을 때만 의미 있음
+    llm_call_timeout: float = 240.0  # 호출 하나의 최대 대기 시간 (초과 시 다음 공급자, 남은 공급자가 없으면 끝까지 대기)
+    llm_hedge_enabled: bool = False  # p90을 넘기면 두 번째 요청 (토큰 비용 증가)
+    llm_hedge_min_samples: int = 5  # 헤지 판단에 필요한 최소 성공 표본 수
+    llm_router_window: int = 50  # 공급자별 보관할 최근 호출 수
+
+    # 프로세스 간 LLM 호출 조절 (utils/llm_governor.py): 스케줄러 / 대시보드 / 배치 스크립트가 같은 예산 공유
+    llm_governor_enabled: bool = True
+    llm_governor_path: str = str(BASE_DIR / "data" / "llm_governor.db")
+    llm_governor_max_wait: float = 120.0  # 예산 대기 상한 (초과 시 TimeoutError → 라우터가 다른 공급자로)
+    llm_claude_rpm: int = 50
+    llm_claude_tpm: int = 80000  # 입력 + 출력 토큰 합계 기준 (0이면 제한 없음)
+    llm_claude_max_concurrent: int = 8
+    llm_gemini_rpm: int = 60
+    llm_gemini_tpm: int = 1000000
+    llm_gemini_max_concurrent: int = 8
+
+    # LLM 호출별 토큰 / 비용 / 지연 시간 기록 (utils/llm_usage.py, 리포트: python trace_report.py --cost)
+    llm_usage_enabled: bool = True
+    llm_usage_path: str = str(BASE_DIR / "data" / "llm_usage.db")
+    llm_usage_keep_days: int = 90
+    # 예상 비용 계산용 단가 (USD / 100만 토큰, 모델 변경 시 함께 수정)
+    # claude_model / gemini_model에 적용, 그 밖의 모델은 utils/llm_usage.MODEL_PRICES (목록에 없으면 이 값)
+    llm_claude_price_input: float = 0.8
+    llm_claude_price_output: float = 4.0
+    llm_gemini_price_input: float = 0.3
+    llm_gemini_price_output: float = 2.5
+
+    # 에버그린 일괄 생성 (python main.py --batch-evergreen N): 본문 호출을 모아 일괄 처리 → 완성 글 대기열
+    batch_backend: str = "auto"  # auto(Claude + SDK 지원 시 anthropic, 아니면 local) / anthropic / local
+    batch_workers: int = 10  # 동시에 준비할 글 수 (= 한 번에 제출할 최대 본문 요청 수)
+    batch_poll_seconds: float = 60.0  # 일괄 처리 상태 확인 간격
+    batch_max_wait_hours: float = 24.0  # 초과 시 취소 → 실시간 호출로 생성
+    ready_max_age_days: int = 14  # 대기열에서 이보다 오래된 글은 발행하지 않고 폐기
+    ready_claim_timeout_minutes: int = 60  # 발행 중(claimed)으로 이보다 오래 남은 글은 다시 ready (발행 프로세스 중단 대비)
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -22,6 +22,7 @@ STRUCTURE_TEMPLATES = {
         ],
         "image_count": [2, 2],
         "total_words": [3500, 5000],
+        "context_tokens": 2400,  # 참고 자료 입력 토큰 예산 (generators/context_assembler.py)
     },
 
     "storytelling": {
@@ -40,6 +41,7 @@ STRUCTURE_TEMPLATES = {
         ],
         "image_count": [2, 2],
         "total_words": [3500, 5000],
+        "context_tokens": 2000,
     },
 
     "listicle": {
@@ -57,6 +59,7 @@ STRUCTURE_TEMPLATES = {
         ],
         "image_count": [2, 2],
         "total_words": [3500, 5000],
+        "context_tokens": 2600,
     },
 
     "comparison": {
@@ -77,6 +80,7 @@ STRUCTURE_TEMPLATES = {
         ],
         "image_count": [2, 2],
         "total_words": [3500, 5500],
+        "context_tokens": 3000,
     },
 
     "qa_format": {
@@ -93,6 +97,7 @@ STRUCTURE_TEMPLATES = {
         ],
         "image_count": [2, 2],
         "total_words": [3500, 5000],
+        "context_tokens": 2600,
     },
 }
 
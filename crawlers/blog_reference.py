@@ -10,18 +10,31 @@
 """
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import List, Dict, Optional
 from urllib.parse import quote, urlparse
 from dataclasses import dataclass, field
 import json
 
-import requests
 from bs4 import BeautifulSoup
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from crawlers.research_memo import research_memo, normalize_blog_url
+from utils.http_client import create_session
+from utils.cassette import cassette
+from utils.llm_governor import llm_governor
+
+try:
+    from config.settings import settings
+    HAS_SETTINGS = True
+except Exception:
+    HAS_SETTINGS = False
+
 try:
     import google.generativeai as genai
     from config.settings import settings
@@ -38,6 +51,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# AI 요약을 생략할 때 상위 블로그 본문에서 발췌할 글자 수
+BLOG_EXCERPT_CHARS = 400
+
 import random
 
 USER_AGENTS = [
@@ -59,6 +75,10 @@ def _get_headers():
 
 HEADERS = _get_headers()
 
+# 호스트별 동시 요청 제한 (프로세스 전체 공유: 여러 크롤러 인스턴스가 동시에 돌아도 적용)
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_LOCK = threading.Lock()
+
 
 @dataclass
 class BlogAnalysis:
@@ -81,13 +101,14 @@ class BlogAnalysis:
     has_table: bool = False  # 표 포함 여부
     has_list: bool = False  # 리스트(ul/ol) 포함 여부
     source: str = ""  # naver/tistory/brunch
+    ai_summary: str = ""  # AI 요약 (메모에 함께 저장, 재요약 방지)
 
 
 class BlogReferenceCrawler:
     """네이버 블로그 + 구글 검색 고품질 블로그 분석기 (강화 버전)"""
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         # UA 로테이션: 각 요청에서 _get_headers() 사용
 
         # Gemini 클라이언트 초기화 (Claude에서 전환)
@@ -103,6 +124,11 @@ class BlogReferenceCrawler:
         # Legacy (사용 안 함)
         self.claude_client = None
 
+        # 동시 분석 설정 (workers <= 1이면 순차 분석)
+        self.max_workers = settings.blog_reference_workers if HAS_SETTINGS else 1
+        self.per_host_limit = max(1, settings.blog_reference_per_host if HAS_SETTINGS else 2)
+        self.deadline = settings.blog_reference_deadline if HAS_SETTINGS else 25.0
+
     def search_naver_blogs(self, keyword: str, count: int = 5) -> List[str]:
         """
         네이버 블로그 검색 결과에서 상위 블로그 URL 추출
@@ -458,63 +484,256 @@ class BlogReferenceCrawler:
 
 200자 이내 요약:"""
 
-            response = self.gemini_model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=300,
-                    temperature=0.3,
+            text = cassette.llm_exchange(
+                "gemini", self.gemini_model.model_name, prompt,
+                llm_governor.wrap(
+                    "gemini", prompt, 300,
+                    lambda: self.gemini_model.generate_content(
+                        prompt,
+                        generation_config=genai.types.GenerationConfig(
+                            max_output_tokens=300,
+                            temperature=0.3,
+                        ),
+                    ),
+                    label="blog_summary", model=self.gemini_model.model_name
                 ),
+                max_tokens=300
             )
 
-            return response.text.strip()
+            return text.strip()
 
         except Exception as e:
             logger.warning(f"AI summarization failed: {e}")
             return ""
 
-    def get_blog_analysis(self, keyword: str, count: int = 5) -> str:
+    def collect_blog_urls(self, keyword: str, count: int = 5) -> List[str]:
         """
-        키워드에 대한 상위 블로그 심층 분석 요약 문자열 반환 (강화 버전)
+        네이버 + 구글 블로그 후보 URL 수집 (정규화 기준 중복 제거, 메모 사용)
+
+        분석 실패에 대비해 count개로 자르지 않고 후보 전체(최대 2*count)를 반환.
+        collect_analyses가 유효한 분석 count개를 채우면 나머지는 건너뜀.
 
         Args:
             keyword: 검색 키워드
-            count: 분석할 블로그 수 (기본 5개로 증가)
+            count: 검색 엔진별로 가져올 블로그 수
 
         Returns:
-            프롬프트에 삽입할 상세 분석 요약 문자열
+            블로그 URL 리스트 (네이버 우선 순서)
         """
-        # 네이버 + 구글 블로그 URL 수집 (중복 제거)
+        cached = research_memo.get_search(keyword, count)
+        if cached is not None:
+            logger.info(f"Blog search memo hit for '{keyword}': {len(cached)} URLs")
+            return cached
+
         naver_urls = self.search_naver_blogs(keyword, count)
         google_urls = self.search_google_blogs(keyword, count)
 
         all_urls = []
         seen = set()
         for url in naver_urls + google_urls:
-            # URL 정규화 (m.blog -> blog)
-            normalized = url.replace("m.blog.naver.com", "blog.naver.com")
-            if normalized not in seen:
+            # URL 정규화 (m.blog -> blog 등)
+            normalized = normalize_blog_url(url)
+            if normalized and normalized not in seen:
                 seen.add(normalized)
                 all_urls.append(url)
 
-        all_urls = all_urls[:count]
+        # 검색 자체가 실패한 경우(빈 결과)는 저장하지 않음 → 다음 호출에서 재시도
+        if all_urls:
+            research_memo.put_search(keyword, count, all_urls)
+        return all_urls
+
+    def analyze_blog_memoized(self, url: str) -> BlogAnalysis:
+        """메모에 분석 결과가 있으면 재사용, 없으면 analyze_blog 후 저장"""
+        cached = research_memo.get_analysis(url)
+        if cached is not None:
+            return cached
+
+        analysis = self.analyze_blog(url)
+        # 네트워크 실패 등 빈 결과는 저장하지 않음 (다음 실행에서 재시도)
+        if analysis.title or analysis.length:
+            research_memo.put_analysis(analysis)
+        return analysis
+
+    @staticmethod
+    def _is_useful(analysis: BlogAnalysis) -> bool:
+        """참고 자료로 쓸 만한 분석인지 (소제목 있음 또는 500자 초과)"""
+        return bool(analysis.headings) or analysis.length > 500
+
+    def collect_analyses(self, keyword: str, count: int = 5) -> List[BlogAnalysis]:
+        """
+        키워드의 상위 블로그 분석 결과 (품질 점수 순)
+
+        get_blog_analysis / get_detailed_analysis가 공유하는 단일 크롤링 경로.
+        같은 실행 안에서 반복 호출해도 검색/분석은 한 번만 수행됨.
+        settings.blog_reference_workers > 1이면 동시 분석 모드 사용.
 
+        Args:
+            keyword: 검색 키워드
+            count: 분석할 블로그 수
+
+        Returns:
+            유효한(소제목 있음 또는 500자 초과) BlogAnalysis 리스트
+        """
+        all_urls = self.collect_blog_urls(keyword, count)
         if not all_urls:
-            return ""
+            return []
+
+        if self.max_workers > 1 and len(all_urls) > 1:
+            analyses = self._analyze_concurrently(all_urls, count)
+        else:
+            analyses = []
+            for url in all_urls:
+                analysis = self.analyze_blog_memoized(url)
+                if self._is_useful(analysis):
+                    analyses.append(analysis)
+                    if len(analyses) >= count:
+                        break
+
+        # 품질 점수 기준 정렬
+        analyses.sort(key=lambda x: x.quality_score, reverse=True)
+        return analyses[:count]
+
+    def _analyze_concurrently(self, urls: List[str], count: int) -> List[BlogAnalysis]:
+        """
+        후보 URL 동시 분석
+
+        - 호스트별 동시 요청 수 제한 (per_host_limit)
+        - 전체 마감 시간 (deadline) 초과 시 남은 작업은 기다리지 않고 버림
+        - 유효한 분석이 count개 모이면 즉시 반환
+
+        Args:
+            urls: 후보 URL (우선순위 순)
+            count: 필요한 유효 분석 수
 
-        # 블로그 분석
+        Returns:
+            유효한 BlogAnalysis 리스트 (완료 순)
+        """
         analyses: List[BlogAnalysis] = []
-        for url in all_urls:
-            analysis = self.analyze_blog(url)
-            if analysis.headings or analysis.length > 500:
-                analyses.append(analysis)
+        pending_urls = []
+
+        # 메모에 있는 분석은 스레드 없이 바로 사용
+        for url in urls:
+            cached = research_memo.get_analysis(url)
+            if cached is None:
+                pending_urls.append(url)
+            elif self._is_useful(cached):
+                analyses.append(cached)
+        if len(analyses) >= count or not pending_urls:
+            return analyses
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending_urls)),
+            thread_name_prefix="blog-ref",
+        )
+        futures = {executor.submit(self._analyze_polite, url): url for url in pending_urls}
+        pending = set(futures)
+        try:
+            while pending and len(analyses) < count:
+                remaining = self.deadline - (time.monotonic() - started)
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        analysis = future.result()
+                    except Exception as e:
+                        logger.warning(f"Blog analysis failed for {futures[future]}: {e}")
+                        continue
+                    if self._is_useful(analysis):
+                        analyses.append(analysis)
+        finally:
+            # 대기 중인 작업은 취소, 실행 중인 작업은 기다리지 않음
+            # (늦게 끝난 결과는 메모에만 저장되어 다음 호출에서 재사용)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        elapsed = time.monotonic() - started
+        if pending:
+            logger.info(
+                f"Blog analysis: {len(analyses)} useful in {elapsed:.1f}s, "
+                f"{len(pending)} stragglers dropped"
+            )
+        else:
+            logger.info(f"Blog analysis: {len(analyses)} useful in {elapsed:.1f}s")
+        return analyses
+
+    def _analyze_polite(self, url: str) -> BlogAnalysis:
+        """호스트별 세마포어를 잡고 분석 (같은 호스트에 동시 요청 과다 방지)"""
+        with self._host_semaphore(url):
+            return self.analyze_blog_memoized(url)
+
+    def _host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 세마포어 (티스토리 서브도메인은 하나로 묶음)"""
+        host = urlparse(normalize_blog_url(url)).netloc
+        if host.endswith(".tistory.com"):
+            host = "tistory.com"
+        with _HOST_LOCK:
+            semaphore = _HOST_SEMAPHORES.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                _HOST_SEMAPHORES[host] = semaphore
+            return semaphore
+
+    def _get_ai_summary(self, analysis: BlogAnalysis, keyword: str) -> str:
+        """AI 요약 (분석 결과에 저장하여 재요약 방지)"""
+        if analysis.ai_summary:
+            return analysis.ai_summary
+        if not analysis.full_text or not self.gemini_model:
+            return ""
+
+        summary = self.summarize_with_ai(analysis.full_text, keyword)
+        if summary:
+            analysis.ai_summary = summary
+            research_memo.put_analysis(analysis)
+        return summary
+
+    def get_blog_analysis(self, keyword: str, count: int = 5) -> str:
+        """
+        키워드에 대한 상위 블로그 심층 분석 요약 문자열 반환 (강화 버전)
+
+        Args:
+            keyword: 검색 키워드
+            count: 분석할 블로그 수 (기본 5개로 증가)
+
+        Returns:
+            프롬프트에 삽입할 상세 분석 요약 문자열
+        """
+        analyses = self.collect_analyses(keyword, count)
+        return self.format_blog_analysis(keyword, analyses)
+
+    def get_reference_bundle(self, keyword: str, count: int = 5, summarize: bool = True) -> tuple:
+        """
+        요약 문자열과 상세 딕셔너리를 한 번의 크롤링으로 생성
+
+        Args:
+            keyword: 검색 키워드
+            count: 분석할 블로그 수
+            summarize: False면 AI 요약 호출 대신 본문 발췌 (글 계획 호출이 요약 역할)
+
+        Returns:
+            (요약 문자열, 상세 분석 딕셔너리) 튜플
+        """
+        analyses = self.collect_analyses(keyword, count)
+        return (
+            self.format_blog_analysis(keyword, analyses, summarize=summarize),
+            self.build_detailed_analysis(keyword, analyses),
+        )
+
+    def format_blog_analysis(self, keyword: str, analyses: List[BlogAnalysis], summarize: bool = True) -> str:
+        """
+        분석 결과를 프롬프트용 요약 문자열로 변환
+
+        Args:
+            keyword: 검색 키워드
+            analyses: collect_analyses 결과
+            summarize: 상위 2개 블로그 AI 요약 여부 (False면 저장된 요약 또는 본문 앞부분 발췌)
 
+        Returns:
+            프롬프트에 삽입할 상세 분석 요약 문자열
+        """
         if not analyses:
             return ""
 
-        # 품질 점수 기준 정렬
-        analyses.sort(key=lambda x: x.quality_score, reverse=True)
-        analyses = analyses[:count]
-
         # 공통 패턴 분석
         common_analysis = self._analyze_common_patterns(analyses)
 
@@ -591,10 +810,14 @@ class BlogReferenceCrawler:
                 lines.append(f"  포맷: {', '.join(extras)} 사용")
 
             # AI 요약 (상위 2개만)
-            if i <= 2 and a.full_text and self.gemini_model:
-                summary = self.summarize_with_ai(a.full_text, keyword)
+            if i <= 2:
+                label, summary = "핵심 요약", a.ai_summary
+                if summarize:
+                    summary = self._get_ai_summary(a, keyword)
+                elif not summary:
+                    label, summary = "본문 발췌", " ".join(a.full_text.split())[:BLOG_EXCERPT_CHARS]
                 if summary:
-                    lines.append(f"  핵심 요약: {summary}")
+                    lines.append(f"  {label}: {summary}")
 
             lines.append("")
 
@@ -643,24 +866,22 @@ class BlogReferenceCrawler:
         Returns:
             분석 결과 딕셔너리
         """
-        # 네이버 + 구글 블로그 URL 수집
-        naver_urls = self.search_naver_blogs(keyword, count)
-        google_urls = self.search_google_blogs(keyword, count)
+        analyses = self.collect_analyses(keyword, count)
+        return self.build_detailed_analysis(keyword, analyses)
 
-        all_urls = list(set(naver_urls + google_urls))[:count]
-
-        if not all_urls:
-            return {"keyword": keyword, "blogs": [], "common_patterns": {}}
+    def build_detailed_analysis(self, keyword: str, analyses: List[BlogAnalysis]) -> Dict:
+        """
+        분석 결과를 딕셔너리로 변환
 
-        # 블로그 분석
-        analyses = []
-        for url in all_urls:
-            analysis = self.analyze_blog(url)
-            if analysis.headings or analysis.length > 500:
-                analyses.append(analysis)
+        Args:
+            keyword: 검색 키워드
+            analyses: collect_analyses 결과
 
-        # 품질 점수 기준 정렬
-        analyses.sort(key=lambda x: x.quality_score, reverse=True)
+        Returns:
+            분석 결과 딕셔너리
+        """
+        if not analyses:
+            return {"keyword": keyword, "blogs": [], "common_patterns": {}}
 
         # 결과 구성
         blogs_data = []
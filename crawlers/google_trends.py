@@ -5,13 +5,13 @@ from typing import Optional
 from dataclasses import dataclass
 
 import feedparser
-import requests
 from bs4 import BeautifulSoup
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +116,7 @@ class GoogleTrendsCrawler:
         try:
             # 네이버 뉴스 검색 (최신순)
             search_url = f"https://search.naver.com/search.naver?where=news&query={keyword}&sort=1"
-            response = requests.get(search_url, headers=self.headers, timeout=10)
+            response = get_session().get(search_url, headers=self.headers, timeout=10)
             soup = BeautifulSoup(response.text, "html.parser")
 
             news_items = []
@@ -1,19 +1,20 @@
 """네이버 뉴스 + Google News RSS 크롤러"""
 import logging
-import time
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from dataclasses import dataclass
 from urllib.parse import quote, urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import create_session
+from utils.rate_limiter import host_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +43,7 @@ class NaverNewsCrawler:
 
     def __init__(self):
         self.search_url = settings.naver_search_url
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        self.session = create_session(headers=HEADERS)
 
     def search_news(self, keyword: str, max_articles: int = 3) -> list[NewsArticle]:
         """
@@ -61,19 +61,17 @@ class NaverNewsCrawler:
             search_url = f"{self.search_url}?where=news&query={quote(keyword)}&sm=tab_jum"
             logger.info(f"Searching news for: {keyword}")
 
+            host_rate_limiter.acquire(search_url)
             response = self.session.get(search_url, timeout=10)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, 'html.parser')
-            articles = []
 
-            # 뉴스 검색 결과에서 네이버 뉴스 링크만 추출
+            # 뉴스 검색 결과에서 네이버 뉴스 링크만 추출 (본문은 아래에서 동시 수집)
+            candidates = []
             news_items = soup.select('div.news_area')
 
             for item in news_items[:max_articles * 2]:  # 여유있게 검색
-                if len(articles) >= max_articles:
-                    break
-
                 # 제목과 링크 추출
                 title_elem = item.select_one('a.news_tit')
                 if not title_elem:
@@ -106,33 +104,27 @@ class NaverNewsCrawler:
                 if not naver_news_link:
                     continue
 
-                # 기사 본문 추출
-                time.sleep(0.5)  # 딜레이
-                article_content = self._fetch_article_content(naver_news_link)
-
-                if article_content:
-                    # 출처 추출
-                    source = None
-                    source_elem = item.select_one('a.info.press')
-                    if source_elem:
-                        source = source_elem.get_text(strip=True)
-
-                    # 날짜 추출
-                    date = None
-                    date_elem = item.select_one('span.info')
-                    if date_elem:
-                        date = date_elem.get_text(strip=True)
-
-                    article = NewsArticle(
-                        title=title,
-                        link=naver_news_link,
-                        summary=article_content,
-                        source=source,
-                        date=date
-                    )
-                    articles.append(article)
-
-                time.sleep(0.5)  # 차단 방지 딜레이
+                # 출처 추출
+                source = None
+                source_elem = item.select_one('a.info.press')
+                if source_elem:
+                    source = source_elem.get_text(strip=True)
+
+                # 날짜 추출
+                date = None
+                date_elem = item.select_one('span.info')
+                if date_elem:
+                    date = date_elem.get_text(strip=True)
+
+                candidates.append(NewsArticle(
+                    title=title,
+                    link=naver_news_link,
+                    summary="",
+                    source=source,
+                    date=date
+                ))
+
+            articles = self._fetch_articles(candidates, max_articles)
 
             logger.info(f"Found {len(articles)} articles for: {keyword}")
             return articles
@@ -141,6 +133,37 @@ class NaverNewsCrawler:
             logger.error(f"Error searching news for {keyword}: {e}")
             return []
 
+    def _fetch_articles(self, candidates: List[NewsArticle], max_articles: int) -> List[NewsArticle]:
+        """
+        후보 기사 본문 동시 수집 (호스트별 토큰 버킷 예산 안에서)
+
+        본문을 못 가져온 후보가 있으면 다음 후보로 채움 (검색 결과 순서 유지)
+
+        Args:
+            candidates: 본문이 비어 있는 후보 기사 (검색 결과 순)
+            max_articles: 최대 기사 수
+
+        Returns:
+            본문 요약이 채워진 NewsArticle 리스트
+        """
+        fetched = {}
+        pending = list(enumerate(candidates))
+        if not pending:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_articles, len(pending)),
+                                thread_name_prefix="news") as executor:
+            while pending and len(fetched) < max_articles:
+                batch = pending[:max_articles - len(fetched)]
+                pending = pending[len(batch):]
+                summaries = executor.map(lambda c: self._fetch_article_content(c[1].link), batch)
+                for (index, article), summary in zip(batch, summaries):
+                    if summary:
+                        article.summary = summary
+                        fetched[index] = article
+
+        return [fetched[i] for i in sorted(fetched)]
+
     def _fetch_article_content(self, url: str) -> Optional[str]:
         """
         네이버 뉴스 기사 본문 추출 및 3줄 요약
@@ -152,6 +175,7 @@ class NaverNewsCrawler:
             3줄 요약 문자열
         """
         try:
+            host_rate_limiter.acquire(url)
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
@@ -233,8 +257,7 @@ class GoogleNewsCrawler:
     GOOGLE_NEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        self.session = create_session(headers=HEADERS)
 
     def search_news(self, keyword: str, max_articles: int = 5) -> List[NewsArticle]:
         """Google News RSS에서 뉴스 검색"""
@@ -2,12 +2,14 @@
 네이버 연관검색어 / 자동완성 크롤러
 키워드를 입력하면 네이버에서 연관검색어와 자동완성 추천어를 수집합니다.
 """
-import requests
 import logging
 import re
 import json
 from typing import List, Dict
 
+from utils.http_client import get_session
+from utils.rate_limiter import host_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 AUTOCOMPLETE_URL = "https://ac.search.naver.com/nx/ac"
@@ -64,7 +66,8 @@ def get_autocomplete(keyword: str, display: int = 10) -> List[str]:
     }
 
     try:
-        resp = requests.get(AUTOCOMPLETE_URL, params=params, headers=_get_headers(), timeout=10)
+        host_rate_limiter.acquire(AUTOCOMPLETE_URL)
+        resp = get_session().get(AUTOCOMPLETE_URL, params=params, headers=_get_headers(), timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
@@ -92,7 +95,8 @@ def get_related_keywords(keyword: str) -> List[str]:
     params = {"where": "nexearch", "query": keyword}
 
     try:
-        resp = requests.get(SEARCH_URL, params=params, headers=_get_headers(), timeout=10)
+        host_rate_limiter.acquire(SEARCH_URL)
+        resp = get_session().get(SEARCH_URL, params=params, headers=_get_headers(), timeout=10)
         resp.raise_for_status()
         html = resp.text
 
@@ -0,0 +1,269 @@
+"""블로그 참조 분석 메모 (리서치 캐시)
+
+같은 키워드/URL을 한 번의 실행에서 여러 번 크롤링하지 않도록
+BlogReferenceCrawler의 검색 결과와 BlogAnalysis를 보관:
+- 1단계: 프로세스 메모리 (실행 단위, 짧은 TTL)
+- 2단계: SQLite (선택, settings.research_memo_ttl_hours > 0일 때)
+  → 스케줄러 슬롯, weekly_learn.py 사이에서 신선한 분석 재사용
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로/TTL (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "research_memo.db"
+DEFAULT_TTL_HOURS = 6.0
+
+# 메모리 계층 TTL: 한 번의 파이프라인 실행을 덮는 정도
+MEMORY_TTL_SECONDS = 60 * 60
+
+
+def normalize_blog_url(url: str) -> str:
+    """
+    블로그 URL 정규화 (메모 키용)
+
+    - m.blog.naver.com → blog.naver.com
+    - 스킴은 https로 통일, 호스트 소문자
+    - fragment, 끝 슬래시 제거
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith("m.blog.naver.com"):
+        host = host[2:]
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(("https", host, path, "", parsed.query, ""))
+
+
+class ResearchMemo:
+    """키워드 → 블로그 URL 목록, 정규화 URL → BlogAnalysis 메모"""
+
+    def __init__(self, db_path: str = None, ttl_hours: float = None):
+        if ttl_hours is None or db_path is None:
+            try:
+                from config.settings import settings
+                ttl_hours = settings.research_memo_ttl_hours if ttl_hours is None else ttl_hours
+                db_path = settings.research_memo_path if db_path is None else db_path
+            except Exception:
+                ttl_hours = DEFAULT_TTL_HOURS if ttl_hours is None else ttl_hours
+                db_path = db_path or str(DEFAULT_DB_PATH)
+
+        self.db_path = Path(db_path)
+        self.ttl_seconds = max(0.0, float(ttl_hours)) * 3600
+        self.persistent = self.ttl_seconds > 0
+
+        self._lock = threading.Lock()
+        # keyword -> (저장 시각, 검색 요청 수, 정규화 URL 목록)
+        self._searches: Dict[str, Tuple[float, int, List[str]]] = {}
+        # 정규화 URL -> (저장 시각, BlogAnalysis 딕셔너리)
+        self._analyses: Dict[str, Tuple[float, dict]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.persistent:
+            self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 (실패 시 메모리 계층만 사용)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS blog_searches (
+                        keyword TEXT PRIMARY KEY,
+                        search_count INTEGER,
+                        urls TEXT,  -- JSON array (정규화 URL)
+                        saved_at REAL
+                    )
+                """)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS blog_analyses (
+                        url TEXT PRIMARY KEY,  -- 정규화 URL
+                        payload TEXT,  -- BlogAnalysis JSON
+                        saved_at REAL
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Research memo DB init failed, memory only: {e}")
+            self.persistent = False
+
+    def _is_fresh(self, saved_at: float, memory: bool) -> bool:
+        age = time.time() - saved_at
+        if memory:
+            return age < max(MEMORY_TTL_SECONDS, self.ttl_seconds)
+        return age < self.ttl_seconds
+
+    # ------------------------------------------------------------
+    # 키워드 검색 결과
+    # ------------------------------------------------------------
+
+    def get_search(self, keyword: str, count: int) -> Optional[List[str]]:
+        """
+        키워드의 블로그 URL 목록 조회
+
+        저장된 검색 요청 수가 count 이상일 때만 재사용 (부족하면 재검색)
+        """
+        with self._lock:
+            entry = self._searches.get(keyword)
+            if entry and entry[1] >= count and self._is_fresh(entry[0], memory=True):
+                self.hits += 1
+                return entry[2]
+
+        if self.persistent:
+            try:
+                with self._get_conn() as conn:
+                    row = conn.execute(
+                        "SELECT search_count, urls, saved_at FROM blog_searches WHERE keyword = ?",
+                        (keyword,)
+                    ).fetchone()
+                if row and row[0] >= count and self._is_fresh(row[2], memory=False):
+                    urls = json.loads(row[1])
+                    with self._lock:
+                        self._searches[keyword] = (row[2], row[0], urls)
+                        self.hits += 1
+                    return urls
+            except Exception as e:
+                logger.debug(f"Research memo search lookup failed: {e}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put_search(self, keyword: str, count: int, urls: List[str]):
+        """키워드 검색 결과 저장"""
+        now = time.time()
+        with self._lock:
+            self._searches[keyword] = (now, count, list(urls))
+
+        if self.persistent:
+            try:
+                with self._get_conn() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO blog_searches (keyword, search_count, urls, saved_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (keyword, count, json.dumps(urls, ensure_ascii=False), now)
+                    )
+                    conn.commit()
+            except Exception as e:
+                logger.debug(f"Research memo search save failed: {e}")
+
+    # ------------------------------------------------------------
+    # URL별 분석 결과
+    # ------------------------------------------------------------
+
+    def get_analysis(self, url: str):
+        """정규화 URL 기준 BlogAnalysis 조회 (없으면 None)"""
+        from crawlers.blog_reference import BlogAnalysis
+
+        key = normalize_blog_url(url)
+        with self._lock:
+            entry = self._analyses.get(key)
+            if entry and self._is_fresh(entry[0], memory=True):
+                self.hits += 1
+                return BlogAnalysis(**entry[1])
+
+        if self.persistent:
+            try:
+                with self._get_conn() as conn:
+                    row = conn.execute(
+                        "SELECT payload, saved_at FROM blog_analyses WHERE url = ?",
+                        (key,)
+                    ).fetchone()
+                if row and self._is_fresh(row[1], memory=False):
+                    data = self._filter_fields(json.loads(row[0]))
+                    with self._lock:
+                        self._analyses[key] = (row[1], data)
+                        self.hits += 1
+                    return BlogAnalysis(**data)
+            except Exception as e:
+                logger.debug(f"Research memo analysis lookup failed: {e}")
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put_analysis(self, analysis):
+        """BlogAnalysis 저장"""
+        key = normalize_blog_url(analysis.url)
+        data = asdict(analysis)
+        now = time.time()
+        with self._lock:
+            self._analyses[key] = (now, data)
+
+        if self.persistent:
+            try:
+                with self._get_conn() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO blog_analyses (url, payload, saved_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(data, ensure_ascii=False), now)
+                    )
+                    conn.commit()
+            except Exception as e:
+                logger.debug(f"Research memo analysis save failed: {e}")
+
+    @staticmethod
+    def _filter_fields(data: dict) -> dict:
+        """BlogAnalysis 필드가 바뀌어도 예전 레코드를 읽을 수 있도록 필터링"""
+        from crawlers.blog_reference import BlogAnalysis
+
+        names = {f.name for f in fields(BlogAnalysis)}
+        return {k: v for k, v in data.items() if k in names}
+
+    # ------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------
+
+    def clear(self):
+        """메모리 계층 비우기 (SQLite 계층은 유지)"""
+        with self._lock:
+            self._searches.clear()
+            self._analyses.clear()
+
+    def purge_expired(self) -> int:
+        """만료된 SQLite 레코드 삭제"""
+        if not self.persistent:
+            return 0
+        cutoff = time.time() - self.ttl_seconds
+        try:
+            with self._get_conn() as conn:
+                deleted = conn.execute("DELETE FROM blog_searches WHERE saved_at < ?", (cutoff,)).rowcount
+                deleted += conn.execute("DELETE FROM blog_analyses WHERE saved_at < ?", (cutoff,)).rowcount
+                conn.commit()
+            return deleted
+        except Exception as e:
+            logger.debug(f"Research memo purge failed: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        """메모 적중 통계"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "keywords": len(self._searches),
+                "analyses": len(self._analyses),
+                "persistent": self.persistent,
+            }
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+research_memo = ResearchMemo()
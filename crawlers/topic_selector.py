@@ -3,10 +3,10 @@ import logging
 import re
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 
 import sys
@@ -15,7 +15,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from crawlers.google_trends import GoogleTrendsCrawler
 from crawlers.naver_related import get_autocomplete, get_related_keywords
+from crawlers.topic_signals import topic_signal_cache
 from database.models import db
+from utils.http_client import get_session
+from utils.rate_limiter import host_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,32 @@ COMMERCIAL_PATTERNS = [
     r"노트북", r"스마트폰", r"태블릿", r"이어폰", r"모니터",
 ]
 
+# 스포츠/연예 차단 패턴 (evergreen_keywords.json 로드 실패 시)
+DEFAULT_BLOCKED_PATTERNS = [
+    "경기 결과", "경기 하이라이트", "골 장면", "승리", "패배", "이적",
+    "우승", "결승", "16강", "8강", "챔피언스리그", "프리미어리그",
+    "KBO", "NBA", "UFC", "올림픽", "아이돌", "컴백", "팬미팅", "콘서트",
+]
+
+EVERGREEN_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "evergreen_keywords.json"
+
+# (파일 수정 시각, 패턴) - 파일이 바뀌었을 때만 다시 읽음
+_blocked_patterns_cache: Tuple[float, List[str]] = (0.0, [])
+
+
+def load_blocked_patterns() -> List[str]:
+    """evergreen_keywords.json의 blocked_patterns (수정 시각 기준 캐시)"""
+    global _blocked_patterns_cache
+    try:
+        mtime = EVERGREEN_CONFIG_PATH.stat().st_mtime
+        if mtime != _blocked_patterns_cache[0]:
+            with open(EVERGREEN_CONFIG_PATH, encoding="utf-8") as f:
+                patterns = json.load(f).get("blocked_patterns", [])
+            _blocked_patterns_cache = (mtime, patterns)
+        return _blocked_patterns_cache[1]
+    except Exception:
+        return DEFAULT_BLOCKED_PATTERNS
+
 
 class TopicSelector:
     """다중 소스 키워드 수집 + 스코어링으로 최적 주제 선정 (v2)"""
@@ -57,6 +86,12 @@ class TopicSelector:
         self.trends_crawler = GoogleTrendsCrawler()
         # 트래픽 수치 캐시: {keyword: approx_traffic_int}
         self._traffic_cache: Dict[str, int] = {}
+        # 신호 수집 동시 실행 수
+        try:
+            from config.settings import settings
+            self.signal_workers = max(1, settings.topic_signal_workers)
+        except Exception:
+            self.signal_workers = 8
 
     # =========================================================================
     # 소스 1: Google Trends RSS (기존 + 트래픽 수치 캐싱)
@@ -102,7 +137,7 @@ class TopicSelector:
         # 방법 1: 네이버 DataLab 쇼핑인사이트 (더 안정적)
         try:
             url = "https://datalab.naver.com/keyword/realtimeList.naver"
-            resp = requests.get(url, headers=_get_headers(), timeout=10)
+            resp = get_session().get(url, headers=_get_headers(), timeout=10)
             if resp.status_code == 200:
                 soup = BeautifulSoup(resp.text, "html.parser")
                 for item in soup.select(".ranking_item .item_title, .keyword_rank .title, span.title"):
@@ -116,7 +151,7 @@ class TopicSelector:
         if not keywords:
             try:
                 url = "https://m.search.naver.com/p/csearch/content/qapirender.nhn?key=RealTimeSearchRank&where=nexearch&_callback=cb"
-                resp = requests.get(url, headers=_get_headers(), timeout=10)
+                resp = get_session().get(url, headers=_get_headers(), timeout=10)
                 if resp.status_code == 200:
                     # JSONP 파싱
                     import re as _re
@@ -135,7 +170,7 @@ class TopicSelector:
         if not keywords:
             try:
                 url = "https://news.naver.com/"
-                resp = requests.get(url, headers=_get_headers(), timeout=10)
+                resp = get_session().get(url, headers=_get_headers(), timeout=10)
                 if resp.status_code == 200:
                     soup = BeautifulSoup(resp.text, "html.parser")
                     for a in soup.select("a.cjs_t, .rankingnews_head a, .ofhd_lst a"):
@@ -159,7 +194,7 @@ class TopicSelector:
         # 방법 1: signal.bz (기존)
         for url in ["https://signal.bz/news", "https://m.signal.bz/naver", "https://signal.bz/"]:
             try:
-                resp = requests.get(url, headers=_get_headers(), timeout=8)
+                resp = get_session().get(url, headers=_get_headers(), timeout=8)
                 if resp.status_code != 200:
                     continue
                 soup = BeautifulSoup(resp.text, "html.parser")
@@ -197,7 +232,7 @@ class TopicSelector:
         # 방법 2: 네이버 실검 대안 — 다음 실시간 이슈
         if not keywords:
             try:
-                resp = requests.get("https://www.daum.net/", headers=_get_headers(), timeout=8)
+                resp = get_session().get("https://www.daum.net/", headers=_get_headers(), timeout=8)
                 if resp.status_code == 200:
                     soup = BeautifulSoup(resp.text, "html.parser")
                     for a in soup.select(".rank_cont a, .hot_issue a, .realtime_issue a, a.link_issue"):
@@ -224,7 +259,7 @@ class TopicSelector:
             "https://issue.zum.com/api/v2/issue/realtime",
         ]:
             try:
-                resp = requests.get(api_url, headers=_get_headers(), timeout=8)
+                resp = get_session().get(api_url, headers=_get_headers(), timeout=8)
                 if resp.status_code == 200:
                     try:
                         data = resp.json()
@@ -246,7 +281,7 @@ class TopicSelector:
         # 방법 2: Zum 메인 페이지 스크래핑
         if not keywords:
             try:
-                resp = requests.get("https://zum.com/", headers=_get_headers(), timeout=8)
+                resp = get_session().get("https://zum.com/", headers=_get_headers(), timeout=8)
                 if resp.status_code == 200:
                     soup = BeautifulSoup(resp.text, "html.parser")
                     for selector in [".realtime_keyword", ".issue_keyword", ".hot-keyword", "a.keyword", ".rank_list a", "a[href*='search.zum.com']"]:
@@ -271,7 +306,7 @@ class TopicSelector:
         try:
             url = "https://trends.google.com/trends/api/dailytrends"
             params = {"hl": "ko", "tz": "-540", "geo": "KR", "ed": datetime.now().strftime("%Y%m%d"), "ns": "15"}
-            resp = requests.get(url, params=params, headers=HEADERS, timeout=10)
+            resp = get_session().get(url, params=params, headers=HEADERS, timeout=10)
 
             keywords = []
             if resp.status_code == 200:
@@ -317,7 +352,8 @@ class TopicSelector:
         """네이버 블로그 검색 결과 수 추정 (낮을수록 기회)"""
         try:
             url = f"https://search.naver.com/search.naver?where=blog&query={keyword}"
-            resp = requests.get(url, headers=HEADERS, timeout=8)
+            host_rate_limiter.acquire(url)
+            resp = get_session().get(url, headers=HEADERS, timeout=8)
             if resp.status_code == 200:
                 # "약 N개" 패턴 매칭
                 m = re.search(r'약\s*([\d,]+)\s*개', resp.text)
@@ -338,77 +374,158 @@ class TopicSelector:
                 return True
         return False
 
-    def _get_performance_bonus(self, keyword: str) -> float:
-        """과거 성과 데이터 기반 보너스 (performance_learner 활용)"""
+    def _load_performance_insights(self) -> dict:
+        """과거 성과 인사이트 1회 로드 (performance_learner 활용)"""
         try:
             from utils.performance_learner import PerformanceLearner
-            learner = PerformanceLearner()
-            insights = learner.get_keyword_insights()
-            if not insights:
-                return 0.0
-
-            # 과거 고성과 키워드와 유사한 패턴이면 보너스
-            high_perf_keywords = insights.get("high_performance_keywords", [])
-            for hp_kw in high_perf_keywords:
-                if isinstance(hp_kw, dict):
-                    hp_kw = hp_kw.get("keyword", "")
-                # 부분 매칭
-                if hp_kw and (hp_kw in keyword or keyword in hp_kw):
-                    return 2.0
-
-            # 고성과 카테고리 보너스
-            high_perf_categories = insights.get("high_performance_categories", [])
-            if high_perf_categories:
-                return 0.5  # 데이터 있으면 약간의 기본 보너스
-
+            return PerformanceLearner().get_keyword_insights() or {}
         except Exception as e:
             logger.debug(f"Performance learner not available: {e}")
+            return {}
+
+    @staticmethod
+    def _get_performance_bonus(keyword: str, insights: dict) -> float:
+        """과거 성과 데이터 기반 보너스"""
+        if not insights:
+            return 0.0
+
+        # 과거 고성과 키워드와 유사한 패턴이면 보너스
+        high_perf_keywords = insights.get("high_performance_keywords", [])
+        for hp_kw in high_perf_keywords:
+            if isinstance(hp_kw, dict):
+                hp_kw = hp_kw.get("keyword", "")
+            # 부분 매칭
+            if hp_kw and (hp_kw in keyword or keyword in hp_kw):
+                return 2.0
+
+        # 고성과 카테고리 보너스
+        high_perf_categories = insights.get("high_performance_categories", [])
+        if high_perf_categories:
+            return 0.5  # 데이터 있으면 약간의 기본 보너스
         return 0.0
 
+    def _get_related_count(self, keyword: str) -> int:
+        """네이버 연관검색어 수"""
+        try:
+            return len(get_related_keywords(keyword))
+        except Exception:
+            return 0
+
     # =========================================================================
-    # 메인 스코어링
+    # 후보 필터 / 신호 수집
     # =========================================================================
 
-    def score_keywords(self, keywords_sources: dict) -> List[Tuple[str, float]]:
+    def filter_candidates(self, keywords_sources: dict) -> dict:
         """
-        키워드별 점수 계산 (v2: 트래픽/경쟁도/상업성/과거성과 반영)
+        발행 이력/차단 패턴으로 후보 필터링 (DB 조회 각 1회)
 
         Args:
             keywords_sources: {keyword: set(sources)} 매핑
 
         Returns:
-            (keyword, score) 리스트, 점수 내림차순
+            통과한 후보의 {keyword: set(sources)}
         """
-        scored = []
         published_keywords = set(db.get_published_keywords())
+        recent = db.get_recent_published(days=7)
+        blocked_patterns = load_blocked_patterns()
 
-        # 스포츠/연예 차단 패턴 로드
-        try:
-            _eg_config = json.load(open(str(Path(__file__).resolve().parent.parent / "config" / "evergreen_keywords.json"), encoding="utf-8"))
-            _blocked_patterns = _eg_config.get("blocked_patterns", [])
-        except Exception:
-            _blocked_patterns = [
-                "경기 결과", "경기 하이라이트", "골 장면", "승리", "패배", "이적",
-                "우승", "결승", "16강", "8강", "챔피언스리그", "프리미어리그",
-                "KBO", "NBA", "UFC", "올림픽", "아이돌", "컴백", "팬미팅", "콘서트",
-            ]
-
+        candidates = {}
         for keyword, sources in keywords_sources.items():
             if keyword in published_keywords:
                 continue
-            if db.is_similar_keyword_published(keyword, days=7):
+            if db.match_recent_keyword(keyword, recent):
                 continue
 
             # 스포츠/연예 키워드 차단
-            _is_blocked = False
-            for bp in _blocked_patterns:
-                if bp in keyword:
-                    _is_blocked = True
-                    logger.info(f"Blocked keyword '{keyword}' (pattern: {bp})")
-                    break
-            if _is_blocked:
+            blocked = next((bp for bp in blocked_patterns if bp in keyword), None)
+            if blocked:
+                logger.info(f"Blocked keyword '{keyword}' (pattern: {blocked})")
                 continue
 
+            candidates[keyword] = sources
+        return candidates
+
+    def gather_signals(self, keywords: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        후보 키워드의 네트워크 신호 일괄 수집
+
+        신호별 캐시(topic_signal_cache)를 먼저 보고, 없는 (키워드, 신호)만
+        동시에 요청. 실패값(자동완성/연관 0개, 경쟁도 -1)은 캐시하지 않음.
+
+        Args:
+            keywords: 후보 키워드 목록
+
+        Returns:
+            {keyword: {"autocomplete": int, "related": int, "blog_competition": int}}
+        """
+        fetchers = {
+            "autocomplete": self.get_naver_autocomplete_count,
+            "related": self._get_related_count,
+            "blog_competition": self._get_blog_competition,
+        }
+        failed_values = {"autocomplete": 0, "related": 0, "blog_competition": -1}
+
+        signals = {kw: {} for kw in keywords}
+        jobs = []
+        for name in fetchers:
+            cached = topic_signal_cache.get_fresh(name, keywords)
+            for kw in keywords:
+                if kw in cached:
+                    signals[kw][name] = cached[kw]
+                else:
+                    jobs.append((kw, name))
+
+        logger.info(
+            f"Topic signals: {len(keywords) * len(fetchers) - len(jobs)} cached, "
+            f"{len(jobs)} to fetch ({self.signal_workers} workers)"
+        )
+
+        fresh_rows = []
+        if jobs:
+            with ThreadPoolExecutor(max_workers=self.signal_workers, thread_name_prefix="signal") as executor:
+                futures = {executor.submit(fetchers[name], kw): (kw, name) for kw, name in jobs}
+                for future in as_completed(futures):
+                    kw, name = futures[future]
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        logger.debug(f"Signal '{name}' failed for '{kw}': {e}")
+                        value = failed_values[name]
+                    signals[kw][name] = value
+                    if value != failed_values[name]:
+                        fresh_rows.append((name, kw, value))
+
+        topic_signal_cache.put_many(fresh_rows)
+        return signals
+
+    # =========================================================================
+    # 메인 스코어링
+    # =========================================================================
+
+    def score_keywords(
+        self,
+        keywords_sources: dict,
+        signals: Dict[str, Dict[str, int]],
+        insights: dict = None
+    ) -> List[Tuple[str, float]]:
+        """
+        키워드별 점수 계산 (v2: 트래픽/경쟁도/상업성/과거성과 반영)
+
+        네트워크/DB 접근 없이 메모리에서만 계산
+        (filter_candidates → gather_signals 결과 사용)
+
+        Args:
+            keywords_sources: {keyword: set(sources)} 매핑 (필터 통과 후보)
+            signals: gather_signals() 결과
+            insights: 과거 성과 인사이트 (_load_performance_insights)
+
+        Returns:
+            (keyword, score) 리스트, 점수 내림차순
+        """
+        scored = []
+
+        for keyword, sources in keywords_sources.items():
+            signal = signals.get(keyword, {})
             score = 0.0
 
             # === 소스별 기본 점수 ===
@@ -435,15 +552,10 @@ class TopicSelector:
                 score += 0.5
 
             # === 네이버 자동완성 점수 ===
-            ac_count = self.get_naver_autocomplete_count(keyword)
-            score += min(ac_count, 5)  # 최대 +5
+            score += min(signal.get("autocomplete", 0), 5)  # 최대 +5
 
             # === 연관 검색어 수 보너스 ===
-            try:
-                related = get_related_keywords(keyword)
-                score += min(len(related), 3)  # 최대 +3
-            except Exception:
-                pass
+            score += min(signal.get("related", 0), 3)  # 최대 +3
 
             # === 상업적 키워드 보너스 (광고 수익) ===
             if self._is_commercial_keyword(keyword):
@@ -456,7 +568,7 @@ class TopicSelector:
                 score *= 1.5
 
             # === 블로그 경쟁도 보너스 (경쟁 낮으면 유리) ===
-            blog_count = self._get_blog_competition(keyword)
+            blog_count = signal.get("blog_competition", -1)
             if blog_count >= 0:
                 if blog_count < 1000:
                     score += 3.0  # 블루오션
@@ -466,7 +578,7 @@ class TopicSelector:
                     score -= 1.0  # 레드오션 페널티
 
             # === 과거 성과 보너스 ===
-            score += self._get_performance_bonus(keyword)
+            score += self._get_performance_bonus(keyword, insights)
 
             scored.append((keyword, round(score, 1)))
 
@@ -524,8 +636,15 @@ class TopicSelector:
                 source_counts[s] = source_counts.get(s, 0) + 1
         logger.info(f"Keywords per source: {source_counts}")
 
-        # 스코어링
-        scored = self.score_keywords(keywords_sources)
+        # 필터 → 신호 일괄 수집 → 스코어링
+        started = time.perf_counter()
+        candidates = self.filter_candidates(keywords_sources)
+        signals = self.gather_signals(list(candidates))
+        scored = self.score_keywords(candidates, signals, self._load_performance_insights())
+        logger.info(
+            f"Scored {len(candidates)}/{len(keywords_sources)} candidates "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
 
         result = [kw for kw, _ in scored[:limit]]
         if scored[:limit]:
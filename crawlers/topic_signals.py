@@ -0,0 +1,132 @@
+"""주제 선정 신호 캐시
+
+TopicSelector 후보 키워드의 네트워크 신호(자동완성 수, 연관검색어 수,
+블로그 경쟁도)를 신호별 TTL로 SQLite에 보관.
+경쟁도 같은 값은 몇 시간 안에 거의 바뀌지 않으므로 트렌드 슬롯 사이에서 재사용.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "topic_signals.db"
+
+# 신호별 TTL (시간)
+SIGNAL_TTL_HOURS = {
+    "autocomplete": 6,
+    "related": 6,
+    "blog_competition": 12,
+}
+# 가장 긴 TTL보다 오래된 행은 저장할 때 삭제
+MAX_TTL_HOURS = max(SIGNAL_TTL_HOURS.values())
+# IN (...) 한 번에 넣을 키워드 수 (SQLite 변수 개수 제한)
+LOOKUP_CHUNK = 500
+
+
+class TopicSignalCache:
+    """(신호, 키워드) → 정수 값 캐시"""
+
+    def __init__(self, db_path: str = None):
+        if db_path is None:
+            try:
+                from config.settings import settings
+                db_path = settings.topic_signal_cache_path
+            except Exception:
+                db_path = str(DEFAULT_DB_PATH)
+
+        self.db_path = Path(db_path)
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 (실패 시 캐시 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS signals (
+                        signal TEXT,
+                        keyword TEXT,
+                        value INTEGER,
+                        saved_at REAL,
+                        PRIMARY KEY (signal, keyword)
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Topic signal cache init failed, caching disabled: {e}")
+            self.enabled = False
+
+    def get_fresh(self, signal: str, keywords: List[str]) -> Dict[str, int]:
+        """
+        신호의 신선한 값 일괄 조회 (키워드 LOOKUP_CHUNK개마다 쿼리 1회)
+
+        Args:
+            signal: 신호 이름 (SIGNAL_TTL_HOURS 키)
+            keywords: 조회할 키워드 목록
+
+        Returns:
+            {keyword: value} (캐시에 있는 키워드만)
+        """
+        if not self.enabled:
+            return {}
+        cutoff = time.time() - SIGNAL_TTL_HOURS[signal] * 3600
+        wanted = list(dict.fromkeys(keywords))
+        found = {}
+        try:
+            with self._get_conn() as conn:
+                for i in range(0, len(wanted), LOOKUP_CHUNK):
+                    chunk = wanted[i:i + LOOKUP_CHUNK]
+                    rows = conn.execute(
+                        "SELECT keyword, value FROM signals WHERE signal = ? AND saved_at >= ? "
+                        f"AND keyword IN ({','.join('?' * len(chunk))})",
+                        (signal, cutoff, *chunk)
+                    ).fetchall()
+                    found.update(rows)
+        except Exception as e:
+            logger.debug(f"Topic signal lookup failed: {e}")
+            return {}
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def put_many(self, rows: List[Tuple[str, str, int]]):
+        """(signal, keyword, value) 일괄 저장 (MAX_TTL_HOURS보다 오래된 행 정리)"""
+        if not self.enabled or not rows:
+            return
+        now = time.time()
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO signals (signal, keyword, value, saved_at) VALUES (?, ?, ?, ?)",
+                    [(signal, keyword, value, now) for signal, keyword, value in rows]
+                )
+                conn.execute("DELETE FROM signals WHERE saved_at < ?", (now - MAX_TTL_HOURS * 3600,))
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Topic signal save failed: {e}")
+
+    def get_stats(self) -> Dict:
+        """캐시 적중 통계"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+# 싱글톤 인스턴스
+topic_signal_cache = TopicSignalCache()
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config.settings import settings
+from utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,7 @@ class WebSearcher:
             }
 
             logger.info(f"웹검색 시작: '{keyword}'")
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = get_session().get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
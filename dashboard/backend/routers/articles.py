@@ -1,4 +1,5 @@
 """글 생성 및 관리 API 라우터"""
+import asyncio
 import re
 import uuid
 import logging
@@ -86,7 +87,7 @@ async def generate_article(request: ArticleCreate):
     """
     # 실시간 로그 임포트
     from dashboard.backend.utils.log_manager import (
-        log_info, log_success, log_error, log_progress, log_warning
+        log_info, log_success, log_error, log_progress, log_warning, log_progress_sync
     )
 
     try:
@@ -109,13 +110,25 @@ async def generate_article(request: ArticleCreate):
         # 로그: 콘텐츠 생성 시작
         await log_progress("generate", "AI 콘텐츠 생성 시작...")
 
-        # 실제 글 생성 (섹션 포함)
+        def on_section(section: dict):
+            """본문 스트리밍 중 섹션 완성 시 /logs/stream으로 미리보기 전송 (작업 스레드에서 호출)"""
+            retry = " (재생성)" if section["attempt"] > 1 else ""
+            heading = section["heading"] or "도입부"
+            log_progress_sync(
+                "generate",
+                f"섹션 {section['index'] + 1} 작성{retry}: {heading} ({section['elapsed']:.1f}s)",
+                section
+            )
+
+        # 실제 글 생성 (섹션 포함) — 스트리밍 진행 로그가 전달되도록 작업 스레드에서 실행
         # custom_context가 있으면 직접 작성 모드
-        post = generator.generate_full_post(
+        post = await asyncio.to_thread(
+            generator.generate_full_post,
             keyword=request.keyword,
             news_data="",  # 대시보드에서는 뉴스 데이터 없이 생성
             custom_context=request.custom_context,  # 사용자 작성 방향
-            force_category=request.category  # 사용자 지정 카테고리
+            force_category=request.category,  # 사용자 지정 카테고리
+            on_section=on_section
         )
 
         # 로그: 콘텐츠 생성 완료
@@ -1,4 +1,5 @@
 """섹션 편집 API 라우터"""
+import asyncio
 import re
 import os
 import logging
@@ -16,6 +17,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from config.settings import settings
+from utils.llm_governor import llm_governor
 from dashboard.backend.utils.log_manager import (
     log_info_sync, log_success_sync, log_error_sync, log_progress_sync
 )
@@ -123,11 +125,18 @@ async def edit_section(request: SectionEditRequest):
 [출력]
 수정된 HTML만 출력 (다른 텍스트 없이):"""
 
-        response = client.messages.create(
-            model=settings.claude_model,
-            max_tokens=2000,
-            messages=[{"role": "user", "content": prompt}]
-        )
+        def governed_edit():
+            with llm_governor.slot("claude", prompt, 2000, label="section_edit") as ticket:
+                response = client.messages.create(
+                    model=settings.claude_model,
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                ticket.record(response, settings.claude_model, 2000)
+                return response
+
+        # 예산 대기(최대 llm_governor_max_wait) + 동기 SDK 호출 → 작업 스레드 (이벤트 루프 / 로그 스트림 막지 않음)
+        response = await asyncio.to_thread(governed_edit)
 
         updated_html = response.content[0].text.strip()
 
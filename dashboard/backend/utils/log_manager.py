@@ -11,6 +11,7 @@ class LogManager:
     _instance = None
     _logs: deque
     _subscribers: List[asyncio.Queue]
+    _loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -38,8 +39,9 @@ class LogManager:
                 pass
 
     def subscribe(self) -> asyncio.Queue:
-        """새 구독자 등록"""
+        """새 구독자 등록 (이벤트 루프 기억 → 작업 스레드에서도 전달 가능)"""
         queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
         self._subscribers.append(queue)
         return queue
 
@@ -73,10 +75,19 @@ def add_log_sync(level: str, stage: str, message: str, details: Dict = None):
     }
     log_manager._logs.append(log_entry)
 
-    # 구독자에게 전송 시도
-    for queue in log_manager._subscribers:
+    # 구독자에게 전송 시도 (asyncio.Queue는 스레드 안전하지 않으므로
+    # asyncio.to_thread 등 작업 스레드에서 호출되면 이벤트 루프로 넘겨서 전달)
+    loop = log_manager._loop
+    try:
+        in_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        in_loop = False
+    for queue in list(log_manager._subscribers):
         try:
-            queue.put_nowait(log_entry)
+            if loop is not None and not in_loop:
+                loop.call_soon_threadsafe(queue.put_nowait, log_entry)
+            else:
+                queue.put_nowait(log_entry)
         except Exception:
             pass
 
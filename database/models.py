@@ -130,16 +130,15 @@ class Database:
                 for row in rows
             ]
 
-    def is_similar_keyword_published(self, keyword: str, days: int = 7) -> bool:
+    def get_recent_published(self, days: int = 7) -> list[tuple[str, str]]:
         """
-        최근 N일 내 유사 키워드가 발행되었는지 확인 (부분 문자열 매칭)
+        최근 N일 내 발행된 (키워드, 제목) 목록
 
         Args:
-            keyword: 확인할 키워드
             days: 조회 기간 (일)
 
         Returns:
-            유사 키워드 존재 여부
+            (keyword, title) 튜플 리스트
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -150,18 +149,43 @@ class Database:
                 """,
                 (f'-{days} days',)
             )
-            for row in cursor.fetchall():
-                pub_keyword = row[0]
-                pub_title = row[1]
-                # 부분 문자열 매칭: 키워드가 서로 포함 관계
-                if keyword in pub_keyword or pub_keyword in keyword:
-                    logger.info(f"Similar keyword found: '{keyword}' ~ '{pub_keyword}'")
-                    return True
-                # 제목에 키워드가 포함되어 있는지
-                if keyword in pub_title:
-                    logger.info(f"Keyword found in recent title: '{keyword}' in '{pub_title}'")
-                    return True
-            return False
+            return [(row[0], row[1] or "") for row in cursor.fetchall()]
+
+    @staticmethod
+    def match_recent_keyword(keyword: str, recent: list[tuple[str, str]]) -> bool:
+        """
+        (키워드, 제목) 목록에 유사 키워드가 있는지 확인 (부분 문자열 매칭)
+
+        Args:
+            keyword: 확인할 키워드
+            recent: get_recent_published() 결과
+
+        Returns:
+            유사 키워드 존재 여부
+        """
+        for pub_keyword, pub_title in recent:
+            # 부분 문자열 매칭: 키워드가 서로 포함 관계
+            if keyword in pub_keyword or pub_keyword in keyword:
+                logger.info(f"Similar keyword found: '{keyword}' ~ '{pub_keyword}'")
+                return True
+            # 제목에 키워드가 포함되어 있는지
+            if keyword in pub_title:
+                logger.info(f"Keyword found in recent title: '{keyword}' in '{pub_title}'")
+                return True
+        return False
+
+    def is_similar_keyword_published(self, keyword: str, days: int = 7) -> bool:
+        """
+        최근 N일 내 유사 키워드가 발행되었는지 확인 (부분 문자열 매칭)
+
+        Args:
+            keyword: 확인할 키워드
+            days: 조회 기간 (일)
+
+        Returns:
+            유사 키워드 존재 여부
+        """
+        return self.match_recent_keyword(keyword, self.get_recent_published(days))
 
     def get_posts_count_today(self) -> int:
         """오늘 발행된 포스트 수 반환"""
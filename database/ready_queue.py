@@ -0,0 +1,207 @@
+"""발행 대기 글 (에버그린 일괄 생성 결과)
+
+python main.py --batch-evergreen N 이 미리 생성한 글을 저장하고,
+에버그린 발행 시간(09:00 / 18:00)에 생성 없이 바로 꺼내 발행
+
+상태: ready → claimed(발행 중) → published / failed
+      ready_max_age_days보다 오래된 ready 글은 꺼낼 때 expired로 정리
+      ready_claim_timeout_minutes 넘게 claimed인 글(발행 중 프로세스 종료)은 꺼낼 때 다시 ready
+"""
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings 로드 실패 시 사용)
+DEFAULT_MAX_AGE_DAYS = 14
+DEFAULT_CLAIM_TIMEOUT_MINUTES = 60
+
+
+@dataclass
+class ReadyPost:
+    """대기열의 글 하나 (GeneratedPost 중 발행에 필요한 필드)"""
+    id: int
+    keyword: str
+    title: str
+    content: str
+    excerpt: str
+    category: str
+    has_coupang: bool
+    quality_score: float
+    template: str = ""
+    sources: list = field(default_factory=list)
+
+
+class ReadyQueue:
+    """발행 대기 글 저장소 (발행 이력과 같은 SQLite 파일의 ready_posts 테이블)"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or settings.database_path
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ready_posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    keyword TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    excerpt TEXT,
+                    category TEXT,
+                    template TEXT,
+                    has_coupang INTEGER DEFAULT 0,
+                    sources TEXT,
+                    quality_score REAL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'ready',
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    claimed_at DATETIME,
+                    published_at DATETIME,
+                    wp_url TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ready_status ON ready_posts(status, created_at)")
+
+    def add(self, keyword: str, post) -> int:
+        """
+        생성된 글을 대기열에 추가
+
+        Args:
+            keyword: 키워드
+            post: GeneratedPost
+
+        Returns:
+            대기열 id
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO ready_posts (keyword, title, content, excerpt, category, template,
+                                         has_coupang, sources, quality_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    keyword, post.title, post.content, post.excerpt, post.category,
+                    post.template or "",
+                    int(bool(post.has_coupang)),
+                    json.dumps(post.sources or [], ensure_ascii=False),
+                    post.quality_score or 0,
+                )
+            )
+            logger.info(f"Ready queue: added '{keyword}' (#{cursor.lastrowid})")
+            return cursor.lastrowid
+
+    def claim(self, max_age_days: int = None, claim_timeout_minutes: int = None) -> Optional[ReadyPost]:
+        """
+        가장 오래된 ready 글을 claimed로 바꾸고 반환 (여러 프로세스가 동시에 꺼내도 한 번만)
+
+        Args:
+            max_age_days: 이보다 오래된 글은 expired 처리 (None이면 설정값)
+            claim_timeout_minutes: 이보다 오래 claimed인 글은 다시 ready (None이면 설정값)
+
+        Returns:
+            ReadyPost, 대기 글이 없으면 None
+        """
+        if max_age_days is None:
+            try:
+                max_age_days = settings.ready_max_age_days
+            except Exception:
+                max_age_days = DEFAULT_MAX_AGE_DAYS
+        if claim_timeout_minutes is None:
+            try:
+                claim_timeout_minutes = settings.ready_claim_timeout_minutes
+            except Exception:
+                claim_timeout_minutes = DEFAULT_CLAIM_TIMEOUT_MINUTES
+
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 발행 도중 종료된 프로세스가 남긴 claimed 글 되살리기 (중복 발행은 발행 단계의 중복 검사가 차단)
+                reclaimed = conn.execute(
+                    "UPDATE ready_posts SET status = 'ready', claimed_at = NULL "
+                    "WHERE status = 'claimed' AND claimed_at < datetime('now', ?)",
+                    (f"-{claim_timeout_minutes} minutes",)
+                ).rowcount
+                if reclaimed:
+                    logger.warning(f"Ready queue: {reclaimed} posts stuck in claimed for over "
+                                   f"{claim_timeout_minutes} minutes, back to ready")
+                expired = conn.execute(
+                    "UPDATE ready_posts SET status = 'expired' "
+                    "WHERE status = 'ready' AND created_at < datetime('now', ?)",
+                    (f"-{max_age_days} days",)
+                ).rowcount
+                if expired:
+                    logger.info(f"Ready queue: {expired} posts expired (older than {max_age_days} days)")
+                row = conn.execute(
+                    "SELECT * FROM ready_posts WHERE status = 'ready' ORDER BY created_at, id LIMIT 1"
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE ready_posts SET status = 'claimed', claimed_at = CURRENT_TIMESTAMP WHERE id = ?",
+                        (row["id"],)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        if not row:
+            return None
+        return ReadyPost(
+            id=row["id"],
+            keyword=row["keyword"],
+            title=row["title"],
+            content=row["content"],
+            excerpt=row["excerpt"] or "",
+            category=row["category"] or "",
+            has_coupang=bool(row["has_coupang"]),
+            quality_score=row["quality_score"] or 0,
+            template=row["template"] or "",
+            sources=json.loads(row["sources"] or "[]"),
+        )
+
+    def _finish(self, post_id: int, status: str, wp_url: str = None, error: str = None):
+        with self._get_connection() as conn:
+            conn.execute(
+                "UPDATE ready_posts SET status = ?, wp_url = ?, error = ?, "
+                "published_at = CASE WHEN ? = 'published' THEN CURRENT_TIMESTAMP ELSE published_at END "
+                "WHERE id = ?",
+                (status, wp_url, error, status, post_id)
+            )
+
+    def mark_published(self, post_id: int, wp_url: str):
+        """발행 완료"""
+        self._finish(post_id, "published", wp_url=wp_url)
+
+    def mark_failed(self, post_id: int, error: str):
+        """발행 실패 / 중복 차단 (다시 꺼내지 않음)"""
+        self._finish(post_id, "failed", error=error)
+
+    def ready_keywords(self) -> List[str]:
+        """대기 중인 글의 키워드 (일괄 생성 시 같은 키워드 중복 생성 방지)"""
+        with self._get_connection() as conn:
+            return [row[0] for row in conn.execute("SELECT keyword FROM ready_posts WHERE status = 'ready'")]
+
+    def count(self) -> int:
+        """대기 중인 글 수"""
+        with self._get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM ready_posts WHERE status = 'ready'").fetchone()[0]
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+ready_queue = ReadyQueue()
@@ -1,9 +1,16 @@
 """Claude AI 콘텐츠 생성기 - 카테고리별 고품질 블로그 글 생성"""
+import bisect
+import contextvars
+import html as html_lib
 import json
 import logging
 import re
+import threading
+import time
 import uuid
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Callable, Iterator, Optional, List, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -167,7 +174,7 @@ from utils.image_fetcher import ImageFetcher
 from utils.google_sheets import get_coupang_products
 from utils.product_matcher import match_products_for_content, generate_product_html
 from utils.web_search import GoogleSearcher
-from utils.humanizer import humanize_full
+from utils.humanizer import humanize_full, humanize_content as humanize_casual, casual_rules
 from .prompts import (
     SYSTEM_PROMPT,
     STRUCTURE_PROMPT,
@@ -183,8 +190,44 @@ from .prompts import (
     CATEGORY_BADGE_TEMPLATE,
     PROFESSIONAL_PERSONA,
     post_process_content,
+    clean_ai_content,
+    clean_markdown_artifacts,
+    FORBIDDEN_REPLACEMENTS,
+    PUNCTUATION_SUBS,
+    EMOJI_PATTERN,
 )
-from .template_prompts import generate_template_prompt, get_template_info_log, PERSON_TITLE_PROMPT
+from .html_pipeline import (
+    HtmlPipeline,
+    CodeFenceVisitor,
+    PreambleVisitor,
+    LeadingTitleVisitor,
+    PlaceholderVisitor,
+    ReplaceVisitor,
+    TextFunctionVisitor,
+    MarkdownVisitor,
+    EmojiLimitVisitor,
+    MarkerVisitor,
+    EmptyParagraphVisitor,
+    StyleVisitor,
+    TagBalanceVisitor,
+    IMAGE_SLOT,
+)
+from .context_assembler import ContextAssembler, ContextBlock
+from .template_prompts import (
+    generate_template_prompt, get_template_info_log, PERSON_TITLE_PROMPT, CONTENT_STATIC_RULES,
+    SECTION_EXPAND_PROMPT, OUTLINE_PROMPT, SECTION_WRITE_PROMPT, POST_PLAN_PROMPT, WORD_COUNT_RANGE
+)
+from .post_plan import PostPlan, parse_post_plan
+from .output_budget import output_budget
+from .stage_graph import Stage, StageGraph
+from .section_stream import SectionStream, section_heading, split_sections, unbalanced_tags
+from utils.tracing import tracer
+from utils.cassette import cassette
+from utils.llm_cache import llm_cache, make_key as make_llm_cache_key
+from utils.llm_router import llm_router
+from utils.llm_governor import llm_governor
+from utils.llm_usage import claude_counts, gemini_counts, llm_usage
+from utils.llm_batch import BATCH_COST_FACTOR, BatchRequest, current_batch
 from generators.humanizer import humanize_content
 from media.link_matcher import insert_related_links
 
@@ -202,8 +245,94 @@ COUPANG_EXCLUDE_KEYWORDS = [
 ]
 
 # 쿠팡 제외 카테고리
+# 본문 최소 글자 수 (미달 시 섹션 보강 → 전체 재생성)
+MIN_CONTENT_CHARS = 2000
+# 섹션 보강 시 그대로 남아야 하는 태그 ([IMAGE_1], [COUPANG], [OFFICIAL_LINK] 등)
+SECTION_TAG_PATTERN = re.compile(r'\[(?:IMAGE_\d+|[A-Z][A-Z_]{2,})[^\]]*\]|<!-- IMG_CONTEXT: .+? -->')
+# 이미지 삽입 위치 색인 (본문 1회 순회): IMG_CONTEXT 주석 [+ IMAGE_N] / 소제목 끝 / 문단 끝 / [IMAGE_N]
+# (모든 분기가 '<' 또는 '['로 시작해야 정규식 엔진이 나머지 글자를 빠르게 건너뜀)
+IMAGE_SLOT_PATTERN = re.compile(
+    r'<(?:(?P<context>!-- IMG_CONTEXT: .+? -->\s*)(?:\[(?P<context_tag>IMAGE_\d+)[^\]]*\])?'
+    r'|(?P<header>/h[23]>)|/p>)'
+    r'|\[(?P<tag>IMAGE_\d+)[^\]]*\]'
+)
+# max_tokens에서 잘린 응답 이어쓰기 호출의 최소 출력 토큰
+CONTINUATION_MIN_TOKENS = 1024
+# Gemini 이어쓰기 지시 (Claude는 잘린 응답을 assistant 메시지로 이어 받음)
+CONTINUATION_PROMPT = """
+
+[이미 작성한 부분 — 출력 길이 제한으로 중간에 끊김]
+{partial}
+
+위 글이 끊긴 지점부터 바로 이어서 작성하세요. 이미 쓴 내용을 반복하거나 앞부분을 다시 쓰지 말고, 이어지는 텍스트만 출력하세요."""
+
 COUPANG_EXCLUDE_CATEGORIES = ["연예", "트렌드", "재테크", "취업교육"]
 
+# 본문 후처리 파이프라인 (settings.html_pipeline_enabled, 규칙표는 기존 정리 함수와 공유)
+# 생성 직후: _postprocess_content (코드 블록 → 메타 응답 → 대제목 → placeholder → AdSense 후처리 → 인간화)
+POSTPROCESS_PIPELINE = HtmlPipeline(
+    CodeFenceVisitor,
+    partial(PreambleVisitor, AI_META_PATTERNS),
+    LeadingTitleVisitor,
+    PlaceholderVisitor,
+    partial(ReplaceVisitor, list(FORBIDDEN_REPLACEMENTS.items()), PUNCTUATION_SUBS),
+    MarkdownVisitor,
+    partial(EmojiLimitVisitor, EMOJI_PATTERN, 2),
+    partial(TextFunctionVisitor, casual_rules.replace_text),
+)
+# 스트리밍 섹션 미리보기: _section_preview (글 전체 기준인 대제목 / 이모지 제한 제외)
+PREVIEW_PIPELINE = HtmlPipeline(
+    CodeFenceVisitor,
+    partial(PreambleVisitor, AI_META_PATTERNS),
+    PlaceholderVisitor,
+    partial(ReplaceVisitor, list(FORBIDDEN_REPLACEMENTS.items()), PUNCTUATION_SUBS),
+    MarkdownVisitor,
+    partial(TextFunctionVisitor, casual_rules.replace_text),
+    strip=True,
+)
+# 이미지 / 링크 / 쿠팡 삽입 후: clean_meta_tags + parse_content_to_sections
+LEFTOVER_MARKERS = frozenset({"[OFFICIAL_LINK]", "[COUPANG]", "[DISCLAIMER]", "[AFFILIATE_NOTICE]", "[/AFFILIATE_NOTICE]"})
+FINALIZE_PIPELINE = HtmlPipeline(
+    partial(MarkerVisitor, lambda token: token.text in LEFTOVER_MARKERS or IMAGE_SLOT.match(token.name) is not None, True),
+    sections=True,
+    strip=True,
+)
+# 발행 직전: clean_html_styles + fix_html_tag_balance
+PUBLISH_MARKERS = frozenset({
+    "[OFFICIAL_LINK]", "[COUPANG]", "[AFFILIATE_NOTICE]", "[AD]", "[LINK]", "[CTA]",
+    "[BANNER]", "[SPONSORED]", "[SOURCE]", "[REF]",
+})
+PUBLISH_IMAGE_MARKER = re.compile(r'\[IMAGE\d*\]')
+PUBLISH_PIPELINE = HtmlPipeline(
+    partial(MarkerVisitor, lambda token: token.text in PUBLISH_MARKERS or PUBLISH_IMAGE_MARKER.fullmatch(token.text) is not None),
+    EmptyParagraphVisitor,
+    StyleVisitor,
+    TagBalanceVisitor,
+)
+
+
+def html_pipeline_enabled() -> bool:
+    """본문 후처리를 1회 순회 파이프라인으로 할지 (설정 로드 실패 시 사용)"""
+    try:
+        return bool(settings.html_pipeline_enabled)
+    except Exception:
+        return True
+
+
+def prepare_publish_html(html_content: str) -> str:
+    """
+    발행 직전 HTML 정리 (잔여 placeholder / 왼쪽 라인 스타일 제거 + 태그 밸런스 수정)
+
+    Args:
+        html_content: HTML 콘텐츠
+
+    Returns:
+        발행용 HTML
+    """
+    if html_pipeline_enabled():
+        return PUBLISH_PIPELINE.run(html_content).html
+    return fix_html_tag_balance(clean_html_styles(html_content))
+
 
 def is_person_keyword(keyword: str) -> bool:
     """
@@ -313,15 +442,17 @@ class ContentGenerator:
         self.client = anthropic.Anthropic(api_key=settings.claude_api_key)
         self.model = settings.claude_model
 
-        # Gemini 초기화
-        if self.ai_provider == "gemini" and HAS_GEMINI:
-            if settings.gemini_api_key:
-                genai.configure(api_key=settings.gemini_api_key)
-                self.gemini_model = genai.GenerativeModel(settings.gemini_model)
-                logger.info(f"AI Provider: Gemini ({settings.gemini_model})")
-            else:
-                logger.warning("Gemini selected but GOOGLE_API_KEY not set, falling back to Claude")
-                self.ai_provider = "claude"
+        # Gemini 초기화 (기본 공급자이거나 장애 조치 대상일 때)
+        self.gemini_model = None
+        if HAS_GEMINI and settings.gemini_api_key and (self.ai_provider == "gemini" or settings.llm_failover_enabled):
+            genai.configure(api_key=settings.gemini_api_key)
+            self.gemini_model = genai.GenerativeModel(settings.gemini_model)
+
+        if self.ai_provider == "gemini" and self.gemini_model is not None:
+            logger.info(f"AI Provider: Gemini ({settings.gemini_model})")
+        elif self.ai_provider == "gemini" and HAS_GEMINI:
+            logger.warning("Gemini selected but GOOGLE_API_KEY not set, falling back to Claude")
+            self.ai_provider = "claude"
         elif self.ai_provider == "gemini" and not HAS_GEMINI:
             logger.warning("google-generativeai not installed, falling back to Claude")
             self.ai_provider = "claude"
@@ -343,6 +474,13 @@ class ContentGenerator:
         self.coupang_defaults = self._load_json("coupang_defaults.json")
         self.evergreen_config = self._load_json("evergreen_keywords.json")
 
+        # 마지막 generate_full_post의 리서치 단계별 소요 시간 (초)
+        self.last_stage_timings = {}
+
+        # 동시에 생성 중인 포스트 수 (main.py --workers 병렬 모드에서 인스턴스 공유)
+        self._active_posts = 0
+        self._active_lock = threading.Lock()
+
     def _load_json(self, filename: str) -> dict:
         """JSON 설정 파일 로드"""
         try:
@@ -403,21 +541,117 @@ class ContentGenerator:
             logger.warning(f"트렌드 맥락 수집 실패: {e}")
             return ""
 
+    def _cached_call(
+        self,
+        provider: str,
+        model: str,
+        system: str,
+        prompt: str,
+        max_tokens: int,
+        temperature,
+        call,
+        use_cache: bool
+    ) -> str:
+        """
+        LLM 응답 캐시를 거쳐 호출 (utils/llm_cache.py, 설정으로 켠 경우만)
+
+        Args:
+            provider / model / system / prompt / max_tokens / temperature: 캐시 키 구성 요소
+            call: 실제 API 호출 (응답 텍스트 반환)
+            use_cache: False면 조회/저장 모두 건너뜀
+
+        Returns:
+            응답 텍스트
+        """
+        if not use_cache or not llm_cache.enabled:
+            return cassette.llm_exchange(provider, model, prompt, call, system=system, max_tokens=max_tokens)
+
+        key = make_llm_cache_key(provider, model, system, prompt, max_tokens, temperature)
+        cached = llm_cache.get(key)
+        if cached is not None:
+            logger.info(f"LLM cache hit ({provider}, {len(cached)} chars)")
+            tracer.annotate(llm_cache_hit=True)
+            return cached
+
+        text = cassette.llm_exchange(provider, model, prompt, call, system=system, max_tokens=max_tokens)
+        llm_cache.put(key, provider, model, text)
+        return text
+
+    @staticmethod
+    def _claude_system(full_system_prompt: str, static_prompt: str = "") -> list:
+        """
+        Claude system 블록 구성: 고정 접두사(페르소나 + 시스템 + 고정 규칙) 끝에 캐시 지점 표시
+
+        키워드별 내용은 모두 user 메시지에 있으므로 같은 system/고정 규칙을 쓰는 호출끼리
+        접두사 캐시를 공유함 (모델별 최소 길이 미만이면 API가 캐시하지 않고 그대로 처리)
+        """
+        blocks = [{"type": "text", "text": full_system_prompt}]
+        if static_prompt:
+            blocks.append({"type": "text", "text": static_prompt})
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return blocks
+
+    @staticmethod
+    def _record_claude_usage(usage, model: str, latency: float, max_tokens: int = 0, output_chars: int = 0,
+                             truncated: bool = False, cost_factor: float = 1.0) -> int:
+        """
+        Claude 응답 usage (입력/출력/캐시 읽기/캐시 쓰기 토큰)를 현재 스팬과 llm_usage에 기록
+
+        Args:
+            usage: 응답의 usage
+            model: 호출한 모델
+            latency: 호출 소요 시간 (초)
+            max_tokens / output_chars / truncated: 출력 예산 학습용 (llm_usage)
+            cost_factor: 비용 단가 배율 (일괄 처리 API 0.5)
+
+        Returns:
+            호출 조절기 정산용 토큰 수 (캐시 읽기는 분당 입력 한도에 포함되지 않으므로 제외)
+        """
+        if usage is None:
+            return 0
+        counts = claude_counts(usage)
+        tracer.annotate(**counts)
+        llm_usage.record("claude", model, counts, latency, max_tokens, output_chars, truncated, cost_factor)
+        logger.info(
+            f"Claude usage: in {counts['input_tokens']} (cache read {counts['cache_read_tokens']}, "
+            f"write {counts['cache_write_tokens']}), out {counts['output_tokens']}"
+        )
+        return counts["input_tokens"] + counts["cache_write_tokens"] + counts["output_tokens"]
+
+    @staticmethod
+    def _record_gemini_usage(usage, model: str, latency: float, max_tokens: int = 0, output_chars: int = 0,
+                             truncated: bool = False) -> int:
+        """Gemini usage_metadata를 Claude와 같은 이름으로 현재 스팬 / llm_usage에 기록하고 전체 토큰 수 반환 (암묵적 접두사 캐시 포함)"""
+        if usage is None:
+            return 0
+        counts = gemini_counts(usage)
+        tracer.annotate(**counts)
+        llm_usage.record("gemini", model, counts, latency, max_tokens, output_chars, truncated)
+        logger.info(
+            f"Gemini usage: in {counts['input_tokens']} (cache read {counts['cache_read_tokens']}), "
+            f"out {counts['output_tokens']}"
+        )
+        return sum(counts.values())
+
     def _call_claude(
         self,
         user_prompt: str,
         system_prompt: str = SYSTEM_PROMPT,
         max_tokens: int = 8000,
-        use_persona: bool = True
+        use_persona: bool = True,
+        use_cache: bool = True,
+        static_prompt: str = ""
     ) -> str:
         """
         Claude API 호출
 
         Args:
-            user_prompt: 사용자 프롬프트
+            user_prompt: 사용자 프롬프트 (키워드별 내용)
             system_prompt: 시스템 프롬프트
             max_tokens: 최대 토큰 수
             use_persona: 전문가 페르소나 프롬프트 사용 여부
+            use_cache: LLM 응답 캐시 사용 여부
+            static_prompt: 키워드와 무관한 고정 규칙 (시스템 프롬프트 뒤, 캐시 지점 앞에 배치)
 
         Returns:
             Claude 응답 텍스트
@@ -428,16 +662,43 @@ class ContentGenerator:
                 full_system_prompt = PROFESSIONAL_PERSONA + "\n\n" + system_prompt
             else:
                 full_system_prompt = system_prompt
-
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                system=full_system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
+            system_blocks = self._claude_system(full_system_prompt, static_prompt)
+
+            def request() -> str:
+                messages = [{"role": "user", "content": user_prompt}]
+                text, tokens = "", max_tokens
+                for attempt in range(settings.llm_max_continuations + 1):
+                    if attempt:
+                        # 잘린 응답을 assistant 메시지로 넘기면 끊긴 지점부터 이어서 생성 (끝 공백은 API가 거부)
+                        text = text.rstrip()
+                        messages = [messages[0], {"role": "assistant", "content": text}]
+                        tokens = max(CONTINUATION_MIN_TOKENS, max_tokens // 2)
+                        logger.info(f"Claude output hit max_tokens, continuing ({attempt}/{settings.llm_max_continuations})")
+                    with llm_governor.slot("claude", full_system_prompt + static_prompt + user_prompt + text, tokens,
+                                           label="content") as ticket:
+                        started = time.perf_counter()
+                        message = self.client.messages.create(
+                            model=self.model,
+                            max_tokens=tokens,
+                            system=system_blocks,
+                            messages=messages
+                        )
+                        part = message.content[0].text
+                        truncated = getattr(message, "stop_reason", None) == "max_tokens"
+                        ticket.settle(self._record_claude_usage(
+                            getattr(message, "usage", None), self.model, time.perf_counter() - started,
+                            tokens, len(part), truncated
+                        ))
+                    text += part
+                    if not truncated:
+                        break
+                self._annotate_continuations(attempt, truncated)
+                return text
+
+            return self._cached_call(
+                "claude", self.model, full_system_prompt + static_prompt, user_prompt, max_tokens, None,
+                request, use_cache
             )
-            return message.content[0].text
 
         except anthropic.APIError as e:
             logger.error(f"Claude API error: {e}")
@@ -446,28 +707,79 @@ class ContentGenerator:
             logger.error(f"Error calling Claude: {e}")
             raise
 
+    @staticmethod
+    def _gemini_truncated(response) -> bool:
+        """Gemini 응답이 max_output_tokens에서 끊겼는지 (finish_reason enum / 정수 모두 처리)"""
+        try:
+            reason = response.candidates[0].finish_reason
+        except (AttributeError, IndexError, TypeError):
+            return False
+        return getattr(reason, "name", reason) in ("MAX_TOKENS", 2)
+
+    @staticmethod
+    def _annotate_continuations(attempts: int, truncated: bool):
+        """이어쓰기 횟수를 현재 스팬에 기록 (이어쓰기 후에도 잘렸으면 경고)"""
+        if attempts:
+            tracer.annotate(continuations=attempts)
+        if truncated:
+            tracer.annotate(truncated=True)
+            logger.warning(f"LLM output still truncated after {attempts} continuations")
+
+    @staticmethod
+    def _gemini_prompt(user_prompt: str, system_prompt: str, use_persona: bool, static_prompt: str) -> str:
+        """Gemini 단일 프롬프트 (고정 부분을 앞에 두어 암묵적 접두사 캐시 적용)"""
+        parts = [PROFESSIONAL_PERSONA] if use_persona else []
+        parts.append(system_prompt)
+        if static_prompt:
+            parts.append(static_prompt)
+        parts.append(user_prompt)
+        return "\n\n".join(parts)
+
     def _call_gemini(
         self,
         user_prompt: str,
         system_prompt: str = SYSTEM_PROMPT,
         max_tokens: int = 8000,
-        use_persona: bool = True
+        use_persona: bool = True,
+        use_cache: bool = True,
+        static_prompt: str = ""
     ) -> str:
         """Gemini API 호출"""
         try:
-            if use_persona:
-                full_prompt = PROFESSIONAL_PERSONA + "\n\n" + system_prompt + "\n\n" + user_prompt
-            else:
-                full_prompt = system_prompt + "\n\n" + user_prompt
-
-            response = self.gemini_model.generate_content(
-                full_prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=max_tokens,
-                    temperature=0.7,
-                )
+            full_prompt = self._gemini_prompt(user_prompt, system_prompt, use_persona, static_prompt)
+
+            def request() -> str:
+                text, prompt, tokens = "", full_prompt, max_tokens
+                for attempt in range(settings.llm_max_continuations + 1):
+                    if attempt:
+                        prompt = full_prompt + CONTINUATION_PROMPT.format(partial=text)
+                        tokens = max(CONTINUATION_MIN_TOKENS, max_tokens // 2)
+                        logger.info(f"Gemini output hit max_tokens, continuing ({attempt}/{settings.llm_max_continuations})")
+                    with llm_governor.slot("gemini", prompt, tokens, label="content") as ticket:
+                        started = time.perf_counter()
+                        response = self.gemini_model.generate_content(
+                            prompt,
+                            generation_config=genai.types.GenerationConfig(
+                                max_output_tokens=tokens,
+                                temperature=0.7,
+                            )
+                        )
+                        part = response.text
+                        truncated = self._gemini_truncated(response)
+                        ticket.settle(self._record_gemini_usage(
+                            getattr(response, "usage_metadata", None), settings.gemini_model,
+                            time.perf_counter() - started, tokens, len(part), truncated
+                        ))
+                    text += part
+                    if not truncated:
+                        break
+                self._annotate_continuations(attempt, truncated)
+                return text
+
+            return self._cached_call(
+                "gemini", settings.gemini_model, "", full_prompt, max_tokens, 0.7,
+                request, use_cache
             )
-            return response.text
 
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
@@ -478,12 +790,267 @@ class ContentGenerator:
         user_prompt: str,
         system_prompt: str = SYSTEM_PROMPT,
         max_tokens: int = 8000,
-        use_persona: bool = True
+        use_persona: bool = True,
+        use_cache: bool = True,
+        static_prompt: str = ""
     ) -> str:
-        """통합 AI 호출 - ai_provider 설정에 따라 Claude/Gemini 선택"""
-        if self.ai_provider == "gemini":
-            return self._call_gemini(user_prompt, system_prompt, max_tokens, use_persona)
-        return self._call_claude(user_prompt, system_prompt, max_tokens, use_persona)
+        """
+        통합 AI 호출 - ai_provider 설정의 공급자 먼저, 오류 / 시간 초과 시 다른 공급자로 (llm_router)
+
+        use_cache=False면 응답 캐시 우회, static_prompt는 캐시 가능한 고정 접두사로 전송
+        """
+        with tracer.span("ai.call", provider=self.ai_provider, max_tokens=max_tokens,
+                         prompt_chars=len(user_prompt), static_chars=len(static_prompt)) as attrs:
+            calls = {}
+            for provider in self._providers():
+                call = self._call_gemini if provider == "gemini" else self._call_claude
+                calls[self._route_name(provider)] = (
+                    lambda call=call: call(user_prompt, system_prompt, max_tokens, use_persona, use_cache, static_prompt)
+                )
+            text, decision = llm_router.call(calls)
+            self._record_route(attrs, decision)
+            attrs["response_chars"] = len(text or "")
+            return text
+
+    def _providers(self) -> List[str]:
+        """시도할 공급자 (설정된 공급자 먼저, 다른 공급자는 장애 조치가 켜져 있고 키가 있을 때만)"""
+        providers = [self.ai_provider]
+        if settings.llm_failover_enabled:
+            if self.ai_provider == "gemini" and settings.claude_api_key:
+                providers.append("claude")
+            elif self.ai_provider == "claude" and self.gemini_model is not None:
+                providers.append("gemini")
+        return providers
+
+    def _route_name(self, provider: str) -> str:
+        return f"{provider}:{settings.gemini_model if provider == 'gemini' else self.model}"
+
+    @staticmethod
+    def _record_route(attrs: dict, decision: dict):
+        """라우터 결정을 현재 스팬에 기록 (헤지 / 장애 조치가 있을 때만 추가 항목)"""
+        attrs["provider"], _, attrs["model"] = decision["winner"].partition(":")
+        if decision["hedged"]:
+            attrs["hedged"] = True
+        if decision["failovers"] or decision["winner"] != decision["order"][0]:
+            attrs["failovers"] = decision["failovers"]
+            attrs["route_errors"] = decision["errors"]
+            logger.warning(f"LLM routed to {decision['winner']} (order {decision['order']}, errors {decision['errors']})")
+
+    def _stream_claude(
+        self,
+        user_prompt: str,
+        system_prompt: str = SYSTEM_PROMPT,
+        max_tokens: int = 8000,
+        use_persona: bool = True,
+        static_prompt: str = ""
+    ) -> Iterator[str]:
+        """Claude 스트리밍 호출 (텍스트 조각 yield)"""
+        full_system_prompt = PROFESSIONAL_PERSONA + "\n\n" + system_prompt if use_persona else system_prompt
+        system_blocks = self._claude_system(full_system_prompt, static_prompt)
+
+        def stream():
+            messages = [{"role": "user", "content": user_prompt}]
+            text, tokens = "", max_tokens
+            for attempt in range(settings.llm_max_continuations + 1):
+                if attempt:
+                    # 이미 보낸 조각은 그대로 두고 끊긴 지점부터 이어 받음 (_call_claude와 동일)
+                    messages = [messages[0], {"role": "assistant", "content": text.rstrip()}]
+                    tokens = max(CONTINUATION_MIN_TOKENS, max_tokens // 2)
+                    logger.info(f"Claude stream hit max_tokens, continuing ({attempt}/{settings.llm_max_continuations})")
+                started = time.perf_counter()
+                part = ""
+                with llm_governor.slot("claude", full_system_prompt + static_prompt + user_prompt + text, tokens,
+                                       label="content_stream") as ticket, \
+                        self.client.messages.stream(
+                            model=self.model,
+                            max_tokens=tokens,
+                            system=system_blocks,
+                            messages=messages
+                        ) as response:
+                    for chunk in response.text_stream:
+                        part += chunk
+                        yield chunk
+                    final = response.get_final_message()
+                    truncated = getattr(final, "stop_reason", None) == "max_tokens"
+                    # 조절기 대기 시간은 호출 지연 시간에서 제외
+                    latency = time.perf_counter() - started - ticket.waited
+                    ticket.settle(self._record_claude_usage(
+                        getattr(final, "usage", None), self.model, latency, tokens, len(part), truncated
+                    ))
+                text += part
+                if not truncated:
+                    break
+            self._annotate_continuations(attempt, truncated)
+
+        yield from self._cached_stream(
+            "claude", self.model, full_system_prompt + static_prompt, user_prompt, max_tokens, None, stream
+        )
+
+    def _stream_gemini(
+        self,
+        user_prompt: str,
+        system_prompt: str = SYSTEM_PROMPT,
+        max_tokens: int = 8000,
+        use_persona: bool = True,
+        static_prompt: str = ""
+    ) -> Iterator[str]:
+        """Gemini 스트리밍 호출 (텍스트 조각 yield)"""
+        full_prompt = self._gemini_prompt(user_prompt, system_prompt, use_persona, static_prompt)
+
+        def stream():
+            text, prompt, tokens = "", full_prompt, max_tokens
+            for attempt in range(settings.llm_max_continuations + 1):
+                if attempt:
+                    prompt = full_prompt + CONTINUATION_PROMPT.format(partial=text)
+                    tokens = max(CONTINUATION_MIN_TOKENS, max_tokens // 2)
+                    logger.info(f"Gemini stream hit max_tokens, continuing ({attempt}/{settings.llm_max_continuations})")
+                part = ""
+                with llm_governor.slot("gemini", prompt, tokens, label="content_stream") as ticket:
+                    started = time.perf_counter()
+                    response = self.gemini_model.generate_content(
+                        prompt,
+                        generation_config=genai.types.GenerationConfig(
+                            max_output_tokens=tokens,
+                            temperature=0.7,
+                        ),
+                        stream=True
+                    )
+                    for chunk in response:
+                        try:
+                            chunk_text = chunk.text
+                        except ValueError:
+                            # 안전 필터 등으로 텍스트가 없는 조각
+                            continue
+                        if chunk_text:
+                            part += chunk_text
+                            yield chunk_text
+                    truncated = self._gemini_truncated(response)
+                    ticket.settle(self._record_gemini_usage(
+                        getattr(response, "usage_metadata", None), settings.gemini_model,
+                        time.perf_counter() - started, tokens, len(part), truncated
+                    ))
+                text += part
+                if not truncated:
+                    break
+            self._annotate_continuations(attempt, truncated)
+
+        yield from self._cached_stream(
+            "gemini", settings.gemini_model, "", full_prompt, max_tokens, 0.7, stream
+        )
+
+    def _cached_stream(self, provider: str, model: str, system: str, prompt: str, max_tokens: int, temperature, stream) -> Iterator[str]:
+        """_cached_call의 스트리밍 버전 (캐시 적중 시 전체 텍스트를 한 조각으로)"""
+        key = None
+        if llm_cache.enabled:
+            key = make_llm_cache_key(provider, model, system, prompt, max_tokens, temperature)
+            cached = llm_cache.get(key)
+            if cached is not None:
+                logger.info(f"LLM cache hit ({provider}, {len(cached)} chars)")
+                tracer.annotate(llm_cache_hit=True)
+                yield cached
+                return
+
+        chunks = []
+        for chunk in cassette.llm_stream(provider, model, prompt, stream, system=system, max_tokens=max_tokens):
+            chunks.append(chunk)
+            yield chunk
+        if key:
+            llm_cache.put(key, provider, model, "".join(chunks))
+
+    def _stream_ai(
+        self,
+        user_prompt: str,
+        system_prompt: str = SYSTEM_PROMPT,
+        max_tokens: int = 8000,
+        use_persona: bool = True,
+        static_prompt: str = ""
+    ) -> Iterator[str]:
+        """
+        통합 스트리밍 AI 호출 - 첫 조각을 받기 전 오류면 다른 공급자로 장애 조치
+        (조각을 이미 보낸 뒤의 오류는 그대로 전파, 스트리밍은 헤지하지 않음)
+        """
+        names = llm_router.order([self._route_name(p) for p in self._providers()])
+        for position, name in enumerate(names):
+            provider = name.partition(":")[0]
+            stream = self._stream_gemini if provider == "gemini" else self._stream_claude
+            started = time.perf_counter()
+            yielded = False
+            try:
+                for chunk in stream(user_prompt, system_prompt, max_tokens, use_persona, static_prompt):
+                    yielded = True
+                    yield chunk
+            except Exception as e:
+                llm_router.record(name, time.perf_counter() - started, False)
+                if yielded or position == len(names) - 1:
+                    raise
+                logger.warning(f"LLM stream {name} failed before first chunk, failing over: {e}")
+                tracer.annotate(failovers=position + 1)
+                continue
+            llm_router.record(name, time.perf_counter() - started, True)
+            tracer.annotate(provider=provider)
+            return
+
+    def _generate_streaming(
+        self,
+        prompt: str,
+        max_tokens: int,
+        on_section: Callable[[dict], None],
+        attempt: int = 1,
+        static_prompt: str = ""
+    ) -> str:
+        """
+        본문 스트리밍 생성: 소제목 단위 섹션이 닫힐 때마다 정리·인간화한 미리보기를 on_section으로 전달
+
+        Args:
+            prompt: 본문 프롬프트
+            max_tokens: 최대 토큰 수
+            on_section: 섹션 콜백 ({"index", "heading", "html", "chars", "elapsed", "attempt"})
+            attempt: 생성 시도 번호 (글자수 미달 재생성 시 2)
+            static_prompt: 캐시 가능한 고정 규칙 (_call_ai와 동일)
+
+        Returns:
+            응답 원문 전체 (최종 후처리는 _postprocess_content)
+        """
+        splitter = SectionStream()
+        started = time.perf_counter()
+        index = 0
+
+        def emit(sections):
+            nonlocal index
+            for raw in sections:
+                html = self._section_preview(raw)
+                if not html:
+                    continue
+                if index == 0:
+                    attrs["first_section"] = round(time.perf_counter() - started, 2)
+                try:
+                    on_section({
+                        "index": index,
+                        "heading": section_heading(html),
+                        "html": html,
+                        "chars": len(html),
+                        "elapsed": round(time.perf_counter() - started, 2),
+                        "attempt": attempt,
+                    })
+                except Exception as e:
+                    logger.debug(f"on_section callback failed: {e}")
+                index += 1
+
+        with tracer.span("ai.stream", provider=self.ai_provider, max_tokens=max_tokens,
+                         prompt_chars=len(prompt), static_chars=len(static_prompt)) as attrs:
+            for chunk in self._stream_ai(prompt, max_tokens=max_tokens, static_prompt=static_prompt):
+                if "first_chunk" not in attrs:
+                    attrs["first_chunk"] = round(time.perf_counter() - started, 2)
+                emit(splitter.feed(chunk))
+            emit(splitter.finish())
+            attrs["sections"] = index
+            attrs["response_chars"] = len(splitter.text)
+
+        logger.info(
+            f"Streamed content: {index} sections, first section after "
+            f"{attrs.get('first_section', 0):.1f}s, total {time.perf_counter() - started:.1f}s"
+        )
+        return splitter.text
 
     def classify_category(self, keyword: str) -> tuple[str, dict]:
         """
@@ -515,7 +1082,13 @@ class ContentGenerator:
         logger.info(f"Category classified: '{keyword}' -> {best_match} (template: {best_config.get('template', 'trend')})")
         return best_match, best_config
 
-    def generate_title(self, keyword: str, news_data: str = "", is_person: bool = False) -> str:
+    def generate_title(
+        self,
+        keyword: str,
+        news_data: str = "",
+        is_person: bool = False,
+        related_keywords: dict = None
+    ) -> str:
         """
         블로그 제목 생성
 
@@ -523,6 +1096,7 @@ class ContentGenerator:
             keyword: 키워드
             news_data: 뉴스/웹검색 데이터 (인물 키워드용)
             is_person: 인물 키워드 여부
+            related_keywords: expand_keywords 결과 (없으면 직접 수집)
 
         Returns:
             생성된 제목
@@ -538,8 +1112,10 @@ class ContentGenerator:
             # SEO 최적화 제목 프롬프트 (v2: 연관 키워드 반영)
             related_kws = None
             try:
-                from crawlers.naver_related import expand_keywords
-                expanded = expand_keywords(keyword)
+                expanded = related_keywords
+                if expanded is None:
+                    from crawlers.naver_related import expand_keywords
+                    expanded = expand_keywords(keyword)
                 related_kws = (expanded.get("autocomplete", []) + expanded.get("related", []))[:8]
                 if related_kws:
                     logger.info(f"Title prompt with {len(related_kws)} related keywords for '{keyword}'")
@@ -616,7 +1192,10 @@ class ContentGenerator:
         category_name: str = "트렌드",
         is_evergreen: bool = False,
         web_data: dict = None,
-        trend_context: str = ""
+        trend_context: str = "",
+        related_keywords: dict = None,
+        on_section: Callable[[dict], None] = None,
+        extra_context: List[ContextBlock] = None
     ) -> tuple[str, list, dict]:
         """
         템플릿 다양화 시스템으로 본문 생성 (저품질 방지)
@@ -629,52 +1208,56 @@ class ContentGenerator:
             is_evergreen: 에버그린 콘텐츠 여부
             web_data: 웹검색 결과 (트렌드 키워드용)
             trend_context: 트렌드 맥락 (왜 지금 이 키워드가 화제인지)
+            related_keywords: expand_keywords 결과 (없으면 직접 수집)
+            on_section: 지정 시 스트리밍 생성, 섹션이 닫힐 때마다 미리보기 전달 (대시보드 진행 표시)
+            extra_context: 추가 참고 자료 블록 (블로그 분석, 학습 패턴, 성과 데이터 등)
 
         Returns:
             (HTML 본문, 출처 목록, 템플릿 정보) 튜플
         """
-        # 웹검색 결과가 있으면 참고 자료로 추가
+        # 참고 자료 블록 (템플릿 토큰 예산에 맞춰 우선순위 / 중복 제거 / 문장 단위 축소로 조립)
         sources = []
-        web_data_content = ""
+        context = ContextAssembler()
 
-        # 트렌드 맥락이 있으면 먼저 추가 (시의성 있는 글 작성을 위해)
+        # 트렌드 맥락이 있으면 먼저 추가 (시의성 있는 글 작성을 위해, 사용자 작성 방향 포함 — 자르지 않음)
         if trend_context:
-            web_data_content = trend_context + "\n\n"
+            context.add(ContextBlock("trend", trend_context, priority=0))
             logger.info("Added trend context to prompt")
 
+        # 블로그 분석 / 학습 패턴 / 성과 데이터 (generate_full_post)
+        for block in extra_context or []:
+            context.add(block)
+
         if web_data and web_data.get("content"):
-            web_content = web_data["content"][:6000]  # 토큰 제한 고려
+            web_content = web_data["content"][:6000]
             sources = web_data.get("sources", [])
 
-            web_data_content += f"""
-[웹검색 결과 - 최신 정보 (반드시 이 내용을 바탕으로 작성)]
-{web_content}
-
-[기존 뉴스 데이터]
-{news_data}
-
-[중요 규칙]
+            context.add(ContextBlock(
+                "web", web_content, priority=1, min_tokens=200,
+                title="[웹검색 결과 - 최신 정보 (반드시 이 내용을 바탕으로 작성)]"
+            ))
+            context.add(ContextBlock("news", news_data, priority=2, min_tokens=150, title="[기존 뉴스 데이터]"))
+            context.add(ContextBlock("rules", """[중요 규칙]
 1. 위 참고 자료의 팩트만 사용하세요
 2. 자료에 없는 내용은 추측하지 마세요
 3. 최신 날짜, 금액, 수치를 정확히 반영하세요
-4. 트렌드 배경이 있다면 "왜 지금 이 키워드가 화제인지" 꼭 언급하세요
-"""
+4. 트렌드 배경이 있다면 "왜 지금 이 키워드가 화제인지" 꼭 언급하세요""", priority=0))
             logger.info(f"Added web search data: {len(web_content)} chars from {len(sources)} sources")
         elif news_data:
-            web_data_content += news_data
+            context.add(ContextBlock("news", news_data, priority=1))
 
         # 연관 키워드 수집 → 프롬프트에 반영 (SEO v2)
-        related_kw_section = ""
         try:
-            from crawlers.naver_related import expand_keywords as _expand_kw
-            _expanded = _expand_kw(keyword)
+            _expanded = related_keywords
+            if _expanded is None:
+                from crawlers.naver_related import expand_keywords as _expand_kw
+                _expanded = _expand_kw(keyword)
             _all_related = (_expanded.get("autocomplete", []) + _expanded.get("related", []))[:10]
             if _all_related:
-                related_kw_section = (
-                    "\n[SEO 연관 키워드 — 본문과 소제목에 자연스럽게 2~3개 포함하세요]\n"
-                    + ", ".join(_all_related) + "\n"
-                )
-                web_data_content += related_kw_section
+                context.add(ContextBlock(
+                    "related_keywords", ", ".join(_all_related), priority=0,
+                    title="[SEO 연관 키워드 — 본문과 소제목에 자연스럽게 2~3개 포함하세요]"
+                ))
                 logger.info(f"Injected {len(_all_related)} related keywords into content prompt")
         except Exception as _e:
             logger.debug(f"Related keywords for content prompt failed: {_e}")
@@ -688,10 +1271,17 @@ class ContentGenerator:
         prompt, template_key, template, cta_config = generate_template_prompt(
             keyword=keyword,
             category=category_name,
-            web_data=web_data_content,
             is_evergreen=is_evergreen,
-            is_person=is_person
+            is_person=is_person,
+            with_static_rules=False,
+            context=context
         )
+        llm_usage.annotate(template=template_key)
+        if context.report:
+            tracer.annotate(context_tokens=context.used_tokens)
+            print(f"  └─ 참고 자료: 약 {context.used_tokens} 토큰 ({context.summary()})")
+        # 태그/일관성 규칙은 키워드와 무관 → 시스템 프롬프트 뒤 캐시 접두사로 전송 (인물 프롬프트는 자체 규칙 사용)
+        static_rules = "" if is_person else CONTENT_STATIC_RULES
 
         # 템플릿 정보 로깅
         template_info = get_template_info_log(template_key, template, cta_config)
@@ -699,20 +1289,472 @@ class ContentGenerator:
         logger.info(f"Template selected: {template_key} ({template['name']})")
         logger.info(f"Target words: {template['selected_word_count']}, Images: {template['selected_image_count']}")
 
-        # 모델 제한 내에서 최대치 사용 (Haiku: 8192)
-        max_tokens = 8000
+        # 분량 가이드 상한 + 기록에서 학습한 글자당 토큰 / 잘림 비율로 산정 (꺼져 있으면 모델 최대치 8000)
+        max_tokens = output_budget.for_chars(template["selected_word_count"] + WORD_COUNT_RANGE, self.ai_provider)
+        tracer.annotate(max_tokens=max_tokens)
+
+        # 글 계획 (제목 후보 / 메타 / 개요 / 이미지 검색어) → 본문은 계획을 따라 작성
+        plan = None
+        if not is_person and settings.post_plan_enabled:
+            plan = self._generate_plan(prompt, keyword, template, static_prompt=static_rules)
+
+        # 개요 → 섹션 동시 생성 모드 (실패 시 한 번에 전체 생성으로 진행)
+        # 일괄 처리 생성(--batch-evergreen) 중이면 본문 1회 호출만 일괄 처리로 모음
+        batch = current_batch()
+        mode = settings.content_generation_mode
+        content = None
+        if not is_person and not batch and (mode == "outline" or (mode == "outline_evergreen" and is_evergreen)):
+            content = self._generate_outlined(prompt, keyword, template, static_prompt=static_rules,
+                                              on_section=on_section, outline=plan.outline() if plan else None)
+        elif plan:
+            prompt += plan.render(template["selected_image_count"])
+
+        if content is None and batch:
+            content = self._call_batched(batch, prompt, max_tokens, static_prompt=static_rules)
+        elif content is None and on_section:
+            content = self._generate_streaming(prompt, max_tokens, on_section, static_prompt=static_rules)
+        elif content is None:
+            content = self._call_ai(prompt, max_tokens=max_tokens, static_prompt=static_rules)
+
+        # 글자수 미달 시 얇은 섹션만 병렬 보강, 그래도 부족하면 1회 전체 재생성 (최소 2000자)
+        plain_length = self._plain_length(content)
+        if plain_length < MIN_CONTENT_CHARS and settings.expand_short_sections:
+            logger.warning(f"Content too short ({plain_length} chars), expanding thin sections...")
+            print(f"  ⚠️ 글자수 미달 ({plain_length}자) → 짧은 섹션 보강 중...")
+            content = self._expand_short_sections(
+                content, keyword, template["selected_word_count"],
+                static_prompt=static_rules, on_section=on_section
+            )
+            plain_length = self._plain_length(content)
+        if plain_length < MIN_CONTENT_CHARS:
+            logger.warning(f"Content too short ({plain_length} chars), regenerating with stronger length enforcement...")
+            print(f"  ⚠️ 글자수 미달 ({plain_length}자) → 재생성 중...")
+            retry_prompt = prompt + f"\n\n🚨 [긴급] 이전 응답이 {plain_length}자로 심각하게 부족했습니다. 반드시 3500자 이상 작성하세요. 소제목 5개 이상, 각 섹션 400자 이상 필수!"
+            max_tokens = output_budget.for_chars(
+                max(template["selected_word_count"], 3500) + WORD_COUNT_RANGE, self.ai_provider
+            )
+            if on_section:
+                content = self._generate_streaming(retry_prompt, max_tokens, on_section, attempt=2,
+                                                   static_prompt=static_rules)
+            else:
+                content = self._call_ai(retry_prompt, max_tokens=max_tokens, static_prompt=static_rules)
+
+        content = self._postprocess_content(content, keyword)
+
+        # 템플릿 정보 딕셔너리 반환
+        template_info_dict = {
+            "key": template_key,
+            "name": template["name"],
+            "word_count": template["selected_word_count"],
+            "image_count": template["selected_image_count"],
+            "cta_position": cta_config["position"],
+            "plan": plan
+        }
+
+        return content.strip(), sources, template_info_dict
+
+    def _call_batched(self, batch, prompt: str, max_tokens: int, static_prompt: str = "") -> str:
+        """
+        본문 1회 호출을 일괄 처리 요청으로 제출하고 결과 대기 (utils/llm_batch)
+
+        일괄 처리가 실패하면 실시간 호출로 다시 생성, max_tokens에서 잘리면 실시간 이어쓰기
+
+        Args:
+            batch: 현재 워커의 BatchCollector
+            prompt: 본문 프롬프트
+            max_tokens: 최대 출력 토큰
+            static_prompt: 고정 규칙 (캐시 접두사)
+
+        Returns:
+            본문 응답 텍스트
+        """
+        def live() -> str:
+            return self._call_ai(prompt, max_tokens=max_tokens, static_prompt=static_prompt)
+
+        with tracer.span("ai.batch", backend=batch.backend.name, max_tokens=max_tokens,
+                         prompt_chars=len(prompt)) as attrs:
+            result = batch.submit(BatchRequest(
+                custom_id=f"post-{uuid.uuid4().hex[:16]}",
+                system=self._claude_system(PROFESSIONAL_PERSONA + "\n\n" + SYSTEM_PROMPT, static_prompt),
+                user_prompt=prompt,
+                max_tokens=max_tokens,
+                call=live,
+            ))
+            if result.error:
+                logger.warning(f"Batched content call failed ({result.error}), calling live")
+                attrs["fallback"] = True
+                return live()
+
+            text = result.text
+            # 로컬 대체 백엔드는 실시간 호출에서 이미 기록 → 일괄 처리 API 응답만 할인 단가로 기록
+            if result.usage is not None:
+                self._record_claude_usage(result.usage, self.model, 0.0, max_tokens, len(text),
+                                          result.truncated, cost_factor=BATCH_COST_FACTOR)
+            if result.truncated:
+                logger.info("Batched content hit max_tokens, continuing live")
+                attrs["truncated"] = True
+                text += self._call_ai(
+                    prompt + CONTINUATION_PROMPT.format(partial=text),
+                    max_tokens=max(CONTINUATION_MIN_TOKENS, max_tokens // 2), static_prompt=static_prompt
+                )
+            attrs["response_chars"] = len(text)
+            return text
+
+    def _generate_plan(self, prompt: str, keyword: str, template: dict, static_prompt: str = "") -> Optional[PostPlan]:
+        """
+        글 계획 1회 호출 (본문 프롬프트를 그대로 맥락으로 사용 → 같은 참고 자료 기반 제목 / 개요 / 검색어)
+
+        Returns:
+            검증된 PostPlan, 호출 / 검증 실패 시 None (제목 / 이미지 검색어는 기존 개별 호출로)
+        """
+        from datetime import datetime as _dt
+
+        started = time.perf_counter()
+        with tracer.span("content.plan") as attrs:
+            try:
+                raw = self._call_ai(
+                    prompt + POST_PLAN_PROMPT.format(
+                        keyword=keyword, year=_dt.now().year, image_count=template["selected_image_count"]
+                    ),
+                    max_tokens=2000, static_prompt=static_prompt
+                )
+            except Exception as e:
+                logger.warning(f"Post plan call failed, using separate calls: {e}")
+                return None
+            plan = parse_post_plan(raw)
+            if not plan:
+                return None
+            attrs.update(titles=len(plan.titles), sections=len(plan.sections), image_queries=len(plan.image_queries))
+        print(f"  └─ 글 계획: 제목 후보 {len(plan.titles)}개, 섹션 {len(plan.sections)}개, "
+              f"이미지 검색어 {len(plan.image_queries)}개 ({time.perf_counter() - started:.1f}s)")
+        return plan
+
+    def _section_max_tokens(self, chars: int) -> int:
+        """섹션 하나 분량(글자)에 맞춘 최대 출력 토큰 (output_budget, 꺼져 있으면 HTML 태그 여유 포함 고정 비율)"""
+        return output_budget.for_chars(chars, self.ai_provider, fixed_tokens=150,
+                                       fallback=min(4000, int(chars * 1.5) + 500))
+
+    @staticmethod
+    def _parse_outline(text: str) -> Optional[dict]:
+        """
+        개요 응답(JSON) 파싱 및 정리
+
+        Returns:
+            {"title", "meta", "sections": [{"heading", "points", "chars", "image"}], "tags": {태그: 섹션 번호}}
+            섹션이 3개 미만이면 None
+        """
+        text = text.replace("```json", "").replace("```", "").strip()
+        match = re.search(r'\{.*\}', text, re.DOTALL)
+        if not match:
+            return None
+        data = json.loads(match.group())
+
+        sections = []
+        for item in data.get("sections") or []:
+            if not isinstance(item, dict):
+                continue
+            points = item.get("points") or []
+            if isinstance(points, str):
+                points = [points]
+            try:
+                chars = int(item.get("chars") or 0)
+            except (TypeError, ValueError):
+                chars = 0
+            sections.append({
+                "heading": str(item.get("heading") or "").strip(),
+                "points": [str(point) for point in points][:6],
+                "chars": max(200, min(chars or 500, 2000)),
+                "image": bool(item.get("image")),
+            })
+        if len(sections) < 3:
+            return None
+
+        tags = {}
+        for name, index in (data.get("tags") or {}).items():
+            if name in ("COUPANG", "OFFICIAL_LINK", "AFFILIATE_NOTICE") and isinstance(index, int) \
+                    and 0 <= index < len(sections):
+                tags[name] = index
+
+        return {
+            "title": str(data.get("title") or "").strip(),
+            "meta": str(data.get("meta") or "").strip(),
+            "sections": sections,
+            "tags": tags,
+        }
+
+    def _generate_outlined(
+        self,
+        prompt: str,
+        keyword: str,
+        template: dict,
+        static_prompt: str = "",
+        on_section: Callable[[dict], None] = None,
+        outline: dict = None
+    ) -> Optional[str]:
+        """
+        개요 → 섹션 동시 생성: 개요 1회 호출 후 각 섹션 본문을 본문 프롬프트를 공통 맥락으로 병렬 작성
+
+        이미지 슬롯([IMAGE_N] + IMG_CONTEXT), 대괄호 태그, [META], 감싸는 <div>와 대제목은
+        조립 단계에서 배치하므로 결과는 한 번에 생성한 원문과 같은 형식 (_postprocess_content 이후 동일 처리)
+
+        Args:
+            prompt: 본문 프롬프트 (generate_template_prompt 결과)
+            keyword: 키워드
+            template: 선택된 템플릿 (selected_image_count 사용)
+            static_prompt: 고정 규칙 (섹션 호출에서는 본문 프롬프트와 함께 캐시 가능한 접두사로 전송)
+            on_section: 섹션이 완성될 때마다 미리보기 콜백 (완료 순서대로)
+            outline: 글 계획에서 받은 개요 (있으면 개요 호출 생략)
+
+        Returns:
+            조립된 원문, 개요/섹션 생성 실패 시 None (호출부가 한 번에 생성으로 진행)
+        """
+        started = time.perf_counter()
+        if outline is None:
+            with tracer.span("content.outline") as attrs:
+                try:
+                    raw = self._call_ai(
+                        prompt + OUTLINE_PROMPT.format(image_count=template["selected_image_count"]),
+                        max_tokens=1500, static_prompt=static_prompt
+                    )
+                    outline = self._parse_outline(raw)
+                except Exception as e:
+                    logger.warning(f"Outline generation failed, falling back to single call: {e}")
+                    return None
+                if not outline:
+                    logger.warning("Outline response unusable, falling back to single call")
+                    return None
+                attrs["sections"] = len(outline["sections"])
+            print(f"  └─ 개요: 섹션 {len(outline['sections'])}개 ({time.perf_counter() - started:.1f}s)")
+        sections = outline["sections"]
+
+        shared_prompt = (static_prompt + "\n\n" if static_prompt else "") + "[글 전체 지시 — 모든 섹션 공통]\n" + prompt.strip()
+        outline_text = "\n".join(
+            f"{i + 1}. {html_lib.escape(section['heading']) or '서론'} — {', '.join(section['points'])}"
+            for i, section in enumerate(sections)
+        )
+
+        def write(index: int) -> str:
+            section = sections[index]
+            # 소제목은 그대로 HTML에 들어가므로 <, &, " 등은 이스케이프해서 전달
+            heading = html_lib.escape(section["heading"])
+            if heading:
+                badge = sum(1 for s in sections[:index + 1] if s["heading"])
+                heading_rule = (
+                    f'첫 부분은 [소제목 스타일]의 HTML을 그대로 복사한 소제목 — 감싸는 <div>/<span>, <h3> 태그, '
+                    f'style 속성은 바꾸지 말고 소제목 문구 자리에만 "{heading}" (문구 그대로, 번호 배지가 있으면 {badge}). '
+                    f'<h2>로 바꾸지 마세요'
+                )
+            else:
+                heading_rule = "서론이므로 소제목 없이 <p> 문단으로 시작 ([서론 시작 문장]으로 시작)"
+            user_prompt = SECTION_WRITE_PROMPT.format(
+                number=index + 1, total=len(sections), outline=outline_text,
+                heading=heading or "(서론 — 소제목 없음)",
+                points=", ".join(section["points"]), chars=section["chars"], heading_rule=heading_rule
+            )
+            with tracer.span("ai.section", section=index, target=section["chars"]):
+                text = self._call_ai(user_prompt, max_tokens=self._section_max_tokens(section["chars"]),
+                                     static_prompt=shared_prompt)
+            text = re.sub(r'^```html\s*|\s*```$', '', text.strip(), flags=re.MULTILINE)
+            text = re.sub(r'\[META\].*?\[/META\]', '', clean_ai_response(text), flags=re.DOTALL)
+            return SECTION_TAG_PATTERN.sub('', text).strip()
+
+        bodies = {}
+        workers = max(1, min(settings.outline_section_workers, len(sections)))
+        with tracer.span("content.sections", sections=len(sections), workers=workers):
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(contextvars.copy_context().run, write, i): i for i in range(len(sections))}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        bodies[index] = future.result()
+                    except Exception as e:
+                        logger.warning(f"Section {index} generation failed: {e}")
+                        continue
+                    if on_section and bodies[index]:
+                        html = self._section_preview(bodies[index])
+                        try:
+                            on_section({
+                                "index": index,
+                                "heading": section_heading(html) or sections[index]["heading"],
+                                "html": html,
+                                "chars": len(html),
+                                "elapsed": round(time.perf_counter() - started, 2),
+                                "attempt": 1,
+                            })
+                        except Exception as e:
+                            logger.debug(f"on_section callback failed: {e}")
+
+        missing = [i for i in range(len(sections)) if not bodies.get(i)]
+        if missing:
+            logger.warning(f"Sections {missing} failed, falling back to single call")
+            return None
+
+        # 이미지 슬롯: 서론 + 개요에서 표시한 섹션 (템플릿 이미지 개수까지)
+        image_count = template["selected_image_count"]
+        image_sections = [i for i, section in enumerate(sections) if section["image"] and i > 0]
+        image_sections = ([0] + image_sections)[:image_count] if image_count else []
+
+        parts = ['<div style="max-width: 700px; margin: 0 auto; font-size: 16px; line-height: 1.9; color: #333;">']
+        if outline["title"]:
+            parts.append(f'<h2 style="font-size: 26px; font-weight: 700; color: #222; text-align: center;">{outline["title"]}</h2>')
+        for index, section in enumerate(sections):
+            html = bodies[index]
+            if index in image_sections:
+                number = image_sections.index(index) + 1
+                context = "introduction visual" if index == 0 else section["heading"]
+                slot = f"<!-- IMG_CONTEXT: {keyword} {context} -->\n[IMAGE_{number}]"
+                html = re.sub(r'(</p>)', lambda m: m.group(1) + "\n" + slot, html, count=1) if "</p>" in html \
+                    else html + "\n" + slot
+            for tag, tag_index in outline["tags"].items():
+                if tag_index == index:
+                    html += f"\n[{tag}]"
+            parts.append(html)
+        parts.append("</div>")
+        if outline["meta"]:
+            parts.append(f"[META]{outline['meta']}[/META]")
+
+        logger.info(f"Outlined content: {len(sections)} sections in {time.perf_counter() - started:.1f}s")
+        return "\n".join(parts)
+
+    @staticmethod
+    def _plain_length(html: str) -> int:
+        """태그 제거 후 공백을 하나로 줄인 글자 수"""
+        plain_text = re.sub(r'<[^>]+>', '', html)
+        return len(re.sub(r'\s+', ' ', plain_text).strip())
+
+    def _expand_short_sections(
+        self,
+        content: str,
+        keyword: str,
+        target_chars: int,
+        static_prompt: str = "",
+        on_section: Callable[[dict], None] = None
+    ) -> str:
+        """
+        짧은 초안 보강: 목표 글자수 대비 얇은 섹션의 본문만 병렬로 다시 써서 제자리에 교체
+
+        소제목 블록(감싸는 <div> 포함)과 본문 앞뒤 가장자리 태그 / [META]는 그대로 두고
+        소제목 사이 본문만 교체함 (글자가 없는 구간은 건너뜀)
+
+        Args:
+            content: 초안 원문 (후처리 전)
+            keyword: 키워드
+            target_chars: 템플릿 목표 글자수 (selected_word_count)
+            static_prompt: 본문 생성과 같은 고정 규칙 (프롬프트 캐시 접두사 재사용)
+            on_section: 보강된 섹션 미리보기 콜백 (attempt=2)
 
-        content = self._call_ai(prompt, max_tokens=max_tokens)
+        Returns:
+            보강된 원문 (소제목이 들어갔거나 태그 짝 / 대괄호 태그가 바뀐 본문은 원래 본문 유지)
+        """
+        sections = split_sections(content)
+        lengths = [self._plain_length(section.body) for section in sections]
+        per_section = target_chars / max(sum(1 for length in lengths if length), 1)
+        thin = sorted(
+            (i for i, section in enumerate(sections)
+             if 0 < lengths[i] < per_section * 0.5 and re.search(r'<[a-zA-Z]', section.body)),
+            key=lambda i: lengths[i]
+        )[:settings.expand_max_sections]
+        if not thin:
+            return content
+
+        outline = "\n".join(f"- {section.heading}" for section in sections if section.heading)
+        started = time.perf_counter()
+
+        def expand(index: int) -> str:
+            target = int(max(per_section, lengths[index] * 2))
+            prompt = SECTION_EXPAND_PROMPT.format(
+                keyword=keyword, outline=outline, target=target,
+                heading=sections[index].heading or "(서론 — 소제목 없음)", section=sections[index].body
+            )
+            with tracer.span("ai.expand", section=index, chars=lengths[index], target=target):
+                text = self._call_ai(prompt, max_tokens=self._section_max_tokens(target),
+                                     static_prompt=static_prompt)
+            text = re.sub(r'^```html\s*|\s*```$', '', text.strip(), flags=re.MULTILINE)
+            return clean_ai_response(text).strip()
 
-        # 글자수 미달 시 1회 재생성 (최소 2000자 미만이면 재시도)
-        plain_text = re.sub(r'<[^>]+>', '', content)
-        plain_text = re.sub(r'\s+', ' ', plain_text).strip()
-        if len(plain_text) < 2000:
-            logger.warning(f"Content too short ({len(plain_text)} chars), regenerating with stronger length enforcement...")
-            print(f"  ⚠️ 글자수 미달 ({len(plain_text)}자) → 재생성 중...")
-            retry_prompt = prompt + f"\n\n🚨 [긴급] 이전 응답이 {len(plain_text)}자로 심각하게 부족했습니다. 반드시 3500자 이상 작성하세요. 소제목 5개 이상, 각 섹션 400자 이상 필수!"
-            content = self._call_ai(retry_prompt, max_tokens=max_tokens)
+        with ThreadPoolExecutor(max_workers=len(thin)) as pool:
+            futures = {i: pool.submit(contextvars.copy_context().run, expand, i) for i in thin}
 
+        expanded = 0
+        for index, future in futures.items():
+            try:
+                text = future.result()
+            except Exception as e:
+                logger.warning(f"Section {index} expansion failed: {e}")
+                continue
+            if not self._valid_expansion(sections[index].body, text):
+                logger.warning(f"Section {index} expansion rejected (heading added, tags changed or not longer)")
+                continue
+            sections[index].body = text
+            expanded += 1
+            if on_section:
+                html = self._section_preview(sections[index].head + text)
+                try:
+                    on_section({
+                        "index": index,
+                        "heading": section_heading(html),
+                        "html": html,
+                        "chars": len(html),
+                        "elapsed": round(time.perf_counter() - started, 2),
+                        "attempt": 2,
+                    })
+                except Exception as e:
+                    logger.debug(f"on_section callback failed: {e}")
+
+        result = "".join(section.head + section.body + section.tail for section in sections)
+        print(f"  └─ 섹션 보강: {expanded}/{len(thin)}개 ({sum(lengths)}자 → {self._plain_length(result)}자, "
+              f"{time.perf_counter() - started:.1f}s)")
+        return result
+
+    @classmethod
+    def _valid_expansion(cls, original: str, expanded: str) -> bool:
+        """보강 결과 검증: 더 길고, 소제목 없이 태그 짝이 맞고, 원래 대괄호 태그 / IMG_CONTEXT 주석이 모두 남아 있어야 함"""
+        if cls._plain_length(expanded) <= cls._plain_length(original):
+            return False
+        if re.search(r'<h[1-6][\s>]', expanded, re.IGNORECASE) or unbalanced_tags(expanded):
+            return False
+        return all(tag in expanded for tag in SECTION_TAG_PATTERN.findall(original))
+
+    @staticmethod
+    def _strip_placeholders(content: str) -> str:
+        """placeholder 이미지 / 남은 IMAGE 태그 / IMG_CONTEXT 주석 제거"""
+        content = re.sub(r'<p[^>]*>\s*<img[^>]*src="https://via\.placeholder\.com[^"]*"[^>]*/?\s*>\s*</p>', '', content, flags=re.DOTALL)
+        content = re.sub(r'<img[^>]*src="https://via\.placeholder\.com[^"]*"[^>]*/?\s*>', '', content, flags=re.DOTALL)
+        content = re.sub(r'<!-- IMG_CONTEXT: .+? -->\s*', '', content)
+        content = re.sub(r'\[IMAGE_\d+[^\]]*\]', '', content)
+        return content
+
+    def _section_preview(self, html: str) -> str:
+        """
+        스트리밍 중 닫힌 섹션 하나의 정리·인간화 (섹션 안에서 끝나는 처리만)
+
+        대제목 제거 / 이모지 개수 제한은 글 전체 기준이고 메타 응답 패턴은 섹션을 넘어 일치할 수 있으므로
+        최종 본문은 _postprocess_content로 다시 처리함 (스트리밍 여부와 무관하게 같은 결과)
+        """
+        if html_pipeline_enabled():
+            html = PREVIEW_PIPELINE.run(html.strip()).html
+            return html if re.search(r'<[a-zA-Z]', html) else ""
+
+        html = re.sub(r'^```html\s*|\s*```$', '', html.strip(), flags=re.MULTILINE)
+        html = clean_ai_response(html)  # 첫 섹션 앞의 메타 응답 ("요청하신 내용으로 ...")
+        if not re.search(r'<[a-zA-Z]', html):
+            return ""  # HTML 없이 남은 메타 응답 조각
+        html = self._strip_placeholders(html)
+        html = clean_markdown_artifacts(clean_ai_content(html))
+        return humanize_casual(html).strip()
+
+    def _postprocess_content(self, content: str, keyword: str) -> str:
+        """생성된 본문 원문 → 발행용 HTML (코드 블록·메타 응답·대제목·placeholder 제거, AdSense 후처리, 인간화)"""
+        if not html_pipeline_enabled():
+            return self._postprocess_regex(content, keyword)
+
+        result = POSTPROCESS_PIPELINE.run(content)
+        logger.info(f"Postprocessed content: {len(content)} -> {len(result.html)} chars")
+        print("  🧑 후처리 / 인간화 완료")
+        return result.html
+
+    def _postprocess_regex(self, content: str, keyword: str) -> str:
+        """_postprocess_content의 기존 정규식 체인 (html_pipeline_enabled=False, bench.py html 비교 기준)"""
         # HTML 코드 블록 제거
         content = re.sub(r'^```html\s*', '', content, flags=re.MULTILINE)
         content = re.sub(r'\s*```$', '', content, flags=re.MULTILINE)
@@ -728,30 +1770,14 @@ class ContentGenerator:
         # Case 3: 본문 시작 blockquote (인용 형태 부제목 제거)
         content = re.sub(r'^\s*<blockquote[^>]*>\s*<p[^>]*>.*?</p>\s*</blockquote>\s*', '', content, count=1, flags=re.DOTALL)
 
-        # placeholder 이미지 제거
-        content = re.sub(r'<p[^>]*>\s*<img[^>]*src="https://via\.placeholder\.com[^"]*"[^>]*/?\s*>\s*</p>', '', content, flags=re.DOTALL)
-        content = re.sub(r'<img[^>]*src="https://via\.placeholder\.com[^"]*"[^>]*/?\s*>', '', content, flags=re.DOTALL)
-
-        # 남은 IMAGE 태그 및 IMG_CONTEXT 주석 제거
-        content = re.sub(r'<!-- IMG_CONTEXT: .+? -->\s*', '', content)
-        content = re.sub(r'\[IMAGE_\d+[^\]]*\]', '', content)
+        # placeholder 이미지, 남은 IMAGE 태그 및 IMG_CONTEXT 주석 제거
+        content = self._strip_placeholders(content)
 
         # AdSense 최적화 후처리 (금지 표현 제거, 이모지 제한)
         content = post_process_content(content)
 
         # 인간화 처리 (AI 탐지 회피)
-        content = humanize_full(content, keyword)
-
-        # 템플릿 정보 딕셔너리 반환
-        template_info_dict = {
-            "key": template_key,
-            "name": template["name"],
-            "word_count": template["selected_word_count"],
-            "image_count": template["selected_image_count"],
-            "cta_position": cta_config["position"]
-        }
-
-        return content.strip(), sources, template_info_dict
+        return humanize_full(content, keyword)
 
     def _extract_meta_description(self, content: str) -> str:
         """메타 설명 추출 (폴백: 본문 첫 문단)"""
@@ -828,7 +1854,8 @@ class ContentGenerator:
         category_name: str,
         count: int = 2,
         use_mixed: bool = True,
-        blog_analysis: dict = None
+        blog_analysis: dict = None,
+        image_queries: List[dict] = None
     ) -> str:
         """
         스마트 이미지 시스템으로 [IMAGE_N] 태그를 실제 이미지로 교체
@@ -845,6 +1872,7 @@ class ContentGenerator:
             count: 필요한 이미지 개수
             use_mixed: 혼합 이미지 시스템 사용 여부
             blog_analysis: 블로그 분석 결과 (스마트 이미지용)
+            image_queries: 글 계획의 위치별 검색어 (있으면 검색어 생성 호출 생략)
 
         Returns:
             이미지가 삽입된 HTML
@@ -852,22 +1880,24 @@ class ContentGenerator:
         images = {}
 
         try:
-            # 스마트 이미지 시스템 사용 (개선 버전)
-            if use_mixed and hasattr(self.image_fetcher, 'fetch_smart_images'):
-                logger.info(f"Fetching smart images for '{keyword}' (count: {count})")
-                images = self.image_fetcher.fetch_smart_images(
-                    content, keyword, category_name, blog_analysis
-                )
-            elif use_mixed:
-                # 기존 혼합 이미지 시스템 (폴백)
-                logger.info(f"Fetching mixed images for '{keyword}' (count: {count})")
-                images = self.image_fetcher.fetch_mixed_images(
-                    content, keyword, category_name, count
-                )
-            else:
-                # 폴백: 기존 AI 기반 Pexels만 사용
-                logger.info(f"Fetching contextual images for '{keyword}'")
-                images = self.image_fetcher.fetch_contextual_images(content, keyword)
+            with tracer.span("images.search") as attrs:
+                # 스마트 이미지 시스템 사용 (개선 버전)
+                if use_mixed and hasattr(self.image_fetcher, 'fetch_smart_images'):
+                    logger.info(f"Fetching smart images for '{keyword}' (count: {count})")
+                    images = self.image_fetcher.fetch_smart_images(
+                        content, keyword, category_name, blog_analysis, image_queries=image_queries
+                    )
+                elif use_mixed:
+                    # 기존 혼합 이미지 시스템 (폴백)
+                    logger.info(f"Fetching mixed images for '{keyword}' (count: {count})")
+                    images = self.image_fetcher.fetch_mixed_images(
+                        content, keyword, category_name, count
+                    )
+                else:
+                    # 폴백: 기존 AI 기반 Pexels만 사용
+                    logger.info(f"Fetching contextual images for '{keyword}'")
+                    images = self.image_fetcher.fetch_contextual_images(content, keyword)
+                attrs["found"] = len(images or {})
         except Exception as e:
             logger.error(f"Image fetching failed for '{keyword}': {e}")
             # 이미지 가져오기 실패해도 글 발행은 계속 진행
@@ -875,10 +1905,8 @@ class ContentGenerator:
 
         if not images:
             logger.warning(f"No images found for {keyword}, continuing without images")
-            # 이미지 태그 및 IMG_CONTEXT 주석 제거 (확장 패턴: 콜론 포함)
-            content = re.sub(r'<!-- IMG_CONTEXT: .+? -->\s*', '', content)
-            content = re.sub(r'\[IMAGE_\d+[^\]]*\]', '', content)  # [IMAGE_N: 설명] 포함
-            return content
+            # 이미지 태그 및 IMG_CONTEXT 주석 제거 ([IMAGE_N: 설명] 포함)
+            return self._splice_images(content, [])
 
         # WP 미디어 업로드용 퍼블리셔 (핫링크 방지)
         wp_publisher = None
@@ -888,7 +1916,8 @@ class ContentGenerator:
         except Exception as e:
             logger.warning(f"WP publisher init failed, using hotlink: {e}")
 
-        # 각 이미지 태그를 실제 이미지로 교체
+        # 각 이미지 태그의 figure HTML 준비 (본문 교체는 마지막에 한 번에)
+        figures = []
         for tag, img_data in images.items():
             # URL 유효성 확인
             if not img_data.get('url') or not img_data['url'].startswith('http'):
@@ -937,42 +1966,94 @@ class ContentGenerator:
     </figcaption>
 </figure>
 '''
-            # tag에서 숫자 추출 (IMAGE_1 -> 1)
-            tag_num = tag.replace("IMAGE_", "")
+            figures.append((tag, img_html, img_data.get('search_query', '')))
+
+        return self._splice_images(content, figures)
+
+    @staticmethod
+    def _splice_images(content: str, figures: List[tuple]) -> str:
+        """
+        이미지 figure를 본문에 한 번에 삽입하고 남은 [IMAGE_N] / IMG_CONTEXT 주석 제거
 
-            # 패턴 1: IMG_CONTEXT 주석 + 이미지 태그 (콜론 포함)
-            pattern1 = rf'<!-- IMG_CONTEXT: .+? -->\s*\[IMAGE_{tag_num}[^\]]*\]'
+        위치는 본문을 한 번 훑어 색인하고, 조각 목록으로 한 번만 다시 조립:
+        1. IMG_CONTEXT 주석 + [IMAGE_N] → figure (주석 포함 교체)
+        2. [IMAGE_N]만 있음 → figure
+        3. 태그 없음 → N번째 </h2|3> (없으면 마지막) 뒤 첫 </p> 다음, 문단이 없으면 소제목 바로 뒤
+           (같은 위치에 여러 개면 나중 것이 앞 — 기존 순차 삽입과 같은 순서)
 
-            # 패턴 2: 이미지 태그만 (콜론 포함) - [IMAGE_1: 설명] 또는 [IMAGE_1]
-            pattern2 = rf'\[IMAGE_{tag_num}[^\]]*\]'
+        Args:
+            content: HTML 본문
+            figures: (태그, figure HTML, 검색어) 목록 (삽입 순서)
 
-            if re.search(pattern1, content):
-                content = re.sub(pattern1, img_html, content, count=1)
-                logger.info(f"Inserted {tag} (with context): {img_data['search_query']}")
-            elif re.search(pattern2, content):
-                content = re.sub(pattern2, img_html, content, count=1)
-                logger.info(f"Inserted {tag} (tag only): {img_data['search_query']}")
+        Returns:
+            이미지가 삽입된 HTML
+        """
+        slots = {}  # 태그 → 교체할 일치 (주석 포함 일치 우선)
+        removals = []  # 교체되지 않으면 지울 일치 ([IMAGE_N] / 짝 없는 주석)
+        headers = []  # </h2|3> 끝 위치
+        paragraphs = []  # </p> 시작 위치
+        for match in IMAGE_SLOT_PATTERN.finditer(content):
+            tag = match.group("context_tag") or match.group("tag")
+            if tag:
+                removals.append(match)
+                if tag not in slots or (match.group("context") and not slots[tag].group("context")):
+                    slots[tag] = match
+            elif match.group("context"):
+                removals.append(match)
+            elif match.group("header"):
+                headers.append(match.end())
             else:
-                logger.warning(f"Tag {tag} not found in content, inserting at section break")
-                # 태그가 없으면 적절한 h3/h2 헤더 뒤에 삽입
-                headers = list(re.finditer(r'</h[23]>', content))
-                tag_idx = int(tag_num) if tag_num.isdigit() else 1
-                # tag_idx번째 헤더 뒤에 삽입 (없으면 마지막 헤더 뒤)
-                if headers:
-                    insert_after = min(tag_idx, len(headers)) - 1
-                    pos = headers[insert_after].end()
-                    # 바로 뒤에 <p> 있으면 그 문단 뒤에 삽입
-                    next_p = re.search(r'</p>', content[pos:])
-                    if next_p:
-                        pos = pos + next_p.end()
-                    content = content[:pos] + img_html + content[pos:]
-                    logger.info(f"Force-inserted {tag} after header #{insert_after+1}")
-
-        # 남은 IMG_CONTEXT 주석 및 이미지 태그 제거 (확장 패턴)
-        content = re.sub(r'<!-- IMG_CONTEXT: .+? -->\s*', '', content)
-        content = re.sub(r'\[IMAGE_\d+[^\]]*\]', '', content)  # [IMAGE_N: 설명] 포함
+                paragraphs.append(match.start())
+
+        replaced = {}  # 일치 시작 위치 → figure HTML
+        inserts = {}  # 삽입 위치 → figure HTML 목록
+        for tag, img_html, query in figures:
+            match = slots.get(tag)
+            if match is not None:
+                replaced[match.start()] = img_html
+                kind = "with context" if match.group("context") else "tag only"
+                logger.info(f"Inserted {tag} ({kind}): {query}")
+                continue
 
-        return content
+            logger.warning(f"Tag {tag} not found in content, inserting at section break")
+            # 태그가 없으면 적절한 h3/h2 헤더 뒤에 삽입
+            if not headers:
+                continue
+            tag_num = tag.replace("IMAGE_", "")
+            tag_idx = int(tag_num) if tag_num.isdigit() else 1
+            # tag_idx번째 헤더 뒤에 삽입 (없으면 마지막 헤더 뒤)
+            insert_after = min(tag_idx, len(headers)) - 1
+            pos = headers[insert_after]
+            # 바로 뒤에 <p> 있으면 그 문단 뒤에 삽입
+            next_p = bisect.bisect_left(paragraphs, pos)
+            if next_p < len(paragraphs):
+                pos = paragraphs[next_p] + len("</p>")
+            inserts.setdefault(pos, []).insert(0, img_html)
+            logger.info(f"Force-inserted {tag} after header #{insert_after + 1}")
+
+        # (시작, 끝, 넣을 HTML, 짝 없는 주석) — 같은 위치면 삽입이 교체 / 제거보다 앞
+        edits = [(pos, pos, "".join(html_list), False) for pos, html_list in inserts.items()]
+        edits += [
+            (match.start(), match.end(), replaced.get(match.start(), ""),
+             bool(match.group("context")) and not match.group("context_tag"))
+            for match in removals
+        ]
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+
+        fragments = []
+        cursor = 0
+        trim = False  # 지운 주석 뒤 공백 제거 (삽입한 figure 앞 줄바꿈 포함, 남은 [IMAGE_N] 전까지)
+        for start, end, html, orphan in edits:
+            for piece in (content[cursor:start], html):
+                if trim and piece:
+                    piece = piece.lstrip()
+                    trim = not piece
+                fragments.append(piece)
+            if not html and start != end:
+                trim = orphan
+            cursor = end
+        fragments.append(content[cursor:].lstrip() if trim else content[cursor:])
+        return "".join(fragments)
 
     def insert_official_link(self, content: str, keyword: str) -> str:
         """[OFFICIAL_LINK] 태그를 카드형 공식 사이트 링크로 교체"""
@@ -1185,6 +2266,36 @@ class ContentGenerator:
         else:
             return "paragraph"
 
+    def _finalize_content(self, content: str) -> Tuple[str, List[Section]]:
+        """
+        삽입 후 남은 태그 정리 + 섹션 분리 (clean_meta_tags → parse_content_to_sections)
+
+        Returns:
+            (정리된 본문, 섹션 목록)
+        """
+        if not html_pipeline_enabled():
+            content = self.clean_meta_tags(content)
+            return content, self.parse_content_to_sections(content)
+
+        result = FINALIZE_PIPELINE.run(content)
+        if result.section_matches:
+            sections = [
+                Section(
+                    id=f"section-{uuid.uuid4().hex[:8]}",
+                    index=index,
+                    type=self._detect_section_type(html),
+                    html=html
+                )
+                for index, html in enumerate(result.sections)
+            ]
+        elif result.html:
+            # 블록 태그가 없으면 전체를 하나의 섹션으로
+            sections = [Section(id=f"section-{uuid.uuid4().hex[:8]}", index=0, type="paragraph", html=result.html)]
+        else:
+            sections = []
+        logger.info(f"Parsed {len(sections)} sections from content")
+        return result.html, sections
+
     def parse_content_to_sections(self, html: str) -> List[Section]:
         """
         HTML 콘텐츠를 섹션 배열로 분리
@@ -1230,25 +2341,152 @@ class ContentGenerator:
         logger.info(f"Parsed {len(sections)} sections from content")
         return sections
 
+    def _build_research_stages(
+        self,
+        keyword: str,
+        category_name: str,
+        is_evergreen: bool,
+        is_person: bool,
+        custom_context: str,
+        web_search_categories: List[str],
+        plan_mode: bool = False
+    ) -> List[Stage]:
+        """
+        generate_full_post 리서치 단계 그래프 구성
+
+        plan_mode면 제목 단계를 빼고 블로그 AI 요약도 생략 (글 계획 호출이 대신함)
+
+        Returns:
+            Stage 리스트 (출력: trend_context, web_data, blog_analysis, blog_detailed,
+            enhanced_prompt, performance_rec, related_keywords, title)
+        """
+        def trend_stage():
+            if custom_context:
+                # 직접 작성 모드: 사용자 입력을 트렌드 맥락으로 사용
+                return f"""
+[작성 방향 - 사용자 요청]
+{custom_context}
+
+중요: 위 작성 방향에 맞춰서 글을 작성해주세요.
+사용자가 요청한 톤, 스타일, 포함할 내용을 반드시 반영하세요.
+"""
+            if category_name == "트렌드" or not is_evergreen:
+                return self.get_trend_context(keyword)
+            return ""
+
+        def web_search_stage():
+            if category_name in web_search_categories:
+                return self.perform_web_search(keyword)
+            return {"sources": [], "content": ""}
+
+        def blog_reference_stage():
+            from crawlers.blog_reference import BlogReferenceCrawler
+            blog_ref = BlogReferenceCrawler()
+            # 요약 문자열 + 상세 분석 (키워드 커버리지 체크용)을 한 번의 크롤링으로
+            # (main.process_keyword에서 이미 분석했다면 리서치 메모에서 재사용)
+            return blog_ref.get_reference_bundle(keyword, count=5, summarize=not plan_mode)
+
+        def enhanced_prompt_stage():
+            try:
+                from utils.performance_tracker import get_enhanced_prompt_injection
+                return get_enhanced_prompt_injection(category_name), "enhanced"
+            except Exception as e:
+                logger.warning(f"Enhanced prompt injection failed: {e}")
+                # 폴백: 기존 blog_learner만 사용
+                try:
+                    from utils.blog_learner import BlogLearner
+                    return BlogLearner().get_prompt_injection(category_name), "fallback"
+                except Exception as e2:
+                    logger.warning(f"Blog learner fallback failed: {e2}")
+                    return "", ""
+
+        def performance_stage():
+            try:
+                from utils.performance_learner import performance_learner
+                return performance_learner.get_content_recommendations(category_name)
+            except Exception as e:
+                logger.debug(f"Performance learner not available: {e}")
+                return None
+
+        def related_keywords_stage():
+            from crawlers.naver_related import expand_keywords
+            return expand_keywords(keyword)
+
+        def title_stage(web_data, related_keywords):
+            # 인물 키워드면 뉴스 데이터 전달하여 팩트 기반 제목 생성
+            web_content_for_title = web_data.get("content", "")[:800] if web_data else ""
+            return self.generate_title(
+                keyword,
+                news_data=web_content_for_title,
+                is_person=is_person,
+                related_keywords=related_keywords
+            )
+
+        stages = [
+            Stage("trend_context", trend_stage, outputs=["trend_context"],
+                  defaults={"trend_context": ""}),
+            Stage("web_search", web_search_stage, outputs=["web_data"],
+                  defaults={"web_data": {"sources": [], "content": ""}}),
+            Stage("blog_reference", blog_reference_stage, outputs=["blog_analysis", "blog_detailed"],
+                  defaults={"blog_analysis": "", "blog_detailed": None}),
+            Stage("enhanced_prompt", enhanced_prompt_stage, outputs=["enhanced_prompt"],
+                  defaults={"enhanced_prompt": ("", "")}),
+            Stage("performance", performance_stage, outputs=["performance_rec"],
+                  defaults={"performance_rec": None}),
+            Stage("related_keywords", related_keywords_stage, outputs=["related_keywords"],
+                  defaults={"related_keywords": {"autocomplete": [], "related": []}}),
+        ]
+        if not plan_mode:
+            stages.append(Stage("title", title_stage, inputs=["web_data", "related_keywords"], outputs=["title"],
+                                defaults={"title": ""}))
+        return stages
+
     def generate_full_post(
         self,
         keyword: str,
         news_data: str = "",
         custom_context: str = None,
-        force_category: str = None
+        force_category: str = None,
+        on_section: Callable[[dict], None] = None
     ) -> GeneratedPost:
         """
         카테고리별 전체 블로그 포스트 생성
 
+        여러 스레드가 같은 인스턴스로 동시에 호출할 수 있음 (main.py --workers).
+        이미지 중복 방지 목록은 동시에 생성 중인 글이 없을 때만 초기화하여
+        병렬 생성 중인 글끼리도 같은 이미지를 쓰지 않도록 함.
+
         Args:
             keyword: 키워드
             news_data: 뉴스 요약 데이터
             custom_context: 사용자 지정 작성 방향 (직접 작성 모드)
             force_category: 강제 카테고리 지정 (직접 작성 모드)
+            on_section: 본문 스트리밍 생성 시 섹션 콜백 (generate_content_with_template 참고)
 
         Returns:
             GeneratedPost 객체
         """
+        with self._active_lock:
+            if self._active_posts == 0:
+                # 이미지 중복 방지 초기화
+                self.image_fetcher.reset_used_images()
+            self._active_posts += 1
+        try:
+            with tracer.span("generate_full_post", keyword=keyword), llm_usage.post(keyword):
+                return self._generate_full_post(keyword, news_data, custom_context, force_category, on_section)
+        finally:
+            with self._active_lock:
+                self._active_posts -= 1
+
+    def _generate_full_post(
+        self,
+        keyword: str,
+        news_data: str,
+        custom_context: str,
+        force_category: str,
+        on_section: Callable[[dict], None] = None
+    ) -> GeneratedPost:
+        """generate_full_post 본체"""
         print("\n" + "=" * 60)
         print("📝 블로그 글 생성 프로세스 시작")
         if custom_context:
@@ -1268,31 +2506,43 @@ class ContentGenerator:
                 category_config = {"template": "trend", "requires_coupang": False}
             print(f"  └─ 카테고리: {category_name} (사용자 지정)")
         else:
-            category_name, category_config = self.classify_category(keyword)
+            with tracer.span("classify"):
+                category_name, category_config = self.classify_category(keyword)
             print(f"  └─ 카테고리: {category_name}")
 
         template_name = category_config.get("template", "trend")
+        llm_usage.annotate(category=category_name)
         is_evergreen = self.is_evergreen_keyword(keyword)
         print(f"  └─ 에버그린: {'✅ Yes' if is_evergreen else '❌ No'}")
         print(f"  └─ 템플릿: {template_name}")
 
+        # Step 1.5 ~ 3: 리서치 단계 (의존성 그래프로 동시 실행)
+        # 트렌드 맥락 / 웹검색 / 블로그 참조 / 강화 프롬프트 / 성과 추천 / 연관 키워드는
+        # 서로 독립적이고, 제목 생성만 웹검색(인물 키워드)과 연관 키워드에 의존
+        web_search_categories = ["트렌드", "연예", "생활정보", "재테크", "건강", "IT/테크", "취업교육"]
+        is_person = is_person_keyword(keyword)
+        # 제목 / 블로그 요약 / 이미지 검색어는 본문 직전 글 계획 호출 1회로 (인물 키워드는 뉴스 기반 제목 유지)
+        plan_mode = settings.post_plan_enabled and not is_person
+
+        graph = StageGraph(
+            self._build_research_stages(keyword, category_name, is_evergreen, is_person,
+                                        custom_context, web_search_categories, plan_mode=plan_mode),
+            max_workers=settings.research_stage_workers,
+            span_prefix="research",
+        )
+        print(f"\n[Step 1.5~3/8] 리서치 단계 동시 실행 (트렌드 맥락 · 웹검색 · 블로그 참조 · 학습 데이터 · 제목)")
+        with tracer.span("research"):
+            research = graph.run()
+        print(f"  └─ 단계별 소요: {graph.format_timings()}")
+        self.last_stage_timings = dict(graph.timings)
+
         # Step 1.5: 트렌드 맥락 수집 또는 사용자 지정 맥락 사용
         print(f"\n[Step 1.5/8] 트렌드 맥락 수집")
-        trend_context = ""
-
+        trend_context = research["trend_context"] or ""
         if custom_context:
-            # 직접 작성 모드: 사용자 입력을 트렌드 맥락으로 사용
-            trend_context = f"""
-[작성 방향 - 사용자 요청]
-{custom_context}
-
-중요: 위 작성 방향에 맞춰서 글을 작성해주세요.
-사용자가 요청한 톤, 스타일, 포함할 내용을 반드시 반영하세요.
-"""
             print(f"  ✅ 사용자 지정 작성 방향 적용")
             print(f"     {custom_context[:80]}...")
         elif category_name == "트렌드" or not is_evergreen:
-            trend_context = self.get_trend_context(keyword)
             if trend_context:
                 print(f"  ✅ 트렌드 맥락 수집 완료 (뉴스 기반)")
             else:
@@ -1300,28 +2550,20 @@ class ContentGenerator:
         else:
             print(f"  ℹ️ 에버그린 키워드 - 트렌드 맥락 스킵")
 
-        # 이미지 중복 방지 초기화
-        self.image_fetcher.reset_used_images()
-
         # Step 2: 웹검색 (트렌드 + 에버그린 카테고리 모두 적용)
         print(f"\n[Step 2/8] 웹검색 실행")
-
-        # 웹 검색 적용 카테고리 (트렌드 + 에버그린)
-        web_search_categories = ["트렌드", "연예", "생활정보", "재테크", "건강", "IT/테크", "취업교육"]
+        web_data = research["web_data"] or {"sources": [], "content": ""}
 
         if category_name in web_search_categories:
             print(f"  🔍 웹 검색 수행: {keyword} (카테고리: {category_name})")
-            web_data = self.perform_web_search(keyword)
-
-            if web_data and web_data.get("content"):
+            if web_data.get("content"):
                 print(f"  ✅ 웹 검색 정보 취합 완료 ({len(web_data.get('content', ''))}자)")
             else:
                 print(f"  ⚠️ 웹 검색 결과 없음, AI 기본 지식으로 작성")
         else:
             print(f"  ℹ️ 웹 검색 스킵 (카테고리: {category_name})")
-            web_data = {"sources": [], "content": ""}
 
-        sources = web_data.get("sources", []) if web_data else []
+        sources = web_data.get("sources", [])
         if sources:
             print(f"  └─ 검색 결과: {len(sources)}개 출처")
             for src in sources[:3]:
@@ -1331,89 +2573,73 @@ class ContentGenerator:
 
         # Step 2.5a: 블로그 참조 분석 (강화: 5개 블로그, 상세 분석)
         print(f"\n[Step 2.5a/8] 블로그 참조 분석 (강화)")
-        blog_analysis = ""
-        blog_detailed = None  # 상세 분석 결과 (품질 점수용)
+        blog_analysis = research["blog_analysis"] or ""
+        blog_detailed = research["blog_detailed"]  # 상세 분석 결과 (품질 점수용)
+        extra_context = []  # 본문 프롬프트 참고 자료 블록 (트렌드 맥락 / 웹검색 외)
         reference_keywords = []  # 참조 키워드 (품질 점수용)
-        try:
-            from crawlers.blog_reference import BlogReferenceCrawler
-            blog_ref = BlogReferenceCrawler()
-            blog_analysis = blog_ref.get_blog_analysis(keyword, count=5)
-            # 상세 분석도 가져오기 (키워드 커버리지 체크용)
-            blog_detailed = blog_ref.get_detailed_analysis(keyword, count=5)
+        if "blog_reference" in graph.errors:
+            print(f"  ⚠️ 블로그 참조 실패: {graph.errors['blog_reference']}")
+        else:
             if blog_detailed and blog_detailed.get("common_patterns"):
                 reference_keywords = blog_detailed["common_patterns"].get("common_keywords", [])[:15]
                 print(f"  ✅ 블로그 참조 분석 완료 ({len(blog_detailed.get('blogs', []))}개 분석)")
                 print(f"  └─ 공통 키워드: {', '.join(reference_keywords[:8])}")
             if blog_analysis:
-                # trend_context에 블로그 분석 추가
-                if not trend_context:
-                    trend_context = ""
-                trend_context += f"\n\n[참고 블로그 구조 분석 — 반드시 반영!]\n{blog_analysis}\n\n위 인기 블로그의 소제목 흐름, 정보 배치 순서, 핵심 키워드를 최대한 유사하게 반영하세요. 특히:\n- 소제목 개수와 흐름을 비슷하게 구성\n- 인기 블로그에서 다루는 핵심 키워드를 빠짐없이 포함\n- 글 톤과 구성 방식(목록형/설명형/비교형)을 참고"
+                # 본문 참고 자료에 블로그 분석 추가 (예산 부족 시 웹검색보다 먼저 축소)
+                extra_context.append(ContextBlock(
+                    "blog_analysis", blog_analysis, priority=3, age_hours=24, min_tokens=300,
+                    title="[참고 블로그 구조 분석 — 반드시 반영!]",
+                    note="\n위 인기 블로그의 소제목 흐름, 정보 배치 순서, 핵심 키워드를 최대한 유사하게 반영하세요. 특히:\n- 소제목 개수와 흐름을 비슷하게 구성\n- 인기 블로그에서 다루는 핵심 키워드를 빠짐없이 포함\n- 글 톤과 구성 방식(목록형/설명형/비교형)을 참고"
+                ))
             else:
                 print(f"  ⚠️ 블로그 참조 결과 없음")
-        except Exception as e:
-            logger.warning(f"Blog reference failed: {e}")
-            print(f"  ⚠️ 블로그 참조 실패: {e}")
 
         # Step 2.5b: 블로그 학습 + 성과 데이터 기반 강화 프롬프트 주입
-        try:
-            from utils.performance_tracker import get_enhanced_prompt_injection
-            enhanced_prompt = get_enhanced_prompt_injection(category_name)
-            if enhanced_prompt:
-                if not trend_context:
-                    trend_context = ""
-                trend_context += enhanced_prompt
+        enhanced_prompt, enhanced_source = research["enhanced_prompt"] or ("", "")
+        if enhanced_prompt:
+            extra_context.append(ContextBlock(
+                "learned_patterns", enhanced_prompt, priority=4, age_hours=24 * 7, min_tokens=150
+            ))
+            if enhanced_source == "fallback":
+                print(f"  📚 학습 DB 패턴 주입: {category_name} (폴백)")
+            else:
                 print(f"  📚 강화 프롬프트 주입: {category_name} (학습DB + 성과데이터)")
-        except Exception as e:
-            logger.warning(f"Enhanced prompt injection failed: {e}")
-            # 폴백: 기존 blog_learner만 사용
-            try:
-                from utils.blog_learner import BlogLearner
-                blog_learner = BlogLearner()
-                learned_prompt = blog_learner.get_prompt_injection(category_name)
-                if learned_prompt:
-                    if not trend_context:
-                        trend_context = ""
-                    trend_context += learned_prompt
-                    print(f"  📚 학습 DB 패턴 주입: {category_name} (폴백)")
-            except Exception as e2:
-                logger.warning(f"Blog learner fallback failed: {e2}")
 
         # Step 2.5c: 성과 학습 — 과거 데이터 기반 콘텐츠 추천
-        performance_rec = None
-        try:
-            from utils.performance_learner import performance_learner
-            performance_rec = performance_learner.get_content_recommendations(category_name)
-            if performance_rec and performance_rec.get("based_on") == "performance_data":
-                print(f"\n  📊 성과 학습 추천: 글자수 {performance_rec['recommended_char_count']}, "
-                      f"이미지 {performance_rec['recommended_image_count']}개, "
-                      f"소제목 {performance_rec['recommended_heading_count']}개")
-                # 성과 데이터를 트렌드 컨텍스트에 반영
-                if not trend_context:
-                    trend_context = ""
-                trend_context += (
-                    f"\n\n[성과 학습 데이터 — 참고]\n"
-                    f"이 카테고리({category_name})의 고성과 글 평균: "
-                    f"글자수 약 {performance_rec['recommended_char_count']}자, "
-                    f"이미지 {performance_rec['recommended_image_count']}개, "
-                    f"소제목 {performance_rec['recommended_heading_count']}개. "
-                    f"이 수치를 참고하여 구성하세요."
-                )
-        except Exception as e:
-            logger.debug(f"Performance learner not available: {e}")
-
-        # Step 2.5b: 인물 키워드 감지 (제목 생성 전에 필요)
-        is_person = is_person_keyword(keyword)
+        performance_rec = research["performance_rec"]
+        if performance_rec and performance_rec.get("based_on") == "performance_data":
+            print(f"\n  📊 성과 학습 추천: 글자수 {performance_rec['recommended_char_count']}, "
+                  f"이미지 {performance_rec['recommended_image_count']}개, "
+                  f"소제목 {performance_rec['recommended_heading_count']}개")
+            # 성과 데이터를 본문 참고 자료에 반영
+            extra_context.append(ContextBlock(
+                "performance",
+                f"이 카테고리({category_name})의 고성과 글 평균: "
+                f"글자수 약 {performance_rec['recommended_char_count']}자, "
+                f"이미지 {performance_rec['recommended_image_count']}개, "
+                f"소제목 {performance_rec['recommended_heading_count']}개. "
+                f"이 수치를 참고하여 구성하세요.",
+                priority=3, age_hours=24 * 7, min_tokens=20,
+                title="[성과 학습 데이터 — 참고]"
+            ))
+
+        # 인물 키워드 감지 (제목 생성 단계에서 사용됨)
         if is_person:
             print(f"\n  👤 인물 키워드 감지: {keyword}")
 
         # Step 3: 제목 생성
         print(f"\n[Step 3/8] 제목 생성")
-        print(f"  └─ Claude API 호출 중...")
-        # 인물 키워드면 뉴스 데이터 전달하여 팩트 기반 제목 생성
-        web_content_for_title = web_data.get("content", "")[:800] if web_data else ""
-        title = self.generate_title(keyword, news_data=web_content_for_title, is_person=is_person)
-        print(f"  └─ 생성된 제목: {title}")
+        title = research.get("title") or ""
+        if plan_mode:
+            print(f"  └─ 본문 직전 글 계획에서 함께 생성")
+        elif not title:
+            # 제목 단계 실패 시 순차 재시도 (제목 없이는 발행 불가)
+            print(f"  └─ 제목 단계 실패, 재시도 중...")
+            web_content_for_title = web_data.get("content", "")[:800]
+            with tracer.span("title_retry"):
+                title = self.generate_title(keyword, news_data=web_content_for_title, is_person=is_person)
+        if title:
+            print(f"  └─ 생성된 제목: {title}")
 
         # Step 4: 본문 생성 (템플릿 다양화 시스템 + 트렌드 맥락)
         print(f"\n[Step 4/8] 본문 생성 (템플릿 다양화)")
@@ -1421,20 +2647,34 @@ class ContentGenerator:
         if trend_context:
             print(f"  └─ 트렌드 맥락: 포함")
         print(f"  └─ Claude API 호출 중...")
-        content, content_sources, template_info = self.generate_content_with_template(
-            keyword, news_data, template_name,
-            category_name=category_name,
-            is_evergreen=is_evergreen,
-            web_data=web_data,
-            trend_context=trend_context  # 트렌드 맥락 추가
-        )
+        with tracer.span("content", template=template_name):
+            content, content_sources, template_info = self.generate_content_with_template(
+                keyword, news_data, template_name,
+                category_name=category_name,
+                is_evergreen=is_evergreen,
+                web_data=web_data,
+                trend_context=trend_context,  # 트렌드 맥락 추가
+                related_keywords=research["related_keywords"],
+                on_section=on_section,
+                extra_context=extra_context
+            )
         print(f"  └─ 생성 완료: {len(content)} chars")
         print(f"  └─ 사용된 템플릿: {template_info['name']} ({template_info['key']})")
         print(f"  └─ 목표 글자수: {template_info['word_count']}자, 이미지: {template_info['image_count']}개")
         sources = content_sources if content_sources else sources
 
-        # Step 5: 메타 설명 추출
-        excerpt = self._extract_meta_description(content)
+        plan = template_info.get("plan")
+        if plan_mode:
+            title = plan.title if plan else ""
+            if not title:
+                # 글 계획 실패 / 쓸 만한 제목 후보 없음 → 기존 제목 호출
+                print(f"  └─ 글 계획 제목 없음, 제목 별도 생성 중...")
+                with tracer.span("title_retry"):
+                    title = self.generate_title(keyword, related_keywords=research["related_keywords"])
+            print(f"  └─ 제목: {title}")
+
+        # Step 5: 메타 설명 추출 (본문 [META] → 글 계획 메타 순)
+        excerpt = self._extract_meta_description(content) or (plan.meta if plan else "")
         if not excerpt:
             excerpt = f"{keyword}에 대한 완벽 가이드! 핵심 정보부터 실전 팁까지 한 번에 알아보세요."[:160]
 
@@ -1443,12 +2683,15 @@ class ContentGenerator:
 
         # 이미지 삽입 (템플릿에서 지정한 이미지 개수 사용)
         image_count = template_info.get('image_count', 4)
-        content = self.insert_images(content, keyword, category_name, image_count)
+        with tracer.span("images", count=image_count):
+            content = self.insert_images(content, keyword, category_name, image_count,
+                                         image_queries=plan.image_keywords(image_count) if plan else None)
         print(f"  └─ 이미지 삽입 완료")
 
         # 관련 사이트 링크 자동 삽입 (카테고리 상관없이 항상)
         print("  🔗 관련 사이트 링크 삽입 중...")
-        content = insert_related_links(content, keyword)
+        with tracer.span("related_links"):
+            content = insert_related_links(content, keyword)
         print("  ✅ 링크 삽입 완료")
 
         # 건강 면책문구 삽입
@@ -1460,9 +2703,10 @@ class ContentGenerator:
 
         # Step 6: 쿠팡 처리
         print(f"\n[Step 6/8] 쿠팡 처리")
-        content, has_coupang = self.insert_coupang_products(
-            content, keyword, category_config, category_name
-        )
+        with tracer.span("coupang"):
+            content, has_coupang = self.insert_coupang_products(
+                content, keyword, category_config, category_name
+            )
         print(f"  └─ 쿠팡 삽입: {'✅ Yes' if has_coupang else '❌ No'}")
 
         # 파트너스 문구 삽입
@@ -1471,12 +2715,9 @@ class ContentGenerator:
         # 카테고리 뱃지 삽입 — 비활성화 (WP 테마에서 이미 표시)
         # content = self.insert_category_badge(content, category_name)
 
-        # 정리
-        content = self.clean_meta_tags(content)
-
-        # Step 7: 섹션 분리
+        # 정리 + Step 7: 섹션 분리
         print(f"\n[Step 7/8] 섹션 분리")
-        sections = self.parse_content_to_sections(content)
+        content, sections = self._finalize_content(content)
         print(f"  └─ 섹션 수: {len(sections)}개")
         for s in sections[:5]:  # 처음 5개만 표시
             text_preview = re.sub(r'<[^>]+>', '', s.html)[:30].strip()
@@ -1499,12 +2740,13 @@ class ContentGenerator:
         quality_result = None
         try:
             from utils.quality_scorer import score_generated_content
-            quality_result = score_generated_content(
-                content=content,
-                keyword=keyword,
-                title=title,
-                reference_keywords=reference_keywords if reference_keywords else None
-            )
+            with tracer.span("quality_score"):
+                quality_result = score_generated_content(
+                    content=content,
+                    keyword=keyword,
+                    title=title,
+                    reference_keywords=reference_keywords if reference_keywords else None
+                )
             print(f"\n  📊 품질 점수: {quality_result.total_score:.1f}/100")
             print(f"     - 글자수: {quality_result.length_score:.0f}/25 ({quality_result.char_count}자)")
             print(f"     - 소제목: {quality_result.heading_score:.0f}/25 ({quality_result.heading_count}개)")
@@ -0,0 +1,209 @@
+"""토큰 예산 기반 참고 자료 조립기
+
+본문 프롬프트의 참고 자료(트렌드 맥락, 웹검색, 뉴스, 블로그 분석, 학습/성과 데이터, 연관 키워드)를
+블록 단위로 받아 입력 토큰 예산 안에 맞춰 조립:
+- 블록별 토큰 추정 (한글 음절 / 그 외 문자 비율 기반 근사치 — 실제 토크나이저보다 약간 크게 잡음)
+- 우선순위(낮을수록 중요) → 신선도(age_hours 작을수록 먼저) 순으로 예산 배정
+  (뒤 블록의 min_tokens만큼은 미리 남겨 두어 앞 블록이 예산을 전부 쓰지 않도록)
+- 먼저 배정된 블록에 이미 있는 문장은 뒤 블록에서 제거 (뉴스 요약 ↔ 웹검색 중복 등)
+- 예산이 부족하면 문장 단위로 앞부분만 남기고, min_tokens도 안 남으면 블록 제외
+- 출력은 추가한 순서 그대로 (프롬프트 구성 유지)
+"""
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+HANGUL = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+NON_WORD = re.compile(r'[\W_]+')
+
+# 중복 판정에 쓰지 않는 짧은 문장 (소제목, 목록 머리 등 정규화 후 글자 수)
+MIN_DEDUPE_CHARS = 12
+# 문장부호 없이 긴 줄(크롤링 본문 등)은 공백 기준으로 이 크기 이하 조각으로 나눠 축소 단위로 사용
+MAX_UNIT_TOKENS = 120
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 근사치 (네트워크 호출 없이)
+
+    한글 음절은 약 1토큰, 그 외(영문/숫자/기호/공백)는 약 3.5자당 1토큰으로 계산
+    """
+    if not text:
+        return 0
+    hangul = len(HANGUL.findall(text))
+    return math.ceil(hangul + (len(text) - hangul) / 3.5)
+
+
+def _normalize(sentence: str) -> str:
+    return NON_WORD.sub("", sentence).lower()
+
+
+@dataclass
+class ContextBlock:
+    """참고 자료 한 덩어리"""
+    name: str                 # 리포트/로그용 이름
+    text: str
+    priority: int = 2         # 0: 절대 자르지 않음, 낮을수록 먼저 예산 배정
+    age_hours: float = 0.0    # 같은 우선순위 안에서 신선한 블록 먼저
+    title: str = ""           # 블록 머리말 (예: "[웹검색 결과 ...]")
+    note: str = ""            # 블록이 남을 때만 붙는 지시문
+    min_tokens: int = 60      # 이보다 적게 남길 수밖에 없으면 블록 제외
+
+    def render(self, text: str = None) -> str:
+        body = self.text if text is None else text
+        parts = [self.title, body.strip("\n"), self.note]
+        return "\n".join(p for p in parts if p)
+
+
+@dataclass
+class _Unit:
+    line: int
+    text: str
+    tokens: int
+
+
+class ContextAssembler:
+    """블록 목록 → 예산 안의 참고 자료 문자열"""
+
+    def __init__(self, blocks: List[ContextBlock] = None):
+        self.blocks: List[ContextBlock] = [b for b in (blocks or []) if b.text and b.text.strip()]
+        self.report: List[Dict] = []  # 마지막 assemble() 결과 (블록별 원래/남은 토큰, 상태)
+
+    def add(self, block: ContextBlock):
+        if block.text and block.text.strip():
+            self.blocks.append(block)
+
+    @staticmethod
+    def _units(text: str) -> List[_Unit]:
+        units = []
+        for line_no, line in enumerate(text.strip("\n").split("\n")):
+            sentences = SENTENCE_END.split(line) if line.strip() else [line]
+            for sentence in sentences:
+                tokens = estimate_tokens(sentence)
+                if tokens <= MAX_UNIT_TOKENS:
+                    units.append(_Unit(line_no, sentence, tokens + 1))
+                    continue
+                piece: List[str] = []
+                piece_tokens = 0
+                for word in sentence.split(" "):
+                    word_tokens = estimate_tokens(word) + 1
+                    if piece and piece_tokens + word_tokens > MAX_UNIT_TOKENS:
+                        units.append(_Unit(line_no, " ".join(piece), piece_tokens))
+                        piece, piece_tokens = [], 0
+                    piece.append(word)
+                    piece_tokens += word_tokens
+                if piece:
+                    units.append(_Unit(line_no, " ".join(piece), piece_tokens))
+        return units
+
+    @staticmethod
+    def _join(units: List[_Unit]) -> str:
+        lines: Dict[int, List[str]] = {}
+        for unit in units:
+            lines.setdefault(unit.line, []).append(unit.text)
+        return "\n".join(" ".join(parts) for _, parts in sorted(lines.items()))
+
+    @staticmethod
+    def _overhead(block: ContextBlock) -> int:
+        """머리말 / 지시문 / 블록 구분 줄바꿈 토큰"""
+        return estimate_tokens(block.title) + estimate_tokens(block.note) + 2
+
+    def render_all(self) -> str:
+        """예산/중복 제거 없이 전체 연결 (context_budget_enabled=False일 때의 기존 동작)"""
+        return "\n\n".join(block.render() for block in self.blocks)
+
+    def assemble(self, budget_tokens: int) -> str:
+        """
+        예산 안에서 조립
+
+        Args:
+            budget_tokens: 참고 자료 전체 입력 토큰 예산 (0 이하면 render_all)
+
+        Returns:
+            조립된 참고 자료 (블록 사이 빈 줄)
+        """
+        if budget_tokens <= 0:
+            self.report = []
+            return self.render_all()
+
+        ranked = sorted(range(len(self.blocks)),
+                        key=lambda i: (self.blocks[i].priority, self.blocks[i].age_hours, i))
+        units_by_block = {i: self._units(block.text) for i, block in enumerate(self.blocks)}
+        # 아직 배정하지 않은 블록에 남겨 둘 최소 토큰 (우선순위 0은 전부 먼저 배정되므로 제외)
+        reserves = {
+            i: min(self.blocks[i].min_tokens, sum(u.tokens for u in units_by_block[i])) + self._overhead(self.blocks[i])
+            for i in ranked if self.blocks[i].priority > 0
+        }
+        reserved = sum(reserves.values())
+        seen = ""  # 먼저 배정된 블록들의 정규화 문장 (부분 문자열 검사로 중복 판정)
+        remaining = budget_tokens
+        kept: Dict[int, str] = {}
+        report: Dict[int, Dict] = {}
+
+        for index in ranked:
+            block = self.blocks[index]
+            reserved -= reserves.get(index, 0)
+            units = units_by_block[index]
+            original = sum(u.tokens for u in units)
+            entry = {"name": block.name, "tokens": original, "kept": 0, "status": "kept"}
+            report[index] = entry
+
+            fresh_units = []
+            for unit in units:
+                norm = _normalize(unit.text)
+                if len(norm) >= MIN_DEDUPE_CHARS and norm in seen:
+                    continue
+                fresh_units.append(unit)
+            if not any(_normalize(u.text) for u in fresh_units):
+                entry["status"] = "duplicate"
+                continue
+
+            overhead = self._overhead(block)
+            if block.priority == 0:
+                chosen = fresh_units
+            else:
+                allowance = max(remaining - reserved, min(remaining, block.min_tokens + overhead)) - overhead
+                chosen, used = [], 0
+                if allowance >= min(block.min_tokens, sum(u.tokens for u in fresh_units)):
+                    for unit in fresh_units:
+                        if used + unit.tokens > allowance:
+                            break
+                        chosen.append(unit)
+                        used += unit.tokens
+                if not chosen:
+                    entry["status"] = "dropped"
+                    continue
+
+            kept_tokens = sum(u.tokens for u in chosen) + overhead
+            remaining -= kept_tokens
+            entry["kept"] = kept_tokens
+            if len(chosen) < len(units):
+                entry["status"] = "trimmed" if len(chosen) < len(fresh_units) else "deduped"
+            seen += "\x00" + "\x00".join(_normalize(u.text) for u in chosen)
+            kept[index] = block.render(self._join(chosen))
+
+        self.report = [report[i] for i in range(len(self.blocks))]
+        used_total = budget_tokens - remaining
+        logger.info(f"Context assembled: {used_total}/{budget_tokens} tokens ({self.summary()})")
+        return "\n\n".join(kept[i] for i in sorted(kept))
+
+    def summary(self) -> str:
+        """리포트 한 줄 요약 (예: "web 1800→1200 trimmed, blog dropped")"""
+        parts = []
+        for entry in self.report:
+            if entry["status"] == "kept":
+                parts.append(f"{entry['name']} {entry['kept']}")
+            elif entry["status"] in ("dropped", "duplicate"):
+                parts.append(f"{entry['name']} {entry['status']}")
+            else:
+                parts.append(f"{entry['name']} {entry['tokens']}→{entry['kept']} {entry['status']}")
+        return ", ".join(parts)
+
+    @property
+    def used_tokens(self) -> int:
+        return sum(entry["kept"] for entry in self.report)
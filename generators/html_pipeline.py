@@ -0,0 +1,764 @@
+"""본문 HTML 후처리 엔진 (토큰 스트림 1회 순회)
+
+기존 후처리는 정리 함수마다 문서 전체에 정규식 / replace를 다시 적용 (글 하나에 수십 회):
+  clean_ai_response → 대제목 제거 → placeholder 제거 → post_process_content → humanize_full
+  → (이미지 / 링크 / 쿠팡 삽입) → clean_meta_tags → parse_content_to_sections
+  → (발행 직전) clean_html_styles → fix_html_tag_balance
+
+여기서는 HTML을 한 번만 토큰(텍스트 / 태그 / 주석 / [대괄호 태그])으로 나누고, 각 정리 함수를
+토큰을 받아 내보내는 방문자(HtmlVisitor)로 옮겨 토큰 하나가 모든 방문자를 차례로 통과하게 함:
+- 텍스트 규칙은 텍스트 노드에만 적용 (태그 속성 / 주석 / 이미지 URL은 바꾸지 않음)
+- 단계마다 인접한 텍스트 토큰을 합쳐서 전달 (앞 단계에서 태그를 지우면 양쪽 텍스트가 이어짐 — 정규식 체인과 동일)
+- 섹션 목록(parse_content_to_sections)은 같은 순회의 출력에서 수집
+
+외부 호출(이미지 검색 / 링크 / 쿠팡)이 사이에 있으므로 실제 파이프라인은 단계별로 조립
+(generators/content_generator.py의 POSTPROCESS_PIPELINE 등)
+"""
+import itertools
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 토큰 종류
+TEXT, TAG, COMMENT, MARKER = 0, 1, 2, 3
+
+# 대괄호 태그 ([IMAGE_1: 설명], [META], [/AFFILIATE_NOTICE] 등 — 본문에 남을 수 있는 이름만, 그 밖의 [ABC]는 텍스트)
+MARKER_NAMES = (
+    "META", "OFFICIAL_LINK", "COUPANG", "DISCLAIMER", "AFFILIATE_NOTICE",
+    "AD", "LINK", "CTA", "BANNER", "SPONSORED", "SOURCE", "REF",
+)
+# 주석 / 태그 / 대괄호 태그
+TOKEN_PATTERN = re.compile(
+    r'<!--.*?-->'
+    r'|<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>'
+    r'|\[(/?(?:' + "|".join(MARKER_NAMES) + r'|IMAGE_?\d*))(?:[:\s][^\]]*)?\]',
+    re.DOTALL
+)
+IMAGE_SLOT = re.compile(r'IMAGE_\d+')  # [IMAGE_N] (본문 이미지 위치)
+IMG_CONTEXT = re.compile(r'<!-- IMG_CONTEXT: .+? -->')
+
+# parse_content_to_sections와 같은 섹션 경계 (여는 태그는 접두사 일치, 닫는 태그는 종류와 무관하게 첫 번째)
+SECTION_OPEN = re.compile(r'<(?:h[1-6]|p|div|figure|ul|ol|table|blockquote|section)', re.IGNORECASE)
+SECTION_CLOSE = re.compile(r'</(?:h[1-6]|p|div|figure|ul|ol|table|blockquote|section)>', re.IGNORECASE)
+
+
+class Token:
+    """
+    토큰 하나
+
+    kind: TEXT / TAG / COMMENT / MARKER
+    name: 태그 이름 (소문자, 닫는 태그는 "/p") / 마커 이름 ("IMAGE_1", "/META")
+    prev: 텍스트 토큰 바로 앞 문자 (문서 시작이면 "", 그 외에는 앞 태그의 ">" 또는 마커의 "]")
+    last: 문서 끝의 텍스트인지
+    """
+    __slots__ = ("kind", "text", "name", "prev", "last")
+
+    def __init__(self, kind: int, text: str, name: str = ""):
+        self.kind = kind
+        self.text = text
+        self.name = name
+        self.prev = ""
+        self.last = False
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.text!r})"
+
+
+def tokenize(html: str) -> List[Token]:
+    """HTML → 토큰 목록 (인접한 텍스트는 하나로)"""
+    tokens = []
+    text_start = 0
+    for match in TOKEN_PATTERN.finditer(html):
+        name = match.group(2)
+        if name is not None:
+            token = Token(TAG, match.group(), (match.group(1) + name).lower())
+        elif match.group(3) is not None:
+            token = Token(MARKER, match.group(), match.group(3))
+        else:
+            token = Token(COMMENT, match.group())
+        if match.start() > text_start:
+            tokens.append(Token(TEXT, html[text_start:match.start()]))
+        tokens.append(token)
+        text_start = match.end()
+    if text_start < len(html):
+        tokens.append(Token(TEXT, html[text_start:]))
+    return tokens
+
+
+class HtmlVisitor:
+    """
+    토큰 스트림 변환 단계 (파이프라인 실행마다 새 인스턴스)
+
+    feed()는 받은 토큰 대신 내보낼 토큰들을 반환 (버리면 빈 튜플, 판단을 미루려면 보관 후 나중에 반환)
+    """
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        return (token,)
+
+    def close(self) -> Iterable[Token]:
+        """문서 끝: 보관 중인 토큰 반환"""
+        return ()
+
+    def finish(self, out: List[str]):
+        """출력 조각 목록 후처리 (마지막 단계에서만 — 내보낸 토큰 순서 = out 순서)"""
+
+
+class TextVisitor(HtmlVisitor):
+    """텍스트 노드만 바꾸는 단계"""
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if token.kind != TEXT:
+            return (token,)
+        text = self.text(token.text, token.prev, token.last)
+        if text is token.text:
+            return (token,)
+        return (Token(TEXT, text),) if text else ()
+
+    def text(self, text: str, prev: str, last: bool) -> str:
+        return text
+
+
+def _sub_with_prev(pattern: re.Pattern, repl, text: str, prev: str) -> str:
+    """
+    앞 문자가 결과에 영향을 주는 패턴 (^ MULTILINE / (?<![<>]) 등)을 문서 기준으로 적용
+
+    앞 문자는 태그 끝(">") / 마커 끝("]") / 없음뿐이므로 붙여서 치환한 뒤 떼어냄
+    (패턴이 ">" / "]"로 시작하지 않는 경우에만 사용)
+    """
+    if not prev:
+        return pattern.sub(repl, text)
+    return pattern.sub(repl, prev + text)[len(prev):]
+
+
+def _sub_line_start(pattern: re.Pattern, repl, text: str, prev: str) -> str:
+    """^ .*? (DOTALL) 패턴: 앞에 태그가 있으면 토큰 시작은 줄 시작이 아니므로 첫 줄바꿈 뒤부터 적용"""
+    if not prev:
+        return pattern.sub(repl, text)
+    newline = text.find("\n")
+    if newline < 0:
+        return text
+    return text[:newline + 1] + pattern.sub(repl, text[newline + 1:])
+
+
+# ------------------------------------------------------------
+# 생성 직후 (_postprocess_content)
+# ------------------------------------------------------------
+
+class CodeFenceVisitor(TextVisitor):
+    """```html / ``` 코드 블록 표시 제거 (줄 시작 / 줄 끝)"""
+
+    OPEN = re.compile(r'^```html\s*', re.MULTILINE)
+    CLOSE = re.compile(r'\s*```$', re.MULTILINE)
+
+    def text(self, text: str, prev: str, last: bool) -> str:
+        if "```" not in text:
+            return text
+        text = _sub_line_start(self.OPEN, "", text, prev)
+        if last:
+            return self.CLOSE.sub("", text)
+        # 뒤에 태그가 이어지면 토큰 끝은 줄 끝이 아님
+        return self.CLOSE.sub("", text + "\x00")[:-1]
+
+
+class PreambleVisitor(HtmlVisitor):
+    """
+    AI 메타 응답 제거 (clean_ai_response): 첫 블록 태그 앞은 모두 버리고, 텍스트 노드의 메타 문장 제거
+
+    정규식 체인과 달리 메타 패턴이 태그를 넘어 지우지 않음
+    """
+
+    START = re.compile(r'<(?:div|h[1-6]|p|section)', re.IGNORECASE)
+
+    def __init__(self, meta_patterns: Sequence[str]):
+        self.patterns = [re.compile(p, re.DOTALL | re.MULTILINE) for p in meta_patterns]
+        self.started = False
+        self.held: List[Token] = []
+
+    def _clean(self, token: Token) -> Token:
+        text = token.text
+        if not token.prev or "\n" in text:  # 태그 뒤 한 줄 텍스트는 줄 시작이 없음
+            for pattern in self.patterns:
+                text = _sub_line_start(pattern, "", text, token.prev)
+        if token.last:
+            text = text.rstrip()
+        if text is token.text:
+            return token
+        cleaned = Token(TEXT, text)
+        cleaned.prev, cleaned.last = token.prev, token.last
+        return cleaned
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if self.started:
+            if token.kind == TEXT:
+                token = self._clean(token)
+                return (token,) if token.text else ()
+            return (token,)
+        if token.kind == TAG and self.START.match(token.text):
+            self.started = True
+            self.held = []
+            return (token,)
+        self.held.append(token)
+        return ()
+
+    def close(self) -> Iterable[Token]:
+        if self.started or not self.held:
+            return ()
+        # 블록 태그가 없으면 전체를 남기고 앞뒤 공백만 정리
+        tokens = [self._clean(t) if t.kind == TEXT else t for t in self.held]
+        if tokens[0].kind == TEXT:
+            tokens[0] = Token(TEXT, tokens[0].text.lstrip())
+        if tokens[-1].kind == TEXT:
+            tokens[-1] = Token(TEXT, tokens[-1].text.rstrip())
+        return [t for t in tokens if t.text]
+
+
+class LeadingTitleVisitor(HtmlVisitor):
+    """
+    본문 시작의 대제목 제거 (WP 테마가 제목을 따로 표시)
+
+    순서대로: 중앙 정렬 h2 → 첫 h2 → <blockquote><p>…</p></blockquote> 부제목
+    (닫는 태그가 없으면 지우지 않음 — 정규식 체인과 동일)
+    """
+
+    CENTER_H2 = re.compile(r'<h2[^>]*style="[^"]*text-align:\s*center[^"]*"[^>]*>')
+
+    def __init__(self):
+        self.step = 0  # 0: 중앙 h2, 1: h2, 2: blockquote, 3: 끝
+        self.held: List[Token] = []  # 앞 공백 + 지울 후보 요소
+        self.closing = ""  # 후보 요소의 끝 태그 이름 ("/h2" / "/blockquote")
+        self.need_p = False  # <blockquote> 다음(공백 제외)이 <p인지 확인 전
+        self.after_p = False  # 직전 토큰(공백 제외)이 </p>인지
+        self.trim = False  # 지운 요소 뒤의 공백 제거
+
+    def _release(self, token: Optional[Token] = None) -> List[Token]:
+        self.step = 3
+        self.closing = ""
+        tokens = self.held + ([token] if token else [])
+        self.held = []
+        return tokens
+
+    def _removed(self, step: int):
+        self.held, self.closing, self.trim = [], "", True
+        self.step = step
+
+    def _inside(self, token: Token) -> Iterable[Token]:
+        self.held.append(token)
+        blank = token.kind == TEXT and not token.text.strip()
+        if self.closing == "/h2":
+            if token.kind == TAG and token.name == "/h2":
+                self._removed(self.step + 1)
+            return ()
+        if self.need_p:
+            if blank:
+                return ()
+            if token.kind == TAG and token.text.startswith("<p"):
+                self.need_p = False
+                return ()
+            return self._release()
+        if token.kind == TAG and token.name == "/blockquote" and self.after_p:
+            self._removed(3)
+        elif token.kind == TAG and token.text == "</p>":
+            self.after_p = True
+        elif not blank:
+            self.after_p = False
+        return ()
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if self.closing:
+            return self._inside(token)
+        if token.kind == TEXT and self.trim:
+            text = token.text.lstrip()
+            if not text:
+                return ()
+            token = Token(TEXT, text)
+        self.trim = False
+        if self.step == 3:
+            return (token,)
+
+        if token.kind == TEXT:
+            if token.text.strip():
+                return self._release(token)
+            self.held.append(token)  # 시작 공백 (지우면 함께 지움)
+            return ()
+        if token.kind != TAG:
+            return self._release(token)
+
+        if self.step == 0 and not self.CENTER_H2.match(token.text):
+            self.step = 1
+        if self.step < 2:
+            if token.text.startswith("<h2"):
+                self.held.append(token)
+                self.closing = "/h2"
+                return ()
+            self.step = 2
+        if token.text.startswith("<blockquote"):
+            self.held.append(token)
+            self.closing, self.need_p, self.after_p = "/blockquote", True, False
+            return ()
+        return self._release(token)
+
+    def close(self) -> Iterable[Token]:
+        return self._release() if self.held else ()
+
+
+class PlaceholderVisitor(HtmlVisitor):
+    """placeholder 이미지(감싼 <p> 포함) / IMG_CONTEXT 주석(뒤 공백 포함) / [IMAGE_N] 제거"""
+
+    PLACEHOLDER_SRC = re.compile(r'src="https://via\.placeholder\.com[^"]*"')
+
+    def __init__(self):
+        self.held: List[Token] = []  # <p> 후보 (<p>, 공백, placeholder img, 공백)
+        self.has_img = False
+        self.trim = False
+
+    def _is_placeholder(self, token: Token) -> bool:
+        return token.name == "img" and self.PLACEHOLDER_SRC.search(token.text) is not None
+
+    def _flush(self) -> List[Token]:
+        tokens = [t for t in self.held if not (t.kind == TAG and self._is_placeholder(t))]
+        self.held, self.has_img, self.trim = [], False, False
+        return tokens
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        kind = token.kind
+        if kind == COMMENT and IMG_CONTEXT.match(token.text):
+            self.trim = True
+            return ()
+        if kind == MARKER and IMAGE_SLOT.match(token.name):
+            self.trim = False
+            return ()
+
+        if self.held:
+            if kind == TEXT and not token.text.strip():
+                self.held.append(token)
+                return ()
+            if kind == TAG and not self.has_img and self._is_placeholder(token):
+                self.held.append(token)
+                self.has_img = True
+                return ()
+            if kind == TAG and self.has_img and token.text == "</p>":
+                self.held, self.has_img = [], False
+                return ()
+            return self._flush() + list(self.feed(token))
+
+        # 주석 뒤 공백 제거는 placeholder 이미지를 지운 뒤 기준 (정규식 체인 순서)
+        if kind == TEXT:
+            if self.trim:
+                text = token.text.lstrip()
+                if not text:
+                    return ()
+                self.trim = False
+                return (Token(TEXT, text),)
+            return (token,)
+        if kind == TAG:
+            if token.text.startswith("<p"):
+                self.held.append(token)
+                return ()
+            if self._is_placeholder(token):
+                return ()
+        self.trim = False
+        return (token,)
+
+    def close(self) -> Iterable[Token]:
+        return self._flush()
+
+
+class ReplaceVisitor(TextVisitor):
+    """텍스트 노드 문자열 치환 (표 순서대로 — 겹치는 규칙도 기존 replace 체인과 같은 결과) + 정규식 치환"""
+
+    def __init__(self, replacements: Sequence[Tuple[str, str]], subs: Sequence[Tuple[str, str]] = ()):
+        self.replacements = list(replacements)
+        # 어느 규칙도 없는 텍스트 노드는 치환 루프를 건너뜀
+        self.trigger = re.compile("|".join(re.escape(old) for old, _ in self.replacements)) if self.replacements else None
+        self.subs = [(re.compile(p), r) for p, r in subs]
+
+    def text(self, text: str, prev: str, last: bool) -> str:
+        if self.trigger is not None and self.trigger.search(text):
+            for old, new in self.replacements:
+                if old in text:
+                    text = text.replace(old, new)
+        for pattern, repl in self.subs:
+            text = pattern.sub(repl, text)
+        return text
+
+
+class TextFunctionVisitor(TextVisitor):
+    """텍스트 노드마다 함수 적용 (예: 컴파일된 인간화 규칙 CompiledRules.replace_text)"""
+
+    def __init__(self, func: Callable[[str], str]):
+        self.func = func
+
+    def text(self, text: str, prev: str, last: bool) -> str:
+        return self.func(text)
+
+
+class MarkdownVisitor(HtmlVisitor):
+    """
+    마크다운 잔여물 (clean_markdown_artifacts): **굵게** / *기울임* → 태그, ## 제목 / ``` 제거
+
+    정규식 체인은 문서 전체에 적용하므로 **…**가 인라인 태그를 사이에 두고 이어져도 바뀜
+    (예: **<a href="…">링크</a> 확인**). 바뀌지 않은 *가 남은 텍스트부터 남은 *가 없어질 때까지 토큰을
+    보관해 이어 붙인 문자열에서 바꾸고, 바뀐 * 위치만 원래 텍스트 토큰에 되돌려 씀 (태그 토큰은 그대로)
+    """
+
+    STRONG = re.compile(r'(?<![<>])\*\*([^*]+)\*\*')
+    EM = re.compile(r'(?<![<>*])\*([^*]+)\*(?!\*)')
+    HEADING = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+    FENCE = re.compile(r'```\w*\n?')
+
+    def __init__(self):
+        self.held: List[Token] = []  # 짝이 남은 *부터 보관 중인 토큰
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if token.kind != TEXT:
+            if not self.held:
+                return (token,)
+            if "*" in token.text:
+                # 태그 / 주석 안의 *와는 짝을 맞추지 않음
+                return (*self._release(), token)
+            self.held.append(token)
+            return ()
+        if "*" not in token.text:
+            if not self.held:
+                return self._plain(token)
+            self.held.append(token)
+            return ()
+        self.held.append(token)
+        # 바뀌지 않고 남은 *는 뒤에 오는 *와 짝이 될 수 있으므로 계속 보관
+        if "*" in self._convert("".join(held.text for held in self.held), self.held[0].prev):
+            return ()
+        return self._release()
+
+    def close(self) -> Iterable[Token]:
+        return self._release()
+
+    def _convert(self, text: str, prev: str) -> str:
+        text = _sub_with_prev(self.STRONG, r'<strong>\1</strong>', text, prev)
+        return _sub_with_prev(self.EM, r'<em>\1</em>', text, prev)
+
+    def _release(self) -> Tuple[Token, ...]:
+        """보관 토큰을 이어 붙여 **/* 변환 후 토큰별로 되돌려 내보냄"""
+        held, self.held = self.held, []
+        if not held:
+            return ()
+        if len(held) == 1:
+            return self._plain(held[0], self._convert(held[0].text, held[0].prev))
+
+        prev = held[0].prev
+        text = "".join(token.text for token in held)
+        bounds = list(itertools.accumulate(len(token.text) for token in held))[:-1]
+        for pattern, open_tag, close_tag in ((self.STRONG, "<strong>", "</strong>"), (self.EM, "<em>", "</em>")):
+            edits = []  # (위치, 바뀌는 글자 수 차이)
+            parts = []
+            last = 0
+            offset = len(prev)
+            for match in pattern.finditer(prev + text):
+                start, end = match.start() - offset, match.end() - offset
+                mark = (end - start - len(match.group(1))) // 2
+                parts += [text[last:start], open_tag, match.group(1), close_tag]
+                edits += [(start, len(open_tag) - mark), (end - mark, len(close_tag) - mark)]
+                last = end
+            if not edits:
+                continue
+            parts.append(text[last:])
+            text = "".join(parts)
+            bounds = [bound + sum(delta for at, delta in edits if at < bound) for bound in bounds]
+
+        out = []
+        for token, start, end in zip(held, [0] + bounds, bounds + [len(text)]):
+            if token.kind != TEXT:
+                out.append(token)
+            else:
+                out.extend(self._plain(token, text[start:end]))
+        return tuple(out)
+
+    def _plain(self, token: Token, text: Optional[str] = None) -> Tuple[Token, ...]:
+        """토큰 하나 안에서 끝나는 처리: 남은 ** / ## 제목 / ``` 제거"""
+        original = token.text
+        if text is None:
+            text = original
+        if "**" in text:
+            text = text.replace('**', '')
+        if "#" in text:
+            text = _sub_with_prev(self.HEADING, '', text, token.prev)
+        if "```" in text:
+            text = self.FENCE.sub('', text)
+        if text == original:
+            return (token,)
+        return (Token(TEXT, text),) if text else ()
+
+
+class EmojiLimitVisitor(TextVisitor):
+    """이모지 개수 제한 (문서 전체에서 앞의 max_emojis개만 남김)"""
+
+    def __init__(self, pattern: re.Pattern, max_emojis: int = 2):
+        self.pattern = pattern
+        self.remaining = max_emojis
+
+    def _keep(self, match: re.Match) -> str:
+        if self.remaining > 0:
+            self.remaining -= 1
+            return match.group()
+        return ""
+
+    def text(self, text: str, prev: str, last: bool) -> str:
+        return self.pattern.sub(self._keep, text)
+
+
+# ------------------------------------------------------------
+# 삽입 후 정리 (clean_meta_tags) / 발행 직전 (clean_html_styles, fix_html_tag_balance)
+# ------------------------------------------------------------
+
+class MarkerVisitor(HtmlVisitor):
+    """
+    대괄호 태그 제거: [META]…[/META] 구간 전체 + drop(토큰)이 참인 마커 (+ IMG_CONTEXT 주석과 뒤 공백)
+
+    [/META]가 없으면 구간을 지우지 않음 (정규식 체인과 동일)
+    """
+
+    def __init__(self, drop: Callable[[Token], bool], img_context: bool = False):
+        self.drop = drop
+        self.img_context = img_context
+        self.block: Optional[List[Token]] = None
+        self.trim = False
+
+    def _plain(self, token: Token) -> Iterable[Token]:
+        kind = token.kind
+        if kind == TEXT and self.trim:
+            self.trim = False
+            text = token.text.lstrip()
+            return (Token(TEXT, text),) if text else ()
+        self.trim = False
+        if kind == MARKER and self.drop(token):
+            return ()
+        if kind == COMMENT and self.img_context and IMG_CONTEXT.match(token.text):
+            self.trim = True
+            return ()
+        return (token,)
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if self.block is not None:
+            if token.kind == MARKER and token.text == "[/META]":
+                self.block = None
+                return ()
+            self.block.append(token)
+            return ()
+        if token.kind == MARKER and token.text == "[META]":
+            self.block = [token]
+            return ()
+        return self._plain(token)
+
+    def close(self) -> Iterable[Token]:
+        if self.block is None:
+            return ()
+        block, self.block = self.block, None
+        out = [block[0]]  # 짝 없는 [META]는 그대로
+        for token in block[1:]:
+            out.extend(self._plain(token))
+        return out
+
+
+class EmptyParagraphVisitor(HtmlVisitor):
+    """<p>\\s*</p> 제거 (속성 없는 <p>만)"""
+
+    def __init__(self):
+        self.held: List[Token] = []
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if self.held:
+            if token.kind == TEXT and not token.text.strip():
+                self.held.append(token)
+                return ()
+            if token.kind == TAG and token.text == "</p>":
+                self.held = []
+                return ()
+            held, self.held = self.held, []
+            return held + list(self.feed(token))
+        if token.kind == TAG and token.text == "<p>":
+            self.held.append(token)
+            return ()
+        return (token,)
+
+    def close(self) -> Iterable[Token]:
+        held, self.held = self.held, []
+        return held
+
+
+class StyleVisitor(HtmlVisitor):
+    """blockquote → info-box div, 왼쪽 세로선 스타일 / 클래스 제거, 빈 style 속성 정리 (태그 안에서만)"""
+
+    BORDER_LEFT = re.compile(r'border-left:\s*(?!4px\s+solid\s+#)[^;"]+;?', re.IGNORECASE)
+    BORDER_CLASS = re.compile(r'\bborder-l-\d+\b')
+    BORDER_LEFT_ONLY = re.compile(
+        r'border:\s*\d+px\s+solid\s+[^;"]+\s*;\s*border-(?:right|top|bottom):\s*none\s*;', re.IGNORECASE
+    )
+    EMPTY_STYLE = re.compile(r'\s*style="\s*"')
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if token.kind != TAG:
+            return (token,)
+        text = token.text
+        if text.startswith("<blockquote"):
+            return (Token(TAG, '<div class="info-box">', "div"),)
+        if text == "</blockquote>":
+            return (Token(TAG, "</div>", "/div"),)
+        if "border" in text:
+            text = self.BORDER_LEFT.sub('', text)
+            text = self.BORDER_CLASS.sub('', text)
+            text = self.BORDER_LEFT_ONLY.sub('', text)
+        if 'style="' in text:
+            text = self.EMPTY_STYLE.sub('', text)
+        return (token,) if text is token.text else (Token(TAG, text, token.name),)
+
+
+class TagBalanceVisitor(HtmlVisitor):
+    """
+    닫히지 않은 블록 태그는 끝에 닫고, 남는 닫는 태그는 뒤에서부터 제거 (fix_html_tag_balance)
+
+    마지막 단계여야 함 (내보낸 토큰 위치로 출력 조각을 고침)
+    """
+
+    TAGS = ('div', 'span', 'table', 'tbody', 'thead', 'tr', 'td', 'th', 'section', 'article')
+
+    def __init__(self):
+        self.opens = dict.fromkeys(self.TAGS, 0)
+        self.closes = {tag: [] for tag in self.TAGS}  # 닫는 태그의 출력 위치
+        self.emitted = 0
+
+    def feed(self, token: Token) -> Iterable[Token]:
+        if token.kind == TAG:
+            name = token.name
+            if name in self.opens:
+                self.opens[name] += 1
+            elif name[1:] in self.closes and name[0] == "/":
+                if token.text.lower() == f"<{name}>":
+                    self.closes[name[1:]].append(self.emitted)
+        self.emitted += 1
+        return (token,)
+
+    def finish(self, out: List[str]):
+        for tag in self.TAGS:
+            diff = self.opens[tag] - len(self.closes[tag])
+            if diff > 0:
+                out.append(f'</{tag}>' * diff)
+                logger.warning(f"[HTML Balance] Fixed {diff} unclosed <{tag}> tag(s)")
+            elif diff < 0:
+                for index in self.closes[tag][diff:]:
+                    out[index] = ""
+                logger.warning(f"[HTML Balance] Removed {-diff} extra </{tag}> tag(s)")
+
+
+# ------------------------------------------------------------
+# 실행
+# ------------------------------------------------------------
+
+@dataclass
+class PipelineResult:
+    """파이프라인 실행 결과"""
+    html: str
+    sections: List[str] = field(default_factory=list)  # 내용 있는 섹션 HTML (parse_content_to_sections 기준)
+    section_matches: int = 0  # 빈 섹션 포함 경계 일치 수 (0이면 전체를 한 섹션으로)
+
+
+class HtmlPipeline:
+    """
+    방문자 단계들을 토큰 스트림 1회 순회로 실행
+
+    Args:
+        *stages: 방문자 생성 함수 (클래스 / functools.partial — 실행마다 새 인스턴스)
+        sections: 출력에서 섹션 목록 수집 여부
+        strip: 결과 앞뒤 공백 제거 여부
+    """
+
+    def __init__(self, *stages: Callable[[], HtmlVisitor], sections: bool = False, strip: bool = False):
+        self.stages = stages
+        self.sections = sections
+        self.strip = strip
+
+    def run(self, html: str) -> PipelineResult:
+        visitors = [stage() for stage in self.stages]
+        feeds = [visitor.feed for visitor in visitors]
+        count = len(visitors)
+        pending: List[Optional[Token]] = [None] * count  # 단계별로 합치는 중인 텍스트
+        prev = [""] * count  # 단계별 직전 토큰의 마지막 문자
+        out: List[str] = []
+        collector = _SectionCollector(out) if self.sections else None
+        sink = collector.feed if collector is not None else None
+
+        def emit(index: int, token: Token):
+            if index == count:
+                if sink is not None:
+                    sink(token)
+                out.append(token.text)
+                return
+            if token.kind == TEXT:
+                if token.text:
+                    held = pending[index]
+                    pending[index] = token if held is None else Token(TEXT, held.text + token.text)
+                return
+            if pending[index] is not None:
+                flush(index, False)
+            prev[index] = token.text[-1]
+            for produced in feeds[index](token):
+                emit(index + 1, produced)
+
+        def flush(index: int, last: bool):
+            # 토큰 객체는 앞 단계가 넘긴 뒤로 다시 읽지 않으므로 그대로 재사용
+            text_token = pending[index]
+            pending[index] = None
+            text_token.prev, text_token.last = prev[index], last
+            prev[index] = text_token.text[-1]
+            for produced in feeds[index](text_token):
+                emit(index + 1, produced)
+
+        for token in tokenize(html):
+            emit(0, token)
+        for index in range(count):
+            if pending[index] is not None:
+                flush(index, True)
+            for produced in visitors[index].close():
+                emit(index + 1, produced)
+        if visitors:
+            visitors[-1].finish(out)
+
+        result = "".join(out)
+        return PipelineResult(
+            html=result.strip() if self.strip else result,
+            sections=collector.sections if collector else [],
+            section_matches=collector.matches if collector else 0,
+        )
+
+
+class _SectionCollector:
+    """출력 토큰에서 섹션 구간 수집 (여는 블록 태그 ~ 다음 닫는 블록 태그)"""
+
+    def __init__(self, out: List[str]):
+        self.out = out
+        self.start = -1
+        self.has_text = False
+        self.has_media = False
+        self.sections: List[str] = []
+        self.matches = 0
+
+    def feed(self, token: Token):
+        if self.start < 0:
+            if token.kind == TAG and SECTION_OPEN.match(token.text):
+                self.start = len(self.out)
+                self.has_text = False
+                self.has_media = token.name in ("img", "figure")
+            return
+        kind = token.kind
+        if kind == TEXT or kind == MARKER:
+            if not self.has_text and token.text.strip():
+                self.has_text = True
+        elif kind == TAG:
+            if token.name in ("img", "figure"):
+                self.has_media = True
+            if SECTION_CLOSE.fullmatch(token.text):
+                self.matches += 1
+                if self.has_text or self.has_media:
+                    self.sections.append("".join(self.out[self.start:]) + token.text)
+                self.start = -1
@@ -5,43 +5,40 @@ AI가 생성한 콘텐츠를 더 자연스럽게 변환합니다.
 import re
 import logging
 
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.humanizer import FORMAL_TO_CASUAL as BASE_RULES, CompiledRules
+
 logger = logging.getLogger(__name__)
 
-# 딱딱한 표현 → 구어체 변환
-FORMAL_TO_CASUAL = [
-    (r"것이 중요합니다", "게 진짜 중요해요"),
-    (r"것이 좋습니다", "게 좋아요"),
-    (r"할 수 있습니다", "할 수 있어요"),
-    (r"됩니다", "돼요"),
-    (r"합니다", "해요"),
-    (r"입니다", "이에요"),
-    (r"습니다", "어요"),
-    (r"있습니다", "있어요"),
-    (r"없습니다", "없어요"),
-    (r"하였습니다", "했어요"),
-    (r"되었습니다", "됐어요"),
-    (r"첫째,", "일단,"),
-    (r"둘째,", "그리고,"),
-    (r"셋째,", "또,"),
-    (r"넷째,", "그리고 또,"),
-    (r"다섯째,", "마지막으로,"),
-    (r"따라서", "그래서"),
-    (r"그러나", "근데"),
-    (r"하지만", "근데"),
-    (r"그러므로", "그래서"),
-    (r"매우 중요한", "진짜 중요한"),
-    (r"반드시", "꼭"),
-    (r"특히", "특히나"),
+# 공통 해요체 규칙표(utils/humanizer.py)에 더하는 구어체 표현 (같은 표현은 공통 규칙 우선)
+CASUAL_EXTRA = [
+    ("것이 중요합니다", "게 진짜 중요해요"),
+    ("것이 좋습니다", "게 좋아요"),
+    ("할 수 있습니다", "할 수 있어요"),
+    ("합니다", "해요"),
+    ("없습니다", "없어요"),
+    ("하였습니다", "했어요"),
+    ("되었습니다", "됐어요"),
+    ("따라서", "그래서"),
+    ("그러나", "근데"),
+    ("하지만", "근데"),
+    ("그러므로", "그래서"),
+    ("매우 중요한", "진짜 중요한"),
+    ("반드시", "꼭"),
+    ("특히", "특히나"),
 ]
 
+FORMAL_TO_CASUAL = BASE_RULES + CASUAL_EXTRA
+casual_tone_rules = CompiledRules(FORMAL_TO_CASUAL)
+
 
 def apply_casual_tone(content: str) -> str:
     """
-    딱딱한 표현을 구어체로 변환
+    딱딱한 표현을 구어체로 변환 (규칙표 1회 순회, 태그 / 주석 안은 그대로)
     """
-    for formal, casual in FORMAL_TO_CASUAL:
-        content = re.sub(formal, casual, content)
-    return content
+    return casual_tone_rules.apply(content)
 
 
 def vary_sentence_length(content: str) -> str:
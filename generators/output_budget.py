@@ -0,0 +1,122 @@
+"""출력 토큰 예산 (max_tokens) 산정
+
+고정 max_tokens(본문 8000 등) 대신 목표 분량(템플릿 selected_word_count / 섹션 chars)으로 계산:
+
+    max_tokens = 목표 글자 × HTML 배율 ÷ 글자당 토큰(학습) × 안전 여유(자동 조정) + 고정 여유
+
+- 글자당 토큰: utils/llm_usage 기록 중 긴 출력 호출의 (응답 글자 수 ÷ 출력 토큰), 공급자별
+  (기록이 적으면 한국어 HTML 기준 기본값)
+- 안전 여유: 같은 기록의 잘림 비율이 목표보다 높으면 늘리고 낮으면 줄임 (범위 제한)
+- 그래도 잘린 응답은 ContentGenerator가 이어쓰기 호출로 마저 받음 (전체 재생성 없음)
+
+학습 값은 프로세스마다 REFRESH_SECONDS 동안 재사용
+결과는 TOKEN_STEP 단위로 올림 (같은 프롬프트가 LLM 캐시 / 카세트 키와 계속 일치하도록)
+"""
+import logging
+import math
+import threading
+import time
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings 로드 실패 시 / 기록 부족 시 사용)
+DEFAULT_MARGIN = 1.25
+DEFAULT_TARGET_TRUNCATION = 0.03
+DEFAULT_CHARS_PER_TOKEN = 1.1  # 한국어 본문 + HTML 태그 응답 원문 기준
+
+# 목표 글자 수(본문 텍스트) → 응답 원문 글자 수 (소제목 / 문단 / 목록 태그)
+MARKUP_FACTOR = 1.3
+# 학습에 필요한 최소 호출 수 / 학습 값 허용 범위
+MIN_SAMPLES = 20
+CHARS_PER_TOKEN_RANGE = (0.6, 2.5)
+# 잘림 비율이 목표보다 1%p 높을(낮을) 때마다 안전 여유 +0.025(-0.025) / 여유 허용 범위
+MARGIN_GAIN = 2.5
+MARGIN_RANGE = (1.1, 2.0)
+# 모델 출력 상한 (Haiku 8192) / 너무 작은 예산 방지
+MAX_OUTPUT_TOKENS = 8000
+MIN_OUTPUT_TOKENS = 512
+# max_tokens는 LLM 캐시 / 카세트 키의 일부 → 학습 값이 조금 움직여도 같은 값이 나오도록 이 단위로 올림
+TOKEN_STEP = 512
+REFRESH_SECONDS = 600
+
+
+class OutputBudget:
+    """목표 분량 → max_tokens (공급자별 학습 값 캐시)"""
+
+    def __init__(self, enabled: bool = None, margin: float = None, target_truncation: float = None):
+        try:
+            from config.settings import settings
+            enabled = settings.output_budget_enabled if enabled is None else enabled
+            margin = settings.output_budget_margin if margin is None else margin
+            target_truncation = (
+                settings.output_budget_target_truncation if target_truncation is None else target_truncation
+            )
+        except Exception:
+            enabled = True if enabled is None else enabled
+            margin = DEFAULT_MARGIN if margin is None else margin
+            target_truncation = DEFAULT_TARGET_TRUNCATION if target_truncation is None else target_truncation
+
+        self.enabled = bool(enabled)
+        self.base_margin = float(margin)
+        self.target_truncation = float(target_truncation)
+
+        self._lock = threading.Lock()
+        self._learned: Dict[str, Tuple[float, float, float]] = {}  # provider → (글자당 토큰, 여유, 갱신 시각)
+
+    def _learn(self, provider: str) -> Tuple[float, float]:
+        """llm_usage 기록에서 (글자당 토큰, 안전 여유) 계산"""
+        chars_per_token, margin = DEFAULT_CHARS_PER_TOKEN, self.base_margin
+        try:
+            from utils.llm_usage import llm_usage
+            history = llm_usage.output_history(provider)
+        except Exception as e:
+            logger.debug(f"Output budget history unavailable: {e}")
+            history = None
+
+        if history and history["calls"] >= MIN_SAMPLES and history["output_tokens"]:
+            low, high = CHARS_PER_TOKEN_RANGE
+            chars_per_token = min(max(history["output_chars"] / history["output_tokens"], low), high)
+            rate = history["truncated"] / history["calls"]
+            low, high = MARGIN_RANGE
+            margin = min(max(self.base_margin + MARGIN_GAIN * (rate - self.target_truncation), low), high)
+            logger.info(
+                f"Output budget ({provider}): {chars_per_token:.2f} chars/token, "
+                f"truncation {rate:.1%} over {history['calls']} calls → margin x{margin:.2f}"
+            )
+        return chars_per_token, margin
+
+    def learned(self, provider: str) -> Tuple[float, float]:
+        """(글자당 토큰, 안전 여유) — REFRESH_SECONDS마다 다시 계산"""
+        with self._lock:
+            cached = self._learned.get(provider)
+            if cached and time.time() - cached[2] < REFRESH_SECONDS:
+                return cached[0], cached[1]
+        chars_per_token, margin = self._learn(provider)
+        with self._lock:
+            self._learned[provider] = (chars_per_token, margin, time.time())
+        return chars_per_token, margin
+
+    def for_chars(self, chars: int, provider: str, fixed_tokens: int = 300, fallback: int = MAX_OUTPUT_TOKENS) -> int:
+        """
+        목표 글자 수에 맞춘 max_tokens
+
+        Args:
+            chars: 목표 글자 수 (본문 텍스트 기준)
+            provider: 주 공급자 ("claude" / "gemini")
+            fixed_tokens: 분량과 무관한 출력 ([META] 줄, 태그 등) 여유
+            fallback: 비활성화 시 사용할 기존 고정값
+
+        Returns:
+            MIN_OUTPUT_TOKENS ~ MAX_OUTPUT_TOKENS 사이 토큰 수 (TOKEN_STEP 배수로 올림)
+        """
+        if not self.enabled or not chars:
+            return fallback
+        chars_per_token, margin = self.learned(provider)
+        tokens = math.ceil(chars * MARKUP_FACTOR / chars_per_token * margin) + fixed_tokens
+        tokens = math.ceil(tokens / TOKEN_STEP) * TOKEN_STEP
+        return max(MIN_OUTPUT_TOKENS, min(tokens, MAX_OUTPUT_TOKENS))
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+output_budget = OutputBudget()
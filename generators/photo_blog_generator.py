@@ -16,6 +16,8 @@ from typing import List, Optional, Dict
 from pathlib import Path
 from dataclasses import dataclass
 
+from utils.llm_governor import llm_governor
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -80,7 +82,9 @@ JSON으로만 응답 (다른 텍스트 없이):
   "tags": ["관련 태그 3~5개"]
 }}"""
 
-        result = self.model.generate_content(prompt)
+        with llm_governor.slot("gemini", prompt, label="photo_memo") as ticket:
+            result = self.model.generate_content(prompt)
+            ticket.record(result, self.model.model_name)
         text = result.text.replace("```json", "").replace("```", "").strip()
         return json.loads(text)
 
@@ -160,7 +164,9 @@ JSON으로만 응답 (다른 텍스트 없이):
   "category": "업종 (카페/음식점/관광지 등)",
   "hours": "영업시간 (모르면 빈 문자열)"
 }}"""
-            result = self.model.generate_content(prompt)
+            with llm_governor.slot("gemini", prompt, label="photo_place") as ticket:
+                result = self.model.generate_content(prompt)
+                ticket.record(result, self.model.model_name)
             text = result.text.replace("```json", "").replace("```", "").strip()
             data = json.loads(text)
             data["naver_map_url"] = f"https://map.naver.com/p/search/{_req.utils.quote(query)}"
@@ -314,19 +320,21 @@ JSON으로만 응답 (다른 텍스트 없이):
         for i, path in enumerate(photo_paths):
             try:
                 img = PILImage.open(path)
-                result = self.model.generate_content(
-                    [
-                        "이 사진을 간결하게 분석해. JSON만 출력:\n"
-                        '{"description": "사진 내용 한 줄 설명", '
-                        '"category": "외관|내부|음식|음료|전시|풍경|인물|기타", '
-                        '"key_objects": ["주요 사물 3개 이내"]}',
-                        img,
-                    ],
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=300,
-                        temperature=0.2,
-                    ),
-                )
+                with llm_governor.slot("gemini", max_tokens=300, label="photo_vision") as ticket:
+                    result = self.model.generate_content(
+                        [
+                            "이 사진을 간결하게 분석해. JSON만 출력:\n"
+                            '{"description": "사진 내용 한 줄 설명", '
+                            '"category": "외관|내부|음식|음료|전시|풍경|인물|기타", '
+                            '"key_objects": ["주요 사물 3개 이내"]}',
+                            img,
+                        ],
+                        generation_config=genai.types.GenerationConfig(
+                            max_output_tokens=300,
+                            temperature=0.2,
+                        ),
+                    )
+                    ticket.record(result, self.model.model_name, 300)
                 text = result.text.replace("```json", "").replace("```", "").strip()
                 data = json.loads(text)
                 data["index"] = i
@@ -430,13 +438,15 @@ JSON으로만 응답 (다른 텍스트 없이):
   "tags": ["태그1", "태그2", "태그3"]
 }}"""
 
-        result = self.model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                max_output_tokens=8000,
-                temperature=0.7,
-            ),
-        )
+        with llm_governor.slot("gemini", prompt, 8000, label="photo_post") as ticket:
+            result = self.model.generate_content(
+                prompt,
+                generation_config=genai.types.GenerationConfig(
+                    max_output_tokens=8000,
+                    temperature=0.7,
+                ),
+            )
+            ticket.record(result, self.model.model_name, 8000)
 
         text = result.text.replace("```json", "").replace("```", "").strip()
         data = json.loads(text)
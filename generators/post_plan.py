@@ -0,0 +1,195 @@
+"""글 계획 (post plan): 제목 후보 / 메타 설명 / 개요 / 섹션별 이미지 검색어를 한 번의 호출로
+
+본문 프롬프트 + POST_PLAN_PROMPT 응답(JSON)을 스키마로 검증한 뒤
+- 본문 생성: 한 번에 생성 모드는 render() 블록을 프롬프트에 덧붙이고, 개요 모드는 outline()을 그대로 사용
+- 제목: 후보 중 규칙을 만족하는 첫 번째 (generate_title 호출 대체)
+- 이미지: image_keywords()로 [IMAGE_N] 위치별 검색어 (ImageFetcher 검색어 생성 호출 대체)
+검증에 실패하면 None → 호출부는 기존 개별 호출 경로로 진행
+"""
+import json
+import logging
+import re
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+
+logger = logging.getLogger(__name__)
+
+PLAN_TAGS = ("COUPANG", "OFFICIAL_LINK", "AFFILIATE_NOTICE")
+# 이보다 짧은 제목 후보는 잘린 응답으로 보고 건너뜀 (generate_title과 같은 기준)
+MIN_TITLE_CHARS = 15
+HANGUL = re.compile(r'[가-힣]')
+
+
+class PlanSection(BaseModel):
+    heading: str = ""                          # 서론은 빈 문자열
+    points: List[str] = Field(default_factory=list)
+    chars: int = 500
+    image: bool = False
+
+    @field_validator("heading", mode="before")
+    @classmethod
+    def _heading(cls, value):
+        return str(value or "").strip()
+
+    @field_validator("points", mode="before")
+    @classmethod
+    def _points(cls, value):
+        if isinstance(value, str):
+            value = [value]
+        return [str(point) for point in (value or [])][:6]
+
+    @field_validator("chars", mode="before")
+    @classmethod
+    def _chars(cls, value):
+        try:
+            chars = int(value or 0)
+        except (TypeError, ValueError):
+            chars = 0
+        return max(200, min(chars or 500, 2000))
+
+
+class ImageQuery(BaseModel):
+    section: int
+    query: str
+
+    @field_validator("query", mode="before")
+    @classmethod
+    def _query(cls, value):
+        return " ".join(str(value or "").split())
+
+
+class PostPlan(BaseModel):
+    titles: List[str] = Field(min_length=1)
+    meta: str = ""
+    sections: List[PlanSection] = Field(min_length=3)
+    image_queries: List[ImageQuery] = Field(default_factory=list)
+    tags: Dict[str, Optional[int]] = Field(default_factory=dict)
+
+    @field_validator("titles", mode="before")
+    @classmethod
+    def _titles(cls, value):
+        if isinstance(value, str):
+            value = [value]
+        titles = []
+        for title in value or []:
+            title = str(title).replace("**", "").strip().strip('"\'')
+            title = re.sub(r'(\S+)\s+\1', r'\1', title)  # 중복 단어 제거 (예: "총정리 총정리")
+            if title and title not in titles:
+                titles.append(title)
+        return titles
+
+    @field_validator("meta", mode="before")
+    @classmethod
+    def _meta(cls, value):
+        return str(value or "").strip()[:160]
+
+    @field_validator("image_queries", mode="before")
+    @classmethod
+    def _image_queries(cls, value):
+        # 검색어 하나가 잘못됐다고 계획 전체를 버리지 않도록 형식이 맞는 항목만
+        queries = []
+        for item in value or []:
+            if isinstance(item, dict) and str(item.get("section", "")).lstrip("-").isdigit():
+                queries.append({"section": int(item["section"]), "query": item.get("query")})
+        return queries
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def _tags(cls, value):
+        if not isinstance(value, dict):
+            return {}
+        return {
+            str(name): int(index) if str(index).isdigit() else None
+            for name, index in value.items()
+        }
+
+    @model_validator(mode="after")
+    def _drop_invalid_refs(self):
+        """범위를 벗어난 섹션 번호 / 한글 검색어 / 모르는 태그 제거"""
+        count = len(self.sections)
+        self.image_queries = [
+            q for q in self.image_queries
+            if 0 <= q.section < count and 2 <= len(q.query) <= 60 and not HANGUL.search(q.query)
+        ]
+        self.tags = {
+            name: index for name, index in self.tags.items()
+            if name in PLAN_TAGS and isinstance(index, int) and 0 <= index < count
+        }
+        return self
+
+    @property
+    def title(self) -> str:
+        """규칙을 만족하는 첫 번째 제목 후보 (없으면 빈 문자열)"""
+        return next((t for t in self.titles if len(t) >= MIN_TITLE_CHARS), "")
+
+    def image_sections(self, image_count: int) -> List[int]:
+        """[IMAGE_N] 슬롯을 둘 섹션 번호 (서론 + image 표시 섹션, 이미지 개수까지)"""
+        if not image_count:
+            return []
+        marked = [i for i, section in enumerate(self.sections) if section.image and i > 0]
+        return ([0] + marked)[:image_count]
+
+    def outline(self) -> dict:
+        """ContentGenerator._parse_outline과 같은 형식 (개요 → 섹션 동시 생성 모드용)"""
+        return {
+            "title": self.title,
+            "meta": self.meta,
+            "sections": [section.model_dump() for section in self.sections],
+            "tags": dict(self.tags),
+        }
+
+    def image_keywords(self, image_count: int) -> List[Dict]:
+        """
+        [IMAGE_N] 위치별 검색어 (ImageFetcher.generate_section_image_keywords_smart와 같은 형식)
+
+        섹션에 지정된 검색어가 없으면 아직 쓰지 않은 다른 검색어로 채움
+        """
+        by_section = {}
+        for q in self.image_queries:
+            by_section.setdefault(q.section, q.query)
+        spare = [q.query for q in self.image_queries if by_section.get(q.section) != q.query]
+
+        keywords = []
+        for position, index in enumerate(self.image_sections(image_count), start=1):
+            query = by_section.get(index) or (spare.pop(0) if spare else "")
+            if query:
+                keywords.append({"position": position, "query": query, "section": self.sections[index].heading})
+        return keywords
+
+    def render(self, image_count: int) -> str:
+        """한 번에 생성 모드의 본문 프롬프트에 덧붙일 계획 블록"""
+        image_sections = self.image_sections(image_count)
+        lines = ["", "", "[글 계획 — 아래 대제목 / 소제목 / 순서 / 분량을 그대로 따르세요]"]
+        if self.title:
+            lines.append(f"대제목: {self.title}")
+        for i, section in enumerate(self.sections):
+            line = f"{i + 1}. {section.heading or '(서론 — 소제목 없음)'} — {', '.join(section.points)} (약 {section.chars}자)"
+            if i in image_sections:
+                line += f" → 첫 문단 뒤 [IMAGE_{image_sections.index(i) + 1}]"
+            tags = [name for name, index in self.tags.items() if index == i]
+            if tags:
+                line += " → 섹션 끝 " + " ".join(f"[{name}]" for name in tags)
+            lines.append(line)
+        if self.meta:
+            lines.append(f"[META] 내용: {self.meta}")
+        return "\n".join(lines)
+
+
+def parse_post_plan(text: str) -> Optional[PostPlan]:
+    """
+    글 계획 응답 파싱 + 스키마 검증
+
+    Returns:
+        PostPlan, JSON이 없거나 스키마를 만족하지 않으면 None
+    """
+    text = (text or "").replace("```json", "").replace("```", "").strip()
+    match = re.search(r'\{.*\}', text, re.DOTALL)
+    if not match:
+        logger.warning("Post plan response has no JSON object")
+        return None
+    try:
+        return PostPlan.model_validate(json.loads(match.group()))
+    except (ValueError, ValidationError) as e:
+        logger.warning(f"Post plan rejected by schema: {str(e)[:300]}")
+        return None
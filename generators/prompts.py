@@ -399,74 +399,82 @@ SYSTEM_PROMPT = """
 # 콘텐츠 후처리 함수 (AdSense 최적화)
 # =============================================================================
 
+# 금지 표현 → 대체 표현 (위에서부터 순서대로 적용: "ㅋㅋㅋ"가 "ㅋㅋ"보다 먼저)
+FORBIDDEN_REPLACEMENTS = {
+    "ㅋㅋㅋ": "",
+    "ㅋㅋ": "",
+    "ㅎㅎㅎ": "",
+    "ㅎㅎ": "",
+    "ㅠㅠ": "",
+    "ㅜㅜ": "",
+    "헐": "",
+    "대박": "주목할 만한",
+    "완전 핵심": "핵심",
+    "진짜 진짜": "정말",
+    "진짜진짜": "정말",
+    "무조건": "반드시",
+    "꿀팁": "유용한 팁",
+    "핵꿀팁": "효과적인 방법",
+    "알짜팁": "실용적인 팁",
+    "충격": "주목할",
+    "경악": "놀라운",
+    "미친": "인상적인",
+    "역대급": "주목할 만한",
+    "레전드": "인상적인",
+    "완전 강추": "추천",
+    "강추": "추천",
+    "저도 솔직히": "사실",
+    "솔직히 저도": "사실",
+    "여기서 꿀팁 하나!": "추가로 알아두면 좋은 점이 있어요.",
+    "이건 진짜 꿀팁이에요": "이것은 효과적인 방법이에요",
+}
+
+# 반복 문장부호 / 공백 정리
+PUNCTUATION_SUBS = [
+    (r'!{2,}', '!'),
+    (r'\?{2,}', '?'),
+    (r' {2,}', ' '),
+]
+
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U00002702-\U000027B0"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F"
+    "\U0001FA70-\U0001FAFF"
+    "\U00002600-\U000026FF"
+    "\U00002700-\U000027BF"
+    "]+",
+    flags=re.UNICODE
+)
+
+
 def clean_ai_content(content: str) -> str:
     """AI 생성 콘텐츠에서 금지 표현 제거"""
     result = content
 
-    replacements = {
-        "ㅋㅋㅋ": "",
-        "ㅋㅋ": "",
-        "ㅎㅎㅎ": "",
-        "ㅎㅎ": "",
-        "ㅠㅠ": "",
-        "ㅜㅜ": "",
-        "헐": "",
-        "대박": "주목할 만한",
-        "완전 핵심": "핵심",
-        "진짜 진짜": "정말",
-        "진짜진짜": "정말",
-        "무조건": "반드시",
-        "꿀팁": "유용한 팁",
-        "핵꿀팁": "효과적인 방법",
-        "알짜팁": "실용적인 팁",
-        "충격": "주목할",
-        "경악": "놀라운",
-        "미친": "인상적인",
-        "역대급": "주목할 만한",
-        "레전드": "인상적인",
-        "완전 강추": "추천",
-        "강추": "추천",
-        "저도 솔직히": "사실",
-        "솔직히 저도": "사실",
-        "여기서 꿀팁 하나!": "추가로 알아두면 좋은 점이 있어요.",
-        "이건 진짜 꿀팁이에요": "이것은 효과적인 방법이에요",
-    }
-
-    for old, new in replacements.items():
+    for old, new in FORBIDDEN_REPLACEMENTS.items():
         result = result.replace(old, new)
 
-    result = re.sub(r'!{2,}', '!', result)
-    result = re.sub(r'\?{2,}', '?', result)
-    result = re.sub(r' {2,}', ' ', result)
+    for pattern, repl in PUNCTUATION_SUBS:
+        result = re.sub(pattern, repl, result)
 
     return result
 
 
 def limit_emojis(content: str, max_emojis: int = 2) -> str:
     """이모지 개수 제한"""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"
-        "\U0001F300-\U0001F5FF"
-        "\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF"
-        "\U00002702-\U000027B0"
-        "\U0001F900-\U0001F9FF"
-        "\U0001FA00-\U0001FA6F"
-        "\U0001FA70-\U0001FAFF"
-        "\U00002600-\U000026FF"
-        "\U00002700-\U000027BF"
-        "]+",
-        flags=re.UNICODE
-    )
-
-    emojis = emoji_pattern.findall(content)
+    emojis = EMOJI_PATTERN.findall(content)
     if len(emojis) <= max_emojis:
         return content
 
     result = content
     emoji_count = 0
-    for match in emoji_pattern.finditer(content):
+    for match in EMOJI_PATTERN.finditer(content):
         emoji_count += 1
         if emoji_count > max_emojis:
             result = result.replace(match.group(), '', 1)
@@ -0,0 +1,176 @@
+"""스트리밍 응답 섹션 분리기
+
+LLM 스트리밍 조각을 받아 <h2>/<h3> 소제목 단위로 섹션이 닫히는 즉시 돌려줌.
+다음 소제목이 시작되면 직전 섹션이 닫힌 것으로 보고, 스트림 종료 시 마지막 섹션을 닫음.
+완성된 응답은 split_sections로 소제목 블록(감싸는 <div>/<span> 포함) 사이의 본문만 떼어냄 (짧은 섹션 보강용).
+"""
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# 섹션 경계: 새 소제목 시작 태그
+HEADING_START = re.compile(r'<h[23][\s>]', re.IGNORECASE)
+HEADING_TEXT = re.compile(r'<h[23][^>]*>(.*?)</h[23]>', re.IGNORECASE | re.DOTALL)
+TAG = re.compile(r'<[^>]+>')
+# 소제목 블록: 템플릿 소제목 스타일의 감싸는 <div> (+ 번호 배지 <span>)까지 한 덩어리
+# (감싸는 <div>로 시작했을 때만 뒤의 </div>까지 포함)
+HEADING_BLOCK = re.compile(
+    r'(?P<wrap><div[^>]*>\s*(?:<span[^>]*>[^<]*</span>\s*)?)?'
+    r'<(?P<level>h[23])\b[^>]*>.*?</(?P=level)\s*>'
+    r'(?(wrap)\s*</div\s*>)',
+    re.IGNORECASE | re.DOTALL
+)
+# 태그 짝 검사용: 주석은 제외, 여는 / 닫는 / 스스로 닫는 태그
+HTML_TAG = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)\b[^>]*?(/?)>')
+VOID_TAGS = {"br", "img", "hr", "input", "meta", "link", "wbr", "source", "col", "area"}
+# 마지막 섹션 뒤의 [META] 블록 (본문이 아니라 가장자리로 취급)
+TRAILING_META = re.compile(r'\[META\](?:(?!\[META\]).)*?\[/META\]\s*$', re.DOTALL)
+
+# 태그 일부만 도착한 경우를 위해 다음 검색 시 뒤로 물러나는 글자 수 (len("<h2 ") - 1)
+_LOOKBACK = 3
+
+
+def section_heading(html: str) -> str:
+    """섹션 소제목 텍스트 (없으면 빈 문자열)"""
+    match = HEADING_TEXT.search(html)
+    if not match:
+        return ""
+    return TAG.sub("", match.group(1)).strip()
+
+
+@dataclass
+class SectionParts:
+    """소제목 블록 사이 본문 하나 (head + body + tail을 이어 붙이면 원문 구간과 동일)"""
+    head: str   # 소제목 블록 + 본문 앞 가장자리 (짝 없는 여는 태그 등)
+    body: str   # 다시 써도 되는 본문 (태그 짝이 맞음, 짝이 안 맞으면 빈 문자열)
+    tail: str   # 본문 뒤 가장자리 (짝 없는 닫는 태그, [META] 블록 등)
+
+    @property
+    def heading(self) -> str:
+        return section_heading(self.head)
+
+
+def unbalanced_tags(html: str) -> List[Tuple[int, int]]:
+    """
+    짝이 맞지 않는 태그 위치 목록
+
+    Args:
+        html: HTML 조각
+
+    Returns:
+        [(시작, 끝)] — 닫히지 않은 여는 태그와 여는 태그 없는 닫는 태그 (위치 순)
+    """
+    stack = []  # (태그 이름, 시작, 끝)
+    stray = []
+    for match in HTML_TAG.finditer(html):
+        closing, name, self_closing = match.group(1), match.group(2).lower(), match.group(3)
+        if self_closing or name in VOID_TAGS:
+            continue
+        if not closing:
+            stack.append((name, match.start(), match.end()))
+            continue
+        if not any(open_name == name for open_name, _, _ in stack):
+            stray.append((match.start(), match.end()))
+            continue
+        while stack:
+            open_name, start, end = stack.pop()
+            if open_name == name:
+                break
+            stray.append((start, end))
+    return sorted(stray + [(start, end) for _, start, end in stack])
+
+
+def _split_edges(segment: str) -> Tuple[str, str, str]:
+    """소제목 블록 뒤 구간 → (앞 가장자리, 본문, 뒤 가장자리)"""
+    edges = unbalanced_tags(segment)
+    starts = {start: end for start, end in edges}
+    ends = {end: start for start, end in edges}
+
+    begin = 0
+    while True:
+        begin += len(segment[begin:]) - len(segment[begin:].lstrip())
+        if begin not in starts:
+            break
+        begin = starts[begin]
+
+    finish = len(segment)
+    while finish > begin:
+        finish = begin + len(segment[begin:finish].rstrip())
+        meta = TRAILING_META.search(segment, begin, finish)
+        if meta:
+            finish = meta.start()
+        elif finish in ends:
+            finish = ends[finish]
+        else:
+            break
+
+    # 본문 안쪽에 짝 없는 태그가 남으면 구조를 모르므로 통째로 가장자리 취급
+    if any(begin <= start < finish for start, _ in edges):
+        return segment, "", ""
+    return segment[:begin], segment[begin:finish], segment[finish:]
+
+
+def split_sections(text: str) -> List[SectionParts]:
+    """
+    완성된 응답을 소제목 블록 단위로 분리 (이어 붙이면 원문과 동일)
+
+    소제목 블록(감싸는 <div>/<span> 포함)과 본문 앞뒤의 짝 없는 태그 / [META]는 head·tail로 빼고
+    태그 짝이 맞는 본문만 body에 남김 (본문만 바꿔 끼워도 HTML 구조가 유지됨)
+
+    Args:
+        text: 응답 원문
+
+    Returns:
+        섹션 목록 (첫 소제목 앞의 도입부 포함)
+    """
+    blocks = list(HEADING_BLOCK.finditer(text))
+    bounds = [(0, 0)] + [(m.start(), m.end()) for m in blocks]
+    nexts = [m.start() for m in blocks] + [len(text)]
+    sections = []
+    for (start, heading_end), next_start in zip(bounds, nexts):
+        lead, body, trail = _split_edges(text[heading_end:next_start])
+        sections.append(SectionParts(text[start:heading_end] + lead, body, trail))
+    return [section for section in sections if section.head or section.body or section.tail]
+
+
+class SectionStream:
+    """텍스트 조각 → 닫힌 섹션 목록"""
+
+    def __init__(self):
+        self._buffer = ""
+        self._scan_from = 0
+        self.text_parts: List[str] = []  # 받은 원문 전체 (최종 후처리용)
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        조각 추가
+
+        Args:
+            chunk: 스트리밍 텍스트 조각
+
+        Returns:
+            이번 조각으로 닫힌 섹션 HTML 목록 (원문)
+        """
+        self.text_parts.append(chunk)
+        self._buffer += chunk
+        closed = []
+        while True:
+            # 버퍼 맨 앞의 소제목은 현재 섹션의 시작이므로 그 다음 소제목을 찾음
+            match = HEADING_START.search(self._buffer, max(self._scan_from, 1))
+            if not match:
+                self._scan_from = max(len(self._buffer) - _LOOKBACK, 0)
+                return closed
+            section = self._buffer[:match.start()]
+            self._buffer = self._buffer[match.start():]
+            self._scan_from = 1
+            if section.strip():
+                closed.append(section)
+
+    def finish(self) -> List[str]:
+        """스트림 종료: 남은 섹션 반환"""
+        rest, self._buffer = self._buffer, ""
+        return [rest] if rest.strip() else []
+
+    @property
+    def text(self) -> str:
+        return "".join(self.text_parts)
@@ -0,0 +1,132 @@
+"""단계 의존성 그래프 실행기
+
+generate_full_post의 리서치 단계(트렌드 맥락, 웹검색, 블로그 참조, 강화 프롬프트,
+성과 추천, 연관 키워드, 제목)를 입력/출력이 선언된 Stage로 표현하고,
+서로 의존하지 않는 단계는 동시에 실행합니다.
+
+- 각 Stage는 선언한 inputs가 모두 준비되면 실행
+- 실패한 Stage는 defaults 값으로 출력을 채워 후속 단계가 계속 진행
+- 단계별 실행 시간(wall time)을 timings에 기록하고 트레이스 스팬으로 남김
+"""
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+from utils.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """그래프의 한 단계"""
+    name: str
+    func: Callable[..., Any]  # inputs를 키워드 인자로 받고, outputs 순서대로 값을 반환
+    inputs: List[str] = field(default_factory=list)
+    outputs: List[str] = field(default_factory=list)
+    defaults: Dict[str, Any] = field(default_factory=dict)  # 실패 시 출력값
+
+
+class StageGraph:
+    """선언된 입력/출력 기반 Stage 동시 실행기"""
+
+    def __init__(self, stages: List[Stage], max_workers: int = 4, span_prefix: str = "stage"):
+        self.stages = stages
+        self.span_prefix = span_prefix
+        self.max_workers = max(1, max_workers)
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._validate()
+
+    def _validate(self):
+        """출력 중복 / 누락된 입력 / 순환 의존성 검사"""
+        produced: Dict[str, str] = {}
+        for stage in self.stages:
+            for out in stage.outputs:
+                if out in produced:
+                    raise ValueError(f"Output '{out}' produced by both '{produced[out]}' and '{stage.name}'")
+                produced[out] = stage.name
+
+        for stage in self.stages:
+            for name in stage.inputs:
+                if name not in produced:
+                    raise ValueError(f"Stage '{stage.name}' requires unknown input '{name}'")
+
+        # 위상 정렬로 순환 검사
+        ready = set()
+        remaining = list(self.stages)
+        while remaining:
+            runnable = [s for s in remaining if all(i in ready for i in s.inputs)]
+            if not runnable:
+                names = ", ".join(s.name for s in remaining)
+                raise ValueError(f"Cyclic stage dependencies: {names}")
+            for stage in runnable:
+                ready.update(stage.outputs)
+                remaining.remove(stage)
+
+    def _run_stage(self, stage: Stage, values: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        """단일 Stage 실행 → (출력 딕셔너리, 소요 시간)"""
+        started = time.perf_counter()
+        kwargs = {name: values[name] for name in stage.inputs}
+        with tracer.span(f"{self.span_prefix}.{stage.name}"):
+            result = stage.func(**kwargs)
+        elapsed = time.perf_counter() - started
+
+        if len(stage.outputs) == 1:
+            result = (result,)
+        elif not stage.outputs:
+            result = ()
+        return dict(zip(stage.outputs, result)), elapsed
+
+    def run(self) -> Dict[str, Any]:
+        """
+        그래프 실행
+
+        Returns:
+            모든 Stage 출력 딕셔너리 (출력 이름 → 값)
+        """
+        values: Dict[str, Any] = {}
+        remaining = list(self.stages)
+        running = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage")
+        try:
+            while remaining or running:
+                # 입력이 준비된 Stage 제출
+                for stage in [s for s in remaining if all(i in values for i in s.inputs)]:
+                    remaining.remove(stage)
+                    snapshot = {name: values[name] for name in stage.inputs}
+                    # 부모 스팬이 워커 스레드로 이어지도록 컨텍스트 복사
+                    ctx = contextvars.copy_context()
+                    running[executor.submit(ctx.run, self._run_stage, stage, snapshot)] = stage
+
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        outputs, elapsed = future.result()
+                        self.timings[stage.name] = elapsed
+                    except Exception as e:
+                        logger.warning(f"Stage '{stage.name}' failed: {e}")
+                        self.errors[stage.name] = str(e)
+                        self.timings.setdefault(stage.name, 0.0)
+                        outputs = {name: stage.defaults.get(name) for name in stage.outputs}
+                    values.update(outputs)
+        finally:
+            executor.shutdown(wait=True)
+
+        return values
+
+    def format_timings(self) -> str:
+        """단계별 실행 시간 요약 문자열 (선언 순서)"""
+        parts = []
+        for stage in self.stages:
+            elapsed = self.timings.get(stage.name)
+            if elapsed is None:
+                continue
+            mark = " (실패)" if stage.name in self.errors else ""
+            parts.append(f"{stage.name} {elapsed:.1f}s{mark}")
+        return ", ".join(parts)
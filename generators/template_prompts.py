@@ -11,6 +11,30 @@ from config.templates import (
     get_cta_config
 )
 from generators.prompts import CONTENT_CONSISTENCY_RULES, get_heading_style_instruction
+from generators.context_assembler import ContextAssembler
+
+# 참고 자료 토큰 예산 기본값 (settings 로드 실패 시), 인물 프롬프트는 뉴스 팩트 비중이 커서 별도
+DEFAULT_CONTEXT_TOKENS = 2400
+PERSON_CONTEXT_TOKENS = 3200
+# 분량 가이드 허용 범위: selected_word_count ~ selected_word_count + WORD_COUNT_RANGE자
+WORD_COUNT_RANGE = 1500
+
+
+def get_context_budget(template: dict = None) -> int:
+    """
+    참고 자료 입력 토큰 예산
+
+    Returns:
+        템플릿 context_tokens → settings.context_budget_tokens 순, 예산 기능이 꺼져 있으면 0
+    """
+    try:
+        from config.settings import settings
+        if not settings.context_budget_enabled:
+            return 0
+        default = settings.context_budget_tokens
+    except Exception:
+        default = DEFAULT_CONTEXT_TOKENS
+    return (template or {}).get("context_tokens", default)
 
 
 # =============================================================================
@@ -164,10 +188,147 @@ CONTENT_LENGTH_GUIDE = """
 """
 
 
+# 본문 프롬프트의 고정 규칙 (태그 / 금지 표현 / 문체)
+TAG_RULES = """
+
+[필수 태그]
+- [OFFICIAL_LINK]: 공식 사이트 버튼 위치 (해당되는 경우)
+- [COUPANG]: 쿠팡 상품 위치 (CTA 위치: {cta_position})
+- [AFFILIATE_NOTICE]: 파트너스 문구 위치 (태그만 작성, 문구는 시스템이 자동 삽입)
+- [META]SEO 메타 설명 150자 이내[/META]: 글 맨 끝
+
+[파트너스 문구 - 매우 중요!]
+- [AFFILIATE_NOTICE] 태그만 표시하세요
+- 파트너스/제휴/광고 관련 문구를 직접 작성하지 마세요
+- "이 포스팅은 파트너십..." 같은 문구를 본문에 직접 쓰지 마세요
+- 시스템이 필요할 때만 자동으로 문구를 삽입합니다
+
+[이미지 태그 형식 - 매우 중요!]
+- 반드시 [IMAGE_1], [IMAGE_2] 형식으로만 작성 (최대 2개)
+- 콜론(:)이나 설명 추가 금지 (예: [IMAGE_1: 설명] ← 이렇게 하지 마세요)
+- <!-- IMG_CONTEXT --> 주석은 그대로 유지
+
+[절대 금지 - AdSense 승인 필수]
+- 감탄사: ㅋㅋ, ㅎㅎ, ㅠㅠ, 헐, 대박
+- 과장 표현: 완전, 진짜진짜, 무조건, 핵심 중의 핵심
+- 클릭베이트: 충격, 경악, 미친, 역대급
+- 꿀팁, 핵꿀팁, 알짜팁 → "효과적인 방법", "유용한 정보"로 대체
+- 이모지: 전체 글에서 최대 2개만 (소제목에만 사용)
+- "첫째, 둘째, 셋째" 사용 금지 (→ "먼저", "다음으로", "마지막으로" 사용)
+- "~하는 것이 중요합니다" 사용 금지 (→ "~하는 게 중요해요")
+- "제공해주신", "작성하겠습니다" 등 메타 표현 금지
+- 모든 문장이 비슷한 길이로 정렬됨 (문장 길이 다양하게)
+- [IMAGE_1: 설명] 형식 사용 금지 (→ [IMAGE_1] 만 사용)
+
+[문체 규칙]
+- 정중한 해요체 사용 ("~해요", "~예요")
+- 전문적이면서 친근한 톤
+- 짧고 명확한 문장 (40자 이내)
+- 객관적 사실 중심 서술
+
+결과는 순수 HTML만 출력하세요 (```html 코드 블록 없이).
+"""
+
+# 키워드와 무관한 고정 규칙 전체: 시스템 프롬프트 뒤에 캐시 가능한 접두사로 전송
+# (generate_template_prompt(with_static_rules=False)와 함께 사용, CTA 위치는 본문 프롬프트에 포함)
+CONTENT_STATIC_RULES = TAG_RULES.format(cta_position="본문 지시의 [CTA 위치] 참고") + CONTENT_CONSISTENCY_RULES
+
+
+# 개요 → 섹션 병렬 생성 모드 (ContentGenerator._generate_outlined)
+# 본문 프롬프트 뒤에 붙여 개요만 받고, 각 섹션은 본문 프롬프트를 공통 맥락으로 동시에 작성
+OUTLINE_PROMPT = """
+
+[이번 응답 — 개요만 작성]
+위 지시대로 글을 쓰기 전에 개요만 JSON으로 출력하세요 (본문 작성 금지):
+{{
+  "title": "대제목",
+  "meta": "SEO 메타 설명 150자 이내",
+  "sections": [
+    {{"heading": "서론은 빈 문자열, 나머지는 소제목 문구", "points": ["이 섹션에서 다룰 핵심 내용 2~4개"], "chars": 목표 글자수, "image": true 또는 false}}
+  ],
+  "tags": {{"COUPANG": 섹션 번호, "OFFICIAL_LINK": 섹션 번호 또는 null, "AFFILIATE_NOTICE": 섹션 번호 또는 null}}
+}}
+- sections는 [글 구조] 순서 그대로, 첫 항목은 서론 (섹션 번호는 0부터)
+- image는 [글 구조]에서 이미지가 배치된 섹션만 true (최대 {image_count}개)
+- chars 합계는 목표 글자수와 비슷하게
+JSON만 출력하세요 (설명, 코드 블록 없이).
+"""
+
+SECTION_WRITE_PROMPT = """
+지금은 위 글의 {number}번째 섹션만 작성합니다 (전체 {total}개 섹션은 동시에 따로 작성 중).
+
+[전체 개요]
+{outline}
+
+[이번 섹션]
+소제목: {heading}
+다룰 내용: {points}
+분량: 약 {chars}자 (공백 포함)
+
+[이번 응답 규칙]
+- {heading_rule}
+- 개요의 다른 섹션 내용은 쓰지 마세요 (중복 금지)
+- 전체를 감싸는 <div>, 대제목, [META], [IMAGE_N], IMG_CONTEXT 주석, [COUPANG] 등 대괄호 태그는 쓰지 마세요 (조립 단계에서 자동 배치)
+- 이 섹션의 HTML만 출력 (설명, 코드 블록 없이)
+"""
+
+# 짧은 초안 보강: 분량이 모자란 섹션만 다시 작성 (ContentGenerator._expand_short_sections)
+SECTION_EXPAND_PROMPT = """
+아래는 '{keyword}' 블로그 글에서 소제목 "{heading}" 아래의 본문입니다.
+
+[글 전체 소제목 흐름]
+{outline}
+
+이 본문만 약 {target}자(공백 포함)로 보강해서 다시 작성하세요.
+- 소제목은 쓰지 마세요 (소제목 아래 본문 HTML만, 소제목은 그대로 유지됨)
+- 모든 태그는 이 본문 안에서 열고 닫기 (앞뒤 섹션의 태그를 닫거나 새로 열어 두지 않기)
+- [IMAGE_N], IMG_CONTEXT 주석, [COUPANG] 등 대괄호 태그는 같은 위치에 그대로 포함
+- 다른 섹션과 겹치지 않게 구체적인 예시, 수치, 방법, 주의사항을 추가
+- 기존 문장의 톤과 말투 유지
+- 본문 HTML만 출력 (설명, 코드 블록, 다른 섹션 없이)
+
+[기존 본문]
+{section}
+"""
+
+# 글 계획: 제목 후보 + 메타 + 개요 + 이미지 검색어를 한 번에 (generators/post_plan.py에서 검증)
+POST_PLAN_PROMPT = """
+
+[이번 응답 — 글 계획만 작성]
+위 지시대로 글을 쓰기 전에 글 계획만 JSON으로 출력하세요 (본문 작성 금지):
+{{
+  "titles": ["제목 후보 3개, 가장 좋은 것을 첫 번째로"],
+  "meta": "SEO 메타 설명 150자 이내",
+  "sections": [
+    {{"heading": "서론은 빈 문자열, 나머지는 소제목 문구", "points": ["이 섹션에서 다룰 핵심 내용 2~4개 (참고 자료의 수치/날짜 포함)"], "chars": 목표 글자수, "image": true 또는 false}}
+  ],
+  "image_queries": [{{"section": 섹션 번호, "query": "english pexels query"}}],
+  "tags": {{"COUPANG": 섹션 번호, "OFFICIAL_LINK": 섹션 번호 또는 null, "AFFILIATE_NOTICE": 섹션 번호 또는 null}}
+}}
+
+[제목 규칙]
+- '{keyword}'를 앞 15자 이내에 배치, 30~45자, {year}년 또는 시의성 표현 권장
+- 구체적인 숫자 / 방법 / 비교로 독자가 얻을 이득이 보이게, 위 SEO 연관 키워드 1개 정도 자연스럽게
+- 금지: "완벽 가이드", "꼭 알아야 할", "핵심 정보" 단독, "총정리" 단독, "모든 것", "A to Z", "알아보겠습니다"
+
+[개요 규칙]
+- sections는 [글 구조] 순서 그대로, 첫 항목은 서론 (섹션 번호는 0부터)
+- image는 [글 구조]에서 이미지가 배치된 섹션만 true (최대 {image_count}개)
+- chars 합계는 목표 글자수와 비슷하게
+
+[이미지 검색어 규칙]
+- 서론(0)과 image가 true인 섹션마다 하나씩, 2~4단어 영문 (Pexels에서 검색 가능한 구체적 사물/장면)
+- 실제 인물 / 연예인 이름 금지, 검색어끼리 서로 다른 장면
+
+JSON만 출력하세요 (설명, 코드 블록 없이).
+"""
+
+
 def generate_person_prompt(
     keyword: str,
     category: str,
-    web_data: str = ""
+    web_data: str = "",
+    web_data_limit: int = 4000
 ) -> tuple:
     """
     인물 키워드 전용 프롬프트 생성 (뉴스 팩트 중심)
@@ -176,6 +337,7 @@ def generate_person_prompt(
         keyword: 인물 키워드
         category: 카테고리명
         web_data: 웹검색 데이터 (뉴스 정보)
+        web_data_limit: web_data 최대 글자 수 (None이면 자르지 않음 — 이미 예산 안에서 조립된 경우)
 
     Returns:
         (프롬프트, 템플릿 키, 템플릿 설정, CTA 설정) 튜플
@@ -183,7 +345,7 @@ def generate_person_prompt(
     prompt = PERSON_NEWS_PROMPT.format(
         keyword=keyword,
         category=category,
-        web_data=web_data[:4000] if web_data else "최신 뉴스 정보를 바탕으로 작성해주세요."
+        web_data=web_data[:web_data_limit] if web_data else "최신 뉴스 정보를 바탕으로 작성해주세요."
     )
 
     # 인물 전용 템플릿 정보
@@ -205,7 +367,9 @@ def generate_template_prompt(
     category: str,
     web_data: str = "",
     is_evergreen: bool = False,
-    is_person: bool = False
+    is_person: bool = False,
+    with_static_rules: bool = True,
+    context: ContextAssembler = None
 ) -> tuple:
     """
     템플릿 기반 프롬프트 생성
@@ -216,17 +380,34 @@ def generate_template_prompt(
         web_data: 웹검색 데이터
         is_evergreen: 에버그린 콘텐츠 여부
         is_person: 인물 키워드 여부
+        with_static_rules: False면 고정 규칙(CONTENT_STATIC_RULES)을 빼고 반환
+                           (호출부가 캐시 가능한 접두사로 따로 전송, 인물 프롬프트에는 영향 없음)
+        context: 참고 자료 블록 (지정 시 web_data 대신 선택된 템플릿의 토큰 예산에 맞춰 조립)
 
     Returns:
         (프롬프트, 템플릿 키, 템플릿 설정, CTA 설정) 튜플
     """
     # 인물 키워드는 전용 프롬프트 사용
     if is_person:
+        if context is not None:
+            budget = get_context_budget({"context_tokens": PERSON_CONTEXT_TOKENS})
+            if budget > 0:
+                return generate_person_prompt(keyword, category, context.assemble(budget), web_data_limit=None)
+            web_data = context.render_all()
         return generate_person_prompt(keyword, category, web_data)
 
     # 1. 랜덤 템플릿 선택
     template_key, template = get_random_template()
 
+    # 참고 자료: 블록이 주어지면 템플릿 예산에 맞춰 조립 (자르지 않음), 아니면 기존처럼 글자 수로 자름
+    web_data_limit = 3000
+    if context is not None:
+        budget = get_context_budget(template)
+        if budget > 0:
+            web_data, web_data_limit = context.assemble(budget), None
+        else:
+            web_data = context.render_all()
+
     # 2. 서론 스타일 결정
     intro_section = next((s for s in template["sections"] if s["type"] == "intro"), None)
     intro_style = intro_section.get("style", "hook") if intro_section else "hook"
@@ -340,7 +521,7 @@ def generate_template_prompt(
         prompt += f"""
 
 [참고 자료 - 최신 정보 반영 필수]
-{web_data[:3000]}
+{web_data[:web_data_limit]}
 
 [중요] 위 참고 자료의 수치, 날짜, 금액을 정확히 반영하세요.
 """
@@ -357,54 +538,19 @@ def generate_template_prompt(
 - "최신", "현재 기준" 표현 권장
 """
 
-    # CTA 및 태그 안내
-    prompt += f"""
-
-[필수 태그]
-- [OFFICIAL_LINK]: 공식 사이트 버튼 위치 (해당되는 경우)
-- [COUPANG]: 쿠팡 상품 위치 (CTA 위치: {cta_config['position']})
-- [AFFILIATE_NOTICE]: 파트너스 문구 위치 (태그만 작성, 문구는 시스템이 자동 삽입)
-- [META]SEO 메타 설명 150자 이내[/META]: 글 맨 끝
-
-[파트너스 문구 - 매우 중요!]
-- [AFFILIATE_NOTICE] 태그만 표시하세요
-- 파트너스/제휴/광고 관련 문구를 직접 작성하지 마세요
-- "이 포스팅은 파트너십..." 같은 문구를 본문에 직접 쓰지 마세요
-- 시스템이 필요할 때만 자동으로 문구를 삽입합니다
-
-[이미지 태그 형식 - 매우 중요!]
-- 반드시 [IMAGE_1], [IMAGE_2] 형식으로만 작성 (최대 2개)
-- 콜론(:)이나 설명 추가 금지 (예: [IMAGE_1: 설명] ← 이렇게 하지 마세요)
-- <!-- IMG_CONTEXT --> 주석은 그대로 유지
-
-[절대 금지 - AdSense 승인 필수]
-- 감탄사: ㅋㅋ, ㅎㅎ, ㅠㅠ, 헐, 대박
-- 과장 표현: 완전, 진짜진짜, 무조건, 핵심 중의 핵심
-- 클릭베이트: 충격, 경악, 미친, 역대급
-- 꿀팁, 핵꿀팁, 알짜팁 → "효과적인 방법", "유용한 정보"로 대체
-- 이모지: 전체 글에서 최대 2개만 (소제목에만 사용)
-- "첫째, 둘째, 셋째" 사용 금지 (→ "먼저", "다음으로", "마지막으로" 사용)
-- "~하는 것이 중요합니다" 사용 금지 (→ "~하는 게 중요해요")
-- "제공해주신", "작성하겠습니다" 등 메타 표현 금지
-- 모든 문장이 비슷한 길이로 정렬됨 (문장 길이 다양하게)
-- [IMAGE_1: 설명] 형식 사용 금지 (→ [IMAGE_1] 만 사용)
-
-[문체 규칙]
-- 정중한 해요체 사용 ("~해요", "~예요")
-- 전문적이면서 친근한 톤
-- 짧고 명확한 문장 (40자 이내)
-- 객관적 사실 중심 서술
-
-결과는 순수 HTML만 출력하세요 (```html 코드 블록 없이).
+    # CTA 및 태그 안내 + 제목-본문 일관성 규칙 (고정 규칙)
+    if with_static_rules:
+        prompt += TAG_RULES.format(cta_position=cta_config['position'])
+        prompt += CONTENT_CONSISTENCY_RULES
+    else:
+        prompt += f"""
+[CTA 위치] [COUPANG] 태그 위치: {cta_config['position']}
 """
 
-    # 제목-본문 일관성 규칙 추가
-    prompt += CONTENT_CONSISTENCY_RULES
-
     # 분량 가이드 추가
     length_guide = CONTENT_LENGTH_GUIDE.format(
         min_words=template['selected_word_count'],
-        max_words=template['selected_word_count'] + 1500
+        max_words=template['selected_word_count'] + WORD_COUNT_RANGE
     )
     prompt += length_guide
 
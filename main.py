@@ -9,10 +9,18 @@
     python main.py --draft              # draft 모드로 발행
     python main.py --limit 2            # 발행 개수 제한
     python main.py --evergreen          # 에버그린 키워드 발행
+    python main.py --limit 5 --workers 3   # 3개 키워드를 동시에 처리
+    python main.py --dry-run --no-llm-cache  # LLM 응답 캐시 조회 건너뛰기 (llm_cache_enabled일 때)
+    python main.py --batch-evergreen 10 # 에버그린 글 10개를 일괄 처리로 미리 생성 (--evergreen 실행 시 먼저 발행)
 """
 import argparse
+import contextvars
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Optional
 import re
 import sys
@@ -24,8 +32,16 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from config.settings import settings
 from database.models import db
+from database.ready_queue import ready_queue
 from crawlers import GoogleTrendsCrawler, NaverNewsCrawler
 from crawlers.blog_reference import BlogReferenceCrawler
+from crawlers.research_memo import research_memo
+from utils.response_cache import response_cache
+from utils.llm_cache import llm_cache
+from utils.llm_router import llm_router
+from utils.llm_governor import llm_governor, PRIORITY_BATCH, PRIORITY_PUBLISH
+from utils.llm_usage import llm_usage
+from utils.tracing import tracer
 from generators import ContentGenerator
 from publishers import WordPressPublisher
 from utils.quality_scorer import score_generated_content
@@ -157,7 +173,8 @@ def process_keyword(
     content_generator: ContentGenerator,
     wp_publisher: WordPressPublisher,
     dry_run: bool = False,
-    status: str = "publish"
+    status: str = "publish",
+    publish_lock: threading.Lock = None
 ) -> bool:
     """
     단일 키워드 처리
@@ -169,6 +186,7 @@ def process_keyword(
         wp_publisher: 워드프레스 발행기 인스턴스
         dry_run: 실제 발행 없이 테스트
         status: 발행 상태
+        publish_lock: 병렬 처리 시 "중복 체크 → 발행 → DB 저장" 구간 직렬화용 락
 
     Returns:
         성공 여부
@@ -176,16 +194,18 @@ def process_keyword(
     try:
         logger.info(f"Processing keyword: {keyword}")
 
-        # 0. 블로그 참조 분석 (강화 버전)
+        # 0. 블로그 참조 분석 (강화 버전, 결과는 리서치 메모에 남아 생성 단계에서 재사용)
         logger.info("Step 0: Blog reference analysis (enhanced)...")
         blog_crawler = BlogReferenceCrawler()
-        blog_analysis = blog_crawler.get_detailed_analysis(keyword, count=5)
+        with tracer.span("blog_reference"):
+            blog_analysis = blog_crawler.get_detailed_analysis(keyword, count=5)
         reference_keywords = blog_analysis.get("common_patterns", {}).get("common_keywords", [])
         logger.info(f"Blog analysis: {len(blog_analysis.get('blogs', []))} blogs, {len(reference_keywords)} common keywords")
 
         # 1. 네이버 뉴스 검색 및 요약
         logger.info("Step 1: Fetching news data...")
-        news_data = news_crawler.get_news_summary(keyword, max_articles=3)
+        with tracer.span("news_crawl"):
+            news_data = news_crawler.get_news_summary(keyword, max_articles=3)
         logger.info(f"News data fetched: {len(news_data)} characters")
 
         # 2. Claude로 블로그 글 생성 (고품질 콘텐츠 + 이미지 + 버튼)
@@ -204,12 +224,13 @@ def process_keyword(
 
         # 2.5. 품질 점수 체크 (새로운 기능)
         logger.info("Step 2.5: Quality score check...")
-        quality_result = score_generated_content(
-            content=post.content,
-            keyword=keyword,
-            title=post.title,
-            reference_keywords=reference_keywords
-        )
+        with tracer.span("quality_score"):
+            quality_result = score_generated_content(
+                content=post.content,
+                keyword=keyword,
+                title=post.title,
+                reference_keywords=reference_keywords
+            )
         logger.info(f"  - Quality Score: {quality_result.total_score:.1f}/100")
         logger.info(f"  - Char: {quality_result.char_count}, Headings: {quality_result.heading_count}, Images: {quality_result.image_count}")
         if quality_result.suggestions:
@@ -236,23 +257,54 @@ def process_keyword(
             logger.info("=== DRY RUN END ===")
             return True
 
+        return _publish_post(keyword, post, wp_publisher, status, publish_lock) is not None
+
+    except Exception as e:
+        logger.error(f"Error processing keyword '{keyword}': {e}")
+        return False
+
+
+def _publish_post(
+    keyword: str,
+    post,
+    wp_publisher: WordPressPublisher,
+    status: str = "publish",
+    publish_lock: threading.Lock = None
+) -> Optional[str]:
+    """
+    생성된 글 발행: 최종 중복 체크 → 워드프레스 발행 → DB 저장 → 성과 추적 / 색인 요청
+
+    Args:
+        keyword: 키워드
+        post: GeneratedPost 또는 ReadyPost (title / content / excerpt / category)
+        wp_publisher: 워드프레스 발행기 인스턴스
+        status: 발행 상태
+        publish_lock: 병렬 처리 시 "중복 체크 → 발행 → DB 저장" 구간 직렬화용 락
+
+    Returns:
+        발행된 글 URL, 중복 차단 / 발행 실패 시 None
+    """
+    # 2.5 ~ 4. 중복 체크 → 발행 → DB 저장 (병렬 처리 시 이 구간만 직렬화:
+    #          두 워커가 동시에 체크를 통과해 유사 글을 발행하는 것 방지)
+    with publish_lock or nullcontext():
         # 2.5. 발행 직전 최종 중복 체크 (토큰 기반 강화)
         try:
-            is_dup, dup_info = check_duplicate(
-                keyword=keyword,
-                wp_url=wp_publisher.site_url,
-                wp_user=wp_publisher.username,
-                wp_pass=wp_publisher.app_password,
-                db=db,
-                threshold=0.6,
-                days=30
-            )
+            with tracer.span("dedup_check"):
+                is_dup, dup_info = check_duplicate(
+                    keyword=keyword,
+                    wp_url=wp_publisher.site_url,
+                    wp_user=wp_publisher.username,
+                    wp_pass=wp_publisher.app_password,
+                    db=db,
+                    threshold=0.6,
+                    days=30
+                )
             if is_dup:
                 logger.warning(f"DUPLICATE BLOCKED: '{keyword}' ~ '{dup_info.get('title', '')}' (sim={dup_info['similarity']})")
-                return False
+                return None
         except Exception as e:
             logger.error(f"Dedup check failed, BLOCKING publish for safety: {e}")
-            return False
+            return None
 
         # 3. 워드프레스에 발행
         logger.info(f"Step 3: Publishing to WordPress (status: {status})...")
@@ -278,39 +330,72 @@ def process_keyword(
             )
             logger.info(f"Successfully published: {result.url}")
 
-            # 4.5. 성과 추적 등록
-            try:
-                from utils.performance_tracker import PerformanceTracker
-                tracker = PerformanceTracker()
-                tracker.register_our_post({
-                    "post_id": result.post_id,
-                    "url": result.url,
-                    "keyword": keyword,
-                    "category": post.category,
-                    "title": post.title,
-                    "length": len(post.content),
-                    "heading_count": post.content.count("<h2") + post.content.count("<h3"),
-                    "image_count": post.content.count("<img"),
-                })
-                logger.info("Post registered for performance tracking")
-            except Exception as e:
-                logger.warning(f"Performance tracking failed: {e}")
+    if not result.success:
+        logger.error(f"Failed to publish: {result.error}")
+        return None
+
+    # 4.5. 성과 추적 등록
+    try:
+        from utils.performance_tracker import PerformanceTracker
+        tracker = PerformanceTracker()
+        with tracer.span("performance_track"):
+            tracker.register_our_post({
+                "post_id": result.post_id,
+                "url": result.url,
+                "keyword": keyword,
+                "category": post.category,
+                "title": post.title,
+                "length": len(post.content),
+                "heading_count": post.content.count("<h2") + post.content.count("<h3"),
+                "image_count": post.content.count("<img"),
+            })
+        logger.info("Post registered for performance tracking")
+    except Exception as e:
+        logger.warning(f"Performance tracking failed: {e}")
+
+    # 5. Google Indexing API 색인 요청
+    try:
+        from utils.google_indexing import request_indexing
+        with tracer.span("indexing"):
+            request_indexing(result.url)
+    except Exception as e:
+        logger.warning(f"Google Indexing request failed: {e}")
+
+    return result.url
 
-            # 5. Google Indexing API 색인 요청
+
+def publish_ready_posts(limit: int, wp_publisher: WordPressPublisher, status: str = "publish") -> int:
+    """
+    --batch-evergreen으로 미리 생성해 둔 글을 대기열에서 꺼내 발행 (생성 단계 없음)
+
+    Args:
+        limit: 최대 발행 수
+        wp_publisher: 워드프레스 발행기 인스턴스
+        status: 발행 상태
+
+    Returns:
+        발행한 글 수
+    """
+    published = 0
+    while published < limit:
+        ready = ready_queue.claim()
+        if ready is None:
+            break
+        logger.info(f"Publishing ready post #{ready.id}: {ready.keyword} ({ready.title})")
+        with tracer.span("publish_ready", keyword=ready.keyword, ready_id=ready.id) as attrs:
             try:
-                from utils.google_indexing import request_indexing
-                request_indexing(result.url)
+                url = _publish_post(ready.keyword, ready, wp_publisher, status)
             except Exception as e:
-                logger.warning(f"Google Indexing request failed: {e}")
-
-            return True
+                logger.error(f"Error publishing ready post #{ready.id}: {e}")
+                url = None
+            attrs["success"] = url is not None
+        if url:
+            ready_queue.mark_published(ready.id, url)
+            published += 1
         else:
-            logger.error(f"Failed to publish: {result.error}")
-            return False
-
-    except Exception as e:
-        logger.error(f"Error processing keyword '{keyword}': {e}")
-        return False
+            # 중복 차단 / 발행 실패 글은 다시 꺼내지 않고 다음 대기 글로
+            ready_queue.mark_failed(ready.id, "duplicate blocked or publish failed")
+    return published
 
 
 def run_pipeline(
@@ -318,10 +403,11 @@ def run_pipeline(
     specific_keyword: str = None,
     posts_limit: int = None,
     status: str = "publish",
-    evergreen: bool = False
+    evergreen: bool = False,
+    workers: int = 1
 ):
     """
-    메인 파이프라인 실행
+    메인 파이프라인 실행 (실행 단위 트레이스 기록)
 
     Args:
         dry_run: 실제 발행 없이 테스트
@@ -329,13 +415,36 @@ def run_pipeline(
         posts_limit: 발행할 포스트 수 제한
         status: 발행 상태
         evergreen: 에버그린 키워드 사용 여부
+        workers: 동시에 처리할 키워드 수 (1이면 순차 처리)
     """
+    tracer.start_run("evergreen" if evergreen else "trending")
+    try:
+        with tracer.span("pipeline", dry_run=dry_run, workers=workers):
+            _run_pipeline(dry_run, specific_keyword, posts_limit, status, evergreen, workers)
+    finally:
+        tracer.end_run()
+
+
+def _run_pipeline(
+    dry_run: bool,
+    specific_keyword: str,
+    posts_limit: int,
+    status: str,
+    evergreen: bool,
+    workers: int
+):
+    """run_pipeline 본체"""
     mode = "Evergreen" if evergreen else "Trending"
     logger.info("=" * 60)
     logger.info(f"Starting Auto Blog Publisher Pipeline [{mode}]")
-    logger.info(f"Dry run: {dry_run}, Status: {status}")
+    logger.info(f"Dry run: {dry_run}, Status: {status}, Workers: {workers}")
     logger.info("=" * 60)
 
+    # 만료된 블로그 분석 메모 정리 (SQLite 계층)
+    purged = research_memo.purge_expired()
+    if purged:
+        logger.info(f"Research memo: {purged} expired entries purged")
+
     # 인스턴스 초기화
     trends_crawler = GoogleTrendsCrawler()
     news_crawler = NaverNewsCrawler()
@@ -350,6 +459,19 @@ def run_pipeline(
         keywords = [specific_keyword]
         logger.info(f"Using specific keyword: {specific_keyword}")
     elif evergreen:
+        # 미리 생성한 글(--batch-evergreen)부터 발행하고 모자란 만큼만 새로 생성
+        if dry_run:
+            logger.info(f"Ready queue: {ready_queue.count()} posts waiting (not published in dry run)")
+        else:
+            with tracer.span("ready_queue") as attrs:
+                published = publish_ready_posts(posts_count, wp_publisher, status)
+                attrs["published"] = published
+            if published:
+                logger.info(f"Published {published} ready posts from batch queue ({ready_queue.count()} left)")
+                posts_count -= published
+            if posts_count <= 0:
+                return
+
         # 에버그린 키워드 가져오기
         keywords = []
         for _ in range(posts_count):
@@ -363,7 +485,8 @@ def run_pipeline(
         try:
             from crawlers.topic_selector import TopicSelector
             topic_selector = TopicSelector()
-            keywords = topic_selector.get_best_keywords(limit=posts_count * 2)  # 성과 기반 필터링용 여유분
+            with tracer.span("topic_select"):
+                keywords = topic_selector.get_best_keywords(limit=posts_count * 2)  # 성과 기반 필터링용 여유분
             logger.info(f"TopicSelector keywords: {keywords}")
 
             # 성과 학습 기반 키워드 우선순위 조정
@@ -419,37 +542,192 @@ def run_pipeline(
         logger.info("All keywords filtered by dedup. Exiting.")
         return
 
-    # 키워드별 처리
-    success_count = 0
-    fail_count = 0
-
-    for i, keyword in enumerate(keywords, 1):
-        logger.info(f"\n--- Processing {i}/{len(keywords)}: {keyword} ---")
+    # 키워드별 처리 (generator/crawler/publisher 인스턴스는 워커 간 공유)
+    workers = max(1, min(workers, len(keywords)))
+    publish_lock = threading.Lock() if workers > 1 else None
+    pipeline_started = time.monotonic()
 
-        success = process_keyword(
-            keyword=keyword,
-            news_crawler=news_crawler,
-            content_generator=content_generator,
-            wp_publisher=wp_publisher,
-            dry_run=dry_run,
-            status=status
-        )
+    def _run_one(index: int, keyword: str) -> tuple[bool, float]:
+        logger.info(f"\n--- Processing {index}/{len(keywords)}: {keyword} ---")
+        started = time.monotonic()
+        with tracer.span("process_keyword", keyword=keyword) as attrs:
+            success = process_keyword(
+                keyword=keyword,
+                news_crawler=news_crawler,
+                content_generator=content_generator,
+                wp_publisher=wp_publisher,
+                dry_run=dry_run,
+                status=status,
+                publish_lock=publish_lock
+            )
+            attrs["success"] = success
+        elapsed = time.monotonic() - started
+        logger.info(f"--- Finished {index}/{len(keywords)}: {keyword} ({'OK' if success else 'FAIL'}, {elapsed:.1f}s) ---")
+        return success, elapsed
+
+    if workers > 1:
+        logger.info(f"Parallel mode: {len(keywords)} keywords on {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline") as executor:
+            # 키워드 스팬이 pipeline 스팬 아래에 기록되도록 컨텍스트 복사
+            futures = [
+                executor.submit(contextvars.copy_context().run, _run_one, i, kw)
+                for i, kw in enumerate(keywords, 1)
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [_run_one(i, kw) for i, kw in enumerate(keywords, 1)]
 
-        if success:
-            success_count += 1
-        else:
-            fail_count += 1
+    success_count = sum(1 for success, _ in results if success)
+    fail_count = len(results) - success_count
+    wall_time = max(time.monotonic() - pipeline_started, 1e-6)
+    busy_time = sum(elapsed for _, elapsed in results)
 
     # 결과 요약
     logger.info("\n" + "=" * 60)
     logger.info(f"Pipeline Complete! [{mode}]")
     logger.info(f"Success: {success_count}, Failed: {fail_count}")
+    logger.info(
+        f"Throughput: {len(results)} keywords in {wall_time:.1f}s "
+        f"({len(results) / wall_time * 60:.2f}/min), "
+        f"avg {busy_time / len(results):.1f}s per keyword, "
+        f"parallel speedup x{busy_time / wall_time:.2f} ({workers} workers)"
+    )
+    memo_stats = research_memo.get_stats()
+    logger.info(f"Research memo: {memo_stats['hits']} hits, {memo_stats['misses']} misses")
+    cache_stats = response_cache.get_stats()
+    logger.info(
+        f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+        f"{cache_stats['misses']} misses ({cache_stats['entries']} entries, {cache_stats['size_mb']}MB)"
+    )
+    if llm_cache.enabled:
+        llm_stats = llm_cache.get_stats()
+        logger.info(
+            f"LLM cache: {llm_stats['hits']} hits, {llm_stats['misses']} misses, "
+            f"{llm_stats['saved_chars']} chars reused{' (bypass)' if llm_stats['bypass'] else ''} "
+            f"({llm_stats['entries']} entries, {llm_stats['size_mb']}MB)"
+        )
+    governor_stats = llm_governor.get_stats()
+    if governor_stats["acquired"]:
+        logger.info(
+            f"LLM governor: {governor_stats['acquired']} calls, {governor_stats['waited']} waited "
+            f"(avg {governor_stats['avg_wait']:.1f}s, max {governor_stats['max_wait']:.1f}s, "
+            f"{governor_stats['timeouts']} timeouts)"
+        )
+    usage_stats = llm_usage.get_stats()
+    if usage_stats["calls"]:
+        logger.info(
+            f"LLM usage: {usage_stats['calls']} calls, {usage_stats['tokens']:,} tokens, "
+            f"~${usage_stats['cost']:.3f}"
+        )
+    route_stats = llm_router.get_stats()
+    if route_stats["providers"]:
+        providers = ", ".join(
+            f"{name} {stats['calls']} calls p90 {stats['p90'] or 0:.1f}s err {stats['error_rate']:.0%}"
+            for name, stats in route_stats["providers"].items()
+        )
+        logger.info(
+            f"LLM router: {providers} "
+            f"({route_stats['failovers']} failovers, {route_stats['hedges']} hedges / {route_stats['hedge_wins']} won)"
+        )
+    logger.info("=" * 60)
+
+
+def run_batch_evergreen(count: int, backend: str = None, workers: int = None):
+    """
+    에버그린 글을 미리 생성해 발행 대기열에 저장 (실행 단위 트레이스 기록)
+
+    키워드별 리서치 / 글 계획은 실시간으로, 본문 호출은 모아서 일괄 처리 API로 제출 (utils/llm_batch.py)
+
+    Args:
+        count: 생성할 글 수
+        backend: 일괄 처리 백엔드 (auto / anthropic / local, None이면 설정값)
+        workers: 동시에 준비할 글 수 (None이면 설정값)
+    """
+    tracer.start_run("batch_evergreen")
+    try:
+        with tracer.span("batch_evergreen", count=count):
+            _run_batch_evergreen(count, backend or settings.batch_backend, workers or settings.batch_workers)
+    finally:
+        tracer.end_run()
+
+
+def _run_batch_evergreen(count: int, backend: str, workers: int):
+    """run_batch_evergreen 본체"""
+    from crawlers.evergreen_selector import EvergreenSelector
+    from utils.llm_batch import AnthropicBatchBackend, BatchCollector, LocalBatchBackend
+
+    logger.info("=" * 60)
+    logger.info(f"Starting evergreen batch generation ({count} posts, backend: {backend})")
+    logger.info("=" * 60)
+
+    news_crawler = NaverNewsCrawler()
+    content_generator = ContentGenerator()
+
+    # 키워드 선정 (대기 중인 글 / 이번 배치에서 이미 고른 키워드 제외, 후보가 떨어지면 중단)
+    selector = EvergreenSelector()
+    queued = ready_queue.ready_keywords()
+    keywords = []
+    for _ in range(count):
+        keyword = selector.select_keyword(exclude_keywords=queued + keywords)
+        if not keyword or keyword in keywords or keyword in queued:
+            break
+        keywords.append(keyword)
+    if not keywords:
+        logger.info("No evergreen keywords left to prepare. Exiting.")
+        return
+    logger.info(f"Batch keywords: {keywords}")
+
+    # 일괄 처리 API는 Claude 전용 → Gemini / 구버전 SDK는 같은 흐름을 실시간 호출로
+    if backend == "auto":
+        backend = "anthropic" if content_generator.ai_provider == "claude" else "local"
+    if backend == "anthropic" and not AnthropicBatchBackend.supported(content_generator.client):
+        logger.warning("Installed anthropic SDK has no Message Batches API, using local backend")
+        backend = "local"
+    if backend == "anthropic":
+        batch_backend = AnthropicBatchBackend(content_generator.client, content_generator.model)
+    else:
+        batch_backend = LocalBatchBackend(workers)
+
+    def job(keyword: str):
+        def run():
+            with tracer.span("process_keyword", keyword=keyword) as attrs:
+                with tracer.span("news_crawl"):
+                    news_data = news_crawler.get_news_summary(keyword, max_articles=3)
+                post = content_generator.generate_full_post(keyword, news_data)
+                ready_id = ready_queue.add(keyword, post)
+                attrs["ready_id"] = ready_id
+            print(f"  ✅ 대기열 추가 #{ready_id}: {post.title}")
+            return ready_id
+        return run
+
+    started = time.monotonic()
+    collector = BatchCollector(batch_backend)
+    results = collector.run([job(keyword) for keyword in keywords], workers)
+
+    success_count = sum(1 for result in results if not isinstance(result, Exception))
+    batch_stats = collector.get_stats()
+    logger.info("\n" + "=" * 60)
+    logger.info("Evergreen batch complete!")
+    logger.info(f"Prepared: {success_count}, Failed: {len(results) - success_count} ({time.monotonic() - started:.0f}s)")
+    logger.info(
+        f"LLM batch ({batch_stats['backend']}): {batch_stats['requests']} requests in "
+        f"{batch_stats['batches']} batches, {batch_stats['errors']} errors"
+    )
+    usage_stats = llm_usage.get_stats()
+    if usage_stats["calls"]:
+        logger.info(
+            f"LLM usage: {usage_stats['calls']} calls, {usage_stats['tokens']:,} tokens, "
+            f"~${usage_stats['cost']:.3f}"
+        )
+    logger.info(f"Ready queue: {ready_queue.count()} posts waiting")
     logger.info("=" * 60)
 
 
 def main():
     """CLI 엔트리포인트"""
     ensure_log_directory()
+    # 발행 파이프라인은 대시보드 / 배치 스크립트보다 먼저 LLM 예산을 받음
+    llm_governor.set_default_priority(PRIORITY_PUBLISH)
 
     parser = argparse.ArgumentParser(
         description="WordPress Auto Blog Publisher"
@@ -479,9 +757,39 @@ def main():
         action="store_true",
         help="Use evergreen keywords instead of trending"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of keywords to process concurrently (default: 1, --batch-evergreen: settings.batch_workers)"
+    )
+    parser.add_argument(
+        "--batch-evergreen",
+        type=int,
+        metavar="N",
+        help="Prepare N evergreen posts via the LLM batch API into the ready queue (published by --evergreen runs)"
+    )
+    parser.add_argument(
+        "--batch-backend",
+        choices=["auto", "anthropic", "local"],
+        help="Batch backend for --batch-evergreen (default: settings.batch_backend)"
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Skip LLM response cache lookups for this run (fresh responses are still stored)"
+    )
 
     args = parser.parse_args()
 
+    if args.no_llm_cache:
+        llm_cache.bypass = True
+
+    if args.batch_evergreen:
+        # 오프라인 생성은 발행 파이프라인 / 대시보드에 LLM 예산 양보
+        llm_governor.set_default_priority(PRIORITY_BATCH)
+        run_batch_evergreen(args.batch_evergreen, backend=args.batch_backend, workers=args.workers)
+        return
+
     status = "draft" if args.draft else "publish"
 
     run_pipeline(
@@ -489,7 +797,8 @@ def main():
         specific_keyword=args.keyword,
         posts_limit=args.limit,
         status=status,
-        evergreen=args.evergreen
+        evergreen=args.evergreen,
+        workers=args.workers or 1
     )
 
 
@@ -31,6 +31,7 @@ from generators.content_generator import ContentGenerator, clean_html_styles
 from publishers.wordpress import WordPressPublisher
 from database.models import Database
 from utils.image_fetcher import ImageFetcher
+from utils.llm_governor import llm_governor
 
 WP_AUTH = (settings.wp_user, settings.wp_app_password)
 
@@ -161,7 +162,9 @@ def generate_link_cards(keyword: str, ref_text: str) -> str:
 JSON 배열로만 응답:
 [{{"name": "사이트명", "url": "https://...", "desc": "설명 20자", "color": "#1a73e8", "initial": "첫글자"}}]"""
 
-        resp = model.generate_content(prompt)
+        with llm_governor.slot("gemini", prompt, label="official_links") as ticket:
+            resp = model.generate_content(prompt)
+            ticket.record(resp, model.model_name)
         text = resp.text.strip()
         json_match = re.search(r'\[.*\]', text, re.DOTALL)
         if json_match:
@@ -203,7 +206,9 @@ JSON 배열로만 응답. 다른 텍스트 없이:
   {{"emoji": "📅", "label": "항목명", "value": "핵심 값"}}
 ]"""
 
-        resp = model.generate_content(prompt)
+        with llm_governor.slot("gemini", prompt, label="key_facts") as ticket:
+            resp = model.generate_content(prompt)
+            ticket.record(resp, model.model_name)
         text = resp.text.strip()
         json_match = re.search(r'\[[\s\S]*\]', text)
         if json_match:
@@ -505,7 +510,9 @@ def manual_publish(keyword: str, ref_url: str = "") -> dict:
 키워드: {keyword}
 참고: {combined_ref[:1000]}
 [{{"emoji":"📅","label":"항목","value":"값"}}] 형식으로만 응답."""
-        resp = model.generate_content(prompt)
+        with llm_governor.slot("gemini", prompt, label="key_facts") as ticket:
+            resp = model.generate_content(prompt)
+            ticket.record(resp, model.model_name)
         json_match = re.search(r'\[[\s\S]*\]', resp.text)
         if json_match:
             info_items = json.loads(json_match.group())[:3]
@@ -12,6 +12,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config.settings import settings
+from utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -251,7 +252,7 @@ class ImageFetcher:
                 "orientation": "landscape",
             }
 
-            response = requests.get(
+            response = get_session().get(
                 self.base_url,
                 headers=self.headers,
                 params=params,
@@ -12,13 +12,15 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import create_session, get_session
+from utils.tracing import tracer
 from config.categories import (
     get_category_for_keyword,
     get_category_id,
     CATEGORY_IDS,
     CATEGORY_NAMES,
 )
-from generators.content_generator import clean_html_styles, fix_html_tag_balance
+from generators.content_generator import prepare_publish_html
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +139,9 @@ class WordPressPublisher:
         # API 엔드포인트
         self.api_base = f"{self.wp_url}/wp-json/wp/v2"
 
+        # REST API 전용 세션 (재시도는 _make_request 루프가 담당, 응답 캐시 없음)
+        self.session = create_session(retries=0, cache=False)
+
         # Basic Auth 토큰 생성
         credentials = f"{self.wp_user}:{self.wp_app_password}"
         self.auth_token = base64.b64encode(credentials.encode()).decode()
@@ -173,16 +178,16 @@ class WordPressPublisher:
         for attempt in range(retry_count):
             try:
                 if method == "GET":
-                    response = requests.get(url, headers=headers, timeout=30)
+                    response = self.session.get(url, headers=headers, timeout=30)
                 elif method == "POST":
                     if files:
                         # 파일 업로드 시 Content-Type 제거
                         headers.pop("Content-Type", None)
-                        response = requests.post(
+                        response = self.session.post(
                             url, headers=headers, files=files, data=data, timeout=60
                         )
                     else:
-                        response = requests.post(
+                        response = self.session.post(
                             url, headers=headers, json=data, timeout=30
                         )
                 else:
@@ -201,6 +206,7 @@ class WordPressPublisher:
 
         return None
 
+    @tracer.traced("wp.upload_image")
     def upload_image(
         self,
         image_url: str = None,
@@ -221,7 +227,7 @@ class WordPressPublisher:
         try:
             if image_url:
                 # URL에서 이미지 다운로드
-                response = requests.get(image_url, timeout=30)
+                response = get_session().get(image_url, timeout=30)
                 response.raise_for_status()
                 image_data = response.content
                 filename = "featured-image.jpg"
@@ -320,6 +326,7 @@ class WordPressPublisher:
 
         return None
 
+    @tracer.traced("wp.publish_post")
     def publish_post(
         self,
         title: str,
@@ -348,11 +355,8 @@ class WordPressPublisher:
             PublishResult 객체
         """
         try:
-            # 발행 전 HTML 스타일 정리 (왼쪽 검은 라인 등 제거)
-            content = clean_html_styles(content)
-
-            # HTML 태그 밸런스 검증 및 자동 수정
-            content = fix_html_tag_balance(content)
+            # 발행 전 HTML 정리 (왼쪽 검은 라인 등 제거 + 태그 밸런스 자동 수정)
+            content = prepare_publish_html(content)
 
             # 카테고리 ID 결정 (category_id 우선, 없으면 categories에서 변환)
             category_ids = []
@@ -415,6 +419,7 @@ class WordPressPublisher:
 
         return PublishResult(success=False, error="Unknown error")
 
+    @tracer.traced("wp.fetch_pexels_image")
     def fetch_pexels_image(self, keyword: str) -> Optional[str]:
         """
         Pexels에서 키워드 관련 이미지 URL 가져오기
@@ -454,7 +459,7 @@ class WordPressPublisher:
                     break
 
             headers = {"Authorization": api_key}
-            response = requests.get(
+            response = get_session().get(
                 "https://api.pexels.com/v1/search",
                 headers=headers,
                 params={"query": search_query, "per_page": 1, "orientation": "landscape"},
@@ -474,6 +479,7 @@ class WordPressPublisher:
             logger.error(f"Pexels image fetch failed: {e}")
             return None
 
+    @tracer.traced("wp.publish")
     def publish_with_image(
         self,
         title: str,
@@ -28,6 +28,7 @@ from apscheduler.triggers.cron import CronTrigger
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from main import run_pipeline
+from utils.llm_governor import llm_governor, PRIORITY_PUBLISH
 
 # 로깅 설정
 def setup_logging():
@@ -250,6 +251,7 @@ def main():
         show_status()
         return
 
+    llm_governor.set_default_priority(PRIORITY_PUBLISH)
     run_scheduler(run_now=args.run_now)
 
 
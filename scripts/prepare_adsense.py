@@ -37,6 +37,8 @@ except ImportError:
     print("❌ google-generativeai 패키지 필요: pip install google-generativeai")
     sys.exit(1)
 
+from utils.llm_governor import llm_governor, PRIORITY_BATCH
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -144,7 +146,9 @@ def rewrite_with_gemini(title: str, content: str) -> str:
     model = genai.GenerativeModel(GEMINI_MODEL)
     prompt = REWRITE_PROMPT.format(title=title, content=content)
 
-    response = model.generate_content(prompt)
+    with llm_governor.slot("gemini", prompt, label="adsense_rewrite") as ticket:
+        response = model.generate_content(prompt)
+        ticket.record(response, GEMINI_MODEL)
     return response.text
 
 
@@ -172,6 +176,7 @@ def main():
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
+    llm_governor.set_default_priority(PRIORITY_BATCH)
 
     print(f"🔧 애드센스 준비 스크립트 시작 (dry-run={args.dry_run})")
     print(f"   대상: {args.count}개 글\n")
@@ -0,0 +1,32 @@
+"""테스트 공통 설정
+
+config.settings import 전에 필수 환경변수를 채우고 모든 상태 경로(SQLite)를 임시 디렉터리로 돌림
+(실제 .env / data/*.db / 발행 이력은 건드리지 않음)
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+STATE_DIR = Path(tempfile.mkdtemp(prefix="autoblog-tests-"))
+
+for name in ("WP_URL", "WP_USER", "WP_APP_PASSWORD", "CLAUDE_API_KEY", "COUPANG_PARTNER_ID"):
+    os.environ.setdefault(name, "test")
+os.environ["AI_PROVIDER"] = "claude"
+os.environ["GOOGLE_API_KEY"] = ""
+os.environ["GEMINI_API_KEY"] = ""
+os.environ["DATABASE_PATH"] = str(STATE_DIR / "blog_publisher.db")
+os.environ["TRACE_PATH"] = str(STATE_DIR / "traces.db")
+os.environ["TOPIC_SIGNAL_CACHE_PATH"] = str(STATE_DIR / "topic_signals.db")
+os.environ["RESEARCH_MEMO_PATH"] = str(STATE_DIR / "research_memo.db")
+os.environ["HTTP_CACHE_PATH"] = str(STATE_DIR / "http_cache.db")
+os.environ["LLM_CACHE_PATH"] = str(STATE_DIR / "llm_cache.db")
+os.environ["LLM_GOVERNOR_PATH"] = str(STATE_DIR / "llm_governor.db")
+os.environ["LLM_USAGE_PATH"] = str(STATE_DIR / "llm_usage.db")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+os.environ["LLM_GOVERNOR_ENABLED"] = "false"
+os.environ["LLM_FAILOVER_ENABLED"] = "false"
+os.environ["OUTPUT_BUDGET_ENABLED"] = "false"
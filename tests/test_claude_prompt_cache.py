@@ -0,0 +1,61 @@
+"""Claude 프롬프트 캐시: system 블록 캐시 지점 / 키워드 자료 위치 / usage 기록 (가짜 Anthropic 클라이언트)"""
+from types import SimpleNamespace
+
+from generators import ContentGenerator
+from generators import content_generator as cg
+
+KEYWORD = "연말정산 환급금 조회"
+STATIC_RULES = "## 고정 작성 규칙\n- 해요체로 작성"
+
+
+class FakeMessages:
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="<h2>본문</h2>")],
+            stop_reason="end_turn",
+            usage=SimpleNamespace(
+                input_tokens=120,
+                output_tokens=340,
+                cache_read_input_tokens=2048,
+                cache_creation_input_tokens=0,
+            ),
+        )
+
+
+def test_claude_system_blocks_and_usage(monkeypatch):
+    generator = ContentGenerator()
+    messages = FakeMessages()
+    generator.client = SimpleNamespace(messages=messages)
+
+    annotations = {}
+    recorded = []
+    monkeypatch.setattr(cg.tracer, "annotate", lambda **attrs: annotations.update(attrs))
+    monkeypatch.setattr(cg.llm_usage, "record", lambda *args: recorded.append(args))
+
+    text = generator._call_claude(f"키워드: {KEYWORD}\n참고 자료: ...", max_tokens=1000,
+                                  use_cache=False, static_prompt=STATIC_RULES)
+    assert text == "<h2>본문</h2>"
+
+    request = messages.requests[0]
+    system = request["system"]
+    # 고정 접두사(페르소나 + 시스템 → 고정 규칙) 마지막 블록에만 캐시 지점
+    assert system[-1]["text"] == STATIC_RULES
+    assert system[-1]["cache_control"] == {"type": "ephemeral"}
+    assert all("cache_control" not in block for block in system[:-1])
+    # 키워드별 자료는 user 메시지에만
+    assert all(KEYWORD not in block["text"] for block in system)
+    assert request["messages"] == [{"role": "user", "content": f"키워드: {KEYWORD}\n참고 자료: ..."}]
+
+    counts = {"input_tokens": 120, "output_tokens": 340, "cache_read_tokens": 2048, "cache_write_tokens": 0}
+    assert {name: annotations[name] for name in counts} == counts
+    provider, model, usage_counts = recorded[0][:3]
+    assert (provider, model, usage_counts) == ("claude", generator.model, counts)
+
+
+def test_claude_system_without_static_prompt():
+    system = ContentGenerator._claude_system("시스템 프롬프트")
+    assert system == [{"type": "text", "text": "시스템 프롬프트", "cache_control": {"type": "ephemeral"}}]
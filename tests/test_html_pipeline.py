@@ -0,0 +1,29 @@
+"""토큰 파이프라인 마크다운 정리 = 정규식 체인 (clean_markdown_artifacts)"""
+import pytest
+
+from generators.html_pipeline import HtmlPipeline, MarkdownVisitor
+from generators.prompts import clean_markdown_artifacts
+
+CASES = [
+    # 인라인 태그를 사이에 둔 **굵게** / *기울임*
+    '<p>**<a href="https://example.com">홈택스</a>에서 조회**하세요</p>',
+    '<p>이건 **정말 <em>중요한</em> 부분**이에요</p>',
+    '<p>*기울임 <br> 두 줄*</p><p>다음 **문단**</p>',
+    # 문단을 넘어가는 짝 (정규식 체인은 문서 전체에서 짝을 찾음)
+    '<p>**첫 문단</p>\n<p>둘째 문단**</p>',
+    # **가 바뀐 뒤 남은 *가 뒤쪽 *와 짝
+    '<p>***굵은 기울임**</p><p>끝*</p>',
+    # 태그 바로 뒤 **는 바꾸지 않고 지움, 짝 없는 *는 그대로
+    '<p>**태그 뒤</p><p>짝 없는 * 별표</p>',
+    '## 제목\n<p>```html\n본문 **굵게** [COUPANG] 끝</p>',
+]
+
+
+@pytest.mark.parametrize("html", CASES)
+def test_markdown_visitor_matches_regex_chain(html):
+    assert HtmlPipeline(MarkdownVisitor).run(html).html == clean_markdown_artifacts(html)
+
+
+def test_bold_across_inline_tag():
+    html = HtmlPipeline(MarkdownVisitor).run('<p>먼저 **<a href="/x">링크</a> 확인**</p>').html
+    assert html == '<p>먼저 <strong><a href="/x">링크</a> 확인</strong></p>'
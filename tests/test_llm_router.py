@@ -0,0 +1,30 @@
+"""LLM 라우터 시간 초과: 넘어갈 공급자가 있을 때만 적용"""
+import time
+
+from utils.llm_router import LLMRouter
+
+
+def slow(value, seconds: float):
+    def call():
+        time.sleep(seconds)
+        return value
+    return call
+
+
+def test_single_provider_waits_past_timeout():
+    router = LLMRouter(timeout=0.05, hedge_enabled=False)
+    result, decision = router.call({"claude:haiku": slow("long article", 0.3)})
+    assert result == "long article"
+    assert decision["winner"] == "claude:haiku"
+    assert decision["failovers"] == 0
+
+
+def test_timeout_fails_over_to_next_provider():
+    router = LLMRouter(timeout=0.05, hedge_enabled=False)
+    result, decision = router.call({
+        "claude:haiku": slow("late", 0.5),
+        "gemini:flash": slow("fallback", 0.0),
+    })
+    assert result == "fallback"
+    assert decision["failovers"] == 1
+    assert decision["errors"] == ["claude:haiku: timeout"]
@@ -0,0 +1,63 @@
+"""ContentGenerator 밖의 단발 호출 usage 기록 (llm_governor.wrap(model=...) / ticket.record)"""
+from types import SimpleNamespace
+
+from utils import llm_governor as governor_module
+from utils.llm_governor import LLMGovernor
+from utils.llm_usage import UsageLedger
+
+
+def claude_response(text: str):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=50, output_tokens=20,
+                              cache_read_input_tokens=0, cache_creation_input_tokens=0),
+    )
+
+
+def gemini_response(text: str):
+    return SimpleNamespace(
+        text=text,
+        usage_metadata=SimpleNamespace(prompt_token_count=300, candidates_token_count=40,
+                                       cached_content_token_count=100),
+    )
+
+
+def test_wrap_and_slot_record_usage(tmp_path, monkeypatch):
+    ledger = UsageLedger(db_path=str(tmp_path / "usage.db"), enabled=True)
+    monkeypatch.setattr(governor_module, "llm_usage", ledger)
+    governor = LLMGovernor(db_path=str(tmp_path / "governor.db"), enabled=False)
+
+    call = governor.wrap("claude", "prompt", 500, lambda: claude_response(' ["office desk"] '),
+                         label="image_queries", model="claude-sonnet-4-20250514")
+    assert call() == ' ["office desk"] '
+
+    with governor.slot("gemini", "prompt", label="key_facts") as ticket:
+        ticket.record(gemini_response("[]"), "gemini-2.0-flash")
+
+    # model 없이 감싼 기존 호출은 그대로 (기록 없음)
+    assert governor.wrap("claude", "prompt", 50, lambda: "text")() == "text"
+
+    with ledger._get_conn() as conn:
+        rows = conn.execute(
+            "SELECT provider, model, input_tokens, output_tokens, cache_read_tokens, max_tokens, output_chars "
+            "FROM calls ORDER BY ts"
+        ).fetchall()
+    assert rows == [
+        ("claude", "claude-sonnet-4-20250514", 50, 20, 0, 500, 17),
+        ("gemini", "gemini-2.0-flash", 200, 40, 100, 0, 2),
+    ]
+    assert ledger.get_stats()["calls"] == 2
+
+
+def test_cost_uses_model_prices(tmp_path):
+    ledger = UsageLedger(db_path=str(tmp_path / "usage.db"), enabled=False,
+                         prices={"claude": (0.8, 4.0), "gemini": (0.3, 2.5)})
+    counts = {"input_tokens": 1_000_000, "output_tokens": 1_000_000, "cache_read_tokens": 0, "cache_write_tokens": 0}
+
+    assert ledger.estimate_cost("claude", counts, "claude-sonnet-4-20250514") == 18.0
+    assert ledger.estimate_cost("claude", counts, "claude-3-5-haiku-20241022") == 4.8
+    assert ledger.estimate_cost("gemini", counts, "models/gemini-2.0-flash") == 0.5
+    # 목록에 없는 모델은 공급자 기본 단가
+    assert ledger.estimate_cost("claude", counts, "claude-future-1") == 4.8
+    assert ledger.estimate_cost("gemini", counts) == 2.8
@@ -0,0 +1,36 @@
+"""개요 → 섹션 동시 생성: 섹션 프롬프트의 소제목 규칙 (가짜 _call_ai)"""
+from generators import ContentGenerator
+
+
+def make_outline(headings):
+    return {
+        "title": "",
+        "meta": "",
+        "sections": [{"heading": heading, "points": ["요점"], "chars": 300, "image": False} for heading in headings],
+        "tags": {},
+    }
+
+
+def test_section_prompt_copies_heading_style_and_escapes_title(monkeypatch):
+    generator = ContentGenerator()
+    prompts = []
+
+    def fake_call_ai(prompt, max_tokens=8000, static_prompt=""):
+        prompts.append(prompt)
+        return "<p>본문</p>"
+
+    monkeypatch.setattr(generator, "_call_ai", fake_call_ai)
+
+    outline = make_outline(["", "A&B <비교>", '"따옴표" 정리'])
+    content = generator._generate_outlined("본문 프롬프트", "키워드", {"selected_image_count": 0}, outline=outline)
+    assert content is not None
+
+    intro, first, second = (next(p for p in prompts if f"위 글의 {n}번째" in p) for n in (1, 2, 3))
+    assert "소제목 없이 <p> 문단" in intro
+    for prompt in (first, second):
+        assert "[소제목 스타일]의 HTML을 그대로 복사" in prompt
+        assert "형식의 <h2> 소제목" not in prompt
+    assert '"A&amp;B &lt;비교&gt;"' in first and "<비교>" not in first
+    assert "&quot;따옴표&quot; 정리" in second
+    # 번호 배지 스타일이면 소제목 순서대로 1, 2
+    assert "번호 배지가 있으면 1" in first and "번호 배지가 있으면 2" in second
@@ -0,0 +1,82 @@
+"""에버그린 일괄 생성 → 발행 대기열 → 발행 (LocalBatchBackend로 네트워크 없이)"""
+import sqlite3
+
+import main
+from database.ready_queue import ReadyQueue
+from generators import ContentGenerator
+from generators.content_generator import GeneratedPost
+from utils.llm_batch import BatchCollector, LocalBatchBackend, current_batch
+
+
+def make_post(keyword: str, content: str) -> GeneratedPost:
+    return GeneratedPost(
+        title=f"{keyword} 총정리", content=content, excerpt=f"{keyword} 요약",
+        category="생활정보", template="list", quality_score=80.0,
+    )
+
+
+def test_batch_to_ready_queue_to_publish(tmp_path, monkeypatch):
+    queue = ReadyQueue(str(tmp_path / "ready.db"))
+    monkeypatch.setattr(main, "ready_queue", queue)
+
+    generator = ContentGenerator()
+    calls = []
+
+    def fake_call_ai(prompt, max_tokens=8000, static_prompt=""):
+        calls.append(prompt)
+        # "fail" 요청은 일괄 처리 안에서 한 번 실패 → _call_batched가 실시간 호출로 다시 생성
+        if prompt == "fail" and calls.count("fail") == 1:
+            raise RuntimeError("overloaded")
+        return f"<h2>{prompt}</h2><p>본문</p>"
+
+    monkeypatch.setattr(generator, "_call_ai", fake_call_ai)
+
+    def job(keyword: str):
+        def run():
+            content = generator._call_batched(current_batch(), keyword, 1000)
+            return queue.add(keyword, make_post(keyword, content))
+        return run
+
+    collector = BatchCollector(LocalBatchBackend(workers=3))
+    results = collector.run([job(keyword) for keyword in ("alpha", "beta", "fail")], workers=3)
+
+    assert all(isinstance(result, int) for result in results)
+    assert collector.get_stats() == {"backend": "local", "batches": 1, "requests": 3, "errors": 1}
+    assert calls.count("fail") == 2
+    assert queue.count() == 3
+    assert sorted(queue.ready_keywords()) == ["alpha", "beta", "fail"]
+
+    published_keywords = []
+
+    def fake_publish(keyword, post, wp_publisher, status):
+        assert post.content == f"<h2>{keyword}</h2><p>본문</p>"
+        if keyword == "beta":
+            return None  # 중복 차단 / 발행 실패
+        published_keywords.append(keyword)
+        return f"https://example.com/{keyword}"
+
+    monkeypatch.setattr(main, "_publish_post", fake_publish)
+
+    assert main.publish_ready_posts(5, wp_publisher=None, status="draft") == 2
+    assert sorted(published_keywords) == ["alpha", "fail"]
+    assert queue.count() == 0
+
+    with sqlite3.connect(queue.db_path) as conn:
+        statuses = dict(conn.execute("SELECT keyword, status FROM ready_posts"))
+    assert statuses == {"alpha": "published", "beta": "failed", "fail": "published"}
+
+
+def test_claim_reclaims_stale_claimed(tmp_path):
+    queue = ReadyQueue(str(tmp_path / "ready.db"))
+    post_id = queue.add("alpha", make_post("alpha", "<p>본문</p>"))
+
+    assert queue.claim().id == post_id
+    assert queue.claim() is None  # 발행 중인 글은 다시 꺼내지 않음
+
+    # 발행 프로세스가 mark_published / mark_failed 전에 종료된 상황
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE ready_posts SET claimed_at = datetime('now', '-2 hours') WHERE id = ?", (post_id,))
+
+    reclaimed = queue.claim(claim_timeout_minutes=60)
+    assert reclaimed is not None and reclaimed.id == post_id
+    assert queue.claim(claim_timeout_minutes=60) is None
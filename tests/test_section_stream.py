@@ -0,0 +1,65 @@
+"""짧은 섹션 보강: 소제목 블록 / 가장자리 마크업을 유지하고 본문만 교체 (가짜 _call_ai)"""
+import re
+
+from generators import ContentGenerator
+from generators.section_stream import split_sections, unbalanced_tags
+
+DRAFT = """<div style="max-width: 700px; margin: 0 auto; font-size: 16px;">
+<p>도입 문단입니다. 오늘은 환급금 조회 방법을 정리해 볼게요.</p>
+<!-- IMG_CONTEXT: 환급금 introduction visual -->
+[IMAGE_1]
+<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 12px 20px;">
+  <h3 style="color: white; margin: 0;">조회 방법</h3>
+</div>
+<p>홈택스에서 조회해요.</p>
+<div style="display: flex; align-items: center; gap: 12px;">
+  <span style="background: #2563eb; color: white;">2</span>
+  <h3 style="font-size: 20px; margin: 0;">지급 일정</h3>
+</div>
+<p>보통 2월 말에 들어와요.</p>
+[COUPANG]
+</div>
+[META]환급금 조회 방법과 지급 일정 정리[/META]"""
+
+
+def test_split_sections_keeps_heading_blocks_and_edges():
+    sections = split_sections(DRAFT)
+
+    assert "".join(s.head + s.body + s.tail for s in sections) == DRAFT
+    assert [s.heading for s in sections] == ["", "조회 방법", "지급 일정"]
+    intro, first, last = sections
+    assert intro.head.startswith('<div style="max-width') and intro.body.startswith("<p>도입")
+    # 감싸는 <div>와 번호 배지까지 소제목 블록에 포함
+    assert first.head.rstrip().endswith("</div>") and first.body == "<p>홈택스에서 조회해요.</p>"
+    assert last.body.endswith("[COUPANG]") and last.tail == "\n</div>\n[META]환급금 조회 방법과 지급 일정 정리[/META]"
+    assert all(not unbalanced_tags(s.body) for s in sections)
+
+
+def test_split_sections_skips_wrapper_only_section():
+    sections = split_sections('<div style="max-width: 700px;">\n<h3>첫 소제목</h3>\n<p>본문</p>\n</div>')
+    assert sections[0].body == "" and sections[0].head == '<div style="max-width: 700px;">\n'
+    assert sections[1].body == "<p>본문</p>" and sections[1].tail == "\n</div>"
+
+
+def test_expand_replaces_body_only(monkeypatch):
+    generator = ContentGenerator()
+    prompts = []
+
+    def fake_call_ai(prompt, max_tokens=8000, static_prompt=""):
+        prompts.append(prompt)
+        if "조회 방법" in prompt.split("[글 전체")[0]:
+            # 소제목을 다시 쓰고 감싸는 </div>를 닫아 버린 응답 → 거부
+            return "<h3>조회 방법</h3><p>" + "홈택스 연말정산 메뉴에서 조회해요. " * 10 + "</p></div>"
+        return "<p>" + "보통 2월 말에 들어오고 늦으면 3월 초에 들어와요. " * 10 + "</p>\n[COUPANG]"
+
+    monkeypatch.setattr(generator, "_call_ai", fake_call_ai)
+
+    result = generator._expand_short_sections(DRAFT, "환급금", target_chars=3000)
+
+    assert len(prompts) == 3  # 도입부 응답은 [IMAGE_1] / IMG_CONTEXT 주석이 빠져서 거부
+    assert all("<h3" not in prompt.split("[기존 본문]")[1] for prompt in prompts)
+    assert "<p>홈택스에서 조회해요.</p>" in result and "<p>도입 문단입니다." in result
+    assert "늦으면 3월 초에" in result
+    assert result.startswith('<div style="max-width') and result.endswith("[META]환급금 조회 방법과 지급 일정 정리[/META]")
+    assert len(re.findall(r"<h3", result)) == 2
+    assert not unbalanced_tags(result.split("[META]")[0])
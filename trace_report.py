@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+단계별 소요 시간 리포트 (utils/tracing 스팬 기반)
+
+최근 N개 실행(run_pipeline 1회 = 1실행)의 스팬을 단계 이름별로 모아
+p50 / p95 / max / 합계를 출력 → 스케줄러 슬롯에서 시간이 어디에 쓰이는지 확인
+
+사용법:
+  python3 trace_report.py                     # 최근 10개 실행
+  python3 trace_report.py --runs 30 --label trending
+  python3 trace_report.py --prefix research.  # 리서치 단계만
+  python3 trace_report.py --usage             # LLM 호출별 토큰 / 프롬프트 캐시 적중 요약
+  python3 trace_report.py --governor          # 프로세스 간 LLM 예산 대기 시간 (최근 24시간)
+  python3 trace_report.py --cost --days 7     # LLM 비용 / 지연 시간 (일 / 글 / 템플릿 / 카테고리 / 단계별)
+"""
+import sys
+import math
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.tracing import tracer
+
+
+def percentile(values: list, pct: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def print_usage(run_ids: list):
+    """ai.call / ai.stream 스팬의 토큰 사용량과 프롬프트 캐시 효과 요약"""
+    calls = [
+        span for run_id in run_ids for span in tracer.run_spans(run_id)
+        if span["name"] in ("ai.call", "ai.stream") and "input_tokens" in span["attrs"]
+    ]
+    if not calls:
+        print("\n토큰 사용량이 기록된 LLM 호출이 없습니다.")
+        return
+
+    totals = {key: sum(span["attrs"].get(key, 0) for span in calls)
+              for key in ("input_tokens", "cache_read_tokens", "cache_write_tokens", "output_tokens")}
+    prompt_tokens = totals["input_tokens"] + totals["cache_read_tokens"] + totals["cache_write_tokens"]
+    hit_calls = [span for span in calls if span["attrs"].get("cache_read_tokens", 0) > 0]
+    miss_calls = [span for span in calls if span["attrs"].get("cache_read_tokens", 0) == 0]
+
+    print(f"\nLLM 호출 {len(calls)}회 (캐시 읽기 발생 {len(hit_calls)}회)")
+    print(f"  입력 토큰: {totals['input_tokens']:,} (캐시 읽기 {totals['cache_read_tokens']:,}, "
+          f"캐시 쓰기 {totals['cache_write_tokens']:,})")
+    print(f"  출력 토큰: {totals['output_tokens']:,}")
+    if prompt_tokens:
+        print(f"  프롬프트 캐시 적중률: {totals['cache_read_tokens'] / prompt_tokens:.1%} (프롬프트 토큰 기준)")
+
+    for label, group in (("캐시 읽기 O", hit_calls), ("캐시 읽기 X", miss_calls)):
+        if not group:
+            continue
+        durations = [span["duration"] for span in group]
+        first_chunks = [span["attrs"]["first_chunk"] for span in group if "first_chunk" in span["attrs"]]
+        line = f"  {label}: {len(group)}회, 평균 {sum(durations) / len(durations):.1f}s"
+        if first_chunks:
+            line += f", 첫 조각 평균 {sum(first_chunks) / len(first_chunks):.2f}s"
+        print(line)
+
+    providers: dict = {}
+    for span in calls:
+        provider = f"{span['attrs'].get('provider', '?')}:{span['attrs'].get('model', '?')}"
+        providers[provider] = providers.get(provider, 0) + 1
+    hedged = sum(1 for span in calls if span["attrs"].get("hedged"))
+    failovers = sum(1 for span in calls if span["attrs"].get("failovers"))
+    print(f"  공급자: {', '.join(f'{name} {count}회' for name, count in providers.items())}"
+          f" (헤지 {hedged}회, 장애 조치 {failovers}회)")
+
+
+def print_governor(hours: float):
+    """llm_governor 대기 기록 (모든 프로세스) 공급자 / 우선순위별 요약"""
+    from utils.llm_governor import llm_governor
+
+    rows = llm_governor.wait_report(hours)
+    if not rows:
+        print(f"\n최근 {hours:g}시간 LLM 예산 대기 기록이 없습니다.")
+        return
+
+    names = {0: "publish", 1: "interactive", 2: "batch"}
+    print(f"\n최근 {hours:g}시간 LLM 예산 대기")
+    print(f"{'provider':<8}  {'priority':<11}  {'calls':>5}  {'waited':>6}  {'avg':>6}  {'p95':>6}  {'max':>6}  {'tokens':>9}")
+    print("-" * 72)
+    for row in rows:
+        print(f"{row['provider']:<8}  {names.get(row['priority'], row['priority']):<11}  {row['calls']:>5}  "
+              f"{row['waited']:>6}  {row['avg']:>5.1f}s  {row['p95']:>5.1f}s  {row['max']:>5.1f}s  {row['tokens']:>9,}")
+
+
+def print_cost(days: float):
+    """llm_usage 기록 (모든 프로세스) 묶음별 토큰 / 예상 비용 / 지연 시간"""
+    from utils.llm_usage import llm_usage
+
+    if not llm_usage.enabled:
+        print("LLM 사용량 기록이 비활성화되어 있습니다 (settings.llm_usage_enabled)")
+        return
+    if not llm_usage.report("day", days):
+        print(f"\n최근 {days:g}일 LLM 사용량 기록이 없습니다.")
+        return
+
+    sections = (
+        ("day", "일별", 31),
+        ("template", "템플릿별 (generate_template_prompt 키)", 30),
+        ("category", "카테고리별", 30),
+        ("stage", "단계별", 30),
+        ("model", "모델별", 10),
+        ("post", "글별 (비용 큰 순)", 20),
+    )
+    for group, title, limit in sections:
+        rows = llm_usage.report(group, days, limit=limit)
+        names = [row["keyword"][:20] if group == "post" else str(row["name"]) for row in rows]
+        width = max([len(name) for name in names] + [8])
+        print(f"\n[{title}] 최근 {days:g}일")
+        print(f"{'name':<{width}}  {'posts':>5}  {'calls':>5}  {'in_tok':>9}  {'out_tok':>8}  {'cost':>8}  "
+              f"{'$/post':>7}  {'avg':>6}  {'max':>6}  {'total':>7}")
+        print("-" * (width + 82))
+        for name, row in zip(names, rows):
+            per_post = row["cost"] / row["posts"] if row["posts"] else 0.0
+            print(f"{name:<{width}}  {row['posts']:>5}  {row['calls']:>5}  {row['input_tokens']:>9,}  "
+                  f"{row['output_tokens']:>8,}  ${row['cost']:>7.3f}  ${per_post:>6.3f}  "
+                  f"{row['avg_latency']:>5.1f}s  {row['max_latency']:>5.1f}s  {row['latency']:>6.0f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="단계별 소요 시간 리포트 (p50/p95/max)")
+    parser.add_argument("--runs", type=int, default=10, help="집계할 최근 실행 수 (기본: 10)")
+    parser.add_argument("--label", type=str, default=None, help="실행 라벨 필터 (trending / evergreen / adhoc)")
+    parser.add_argument("--prefix", type=str, default="", help="단계 이름 접두사 필터 (예: research., wp.)")
+    parser.add_argument("--usage", action="store_true", help="LLM 토큰 사용량 / 프롬프트 캐시 적중 요약")
+    parser.add_argument("--governor", action="store_true", help="프로세스 간 LLM 예산 대기 시간 요약")
+    parser.add_argument("--hours", type=float, default=24, help="--governor 집계 기간 (기본: 24시간)")
+    parser.add_argument("--cost", action="store_true", help="LLM 토큰 / 예상 비용 / 지연 시간 (일·글·템플릿·카테고리·단계별)")
+    parser.add_argument("--days", type=float, default=1, help="--cost 집계 기간 (기본: 1일)")
+    args = parser.parse_args()
+
+    if args.governor:
+        print_governor(args.hours)
+        return
+
+    if args.cost:
+        print_cost(args.days)
+        return
+
+    if not tracer.enabled:
+        print("트레이싱이 비활성화되어 있습니다 (settings.trace_enabled)")
+        return
+
+    runs = tracer.recent_runs(limit=args.runs, label=args.label)
+    if not runs:
+        print("기록된 실행이 없습니다.")
+        return
+
+    print(f"\n최근 {len(runs)}개 실행")
+    for run in runs:
+        started = datetime.fromtimestamp(run["started_at"]).strftime("%m-%d %H:%M")
+        if run["finished_at"]:
+            wall = f"{run['finished_at'] - run['started_at']:.0f}s"
+        else:
+            wall = "진행 중/중단"
+        print(f"  {run['run_id']}  {started}  [{run['label']}]  {wall}")
+
+    if args.usage:
+        print_usage([run["run_id"] for run in runs])
+        return
+
+    durations = tracer.stage_durations([run["run_id"] for run in runs])
+    rows = []
+    for name, values in durations.items():
+        if not name.startswith(args.prefix):
+            continue
+        rows.append((
+            name, len(values),
+            percentile(values, 50), percentile(values, 95), max(values), sum(values)
+        ))
+    rows.sort(key=lambda r: r[5], reverse=True)
+
+    if not rows:
+        print("\n해당하는 스팬이 없습니다.")
+        return
+
+    width = max(len(r[0]) for r in rows)
+    print(f"\n{'stage':<{width}}  {'count':>5}  {'p50':>7}  {'p95':>7}  {'max':>7}  {'total':>8}")
+    print("-" * (width + 44))
+    for name, count, p50, p95, peak, total in rows:
+        print(f"{name:<{width}}  {count:>5}  {p50:>6.1f}s  {p95:>6.1f}s  {peak:>6.1f}s  {total:>7.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""HTTP / LLM 교환 녹화·재생 (카세트)
+
+네트워크 없이 파이프라인 성능을 측정하기 위해
+키워드 1회 실행의 모든 외부 교환을 파일에 기록하고 다시 재생:
+- HTTP: utils/http_client 세션의 CassetteAdapter가 기록/재생 (캐시·네트워크보다 바깥)
+- LLM: 각 호출부가 cassette.llm_exchange()로 SDK 호출을 감쌈
+- 자체 HTTP 클라이언트를 쓰는 SDK(gspread 등): cassette.value_exchange()
+
+재생 시 매칭 순서 (같은 키가 여러 번이면 녹화 순서대로 소비):
+1. 정확한 키 (HTTP: 메서드+URL+본문 해시 / LLM: 공급자+모델+프롬프트 해시)
+2. 느슨한 키 (HTTP: 메서드+호스트+경로 / LLM: 공급자+max_tokens)
+   → 날짜·랜덤 템플릿처럼 실행마다 달라지는 부분 허용
+3. 없으면 CassetteMiss (네트워크로 나가지 않음)
+
+사용 (bench.py 참고):
+    from utils.cassette import cassette
+    cassette.record("data/cassettes/연말정산.json")
+    ...  # 실행
+    cassette.stop()   # 저장
+"""
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(RuntimeError):
+    """재생 모드에서 녹화되지 않은 교환 요청"""
+
+
+def _digest(*parts: Any) -> str:
+    raw = "\x1f".join("" if p is None else str(p) for p in parts)
+    return hashlib.sha1(raw.encode("utf-8", "surrogatepass")).hexdigest()[:16]
+
+
+def _body_digest(body: Union[bytes, str, None]) -> str:
+    if body is None:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha1(body).hexdigest()[:16]
+
+
+class Cassette:
+    """녹화/재생 상태 (프로세스 전체 공유)"""
+
+    def __init__(self):
+        self.mode = "off"  # off / record / replay
+        self.path: Optional[Path] = None
+        self.meta: Dict = {}
+        # 재생 지연: None(없음) / 초(고정) / "recorded"(녹화 당시 소요 시간 × latency_scale)
+        self.latency: Union[None, float, str] = None
+        self.latency_scale = 1.0
+
+        self._lock = threading.Lock()
+        self._exchanges: List[Dict] = []
+        self._used: set = set()
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "off"
+
+    # ------------------------------------------------------------
+    # 모드 전환
+    # ------------------------------------------------------------
+
+    def record(self, path: str, **meta):
+        """녹화 시작 (stop() 시 저장)"""
+        with self._lock:
+            self.mode = "record"
+            self.path = Path(path)
+            self.meta = {"recorded_at": datetime.now().isoformat(timespec="seconds"), **meta}
+            self._exchanges = []
+            self._used = set()
+            self.misses = 0
+        logger.info(f"Cassette recording → {path}")
+
+    def replay(self, path: str, latency: Union[None, float, str] = None, latency_scale: float = 1.0):
+        """재생 시작"""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        with self._lock:
+            self.mode = "replay"
+            self.path = Path(path)
+            self.meta = data.get("meta", {})
+            self._exchanges = data.get("exchanges", [])
+            self._used = set()
+            self.misses = 0
+            self.latency = latency
+            self.latency_scale = latency_scale
+        logger.info(f"Cassette replay ← {path} ({len(self._exchanges)} exchanges)")
+
+    def rewind(self):
+        """재생 위치 처음으로 (반복 벤치마크용)"""
+        with self._lock:
+            self._used = set()
+            self.misses = 0
+
+    def stop(self):
+        """녹화 중이면 저장 후 종료"""
+        if self.mode == "record" and self.path:
+            self.save()
+        with self._lock:
+            self.mode = "off"
+
+    def save(self):
+        """카세트 파일 저장"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"meta": self.meta, "exchanges": list(self._exchanges)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.info(f"Cassette saved: {len(data['exchanges'])} exchanges → {self.path}")
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            kinds: Dict[str, int] = {}
+            for ex in self._exchanges:
+                kinds[ex["kind"]] = kinds.get(ex["kind"], 0) + 1
+            return {"mode": self.mode, "exchanges": kinds, "used": len(self._used), "misses": self.misses}
+
+    # ------------------------------------------------------------
+    # 내부: 기록 / 매칭
+    # ------------------------------------------------------------
+
+    def _append(self, exchange: Dict):
+        with self._lock:
+            self._exchanges.append(exchange)
+
+    def _take(self, kind: str, key: str, loose_key: str) -> Dict:
+        """녹화 순서대로 아직 쓰지 않은 교환 소비 (정확한 키 → 느슨한 키)"""
+        with self._lock:
+            for field, value in (("key", key), ("loose_key", loose_key)):
+                for index, ex in enumerate(self._exchanges):
+                    if index not in self._used and ex["kind"] == kind and ex[field] == value:
+                        self._used.add(index)
+                        return ex
+            self.misses += 1
+        raise CassetteMiss(f"No recorded {kind} exchange for {loose_key}")
+
+    def _delay(self, exchange: Dict):
+        if self.latency is None:
+            return
+        if self.latency == "recorded":
+            seconds = exchange.get("elapsed", 0.0) * self.latency_scale
+        else:
+            seconds = float(self.latency)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    # ------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _http_keys(method: str, url: str, body) -> tuple:
+        parsed = urlparse(url)
+        loose = f"{method} {parsed.netloc}{parsed.path}"
+        return _digest(method, url, _body_digest(body)), loose
+
+    def replay_http(self, method: str, url: str, body) -> Dict:
+        """
+        녹화된 HTTP 응답 반환
+
+        Returns:
+            {"status", "reason", "headers", "body"(bytes)}
+        """
+        key, loose = self._http_keys(method, url, body)
+        exchange = self._take("http", key, loose)
+        self._delay(exchange)
+        return {
+            "status": exchange["status"],
+            "reason": exchange.get("reason", ""),
+            "headers": exchange["headers"],
+            "body": base64.b64decode(exchange["body"]),
+        }
+
+    def record_http(self, method: str, url: str, body, status: int, reason: str,
+                    headers: Dict[str, str], content: bytes, elapsed: float):
+        """HTTP 교환 기록"""
+        key, loose = self._http_keys(method, url, body)
+        self._append({
+            "kind": "http",
+            "key": key,
+            "loose_key": loose,  # 쿼리(API 키 포함 가능)는 해시로만 보관
+            "status": status,
+            "reason": reason,
+            "headers": dict(headers),
+            "body": base64.b64encode(content or b"").decode("ascii"),
+            "elapsed": round(elapsed, 4),
+        })
+
+    # ------------------------------------------------------------
+    # LLM
+    # ------------------------------------------------------------
+
+    def llm_exchange(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        call: Callable[[], str],
+        system: str = "",
+        max_tokens: int = 0
+    ) -> str:
+        """
+        LLM 호출 녹화/재생 래퍼
+
+        Args:
+            provider: "claude" / "gemini"
+            model: 모델 이름
+            prompt: 사용자 프롬프트
+            call: 실제 SDK 호출 (응답 텍스트 반환)
+            system: 시스템 프롬프트
+            max_tokens: 최대 출력 토큰
+
+        Returns:
+            응답 텍스트
+        """
+        if not self.active:
+            return call()
+        return self._exchange(
+            "llm", _digest(provider, model, system, prompt, max_tokens), f"{provider} {max_tokens}",
+            call, provider=provider, model=model, prompt_chars=len(prompt) + len(system)
+        )
+
+    def llm_stream(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        stream: Callable[[], Iterator[str]],
+        system: str = "",
+        max_tokens: int = 0
+    ) -> Iterator[str]:
+        """
+        스트리밍 LLM 호출 녹화/재생 래퍼 (llm_exchange와 같은 키 — 재생 시 전체 텍스트를 한 조각으로)
+
+        Args:
+            stream: 실제 스트리밍 호출 (텍스트 조각 이터레이터 반환)
+            나머지는 llm_exchange와 동일
+
+        Yields:
+            응답 텍스트 조각
+        """
+        if not self.active:
+            yield from stream()
+            return
+
+        key = _digest(provider, model, system, prompt, max_tokens)
+        loose = f"{provider} {max_tokens}"
+        if self.mode == "replay":
+            exchange = self._take("llm", key, loose)
+            self._delay(exchange)
+            yield exchange["value"]
+            return
+
+        started = time.perf_counter()
+        chunks = []
+        for chunk in stream():
+            chunks.append(chunk)
+            yield chunk
+        self._append({
+            "kind": "llm",
+            "key": key,
+            "loose_key": loose,
+            "provider": provider,
+            "model": model,
+            "prompt_chars": len(prompt) + len(system),
+            "value": "".join(chunks),
+            "elapsed": round(time.perf_counter() - started, 4),
+        })
+
+    # ------------------------------------------------------------
+    # 기타 SDK (자체 HTTP 클라이언트를 쓰는 라이브러리: gspread 등)
+    # ------------------------------------------------------------
+
+    def value_exchange(self, name: str, call: Callable[[], Any], *key_parts: Any) -> Any:
+        """
+        JSON 직렬화 가능한 결과를 반환하는 SDK 호출 녹화/재생 래퍼
+
+        Args:
+            name: 호출 이름 (예: "google_sheets.products")
+            call: 실제 호출
+            *key_parts: 결과를 구분하는 인자
+
+        Returns:
+            호출 결과 (재생 시 녹화된 값)
+        """
+        if not self.active:
+            return call()
+        return self._exchange("value", _digest(name, *key_parts), name, call)
+
+    def _exchange(self, kind: str, key: str, loose: str, call: Callable[[], Any], **info) -> Any:
+        if self.mode == "replay":
+            exchange = self._take(kind, key, loose)
+            self._delay(exchange)
+            return exchange["value"]
+
+        started = time.perf_counter()
+        value = call()
+        self._append({
+            "kind": kind,
+            "key": key,
+            "loose_key": loose,
+            **info,
+            "value": value,
+            "elapsed": round(time.perf_counter() - started, 4),
+        })
+        return value
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+cassette = Cassette()
@@ -6,9 +6,10 @@
 """
 import re
 import logging
-import requests
 from typing import Optional, List, Tuple
 
+from utils.http_client import get_session
+
 logger = logging.getLogger(__name__)
 
 # 불용어 (체크에서 제외)
@@ -69,7 +70,7 @@ def check_wp_duplicates(
     
     for term in search_terms:
         try:
-            r = requests.get(
+            r = get_session().get(
                 f"{wp_url}/wp-json/wp/v2/posts",
                 params={"search": term, "per_page": 20, "status": "publish"},
                 auth=auth,
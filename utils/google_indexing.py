@@ -24,7 +24,7 @@ def request_indexing(url: str, action: str = "URL_UPDATED") -> bool:
     """
     try:
         from google.oauth2 import service_account
-        import requests as req
+        from utils.http_client import get_session
 
         if not KEY_FILE.exists():
             logger.warning(f"Google Indexing key not found: {KEY_FILE}")
@@ -49,7 +49,7 @@ def request_indexing(url: str, action: str = "URL_UPDATED") -> bool:
             "type": action,
         }
 
-        resp = req.post(INDEXING_API_URL, headers=headers, json=body, timeout=10)
+        resp = get_session().post(INDEXING_API_URL, headers=headers, json=body, timeout=10)
 
         if resp.status_code == 200:
             logger.info(f"✅ Google Indexing 요청 성공: {url}")
@@ -9,6 +9,7 @@ from google.oauth2.service_account import Credentials
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.cassette import cassette
 
 logger = logging.getLogger(__name__)
 
@@ -182,8 +183,10 @@ def get_coupang_products() -> list[dict]:
             ...
         ]
     """
-    client = get_sheets_client()
-    return client.get_coupang_products()
+    # gspread는 자체 HTTP 세션을 쓰므로 결과 단위로 녹화/재생
+    return cassette.value_exchange(
+        "google_sheets.products", lambda: get_sheets_client().get_coupang_products()
+    )
 
 
 if __name__ == "__main__":
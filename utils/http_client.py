@@ -0,0 +1,332 @@
+"""공유 HTTP 클라이언트
+
+크롤러/퍼블리셔가 요청마다 TCP+TLS 핸드셰이크를 반복하지 않도록
+requests.Session 생성을 한 곳으로 모음:
+- 호스트별 keep-alive 연결 풀 (pool_connections 호스트 × pool_maxsize 연결)
+- 멱등 요청(GET/HEAD) 자동 재시도: 연결 오류, 429/5xx (지수 백오프)
+- 기본 타임아웃: 호출부에서 timeout을 지정하지 않은 경우 적용
+- 선택: HTTP/2 (settings.http2_enabled이고 httpx[http2]가 설치된 경우 https만)
+- 크롤러 GET 응답 캐시 (utils/response_cache.py의 도메인별 TTL 규칙)
+- 카세트 녹화/재생 (utils/cassette.py, 벤치마크용 — 꺼져 있으면 그대로 통과)
+
+사용:
+    from utils.http_client import get_session, create_session
+
+    # 모듈 함수: 프로세스 공유 세션 (헤더는 요청마다 headers=로 전달)
+    resp = get_session().get(url, headers=headers, timeout=10)
+
+    # 세션 헤더를 바꾸는 크롤러 클래스: 전용 세션 (설정은 동일)
+    self.session = create_session(headers=HEADERS)
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.response_cache import response_cache, get_ttl, _DROP_HEADERS
+from utils.cassette import cassette, CassetteMiss
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 선택 의존성
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx의 http2=True에 필요)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+# 재시도 대상 상태 코드 / 메서드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# settings 로드 실패 시 기본값
+DEFAULT_CONFIG = {
+    "pool_connections": 20,
+    "pool_maxsize": 10,
+    "retries": 2,
+    "backoff": 0.5,
+    "timeout": 15.0,
+    "http2": False,
+}
+
+
+def _load_config() -> Dict:
+    """settings에서 HTTP 클라이언트 설정 로드"""
+    config = dict(DEFAULT_CONFIG)
+    try:
+        from config.settings import settings
+        config.update({
+            "pool_connections": settings.http_pool_connections,
+            "pool_maxsize": settings.http_pool_maxsize,
+            "retries": settings.http_retries,
+            "backoff": settings.http_backoff,
+            "timeout": settings.http_timeout,
+            "http2": settings.http2_enabled,
+        })
+    except Exception as e:
+        logger.debug(f"HTTP client settings unavailable, using defaults: {e}")
+    return config
+
+
+def _build_retry(retries: int, backoff: float) -> Retry:
+    """
+    urllib3 재시도 정책
+
+    - 연결 오류는 메서드와 무관하게 재시도 (요청이 전송되지 않았으므로 안전)
+    - 읽기 오류/상태 코드 재시도는 멱등 메서드만
+    - 재시도 소진 시 예외 대신 마지막 응답 반환 (기존 status_code 검사 유지)
+    """
+    return Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+
+
+def _build_response(request, status_code: int, headers, body: bytes, reason: str, connection) -> requests.Response:
+    """본문을 이미 읽은 응답을 requests.Response로 구성"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = reason
+    response.url = request.url
+    response.request = request
+    response.connection = connection
+    # stream=True 호출도 iter_content가 버퍼를 사용
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """timeout 미지정 요청에 기본 타임아웃을 적용하는 HTTPAdapter"""
+
+    def __init__(self, *args, timeout: float = None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    httpx(HTTP/2) 기반 requests 어댑터
+
+    호출부는 requests API를 그대로 쓰고, https 요청만 HTTP/2 연결을 재사용.
+    재시도는 연결 오류만 (httpx transport), 응답 쿠키는 세션에 저장하지 않음.
+    """
+
+    def __init__(self, timeout: float, retries: int, pool_maxsize: int):
+        super().__init__()
+        self.timeout = timeout
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=retries,
+            limits=httpx.Limits(max_keepalive_connections=pool_maxsize),
+        )
+        self._client = httpx.Client(transport=transport, follow_redirects=False)
+
+    def _to_httpx_timeout(self, timeout) -> "httpx.Timeout":
+        if timeout is None:
+            timeout = self.timeout
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        try:
+            resp = self._client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=self._to_httpx_timeout(timeout),
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request)
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+
+        return _build_response(request, resp.status_code, resp.headers.items(),
+                               resp.content, resp.reason_phrase, self)
+
+    def close(self):
+        self._client.close()
+
+
+class CachingAdapter(BaseAdapter):
+    """
+    도메인 TTL 규칙에 해당하는 GET 응답을 response_cache에 보관하는 어댑터
+
+    - 신선한 항목: 네트워크 없이 반환 (response.from_cache = True)
+    - 만료 + ETag/Last-Modified: 조건부 요청, 304면 저장된 본문 재사용
+    - Authorization 헤더가 있거나 stream=True인 요청은 그대로 통과
+    """
+
+    def __init__(self, inner: BaseAdapter, cache=None):
+        super().__init__()
+        self.inner = inner
+        self.cache = cache or response_cache
+
+    def _from_cache(self, request, entry: Dict) -> requests.Response:
+        response = _build_response(request, entry["status"], entry["headers"], entry["body"], "OK", self)
+        response.from_cache = True
+        return response
+
+    def send(self, request, stream=False, **kwargs):
+        ttl = get_ttl(request.url) if request.method == "GET" else 0
+        if not ttl or stream or not self.cache.enabled or "Authorization" in request.headers:
+            return self.inner.send(request, stream=stream, **kwargs)
+
+        entry = self.cache.lookup(request.url)
+        if entry and entry["fresh"]:
+            self.cache.touch(request.url)
+            self.cache.record("hits")
+            return self._from_cache(request, entry)
+
+        if entry:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.inner.send(request, stream=stream, **kwargs)
+        if response.status_code == 304 and entry:
+            response.close()
+            self.cache.touch(request.url, ttl=ttl)
+            self.cache.record("revalidated")
+            return self._from_cache(request, entry)
+
+        self.cache.record("misses")
+        if response.status_code == 200:
+            self.cache.store(request.url, 200, response.headers, response.content, ttl)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    카세트 녹화/재생 어댑터 (가장 바깥에 마운트)
+
+    - 녹화: 캐시 적중 응답을 포함해 호출부가 받은 응답을 그대로 기록
+    - 재생: 녹화된 응답 반환, 없으면 ConnectionError (네트워크로 나가지 않음)
+    """
+
+    def __init__(self, inner: BaseAdapter):
+        super().__init__()
+        self.inner = inner
+
+    def send(self, request, stream=False, **kwargs):
+        if not cassette.active:
+            return self.inner.send(request, stream=stream, **kwargs)
+
+        if cassette.mode == "replay":
+            try:
+                entry = cassette.replay_http(request.method, request.url, request.body)
+            except CassetteMiss as e:
+                raise requests.exceptions.ConnectionError(str(e), request=request)
+            return _build_response(request, entry["status"], entry["headers"], entry["body"], entry["reason"], self)
+
+        started = time.perf_counter()
+        response = self.inner.send(request, stream=stream, **kwargs)
+        content = response.content
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS}
+        cassette.record_http(
+            request.method, request.url, request.body, response.status_code, response.reason or "",
+            headers, content, time.perf_counter() - started
+        )
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+def create_session(
+    headers: Dict[str, str] = None,
+    retries: Optional[int] = None,
+    cache: bool = True
+) -> requests.Session:
+    """
+    설정이 적용된 새 Session 생성
+
+    Args:
+        headers: 세션 기본 헤더 (세션 헤더를 바꾸는 크롤러용)
+        retries: 재시도 횟수 재정의 (자체 재시도 루프가 있는 호출부는 0)
+        cache: 크롤러 GET 응답 캐시 사용 여부 (API 전용 세션은 False)
+
+    Returns:
+        연결 풀/재시도/기본 타임아웃이 적용된 requests.Session
+    """
+    config = _load_config()
+    if retries is None:
+        retries = config["retries"]
+
+    session = requests.Session()
+    adapter = TimeoutHTTPAdapter(
+        timeout=config["timeout"],
+        pool_connections=config["pool_connections"],
+        pool_maxsize=config["pool_maxsize"],
+        max_retries=_build_retry(retries, config["backoff"]),
+    )
+    https_adapter = adapter
+    if config["http2"] and HAS_HTTP2:
+        https_adapter = HTTP2Adapter(config["timeout"], retries, config["pool_maxsize"])
+    elif config["http2"]:
+        logger.debug("http2_enabled but httpx[http2] not installed, using HTTP/1.1 pools")
+
+    if cache and response_cache.enabled:
+        cached = CachingAdapter(adapter)
+        https_adapter = cached if https_adapter is adapter else CachingAdapter(https_adapter)
+        adapter = cached
+
+    recorded = CassetteAdapter(adapter)
+    https_adapter = recorded if https_adapter is adapter else CassetteAdapter(https_adapter)
+    adapter = recorded
+
+    session.mount("http://", adapter)
+    session.mount("https://", https_adapter)
+
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    프로세스 공유 Session (지연 생성)
+
+    여러 스레드가 함께 사용하므로 session.headers를 수정하지 말고
+    요청마다 headers=로 전달할 것.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
@@ -51,6 +51,77 @@ FORMAL_TO_CASUAL = [
 ]
 
 
+def _trie_pattern(words) -> str:
+    """
+    문자열 목록 → 접두사 트리 모양 정규식 (같은 위치에서는 가장 긴 문자열이 일치)
+
+    ["습니다", "있습니다", "있어"] → (?:습니다|있(?:습니다|어))
+    """
+    root = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 여기서 끝나는 문자열도 있으면 더 긴 쪽을 먼저 시도 (탐욕적 ?)
+        return f"(?:{body})?" if "" in node else body
+
+    return build(root)
+
+
+# 규칙을 적용하지 않는 부분: 주석 / 태그(속성 포함) / [IMAGE_1: 설명] 같은 대괄호 태그
+# (태그는 generators/html_pipeline.TOKEN_PATTERN과 같은 문법 — 본문의 "3 < 5" 같은 '<'는 텍스트)
+MARKUP_PATTERN = r'<!--.*?-->|</?[a-zA-Z][^>]*>|\[/?[A-Z][A-Z_]*\d*(?:[:\s][^\]]*)?\]'
+# apply()에서 텍스트 조각을 이어 붙일 때 쓰는 구분 문자 (본문에 있으면 조각별로 변환)
+TEXT_SEPARATOR = "\x00"
+
+
+class CompiledRules:
+    """
+    치환 규칙표를 정규식 하나로 컴파일해 1회 순회로 적용
+
+    - 같은 위치에서 시작하는 규칙은 가장 긴 것 우선 (표 순서와 무관: "있습니다"가 "습니다"보다 우선)
+    - 치환 결과를 다른 규칙이 다시 바꾸지 않음
+    - 같은 표현이 두 번 있으면 앞의 규칙 사용
+    """
+
+    def __init__(self, rules):
+        self.table = {}
+        for old, new in rules:
+            self.table.setdefault(old, new)
+        # split 결과의 홀수 칸이 일치한 표현 → 표에서 바로 찾아 교체 (일치마다 파이썬 콜백 없음)
+        self.text_pattern = re.compile(f"({_trie_pattern(self.table)})")
+        # 마크업은 따로 잘라내고 그 사이 텍스트에만 규칙 적용
+        # (규칙과 한 정규식으로 묶으면 첫 글자 빠른 건너뛰기가 꺼져 더 느림)
+        self.markup_pattern = re.compile(f"({MARKUP_PATTERN})", re.DOTALL)
+
+    def replace_text(self, text: str) -> str:
+        """텍스트 노드 하나 (마크업 없음) 변환"""
+        parts = self.text_pattern.split(text)
+        parts[1::2] = map(self.table.__getitem__, parts[1::2])
+        return "".join(parts)
+
+    def apply(self, html: str) -> str:
+        """HTML 변환 (태그 속성 / 주석 / 대괄호 태그 안은 그대로)"""
+        parts = self.markup_pattern.split(html)
+        if TEXT_SEPARATOR in html:
+            parts[0::2] = map(self.replace_text, parts[0::2])
+        else:
+            # 텍스트 조각을 구분 문자로 이어 한 번에 변환 (규칙은 구분 문자를 넘어 일치하지 않음)
+            parts[0::2] = self.replace_text(TEXT_SEPARATOR.join(parts[0::2])).split(TEXT_SEPARATOR)
+        return "".join(parts)
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+casual_rules = CompiledRules(FORMAL_TO_CASUAL)
+
+
 def humanize_content(content: str) -> str:
     """
     AI 생성 텍스트를 자연스러운 해요체로 변환
@@ -63,8 +134,7 @@ def humanize_content(content: str) -> str:
     """
     original_length = len(content)
 
-    for old, new in FORMAL_TO_CASUAL:
-        content = content.replace(old, new)
+    content = casual_rules.apply(content)
 
     logger.info(f"Humanized content: {original_length} -> {len(content)} chars")
     return content
@@ -22,6 +22,9 @@ import anthropic
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import get_session
+from utils.cassette import cassette
+from utils.llm_governor import llm_governor
 from utils.unique_image import (
     generate_unique_screenshot,
     should_use_screenshot,
@@ -317,13 +320,19 @@ class ImageFetcher:
   {{"position": 2, "query": "office professional meeting", "section": "섹션제목"}}
 ]"""
 
-            response = self.claude_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = response.content[0].text.strip()
+            response_text = cassette.llm_exchange(
+                "claude", "claude-sonnet-4-20250514", prompt,
+                llm_governor.wrap(
+                    "claude", prompt, 500,
+                    lambda: self.claude_client.messages.create(
+                        model="claude-sonnet-4-20250514",
+                        max_tokens=500,
+                        messages=[{"role": "user", "content": prompt}]
+                    ),
+                    label="image_queries", model="claude-sonnet-4-20250514"
+                ),
+                max_tokens=500
+            ).strip()
 
             # JSON 파싱
             if '```' in response_text:
@@ -364,7 +373,8 @@ class ImageFetcher:
         content: str,
         keyword: str,
         category: str,
-        blog_analysis: Dict = None
+        blog_analysis: Dict = None,
+        image_queries: List[Dict] = None
     ) -> Dict:
         """
         스마트 이미지 삽입 시스템 메인 메서드
@@ -379,6 +389,7 @@ class ImageFetcher:
             keyword: 블로그 키워드
             category: 카테고리 이름
             blog_analysis: 블로그 분석 결과 (선택)
+            image_queries: 글 계획에서 받은 위치별 검색어 (있으면 AI 키워드 생성 생략, 모자라면 폴백 키워드로 채움)
 
         Returns:
             {IMAGE_1: {url, alt, ...}, ...} 딕셔너리
@@ -389,11 +400,18 @@ class ImageFetcher:
         optimal_count, positions = self.calculate_optimal_image_count(content, blog_analysis)
         print(f"  📊 적정 이미지 수: {optimal_count}개 (위치: {positions})")
 
-        # 2. AI로 섹션별 키워드 생성
-        image_keywords = self.generate_section_image_keywords_smart(
-            content, keyword, blog_analysis, optimal_count
-        )
-        print(f"  🔑 AI 검색 키워드 생성 완료: {len(image_keywords)}개")
+        # 2. AI로 섹션별 키워드 생성 (글 계획에 이미 있으면 그대로 사용)
+        if image_queries:
+            planned = {kw["position"]: kw for kw in image_queries if kw["position"] <= optimal_count}
+            image_keywords = [
+                planned.get(kw["position"], kw) for kw in self._generate_fallback_keywords(keyword, optimal_count)
+            ]
+            print(f"  🔑 글 계획 검색 키워드 사용: {len(planned)}개")
+        else:
+            image_keywords = self.generate_section_image_keywords_smart(
+                content, keyword, blog_analysis, optimal_count
+            )
+            print(f"  🔑 AI 검색 키워드 생성 완료: {len(image_keywords)}개")
         for kw in image_keywords:
             print(f"      - 위치 {kw['position']}: {kw['query']}")
 
@@ -548,7 +566,7 @@ class ImageFetcher:
                 print(f"  └─ Pexels 검색: {search_term}")
                 logger.info(f"Searching Pexels: {search_term}")
 
-                response = requests.get(
+                response = get_session().get(
                     self.api_url,
                     headers=self.headers,
                     params=params,
@@ -626,7 +644,7 @@ class ImageFetcher:
     def download_image(self, url: str) -> Optional[bytes]:
         """이미지 다운로드"""
         try:
-            response = requests.get(url, timeout=30)
+            response = get_session().get(url, timeout=30)
             response.raise_for_status()
             return response.content
         except Exception as e:
@@ -647,13 +665,13 @@ class ImageFetcher:
             return False
 
         try:
-            response = requests.head(url, timeout=30, allow_redirects=True)
+            response = get_session().head(url, timeout=30, allow_redirects=True)
             if response.status_code == 200:
                 content_type = response.headers.get('Content-Type', '')
                 if 'image' in content_type:
                     return True
             # HEAD 실패 시 GET으로 재시도 (일부 서버는 HEAD 미지원)
-            response = requests.get(url, timeout=30, stream=True)
+            response = get_session().get(url, timeout=30, stream=True)
             response.close()
             return response.status_code == 200
         except Exception as e:
@@ -776,13 +794,19 @@ office desk documents
 fitness workout gym
 smartphone technology modern"""
 
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=50,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            search_query = response.content[0].text.strip()
+            search_query = cassette.llm_exchange(
+                "claude", "claude-sonnet-4-20250514", prompt,
+                llm_governor.wrap(
+                    "claude", prompt, 50,
+                    lambda: client.messages.create(
+                        model="claude-sonnet-4-20250514",
+                        max_tokens=50,
+                        messages=[{"role": "user", "content": prompt}]
+                    ),
+                    label="image_query", model="claude-sonnet-4-20250514"
+                ),
+                max_tokens=50
+            ).strip()
 
             # 안전 검증
             if re.search(r'[가-힣]', search_query) or len(search_query) > 50:
@@ -829,7 +853,7 @@ smartphone technology modern"""
                 "size": "medium"
             }
 
-            response = requests.get(
+            response = get_session().get(
                 self.api_url,
                 headers=self.headers,
                 params=params,
@@ -850,7 +874,7 @@ smartphone technology modern"""
         if not unsplash_key:
             return []
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 "https://api.unsplash.com/search/photos",
                 params={"query": query, "client_id": unsplash_key, "per_page": per_page, "orientation": "landscape"},
                 timeout=5
@@ -879,7 +903,7 @@ smartphone technology modern"""
         if not pixabay_key:
             return []
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 "https://pixabay.com/api/",
                 params={"key": pixabay_key, "q": query, "image_type": "photo", "per_page": per_page, "min_width": 800},
                 timeout=5
@@ -1051,13 +1075,19 @@ smartphone technology modern"""
 출력: JSON 배열만 (설명 없이)
 ["키워드1", "키워드2", "키워드3", ...]"""
 
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = response.content[0].text.strip()
+            response_text = cassette.llm_exchange(
+                "claude", "claude-sonnet-4-20250514", prompt,
+                llm_governor.wrap(
+                    "claude", prompt, 200,
+                    lambda: client.messages.create(
+                        model="claude-sonnet-4-20250514",
+                        max_tokens=200,
+                        messages=[{"role": "user", "content": prompt}]
+                    ),
+                    label="image_keywords", model="claude-sonnet-4-20250514"
+                ),
+                max_tokens=200
+            ).strip()
 
             # JSON 파싱
             import json
@@ -1198,7 +1228,7 @@ smartphone technology modern"""
             }
 
             with open(local_path, 'rb') as img_file:
-                response = requests.post(
+                response = get_session().post(
                     f"{settings.wp_url}/wp-json/wp/v2/media",
                     headers=headers,
                     data=img_file,
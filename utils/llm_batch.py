@@ -0,0 +1,238 @@
+"""LLM 일괄 처리 (오프라인 배치 생성: python main.py --batch-evergreen N)
+
+여러 글을 동시에 생성하면서 본문 호출만 모아 공급자 일괄 처리 API로 한 번에 제출:
+- 글마다 워커 스레드에서 평소처럼 generate_full_post (리서치 / 글 계획 / 제목은 실시간 호출)
+- 본문 호출 차례가 되면 BatchCollector.submit()으로 요청을 넘기고 결과를 기다림
+- 남은 워커가 모두 대기 중이면 모인 요청을 백엔드에 한 번에 제출 → 폴링 → 결과 분배
+
+백엔드:
+- AnthropicBatchBackend: Message Batches API (토큰 단가 50%, 보통 1시간 이내 / 최대 24시간)
+- LocalBatchBackend: 같은 요청을 실시간 호출로 처리 (Gemini / SDK 미지원 / 테스트용 대체)
+
+일괄 처리 요청은 별도 한도를 쓰므로 llm_governor를 거치지 않음
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings 로드 실패 시 사용)
+DEFAULT_POLL_SECONDS = 60.0
+DEFAULT_MAX_WAIT_HOURS = 24.0
+
+# 일괄 처리 토큰 단가 (실시간 대비, llm_usage 비용 기록용)
+BATCH_COST_FACTOR = 0.5
+
+# 현재 워커가 속한 수집기 (generate_content_with_template에서 본문 호출 경로 선택)
+_current_batch: ContextVar[Optional["BatchCollector"]] = ContextVar("llm_batch", default=None)
+
+
+def current_batch() -> Optional["BatchCollector"]:
+    """배치 워커 안이면 수집기, 아니면 None"""
+    return _current_batch.get()
+
+
+@dataclass
+class BatchRequest:
+    """본문 호출 하나"""
+    custom_id: str  # 영문 / 숫자 / -_ 64자 이내
+    system: list  # Claude system 블록 (ContentGenerator._claude_system)
+    user_prompt: str
+    max_tokens: int
+    call: Callable[[], str]  # 실시간 호출 (LocalBatchBackend / 실패 시 대체)
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+
+
+@dataclass
+class BatchResult:
+    """호출 결과 (error가 있으면 실패)"""
+    text: str = ""
+    usage: Any = None  # 공급자 usage (LocalBatchBackend는 실시간 호출에서 이미 기록)
+    truncated: bool = False
+    error: Optional[str] = None
+
+
+class LocalBatchBackend:
+    """요청을 실시간 호출로 동시에 처리하는 대체 백엔드"""
+
+    name = "local"
+
+    def __init__(self, workers: int = 4):
+        self.workers = workers
+
+    def run(self, requests: List[BatchRequest]) -> Dict[str, BatchResult]:
+        def one(request: BatchRequest) -> BatchResult:
+            try:
+                # 제출한 워커의 컨텍스트(트레이스 스팬 / llm_usage 글)에서 호출
+                return BatchResult(text=request.context.run(request.call))
+            except Exception as e:
+                return BatchResult(error=f"{type(e).__name__}: {e}")
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(requests))),
+                                thread_name_prefix="llm-batch-local") as pool:
+            futures = {request.custom_id: pool.submit(one, request) for request in requests}
+            return {custom_id: future.result() for custom_id, future in futures.items()}
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API"""
+
+    name = "anthropic"
+
+    def __init__(self, client, model: str, poll_seconds: float = None, max_wait_hours: float = None):
+        try:
+            from config.settings import settings
+            poll_seconds = settings.batch_poll_seconds if poll_seconds is None else poll_seconds
+            max_wait_hours = settings.batch_max_wait_hours if max_wait_hours is None else max_wait_hours
+        except Exception:
+            poll_seconds = DEFAULT_POLL_SECONDS if poll_seconds is None else poll_seconds
+            max_wait_hours = DEFAULT_MAX_WAIT_HOURS if max_wait_hours is None else max_wait_hours
+
+        self.client = client
+        self.model = model
+        self.poll_seconds = float(poll_seconds)
+        self.max_wait = float(max_wait_hours) * 3600
+
+    @staticmethod
+    def supported(client) -> bool:
+        """설치된 SDK가 Message Batches API를 지원하는지 (anthropic>=0.39)"""
+        return hasattr(getattr(client, "messages", None), "batches")
+
+    def run(self, requests: List[BatchRequest]) -> Dict[str, BatchResult]:
+        batches = self.client.messages.batches
+        batch = batches.create(requests=[
+            {
+                "custom_id": request.custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": request.max_tokens,
+                    "system": request.system,
+                    "messages": [{"role": "user", "content": request.user_prompt}],
+                },
+            }
+            for request in requests
+        ])
+        print(f"  📦 일괄 처리 제출: {batch.id} ({len(requests)}건)")
+
+        started = time.time()
+        while batch.processing_status != "ended":
+            if time.time() - started > self.max_wait:
+                batches.cancel(batch.id)
+                raise TimeoutError(f"Message batch {batch.id} not finished after {self.max_wait / 3600:.1f}h")
+            time.sleep(self.poll_seconds)
+            batch = batches.retrieve(batch.id)
+            counts = batch.request_counts
+            print(f"  ⏳ {batch.id}: 처리 중 {counts.processing}, 완료 {counts.succeeded}, "
+                  f"오류 {counts.errored} ({time.time() - started:.0f}s)")
+
+        results = {}
+        for entry in batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                results[entry.custom_id] = BatchResult(
+                    text=message.content[0].text,
+                    usage=getattr(message, "usage", None),
+                    truncated=getattr(message, "stop_reason", None) == "max_tokens",
+                )
+            else:
+                error = getattr(entry.result, "error", None)
+                results[entry.custom_id] = BatchResult(error=f"{entry.result.type}: {error}" if error else entry.result.type)
+        logger.info(f"Message batch {batch.id} ended after {time.time() - started:.0f}s ({len(results)} results)")
+        return results
+
+
+class BatchCollector:
+    """워커들의 본문 호출을 모아 백엔드로 한 번에 제출"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[BatchRequest, dict]] = []
+        self._remaining = 0
+        self.batches = 0
+        self.requests = 0
+        self.errors = 0
+
+    def run(self, jobs: List[Callable[[], Any]], workers: int) -> List[Any]:
+        """
+        작업(글 하나씩)을 워커 스레드에서 실행하고 본문 호출을 모아 제출
+
+        Args:
+            jobs: 인자 없는 작업 함수 목록
+            workers: 동시에 실행할 작업 수 (= 한 번에 모을 수 있는 최대 요청 수)
+
+        Returns:
+            작업별 반환값 (실패한 작업은 예외 객체)
+        """
+        workers = max(1, min(workers, len(jobs)))
+        results: List[Any] = [None] * len(jobs)
+        self._remaining = len(jobs)
+
+        def work(index: int, job: Callable[[], Any]):
+            token = _current_batch.set(self)
+            try:
+                results[index] = job()
+            except Exception as e:
+                logger.error(f"Batch job {index} failed: {e}")
+                results[index] = e
+            finally:
+                _current_batch.reset(token)
+                with self._cond:
+                    self._remaining -= 1
+                    self._cond.notify_all()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-batch") as pool:
+            for index, job in enumerate(jobs):
+                pool.submit(contextvars.copy_context().run, work, index, job)
+            self._dispatch(workers)
+        return results
+
+    def _dispatch(self, workers: int):
+        """실행 중인 워커가 모두 대기하면 제출 (대기 중인 워커가 자리를 차지하므로 실행 중 = min(남은 작업, workers))"""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._remaining == 0
+                    or (self._pending and len(self._pending) >= min(self._remaining, workers))
+                )
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, []
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[BatchRequest, dict]]):
+        requests = [request for request, _ in batch]
+        self.batches += 1
+        self.requests += len(requests)
+        try:
+            results = self.backend.run(requests)
+        except Exception as e:
+            logger.error(f"LLM batch ({self.backend.name}) failed: {e}")
+            results = {}
+            error = f"{type(e).__name__}: {e}"
+        else:
+            error = "missing result"
+        for request, holder in batch:
+            result = results.get(request.custom_id) or BatchResult(error=error)
+            if result.error:
+                self.errors += 1
+            holder["result"] = result
+            holder["event"].set()
+
+    def submit(self, request: BatchRequest) -> BatchResult:
+        """요청을 다음 일괄 처리에 넣고 결과까지 대기 (워커 스레드에서 호출)"""
+        holder = {"event": threading.Event(), "result": None}
+        with self._cond:
+            self._pending.append((request, holder))
+            self._cond.notify_all()
+        holder["event"].wait()
+        return holder["result"]
+
+    def get_stats(self) -> Dict:
+        return {"backend": self.backend.name, "batches": self.batches, "requests": self.requests, "errors": self.errors}
@@ -0,0 +1,217 @@
+"""LLM 응답 캐시 (SQLite, 선택 기능)
+
+--dry-run 반복, 발행 실패 후 재실행, 대시보드 재생성처럼
+바이트 단위로 같은 프롬프트를 다시 보낼 때 토큰/시간을 쓰지 않도록
+ContentGenerator._call_ai 응답을 보관:
+- 키: 공급자 + 모델 + 전체 시스템 프롬프트 + 사용자 프롬프트 + max_tokens + temperature 해시
+- 본문 zlib 압축, TTL 만료, 전체 크기 상한 초과 시 LRU 삭제
+- settings.llm_cache_enabled로 켬 (기본 꺼짐)
+- 우회: 호출별 use_cache=False, 실행 단위 bypass (조회만 건너뛰고 새 응답은 저장)
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로/TTL/크기 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_cache.db"
+DEFAULT_TTL_HOURS = 72
+DEFAULT_MAX_MB = 100
+
+
+def make_key(provider: str, model: str, system: str, prompt: str, max_tokens: int, temperature=None) -> str:
+    """요청 내용 해시 (구분자로 필드 경계 고정)"""
+    h = hashlib.sha256()
+    for part in (provider, model, system, prompt, str(max_tokens), "default" if temperature is None else str(temperature)):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LLMCache:
+    """요청 해시 → 응답 텍스트 캐시"""
+
+    def __init__(self, db_path: str = None, enabled: bool = None, ttl_hours: float = None, max_mb: float = None):
+        if db_path is None or enabled is None or ttl_hours is None or max_mb is None:
+            try:
+                from config.settings import settings
+                db_path = settings.llm_cache_path if db_path is None else db_path
+                enabled = settings.llm_cache_enabled if enabled is None else enabled
+                ttl_hours = settings.llm_cache_ttl_hours if ttl_hours is None else ttl_hours
+                max_mb = settings.llm_cache_max_mb if max_mb is None else max_mb
+            except Exception:
+                db_path = db_path or str(DEFAULT_DB_PATH)
+                enabled = False if enabled is None else enabled
+                ttl_hours = DEFAULT_TTL_HOURS if ttl_hours is None else ttl_hours
+                max_mb = DEFAULT_MAX_MB if max_mb is None else max_mb
+
+        self.db_path = Path(db_path)
+        self.ttl = float(ttl_hours) * 3600
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self.enabled = bool(enabled) and self.ttl > 0 and self.max_bytes > 0
+        # 실행 단위 우회 (main.py --no-llm-cache, LLM_CACHE_BYPASS=1)
+        self.bypass = os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.saved_chars = 0  # 캐시로 대체한 응답 글자 수
+
+        if self.enabled:
+            self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 (실패 시 캐시 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        provider TEXT,
+                        model TEXT,
+                        body BLOB,  -- zlib 압축 응답 텍스트
+                        saved_at REAL,
+                        last_access REAL,
+                        size INTEGER
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_access ON llm_responses(last_access)")
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"LLM cache DB init failed, caching disabled: {e}")
+            self.enabled = False
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        """신선한 응답 조회 (bypass 중이면 항상 None)"""
+        if not self.enabled or self.bypass:
+            return None
+        cutoff = time.time() - self.ttl
+        try:
+            with self._get_conn() as conn:
+                row = conn.execute(
+                    "SELECT body FROM llm_responses WHERE key = ? AND saved_at >= ?",
+                    (key, cutoff)
+                ).fetchone()
+                if row:
+                    conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (time.time(), key))
+                    conn.commit()
+        except Exception as e:
+            logger.debug(f"LLM cache lookup failed: {e}")
+            return None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            text = zlib.decompress(row[0]).decode("utf-8")
+            self.hits += 1
+            self.saved_chars += len(text)
+        return text
+
+    def put(self, key: str, provider: str, model: str, text: str):
+        """응답 저장 후 크기 상한 확인 (빈 응답은 저장하지 않음)"""
+        if not self.enabled or not text:
+            return
+        packed = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        try:
+            with self._get_conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, provider, model, body, saved_at, last_access, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, packed, now, now, len(packed))
+                )
+                conn.commit()
+            with self._lock:
+                self.stores += 1
+            self._evict()
+        except Exception as e:
+            logger.debug(f"LLM cache store failed: {e}")
+
+    def _evict(self):
+        """만료 항목 삭제 + 크기 상한 초과 시 오래 접근하지 않은 항목부터 삭제 (상한의 90%까지)"""
+        with self._get_conn() as conn:
+            removed = conn.execute(
+                "DELETE FROM llm_responses WHERE saved_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+            if total > self.max_bytes:
+                target = int(self.max_bytes * 0.9)
+                for key, size in conn.execute("SELECT key, size FROM llm_responses ORDER BY last_access").fetchall():
+                    if total <= target:
+                        break
+                    conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    total -= size
+                    removed += 1
+            conn.commit()
+
+        if removed:
+            with self._lock:
+                self.evictions += removed
+            logger.debug(f"LLM cache evicted {removed} entries")
+
+    # ------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------
+
+    def clear(self) -> int:
+        """전체 삭제"""
+        if not self.enabled:
+            return 0
+        try:
+            with self._get_conn() as conn:
+                deleted = conn.execute("DELETE FROM llm_responses").rowcount
+                conn.commit()
+            return deleted
+        except Exception as e:
+            logger.debug(f"LLM cache clear failed: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        """캐시 적중 통계 + 저장 현황"""
+        entries, size = 0, 0
+        if self.enabled:
+            try:
+                with self._get_conn() as conn:
+                    entries, size = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+                    ).fetchone()
+            except Exception as e:
+                logger.debug(f"LLM cache stats failed: {e}")
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "saved_chars": self.saved_chars,
+                "entries": entries,
+                "size_mb": round(size / 1024 / 1024, 2),
+                "enabled": self.enabled,
+                "bypass": self.bypass,
+            }
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유, SQLite로 프로세스 간 공유)
+llm_cache = LLMCache()
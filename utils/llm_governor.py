@@ -0,0 +1,443 @@
+"""프로세스 간 LLM 호출 조절기 (SQLite 공유 토큰 버킷)
+
+스케줄러, 대시보드 백엔드, manual_publish.py, weekly_learn.py, scripts/prepare_adsense.py가
+같은 API 키로 동시에 Claude / Gemini를 부르면 429와 재시도 폭주가 생기므로
+모든 실제 API 호출 직전에 data/llm_governor.db의 공유 예산을 먼저 획득:
+- 공급자별 분당 요청 수(RPM) / 분당 토큰 수(TPM) 토큰 버킷 + 동시 호출 수 상한
+- 토큰은 프롬프트 길이 + max_tokens로 미리 잡고, 응답의 실제 사용량으로 정산 (settle)
+- ticket.record(응답, 모델) / wrap(..., model=...)은 응답 usage를 utils/llm_usage에도 기록 (비용 리포트)
+- 대기열 우선순위: 발행(0) > 대화형(1, 대시보드 / 수동 발행) > 배치(2, 주간 학습 / 애드센스 준비)
+  같은 우선순위는 먼저 온 순서, 앞선 대기자가 있으면 예산이 남아도 양보
+- 대기 시간은 waits 테이블에 기록 (python trace_report.py --governor) + 현재 스팬에 llm_wait
+- DB를 열 수 없으면 조절 없이 바로 호출 (기능 비활성화)
+
+LLM 응답 캐시 / 카세트 재생은 실제 호출이 아니므로 여기를 거치지 않음
+"""
+import logging
+import math
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.llm_usage import llm_usage, response_text
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_PUBLISH = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BATCH = 2
+PRIORITY_NAMES = {"publish": PRIORITY_PUBLISH, "interactive": PRIORITY_INTERACTIVE, "batch": PRIORITY_BATCH}
+
+# 기본값 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_governor.db"
+DEFAULT_MAX_WAIT = 120.0
+DEFAULT_LIMITS = {
+    "claude": {"rpm": 50, "tpm": 80000, "concurrent": 8},
+    "gemini": {"rpm": 60, "tpm": 1000000, "concurrent": 8},
+}
+
+# max_tokens를 모르는 호출(기본 generation_config)의 출력 토큰 예상치
+DEFAULT_OUTPUT_TOKENS = 1024
+# 대기열 / 진행 중 기록이 이 시간 동안 갱신되지 않으면 죽은 프로세스로 보고 정리
+WAITER_STALE_SECONDS = 30.0
+INFLIGHT_STALE_SECONDS = 900.0
+# 대기 중 DB 재확인 간격 상한
+MAX_POLL_SECONDS = 1.0
+# 대기 기록(waits) 보관 기간 (초기화 시 정리)
+WAITS_KEEP_DAYS = 30
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 대략치 (한글 위주 기준 2자당 1토큰, 실제 사용량으로 정산되므로 거칠게)"""
+    return math.ceil(len(text or "") / 2)
+
+
+def _pid_alive(pid: int) -> bool:
+    # Windows의 os.kill은 신호 0도 프로세스를 종료시키므로 확인하지 않음 (시간 기준 정리만)
+    if pid == os.getpid() or os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+class Ticket:
+    """획득한 호출 슬롯 (slot() 블록 안에서 실제 사용량 정산용)"""
+
+    def __init__(self, governor: "LLMGovernor", provider: str, reserved: int, waited: float):
+        self.governor = governor
+        self.provider = provider
+        self.reserved = reserved
+        self.waited = waited
+        self.settled = False
+        self.started = time.perf_counter()  # 예산 획득 시각 (record의 지연 시간 기준)
+
+    def settle(self, actual_tokens: Optional[int]):
+        """미리 잡은 토큰과 실제 사용량의 차이를 버킷에 되돌림 (초과분은 차감)"""
+        if self.settled or not actual_tokens:
+            return
+        self.settled = True
+        self.governor._adjust_tokens(self.provider, self.reserved - int(actual_tokens))
+
+    def record(self, response, model: str, max_tokens: int = 0):
+        """응답 usage를 llm_usage에 기록하고 그 토큰 수로 정산 (ContentGenerator 밖의 단발 호출용)"""
+        try:
+            tokens = llm_usage.record_response(self.provider, model, response,
+                                               time.perf_counter() - self.started, max_tokens)
+        except Exception as e:
+            logger.debug(f"LLM usage record failed: {e}")
+            return
+        self.settle(tokens)
+
+
+class LLMGovernor:
+    """공급자별 공유 RPM / TPM / 동시 호출 예산 (프로세스 간 공유)"""
+
+    def __init__(self, db_path: str = None, enabled: bool = None, limits: Dict[str, Dict] = None,
+                 max_wait: float = None):
+        try:
+            from config.settings import settings
+            db_path = settings.llm_governor_path if db_path is None else db_path
+            enabled = settings.llm_governor_enabled if enabled is None else enabled
+            max_wait = settings.llm_governor_max_wait if max_wait is None else max_wait
+            if limits is None:
+                limits = {
+                    "claude": {"rpm": settings.llm_claude_rpm, "tpm": settings.llm_claude_tpm,
+                               "concurrent": settings.llm_claude_max_concurrent},
+                    "gemini": {"rpm": settings.llm_gemini_rpm, "tpm": settings.llm_gemini_tpm,
+                               "concurrent": settings.llm_gemini_max_concurrent},
+                }
+        except Exception:
+            db_path = db_path or str(DEFAULT_DB_PATH)
+            enabled = True if enabled is None else enabled
+            max_wait = DEFAULT_MAX_WAIT if max_wait is None else max_wait
+            limits = limits or DEFAULT_LIMITS
+
+        self.db_path = Path(db_path)
+        self.enabled = bool(enabled)
+        self.max_wait = float(max_wait)
+        self.limits = limits
+        # 프로세스 기본 우선순위 (LLM_PRIORITY=publish|interactive|batch 또는 set_default_priority)
+        self.default_priority = PRIORITY_NAMES.get(os.getenv("LLM_PRIORITY", "").lower(), PRIORITY_INTERACTIVE)
+
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_calls = 0
+        self.total_wait = 0.0
+        self.max_waited = 0.0
+        self.timeouts = 0
+
+        if self.enabled:
+            self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _init_db(self):
+        """테이블 초기화 + 보관 기간 지난 대기 기록 삭제 (실패 시 조절 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._get_conn()
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    provider TEXT PRIMARY KEY,
+                    requests REAL NOT NULL,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS waiters (
+                    id TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    enqueued REAL NOT NULL,
+                    pid INTEGER NOT NULL,
+                    seen REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS inflight (
+                    id TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    pid INTEGER NOT NULL,
+                    started REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS waits (
+                    provider TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    label TEXT,
+                    waited REAL NOT NULL,
+                    tokens INTEGER NOT NULL,
+                    at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_waits_at ON waits(at);
+            """)
+            conn.execute("DELETE FROM waits WHERE at < ?", (time.time() - WAITS_KEEP_DAYS * 86400,))
+            conn.close()
+        except Exception as e:
+            logger.warning(f"LLM governor disabled (DB init failed): {e}")
+            self.enabled = False
+
+    def set_default_priority(self, priority):
+        """프로세스 기본 우선순위 지정 ("publish" / "interactive" / "batch" 또는 숫자)"""
+        self.default_priority = PRIORITY_NAMES.get(priority, priority) if isinstance(priority, str) else int(priority)
+
+    # ------------------------------------------------------------
+    # 획득 / 반납
+    # ------------------------------------------------------------
+
+    def _refill(self, conn: sqlite3.Connection, provider: str, now: float):
+        """버킷을 경과 시간만큼 채운 (요청, 토큰) 반환"""
+        limits = self.limits.get(provider, {})
+        rpm, tpm = limits.get("rpm", 0), limits.get("tpm", 0)
+        row = conn.execute("SELECT requests, tokens, updated FROM buckets WHERE provider = ?", (provider,)).fetchone()
+        if row is None:
+            return float(rpm), float(tpm)
+        requests, tokens, updated = row
+        elapsed = max(now - updated, 0.0)
+        return min(rpm, requests + elapsed * rpm / 60), min(tpm, tokens + elapsed * tpm / 60)
+
+    def _cleanup(self, conn: sqlite3.Connection, now: float):
+        conn.execute("DELETE FROM waiters WHERE seen < ?", (now - WAITER_STALE_SECONDS,))
+        conn.execute("DELETE FROM inflight WHERE started < ?", (now - INFLIGHT_STALE_SECONDS,))
+        for row_id, pid in conn.execute("SELECT id, pid FROM inflight").fetchall():
+            if not _pid_alive(pid):
+                conn.execute("DELETE FROM inflight WHERE id = ?", (row_id,))
+
+    def _try_acquire(self, provider: str, tokens: int, priority: int, ticket_id: str, enqueued: float) -> float:
+        """
+        한 번 시도 (트랜잭션 하나)
+
+        Returns:
+            0이면 획득, 양수면 다시 시도하기까지 기다릴 시간 (초)
+        """
+        limits = self.limits.get(provider, {})
+        rpm, tpm, concurrent = limits.get("rpm", 0), limits.get("tpm", 0), limits.get("concurrent", 0)
+        conn = self._get_conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            self._cleanup(conn, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO waiters (id, provider, priority, enqueued, pid, seen) VALUES (?, ?, ?, ?, ?, ?)",
+                (ticket_id, provider, priority, enqueued, os.getpid(), now)
+            )
+            ahead = conn.execute(
+                "SELECT 1 FROM waiters WHERE provider = ? AND id != ? "
+                "AND (priority < ? OR (priority = ? AND enqueued < ?)) LIMIT 1",
+                (provider, ticket_id, priority, priority, enqueued)
+            ).fetchone()
+            running = conn.execute("SELECT COUNT(*) FROM inflight WHERE provider = ?", (provider,)).fetchone()[0]
+            requests, available = self._refill(conn, provider, now)
+            need = min(tokens, tpm) if tpm else 0
+
+            wait = 0.0
+            if ahead:
+                wait = MAX_POLL_SECONDS / 4
+            else:
+                if rpm and requests < 1:
+                    wait = max(wait, (1 - requests) * 60 / rpm)
+                if tpm and available < need:
+                    wait = max(wait, (need - available) * 60 / tpm)
+                if concurrent and running >= concurrent:
+                    wait = max(wait, MAX_POLL_SECONDS / 4)
+
+            if wait == 0.0:
+                requests -= 1 if rpm else 0
+                available -= need
+                conn.execute("DELETE FROM waiters WHERE id = ?", (ticket_id,))
+                conn.execute("INSERT INTO inflight (id, provider, pid, started) VALUES (?, ?, ?, ?)",
+                             (ticket_id, provider, os.getpid(), now))
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (provider, requests, tokens, updated) VALUES (?, ?, ?, ?)",
+                (provider, requests, available, now)
+            )
+            conn.execute("COMMIT")
+            return wait
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _leave(self, table: str, ticket_id: str):
+        try:
+            conn = self._get_conn()
+            conn.execute(f"DELETE FROM {table} WHERE id = ?", (ticket_id,))
+            conn.close()
+        except Exception as e:
+            logger.debug(f"LLM governor {table} cleanup failed: {e}")
+
+    def _adjust_tokens(self, provider: str, delta: int):
+        if not delta or not self.enabled:
+            return
+        try:
+            conn = self._get_conn()
+            conn.execute("UPDATE buckets SET tokens = MIN(tokens + ?, ?) WHERE provider = ?",
+                         (delta, self.limits.get(provider, {}).get("tpm", 0), provider))
+            conn.close()
+        except Exception as e:
+            logger.debug(f"LLM governor settle failed: {e}")
+
+    def _record_wait(self, provider: str, priority: int, label: str, waited: float, tokens: int):
+        with self._lock:
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_waited = max(self.max_waited, waited)
+            if waited >= 0.05:
+                self.waited_calls += 1
+        try:
+            conn = self._get_conn()
+            conn.execute("INSERT INTO waits (provider, priority, label, waited, tokens, at) VALUES (?, ?, ?, ?, ?, ?)",
+                         (provider, priority, label, waited, tokens, time.time()))
+            conn.close()
+        except Exception as e:
+            logger.debug(f"LLM governor wait log failed: {e}")
+
+    @contextmanager
+    def slot(self, provider: str, prompt: str = "", max_tokens: int = 0, priority: int = None,
+             label: str = "", timeout: float = None):
+        """
+        실제 API 호출 하나를 감싸는 예산 획득 블록
+
+        Args:
+            provider: "claude" / "gemini"
+            prompt: 보낼 프롬프트 전체 (토큰 예상치 계산용)
+            max_tokens: 최대 출력 토큰 (0이면 DEFAULT_OUTPUT_TOKENS)
+            priority: 대기열 우선순위 (None이면 프로세스 기본값)
+            label: 대기 기록용 호출 구분 (예: "content", "blog_summary")
+            timeout: 최대 대기 시간 (None이면 settings.llm_governor_max_wait)
+
+        Yields:
+            Ticket (ticket.settle(실제 토큰)으로 정산, 조절 꺼짐이면 정산은 무시됨)
+
+        Raises:
+            TimeoutError: 대기 시간 초과
+        """
+        tokens = estimate_tokens(prompt) + (max_tokens or DEFAULT_OUTPUT_TOKENS)
+        if not self.enabled or provider not in self.limits:
+            yield Ticket(self, provider, tokens, 0.0)
+            return
+
+        priority = self.default_priority if priority is None else priority
+        timeout = self.max_wait if timeout is None else timeout
+        ticket_id = uuid.uuid4().hex
+        enqueued = time.time()
+        started = time.perf_counter()
+
+        try:
+            while True:
+                wait = self._try_acquire(provider, tokens, priority, ticket_id, enqueued)
+                if wait == 0.0:
+                    break
+                if time.perf_counter() - started + wait > timeout:
+                    self._leave("waiters", ticket_id)
+                    with self._lock:
+                        self.timeouts += 1
+                    raise TimeoutError(f"LLM governor: {provider} budget not available within {timeout:.0f}s")
+                time.sleep(min(wait, MAX_POLL_SECONDS) * random.uniform(0.8, 1.2))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM governor unavailable, calling without limit: {e}")
+            yield Ticket(self, provider, tokens, 0.0)
+            return
+
+        waited = time.perf_counter() - started
+        self._record_wait(provider, priority, label, waited, tokens)
+        if waited >= 1:
+            logger.info(f"LLM governor: waited {waited:.1f}s for {provider} ({label or 'call'}, priority {priority})")
+        try:
+            from utils.tracing import tracer
+            tracer.annotate(llm_wait=round(waited, 3))
+        except Exception:
+            pass
+
+        try:
+            yield Ticket(self, provider, tokens, waited)
+        finally:
+            self._leave("inflight", ticket_id)
+
+    def wrap(self, provider: str, prompt: str, max_tokens: int, call: Callable[[], Any],
+             label: str = "", priority: int = None, model: str = None) -> Callable[[], Any]:
+        """
+        call을 slot() 안에서 실행하는 함수로 감쌈 (cassette.llm_exchange 등에 넘기는 호출용)
+
+        model을 주면 call은 SDK 응답 객체를 반환 → usage를 llm_usage에 기록 / 정산하고 응답 텍스트 반환
+        """
+        def governed():
+            with self.slot(provider, prompt, max_tokens, priority=priority, label=label) as ticket:
+                if model is None:
+                    return call()
+                response = call()
+                ticket.record(response, model, max_tokens)
+                return response_text(provider, response)
+        return governed
+
+    # ------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------
+
+    def get_stats(self) -> Dict:
+        """이 프로세스의 획득 횟수 / 대기한 호출 수 / 평균·최대 대기 시간"""
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "waited": self.waited_calls,
+                "avg_wait": self.total_wait / self.acquired if self.acquired else 0.0,
+                "max_wait": self.max_waited,
+                "timeouts": self.timeouts,
+            }
+
+    def wait_report(self, hours: float = 24) -> List[Dict]:
+        """
+        최근 대기 기록 요약 (모든 프로세스)
+
+        Returns:
+            [{"provider", "priority", "calls", "waited", "avg", "p95", "max", "tokens"}, ...]
+        """
+        if not self.enabled:
+            return []
+        conn = self._get_conn()
+        try:
+            rows = conn.execute(
+                "SELECT provider, priority, waited, tokens FROM waits WHERE at >= ? ORDER BY provider, priority",
+                (time.time() - hours * 3600,)
+            ).fetchall()
+        finally:
+            conn.close()
+
+        groups: Dict[tuple, List] = {}
+        for provider, priority, waited, tokens in rows:
+            groups.setdefault((provider, priority), []).append((waited, tokens))
+
+        report = []
+        for (provider, priority), items in groups.items():
+            waits = sorted(w for w, _ in items)
+            report.append({
+                "provider": provider,
+                "priority": priority,
+                "calls": len(waits),
+                "waited": sum(1 for w in waits if w >= 0.05),
+                "avg": sum(waits) / len(waits),
+                "p95": waits[min(len(waits) - 1, math.ceil(0.95 * len(waits)) - 1)],
+                "max": waits[-1],
+                "tokens": sum(t for _, t in items),
+            })
+        return report
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유, 프로세스 간에는 DB로 공유)
+llm_governor = LLMGovernor()
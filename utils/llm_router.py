@@ -0,0 +1,270 @@
+"""LLM 공급자 라우터 (지연 시간 인지 + 장애 조치 + 선택적 헤지 요청)
+
+ContentGenerator._call_ai가 공급자(claude / gemini)별 호출 함수를 넘기면:
+- 공급자·모델별 최근 N회 지연 시간 / 성공 여부를 보관 (p50 / p90 / 오류율)
+- 기본 공급자가 최근 연속 실패(쿨다운 중)거나 오류율이 높으면 다른 공급자를 먼저 시도
+- 오류 또는 시간 초과 시 다음 공급자로 장애 조치
+  (시간 초과는 넘어갈 공급자가 남아 있을 때만 — 마지막 공급자는 이어쓰기 포함 끝까지 기다림)
+- 헤지 (settings.llm_hedge_enabled): 첫 요청이 해당 공급자 p90을 넘기면
+  다음 공급자(하나뿐이면 같은 공급자)에 두 번째 요청을 보내고 먼저 끝난 응답 사용
+  → 늦게 끝난 요청도 통계에는 반영 (취소 불가, 응답은 버림)
+- 호출별 결정(순서, 승자, 헤지 / 장애 조치 여부)은 반환값으로 돌려주고
+  호출부가 트레이스 스팬에 기록 (python trace_report.py --usage)
+"""
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings 로드 실패 시 사용)
+DEFAULT_WINDOW = 50
+DEFAULT_TIMEOUT = 240.0
+DEFAULT_HEDGE_MIN_SAMPLES = 5
+DEFAULT_ERROR_THRESHOLD = 0.5
+DEFAULT_COOLDOWN = 300.0
+
+# 연속 실패 횟수가 이 이상이면 쿨다운 동안 뒤로 보냄
+MAX_CONSECUTIVE_FAILURES = 3
+
+
+class ProviderStats:
+    """공급자·모델 하나의 최근 호출 기록"""
+
+    def __init__(self, window: int):
+        self._samples: deque = deque(maxlen=window)  # (지연 시간, 성공 여부)
+        self.consecutive_failures = 0
+        self.last_failure_at = 0.0
+        self.calls = 0
+        self.failures = 0
+
+    def record(self, latency: float, ok: bool):
+        self._samples.append((latency, ok))
+        self.calls += 1
+        if ok:
+            self.consecutive_failures = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_failure_at = time.time()
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """성공한 호출의 nearest-rank 백분위 지연 시간 (기록 없으면 None)"""
+        latencies = sorted(latency for latency, ok in self._samples if ok)
+        if not latencies:
+            return None
+        rank = max(1, math.ceil(pct / 100 * len(latencies)))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    @property
+    def samples(self) -> int:
+        return sum(1 for _, ok in self._samples if ok)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+
+class LLMRouter:
+    """공급자 선택 / 장애 조치 / 헤지 (프로세스 전체 공유)"""
+
+    def __init__(
+        self,
+        window: int = None,
+        timeout: float = None,
+        hedge_enabled: bool = None,
+        hedge_min_samples: int = None,
+        error_threshold: float = None,
+        cooldown: float = None
+    ):
+        try:
+            from config.settings import settings
+            window = settings.llm_router_window if window is None else window
+            timeout = settings.llm_call_timeout if timeout is None else timeout
+            hedge_enabled = settings.llm_hedge_enabled if hedge_enabled is None else hedge_enabled
+            hedge_min_samples = settings.llm_hedge_min_samples if hedge_min_samples is None else hedge_min_samples
+        except Exception:
+            window = DEFAULT_WINDOW if window is None else window
+            timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+            hedge_enabled = False if hedge_enabled is None else hedge_enabled
+            hedge_min_samples = DEFAULT_HEDGE_MIN_SAMPLES if hedge_min_samples is None else hedge_min_samples
+
+        self.window = int(window)
+        self.timeout = float(timeout)
+        self.hedge_enabled = bool(hedge_enabled)
+        self.hedge_min_samples = int(hedge_min_samples)
+        self.error_threshold = DEFAULT_ERROR_THRESHOLD if error_threshold is None else error_threshold
+        self.cooldown = DEFAULT_COOLDOWN if cooldown is None else cooldown
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ProviderStats] = {}
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-router")
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def _get(self, name: str) -> ProviderStats:
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = ProviderStats(self.window)
+            return self._stats[name]
+
+    def record(self, name: str, latency: float, ok: bool):
+        """호출 결과 기록 (스트리밍처럼 call()을 거치지 않는 호출용)"""
+        with self._lock:
+            self._stats.setdefault(name, ProviderStats(self.window)).record(latency, ok)
+
+    def _record(self, name: str, started: float, future):
+        self.record(name, time.perf_counter() - started, future.exception() is None)
+
+    # ------------------------------------------------------------
+    # 선택
+    # ------------------------------------------------------------
+
+    def healthy(self, name: str) -> bool:
+        """쿨다운 중(연속 실패)이거나 최근 오류율이 임계값 이상이면 False"""
+        stats = self._get(name)
+        with self._lock:
+            if stats.consecutive_failures >= MAX_CONSECUTIVE_FAILURES \
+                    and time.time() - stats.last_failure_at < self.cooldown:
+                return False
+            return not (len(stats._samples) >= 4 and stats.error_rate >= self.error_threshold)
+
+    def order(self, names: List[str]) -> List[str]:
+        """시도 순서: 건강한 공급자 먼저 (각 그룹 안에서는 전달한 선호 순서 유지)"""
+        healthy = [name for name in names if self.healthy(name)]
+        return healthy + [name for name in names if name not in healthy]
+
+    def hedge_delay(self, name: str) -> Optional[float]:
+        """헤지 요청을 보낼 대기 시간 (p90, 표본 부족 / 헤지 꺼짐이면 None)"""
+        if not self.hedge_enabled:
+            return None
+        stats = self._get(name)
+        with self._lock:
+            if stats.samples < self.hedge_min_samples:
+                return None
+            return stats.percentile(90)
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+
+    def call(self, calls: Dict[str, Callable[[], Any]]) -> Tuple[Any, Dict]:
+        """
+        공급자별 호출 실행
+
+        Args:
+            calls: {"공급자:모델": 호출 함수} (선호 순서대로)
+
+        Returns:
+            (응답, 결정) — 결정: {"order", "winner", "hedged", "failovers", "errors"}
+
+        Raises:
+            마지막 공급자의 예외 (모두 실패)
+        """
+        names = self.order(list(calls))
+        queue = list(names)
+        decision = {"order": names, "winner": None, "hedged": False, "failovers": 0, "errors": []}
+        pending: Dict[Any, str] = {}
+
+        def launch(name: str):
+            started = time.perf_counter()
+            future = self._pool.submit(contextvars.copy_context().run, calls[name])
+            future.add_done_callback(lambda f, n=name, s=started: self._record(n, s, f))
+            pending[future] = name
+            return future
+
+        def next_deadline() -> Optional[float]:
+            # 넘어갈 공급자가 없으면 기다림 (버린 요청도 과금되고 끝까지 실행되므로)
+            return time.perf_counter() + self.timeout if queue else None
+
+        launch(queue.pop(0))
+        hedge_at = self.hedge_delay(names[0])
+        deadline = next_deadline()
+        hedge_deadline = None if hedge_at is None else time.perf_counter() + hedge_at
+        hedge_future = None
+        last_error: Optional[BaseException] = None
+
+        while pending:
+            now = time.perf_counter()
+            wakes = [deadline] if deadline is not None else []
+            if hedge_deadline is not None and not decision["hedged"]:
+                wakes.append(hedge_deadline)
+            timeout = max(min(wakes) - now, 0) if wakes else None
+            done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    decision["winner"] = name
+                    if future is hedge_future:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result(), decision
+                last_error = error
+                decision["errors"].append(f"{name}: {type(error).__name__}")
+                logger.warning(f"LLM provider {name} failed: {error}")
+                if not pending and queue:
+                    decision["failovers"] += 1
+                    with self._lock:
+                        self.failovers += 1
+                    launch(queue.pop(0))
+                    deadline = next_deadline()
+
+            if done:
+                continue
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                # 시간 초과: 남은 공급자로 장애 조치 (진행 중인 요청은 버림)
+                decision["errors"].append(f"{', '.join(pending.values())}: timeout")
+                pending.clear()
+                decision["failovers"] += 1
+                with self._lock:
+                    self.failovers += 1
+                launch(queue.pop(0))
+                deadline = next_deadline()
+                continue
+
+            if hedge_deadline is not None and not decision["hedged"] and time.perf_counter() >= hedge_deadline:
+                # 헤지: p90을 넘긴 첫 요청과 경쟁 (다음 공급자가 없으면 같은 공급자)
+                decision["hedged"] = True
+                with self._lock:
+                    self.hedges += 1
+                hedge_future = launch(queue.pop(0) if queue else names[0])
+                if not queue:
+                    deadline = None
+                logger.info(f"LLM hedge after {hedge_at:.1f}s (p90 of {names[0]})")
+
+        raise last_error or RuntimeError("No LLM provider available")
+
+    def get_stats(self) -> Dict:
+        """공급자별 호출 수 / 오류율 / p50·p90 + 헤지 / 장애 조치 횟수"""
+        with self._lock:
+            providers = {
+                name: {
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "error_rate": round(stats.error_rate, 2),
+                    "p50": stats.percentile(50),
+                    "p90": stats.percentile(90),
+                }
+                for name, stats in self._stats.items()
+            }
+            return {
+                "providers": providers,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "failovers": self.failovers,
+            }
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+llm_router = LLMRouter()
@@ -0,0 +1,416 @@
+"""LLM 호출별 토큰 / 비용 / 지연 시간 기록 (data/llm_usage.db)
+
+실제 API 호출마다 한 행 (ContentGenerator의 _call_claude / _call_gemini / 스트리밍,
+그 밖의 호출은 llm_governor.slot의 ticket.record / llm_governor.wrap(model=...)로):
+공급자, 모델, 입력 / 출력 / 캐시 토큰, 지연 시간, 단계(호출을 감싼 스팬 이름), 키워드,
+템플릿 키(generate_template_prompt), 카테고리, 예상 비용(USD),
+max_tokens / 출력 글자 수 / 잘림 여부 (generators/output_budget.py가 출력 예산 학습에 사용)
+
+사용:
+    from utils.llm_usage import llm_usage
+
+    with llm_usage.post(keyword):             # 글 하나 (generate_full_post)
+        llm_usage.annotate(category="재테크")  # 분류 / 템플릿 선택 후 채움
+        ...                                   # 안쪽 호출은 llm_usage.record(...)
+
+- 글이 끝나면 그 글의 모든 행에 최종 템플릿 / 카테고리를 채움 (분류 전에 나간 호출 포함)
+- LLM 응답 캐시 / 카세트 재생은 실제 호출이 아니므로 기록하지 않음
+- 리포트: python trace_report.py --cost [--days 7]
+- DB를 열 수 없으면 기록 비활성화
+"""
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# 기본값 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "llm_usage.db"
+DEFAULT_KEEP_DAYS = 90
+# USD / 100만 토큰 (입력, 출력) — 공급자 기본 단가 (MODEL_PRICES에 없는 모델)
+DEFAULT_PRICES = {
+    "claude": (0.8, 4.0),
+    "gemini": (0.3, 2.5),
+}
+# 모델별 단가 (모델 이름 접두사, 가장 긴 접두사 우선 — 설정의 기본 모델은 settings 단가가 우선)
+MODEL_PRICES = {
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-haiku-4-5": (1.0, 5.0),
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-sonnet-4": (3.0, 15.0),
+    "claude-opus-4": (15.0, 75.0),
+    "claude-opus-4-5": (5.0, 25.0),
+    "gemini-1.5-flash": (0.075, 0.3),
+    "gemini-2.0-flash": (0.1, 0.4),
+    "gemini-2.5-flash": (0.3, 2.5),
+    "gemini-2.5-pro": (1.25, 10.0),
+}
+
+# 캐시 토큰 단가 (입력 단가 대비 배율)
+CACHE_READ_RATE = {"claude": 0.1, "gemini": 0.25}
+CACHE_WRITE_RATE = 1.25
+
+# 단계 이름에서 건너뛸 호출 스팬 (호출을 감싼 단계를 기록)
+CALL_SPANS = ("ai.call", "ai.stream", "ai.batch")
+
+# 리포트 묶음 기준 → SQL 식
+GROUPS = {
+    "day": "date(ts, 'unixepoch', 'localtime')",
+    "post": "post_id",
+    "template": "template",
+    "category": "category",
+    "stage": "stage",
+    "model": "provider || ':' || model",
+}
+
+# 이전 버전 DB에 없을 수 있는 열 (없으면 _init_db에서 추가)
+ADDED_COLUMNS = {
+    "max_tokens": "INTEGER DEFAULT 0",
+    "output_chars": "INTEGER DEFAULT 0",
+    "truncated": "INTEGER DEFAULT 0",
+}
+
+# 현재 글 (post_id / keyword / template / category)
+_current_post: ContextVar[Optional[dict]] = ContextVar("llm_usage_post", default=None)
+
+
+def claude_counts(usage) -> Dict[str, int]:
+    """Claude 응답 usage → 기록용 토큰 수"""
+    return {
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+        "cache_read_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+        "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+    }
+
+
+def gemini_counts(usage) -> Dict[str, int]:
+    """Gemini usage_metadata → Claude와 같은 이름의 토큰 수 (암묵적 접두사 캐시는 입력에서 분리)"""
+    cached = getattr(usage, "cached_content_token_count", 0) or 0
+    return {
+        "input_tokens": (getattr(usage, "prompt_token_count", 0) or 0) - cached,
+        "output_tokens": getattr(usage, "candidates_token_count", 0) or 0,
+        "cache_read_tokens": cached,
+        "cache_write_tokens": 0,
+    }
+
+
+def response_text(provider: str, response) -> str:
+    """SDK 응답 객체의 텍스트 (Claude: content[0].text, Gemini: .text)"""
+    return response.content[0].text if provider == "claude" else response.text
+
+
+class UsageLedger:
+    """LLM 호출 기록 저장소 (프로세스 간 공유 SQLite)"""
+
+    def __init__(self, db_path: str = None, enabled: bool = None, keep_days: int = None,
+                 prices: Dict[str, tuple] = None, model_prices: Dict[str, tuple] = None):
+        model_prices = dict(MODEL_PRICES if model_prices is None else model_prices)
+        try:
+            from config.settings import settings
+            db_path = settings.llm_usage_path if db_path is None else db_path
+            enabled = settings.llm_usage_enabled if enabled is None else enabled
+            keep_days = settings.llm_usage_keep_days if keep_days is None else keep_days
+            if prices is None:
+                prices = {
+                    "claude": (settings.llm_claude_price_input, settings.llm_claude_price_output),
+                    "gemini": (settings.llm_gemini_price_input, settings.llm_gemini_price_output),
+                }
+                # 설정의 기본 모델은 settings 단가 (모델 변경 시 함께 수정하는 값)
+                model_prices[settings.claude_model.lower()] = prices["claude"]
+                model_prices[settings.gemini_model.lower()] = prices["gemini"]
+        except Exception:
+            db_path = db_path or str(DEFAULT_DB_PATH)
+            enabled = True if enabled is None else enabled
+            keep_days = DEFAULT_KEEP_DAYS if keep_days is None else keep_days
+            prices = prices or DEFAULT_PRICES
+
+        self.db_path = Path(db_path)
+        self.enabled = bool(enabled)
+        self.keep_days = keep_days
+        self.prices = prices
+        self.model_prices = model_prices
+
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.tokens = 0
+        self.cost = 0.0
+
+        if self.enabled:
+            self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 + 보관 기간 지난 행 삭제 (실패 시 기록 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS calls (
+                        ts REAL,
+                        run_id TEXT,
+                        post_id TEXT,
+                        keyword TEXT,
+                        template TEXT,
+                        category TEXT,
+                        stage TEXT,
+                        provider TEXT,
+                        model TEXT,
+                        input_tokens INTEGER,
+                        output_tokens INTEGER,
+                        cache_read_tokens INTEGER,
+                        cache_write_tokens INTEGER,
+                        latency REAL,  -- 초 (스트리밍은 마지막 조각까지)
+                        cost REAL,  -- USD
+                        max_tokens INTEGER DEFAULT 0,
+                        output_chars INTEGER DEFAULT 0,  -- 응답 원문 글자 수 (HTML 포함)
+                        truncated INTEGER DEFAULT 0  -- max_tokens에서 잘림
+                    )
+                """)
+                existing = {row[1] for row in conn.execute("PRAGMA table_info(calls)")}
+                for column, spec in ADDED_COLUMNS.items():
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE calls ADD COLUMN {column} {spec}")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_calls_ts ON calls(ts)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_calls_post ON calls(post_id)")
+                conn.execute("DELETE FROM calls WHERE ts < ?", (time.time() - self.keep_days * 86400,))
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"LLM usage store init failed, usage accounting disabled: {e}")
+            self.enabled = False
+
+    # ------------------------------------------------------------
+    # 글 단위 맥락
+    # ------------------------------------------------------------
+
+    @contextmanager
+    def post(self, keyword: str, **fields):
+        """
+        글 하나의 호출을 묶는 컨텍스트 (스레드풀에 넘길 때는 contextvars.copy_context().run)
+
+        Args:
+            keyword: 키워드
+            **fields: template / category (나중에 annotate로 채워도 됨)
+        """
+        post = {"post_id": uuid.uuid4().hex[:12], "keyword": keyword, "template": "", "category": ""}
+        post.update(fields)
+        token = _current_post.set(post)
+        try:
+            yield post
+        finally:
+            _current_post.reset(token)
+            self._finish_post(post)
+
+    def annotate(self, **fields):
+        """현재 글의 템플릿 / 카테고리 지정 (글 밖이면 무시)"""
+        post = _current_post.get()
+        if post is not None:
+            post.update(fields)
+
+    def _finish_post(self, post: dict):
+        """최종 템플릿 / 카테고리를 글의 모든 행에 반영"""
+        if not self.enabled:
+            return
+        try:
+            with self._get_conn() as conn:
+                conn.execute(
+                    "UPDATE calls SET template = ?, category = ? WHERE post_id = ?",
+                    (post["template"], post["category"], post["post_id"])
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"LLM usage post update failed: {e}")
+
+    # ------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------
+
+    def price(self, provider: str, model: str = "") -> tuple:
+        """(입력, 출력) 단가: 모델 정확히 일치 → 가장 긴 모델 접두사 → 공급자 기본 (모르는 공급자는 0)"""
+        name = (model or "").lower()
+        if name.startswith("models/"):
+            name = name[len("models/"):]  # Gemini GenerativeModel.model_name
+        if name in self.model_prices:
+            return self.model_prices[name]
+        prefixes = [prefix for prefix in self.model_prices if name.startswith(prefix)]
+        if prefixes:
+            return self.model_prices[max(prefixes, key=len)]
+        return self.prices.get(provider, (0.0, 0.0))
+
+    def estimate_cost(self, provider: str, counts: Dict[str, int], model: str = "") -> float:
+        """토큰 수 → 예상 비용 (USD, 모델 단가 우선)"""
+        price_in, price_out = self.price(provider, model)
+        cost = (
+            counts.get("input_tokens", 0) * price_in
+            + counts.get("cache_read_tokens", 0) * price_in * CACHE_READ_RATE.get(provider, 1.0)
+            + counts.get("cache_write_tokens", 0) * price_in * CACHE_WRITE_RATE
+            + counts.get("output_tokens", 0) * price_out
+        )
+        return cost / 1_000_000
+
+    def record(self, provider: str, model: str, counts: Dict[str, int], latency: float,
+               max_tokens: int = 0, output_chars: int = 0, truncated: bool = False, cost_factor: float = 1.0):
+        """
+        실제 API 호출 하나 기록
+
+        Args:
+            provider: "claude" / "gemini"
+            model: 모델 이름
+            counts: input_tokens / output_tokens / cache_read_tokens / cache_write_tokens
+            latency: 호출 소요 시간 (초)
+            max_tokens: 요청한 최대 출력 토큰
+            output_chars: 응답 글자 수
+            truncated: max_tokens에서 잘렸는지
+            cost_factor: 단가 배율 (일괄 처리 API 할인 등)
+        """
+        cost = self.estimate_cost(provider, counts, model) * cost_factor
+        with self._lock:
+            self.calls += 1
+            self.tokens += sum(counts.values())
+            self.cost += cost
+        if not self.enabled:
+            return
+
+        post = _current_post.get() or {}
+        row = (
+            time.time(), tracer.run_id, post.get("post_id", ""), post.get("keyword", ""),
+            post.get("template", ""), post.get("category", ""), tracer.current_stage(skip=CALL_SPANS),
+            provider, model,
+            counts.get("input_tokens", 0), counts.get("output_tokens", 0),
+            counts.get("cache_read_tokens", 0), counts.get("cache_write_tokens", 0),
+            round(latency, 3), cost, max_tokens, output_chars, int(bool(truncated)),
+        )
+        try:
+            with self._get_conn() as conn:
+                conn.execute(
+                    "INSERT INTO calls (ts, run_id, post_id, keyword, template, category, stage, provider, model, "
+                    "input_tokens, output_tokens, cache_read_tokens, cache_write_tokens, latency, cost, "
+                    "max_tokens, output_chars, truncated) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"LLM usage record failed: {e}")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def record_response(self, provider: str, model: str, response, latency: float, max_tokens: int = 0) -> int:
+        """
+        SDK 응답 객체에서 usage를 꺼내 기록 (ContentGenerator 밖의 단발 호출용)
+
+        Args:
+            provider: "claude" / "gemini"
+            model: 모델 이름
+            response: Claude Message / Gemini GenerateContentResponse
+            latency: 호출 소요 시간 (초)
+            max_tokens: 요청한 최대 출력 토큰 (모르면 0)
+
+        Returns:
+            호출 조절기 정산용 토큰 수 (usage가 없으면 0)
+        """
+        if provider == "claude":
+            usage = getattr(response, "usage", None)
+            truncated = getattr(response, "stop_reason", None) == "max_tokens"
+        else:
+            usage = getattr(response, "usage_metadata", None)
+            truncated = False
+        if usage is None:
+            return 0
+        counts = claude_counts(usage) if provider == "claude" else gemini_counts(usage)
+        try:
+            output_chars = len(response_text(provider, response))
+        except Exception:
+            output_chars = 0  # 차단 / 빈 응답 (호출부에서 .text 예외 처리)
+        self.record(provider, model, counts, latency, max_tokens, output_chars, truncated)
+        if provider == "claude":
+            # 캐시 읽기는 분당 입력 한도에 포함되지 않음
+            return counts["input_tokens"] + counts["cache_write_tokens"] + counts["output_tokens"]
+        return sum(counts.values())
+
+    def report(self, group: str, days: float = 1, limit: int = 50) -> List[Dict]:
+        """
+        최근 기간 호출을 묶음별로 집계 (비용 큰 순)
+
+        Args:
+            group: day / post / template / category / stage / model
+            days: 집계 기간 (일)
+            limit: 최대 행 수
+
+        Returns:
+            [{"name", "keyword", "posts", "calls", "input_tokens", "output_tokens",
+              "cache_read_tokens", "cost", "latency", "avg_latency", "max_latency"}]
+            (post 묶음의 name은 post_id, keyword는 해당 글 키워드)
+        """
+        if not self.enabled:
+            return []
+        expr = GROUPS[group]
+        order = "name DESC" if group == "day" else "cost DESC"
+        with self._get_conn() as conn:
+            rows = conn.execute(f"""
+                SELECT {expr} AS name, MAX(keyword), COUNT(DISTINCT post_id), COUNT(*),
+                       SUM(input_tokens), SUM(output_tokens), SUM(cache_read_tokens),
+                       SUM(cost) AS cost, SUM(latency), AVG(latency), MAX(latency)
+                FROM calls WHERE ts >= ?
+                GROUP BY name ORDER BY {order} LIMIT ?
+            """, (time.time() - days * 86400, limit)).fetchall()
+        return [
+            {
+                "name": r[0] or "-", "keyword": r[1] or "", "posts": r[2], "calls": r[3],
+                "input_tokens": r[4] or 0, "output_tokens": r[5] or 0, "cache_read_tokens": r[6] or 0,
+                "cost": r[7] or 0.0, "latency": r[8] or 0.0, "avg_latency": r[9] or 0.0,
+                "max_latency": r[10] or 0.0,
+            }
+            for r in rows
+        ]
+
+    def output_history(self, provider: str, days: float = 14, min_max_tokens: int = 1000,
+                       limit: int = 200) -> Optional[Dict]:
+        """
+        최근 긴 출력 호출(max_tokens가 min_max_tokens 이상)의 출력 글자 / 토큰 / 잘림 합계
+
+        Returns:
+            {"calls", "output_chars", "output_tokens", "truncated"}, 기록이 없거나 비활성화면 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._get_conn() as conn:
+                row = conn.execute("""
+                    SELECT COUNT(*), SUM(output_chars), SUM(output_tokens), SUM(truncated) FROM (
+                        SELECT output_chars, output_tokens, truncated FROM calls
+                        WHERE provider = ? AND ts >= ? AND max_tokens >= ? AND output_chars > 0
+                        ORDER BY ts DESC LIMIT ?
+                    )
+                """, (provider, time.time() - days * 86400, min_max_tokens, limit)).fetchone()
+        except Exception as e:
+            logger.debug(f"LLM usage history query failed: {e}")
+            return None
+        if not row or not row[0]:
+            return None
+        return {"calls": row[0], "output_chars": row[1] or 0, "output_tokens": row[2] or 0, "truncated": row[3] or 0}
+
+    def get_stats(self) -> Dict:
+        """이 프로세스의 기록 호출 수 / 토큰 / 예상 비용"""
+        with self._lock:
+            return {"calls": self.calls, "tokens": self.tokens, "cost": round(self.cost, 4)}
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+llm_usage = UsageLedger()
@@ -15,11 +15,11 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import requests
 
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -173,7 +173,7 @@ class PerformanceLearner:
         """WordPress API 요청"""
         try:
             url = f"{self.api_base}/{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = get_session().get(url, headers=self.headers, params=params, timeout=30)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -0,0 +1,112 @@
+"""호스트별 토큰 버킷 속도 제한
+
+고정 time.sleep 대신 호스트마다 초당 요청 수(rate)와 순간 허용량(burst)을 두어
+동시 요청을 보내면서도 같은 호스트에 대한 예의(politeness)를 유지.
+프로세스 전체에서 host_rate_limiter 싱글톤을 공유하므로
+--workers 병렬 실행에서도 호스트별 예산은 하나.
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 예산 (settings 로드 실패 시 사용)
+DEFAULT_RATE = 2.0  # 초당 요청 수
+DEFAULT_BURST = 3  # 순간 허용 요청 수
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 획득 (부족하면 채워질 때까지 대기)
+
+        Args:
+            tokens: 필요한 토큰 수
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            획득 여부 (timeout 내에 획득하지 못하면 False)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                wait = (tokens - self.tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트 → TokenBucket (처음 요청 시 생성)"""
+
+    def __init__(self, rate: float = None, burst: int = None):
+        if rate is None or burst is None:
+            try:
+                from config.settings import settings
+                rate = settings.crawl_rate_per_host if rate is None else rate
+                burst = settings.crawl_burst_per_host if burst is None else burst
+            except Exception:
+                rate = DEFAULT_RATE if rate is None else rate
+                burst = DEFAULT_BURST if burst is None else burst
+
+        self.default_rate = rate
+        self.default_burst = burst
+        self._overrides: Dict[str, Tuple[float, int]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+    def configure(self, host: str, rate: float, burst: int):
+        """호스트별 예산 지정 (이미 생성된 버킷도 교체)"""
+        host = host.lower()
+        with self._lock:
+            self._overrides[host] = (rate, burst)
+            self._buckets[host] = TokenBucket(rate, burst)
+
+    def bucket(self, url: str) -> TokenBucket:
+        """URL 호스트의 버킷"""
+        host = self._host(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._overrides.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str, timeout: Optional[float] = None) -> bool:
+        """URL 호스트의 토큰 획득 (대기 포함)"""
+        return self.bucket(url).acquire(timeout=timeout)
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+host_rate_limiter = HostRateLimiter()
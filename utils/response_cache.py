@@ -0,0 +1,265 @@
+"""크롤러 GET 응답 캐시 (SQLite)
+
+스케줄러 슬롯, 대시보드 /keywords/refresh, weekly_learn.py가
+같은 네이버 검색/뉴스/블로그 페이지를 반복해서 받지 않도록
+utils/http_client의 세션 앞단에서 GET 응답을 보관:
+- 도메인별 TTL 규칙 (규칙이 없는 도메인은 캐시하지 않음)
+- 만료 후 ETag / Last-Modified가 있으면 조건부 요청으로 재검증 (304 → 재사용)
+- 전체 크기 상한 초과 시 마지막 접근 순(LRU)으로 삭제
+- 적중/미스/재검증 카운터
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로/크기 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "http_cache.db"
+DEFAULT_MAX_MB = 200
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# 도메인별 TTL 규칙: (호스트 접미사, 경로 접두사, TTL 초) - 먼저 일치한 규칙 적용
+CACHE_RULES = [
+    ("ac.search.naver.com", "", 1 * HOUR),  # 네이버 자동완성
+    ("search.naver.com", "", 10 * MINUTE),  # 네이버 검색 결과 페이지
+    ("news.naver.com", "/article", 3 * DAY),  # 네이버 뉴스 기사 본문 (n.news.naver.com/article/...)
+    ("news.naver.com", "/mnews/article", 3 * DAY),
+    ("news.naver.com", "/main/read", 3 * DAY),  # 구형 기사 주소 (read.naver?oid=&aid=)
+    ("news.naver.com", "", 5 * MINUTE),  # 뉴스 홈 / 섹션 / 랭킹 (인기 기사 신호라 짧게)
+    ("blog.naver.com", "", 1 * DAY),  # 네이버 블로그 글
+    ("tistory.com", "", 1 * DAY),  # 티스토리 글
+    ("news.google.com", "/rss", 15 * MINUTE),  # Google News RSS
+    ("www.googleapis.com", "/customsearch", 6 * HOUR),  # Google Custom Search (할당량 절약)
+    ("daum.net", "", 5 * MINUTE),  # 실시간 이슈 (포털 메인)
+    ("zum.com", "", 5 * MINUTE),
+]
+
+# 저장하지 않는 응답 헤더 (본문은 디코딩된 상태로 저장)
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def get_ttl(url: str) -> int:
+    """URL에 적용할 TTL (초, 0이면 캐시하지 않음)"""
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    for suffix, path_prefix, ttl in CACHE_RULES:
+        if (host == suffix or host.endswith("." + suffix)) and parsed.path.startswith(path_prefix):
+            return ttl
+    return 0
+
+
+class ResponseCache:
+    """URL → (상태 코드, 헤더, 본문, 검증자) 캐시"""
+
+    def __init__(self, db_path: str = None, max_mb: float = None, enabled: bool = None):
+        if db_path is None or max_mb is None or enabled is None:
+            try:
+                from config.settings import settings
+                db_path = settings.http_cache_path if db_path is None else db_path
+                max_mb = settings.http_cache_max_mb if max_mb is None else max_mb
+                enabled = settings.http_cache_enabled if enabled is None else enabled
+            except Exception:
+                db_path = db_path or str(DEFAULT_DB_PATH)
+                max_mb = DEFAULT_MAX_MB if max_mb is None else max_mb
+                enabled = True if enabled is None else enabled
+
+        self.db_path = Path(db_path)
+        self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        self.enabled = bool(enabled) and self.max_bytes > 0
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stores = 0
+        self.evictions = 0
+
+        if self.enabled:
+            self._init_db()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 (실패 시 캐시 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS responses (
+                        url TEXT PRIMARY KEY,
+                        status INTEGER,
+                        headers TEXT,  -- JSON
+                        body BLOB,  -- zlib 압축
+                        etag TEXT,
+                        last_modified TEXT,
+                        saved_at REAL,
+                        expires_at REAL,
+                        last_access REAL,
+                        size INTEGER
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"HTTP cache DB init failed, caching disabled: {e}")
+            self.enabled = False
+
+    def record(self, event: str):
+        """카운터 증가 (hits / misses / revalidated)"""
+        with self._lock:
+            setattr(self, event, getattr(self, event) + 1)
+
+    # ------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        캐시 항목 조회 (만료 여부와 무관)
+
+        Returns:
+            {"status", "headers", "body", "etag", "last_modified", "fresh"} 또는 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            with self._get_conn() as conn:
+                row = conn.execute(
+                    "SELECT status, headers, body, etag, last_modified, expires_at "
+                    "FROM responses WHERE url = ?",
+                    (url,)
+                ).fetchone()
+        except Exception as e:
+            logger.debug(f"HTTP cache lookup failed: {e}")
+            return None
+
+        if not row:
+            return None
+        return {
+            "status": row[0],
+            "headers": json.loads(row[1]),
+            "body": zlib.decompress(row[2]),
+            "etag": row[3],
+            "last_modified": row[4],
+            "fresh": time.time() < row[5],
+        }
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes, ttl: int):
+        """응답 저장 후 크기 상한 확인"""
+        if not self.enabled:
+            return
+        kept = {k: v for k, v in headers.items() if k.lower() not in _DROP_HEADERS}
+        packed = zlib.compress(body)
+        now = time.time()
+        try:
+            with self._get_conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(url, status, headers, body, etag, last_modified, saved_at, expires_at, last_access, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (url, status, json.dumps(kept, ensure_ascii=False), packed,
+                     headers.get("ETag"), headers.get("Last-Modified"),
+                     now, now + ttl, now, len(packed))
+                )
+                conn.commit()
+            self.record("stores")
+            self._evict()
+        except Exception as e:
+            logger.debug(f"HTTP cache store failed: {e}")
+
+    def touch(self, url: str, ttl: int = None):
+        """접근 시각 갱신 (ttl 지정 시 재검증 성공으로 만료 시각도 연장)"""
+        if not self.enabled:
+            return
+        now = time.time()
+        try:
+            with self._get_conn() as conn:
+                if ttl is None:
+                    conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+                else:
+                    conn.execute(
+                        "UPDATE responses SET last_access = ?, saved_at = ?, expires_at = ? WHERE url = ?",
+                        (now, now, now + ttl, url)
+                    )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"HTTP cache touch failed: {e}")
+
+    def _evict(self):
+        """전체 크기가 상한을 넘으면 오래 접근하지 않은 항목부터 삭제 (상한의 90%까지)"""
+        with self._get_conn() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            target = int(self.max_bytes * 0.9)
+            removed = 0
+            for url, size in conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall():
+                if total <= target:
+                    break
+                conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                total -= size
+                removed += 1
+            conn.commit()
+
+        with self._lock:
+            self.evictions += removed
+        logger.debug(f"HTTP cache evicted {removed} entries")
+
+    # ------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------
+
+    def clear(self) -> int:
+        """전체 삭제"""
+        if not self.enabled:
+            return 0
+        try:
+            with self._get_conn() as conn:
+                deleted = conn.execute("DELETE FROM responses").rowcount
+                conn.commit()
+            return deleted
+        except Exception as e:
+            logger.debug(f"HTTP cache clear failed: {e}")
+            return 0
+
+    def get_stats(self) -> Dict:
+        """캐시 적중 통계 + 저장 현황"""
+        entries, size = 0, 0
+        if self.enabled:
+            try:
+                with self._get_conn() as conn:
+                    entries, size = conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+            except Exception as e:
+                logger.debug(f"HTTP cache stats failed: {e}")
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_mb": round(size / 1024 / 1024, 2),
+                "enabled": self.enabled,
+            }
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유, SQLite로 프로세스 간 공유)
+response_cache = ResponseCache()
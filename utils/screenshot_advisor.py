@@ -9,6 +9,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config.settings import settings
+from utils.cassette import cassette
+from utils.llm_governor import llm_governor
 
 logger = logging.getLogger(__name__)
 
@@ -78,13 +80,19 @@ JSON 형식으로만 응답하세요:
 }}"""
 
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=400,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        result_text = response.content[0].text.strip()
+        result_text = cassette.llm_exchange(
+            "claude", "claude-sonnet-4-20250514", prompt,
+            llm_governor.wrap(
+                "claude", prompt, 400,
+                lambda: client.messages.create(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=400,
+                    messages=[{"role": "user", "content": prompt}]
+                ),
+                label="screenshot_advice", model="claude-sonnet-4-20250514"
+            ),
+            max_tokens=400
+        ).strip()
 
         # JSON 파싱
         if result_text.startswith('{'):
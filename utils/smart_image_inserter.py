@@ -7,8 +7,9 @@
 """
 import re
 import logging
-import requests
 from typing import List, Dict, Optional, Tuple
+
+from utils.http_client import get_session
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -127,7 +128,7 @@ class SmartImageInserter:
 
             try:
                 # Pexels 검색 (여러 장 가져와서 미사용 이미지 선택)
-                pr = requests.get(
+                pr = get_session().get(
                     "https://api.pexels.com/v1/search",
                     params={"query": query, "per_page": 5, "orientation": "landscape"},
                     headers={"Authorization": self.pexels_key},
@@ -156,11 +157,11 @@ class SmartImageInserter:
                 alt_text = selected_photo.get("alt", heading)[:100]
 
                 # WP 업로드
-                img_data = requests.get(img_url, timeout=30).content
+                img_data = get_session().get(img_url, timeout=30).content
                 filename = f"{query.replace(' ', '_')}_{position}.jpg"
                 files = {"file": (filename, img_data, "image/jpeg")}
 
-                mr = requests.post(
+                mr = get_session().post(
                     f"{self.wp_url}/wp-json/wp/v2/media",
                     files=files,
                     auth=self.wp_auth,
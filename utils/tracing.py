@@ -0,0 +1,386 @@
+"""경량 스팬 트레이싱
+
+process_keyword / generate_full_post의 단계별 소요 시간을 SQLite에 기록해
+스케줄러 슬롯마다 시간이 어디에 쓰이는지 확인 (리포트: trace_report.py)
+
+사용:
+    from utils.tracing import tracer
+
+    tracer.start_run("trending")          # 실행(run) 단위 시작 (run_pipeline)
+    with tracer.span("news_crawl", keyword=keyword) as attrs:
+        ...
+        attrs["chars"] = len(news_data)   # 종료 시 함께 기록
+        tracer.annotate(articles=3)       # 안쪽 함수에서 현재 스팬에 추가
+    tracer.end_run()
+
+- 부모 스팬은 contextvars로 추적 (스레드풀에 넘길 때는 contextvars.copy_context().run)
+- 스팬은 메모리에 모았다가 end_run / 버퍼 초과 / 프로세스 종료 시 한 번에 저장
+- start_run 없이 생긴 스팬은 "adhoc" 실행으로 기록
+- enable_profiling() 후에는 스팬마다 CPU 시간(cpu, 해당 스레드)과
+  구간 중 최대 추적 메모리(mem_peak_kb, tracemalloc — 선택)를 속성에 함께 기록 (bench.py)
+"""
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+logger = logging.getLogger(__name__)
+
+# 기본 경로/보관 실행 수 (settings 로드 실패 시 사용)
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "traces.db"
+DEFAULT_KEEP_RUNS = 200
+
+# 버퍼가 이 크기를 넘으면 중간 저장
+FLUSH_THRESHOLD = 200
+
+# 현재 스팬 ID (부모 추적용) / 현재 스팬 속성 (annotate용)
+_current_span: ContextVar[Optional[str]] = ContextVar("trace_span", default=None)
+_current_attrs: ContextVar[Optional[dict]] = ContextVar("trace_attrs", default=None)
+# 열린 스팬 이름 (바깥 → 안쪽, 트레이싱이 꺼져 있어도 유지 — llm_usage의 단계 이름용)
+_current_names: ContextVar[tuple] = ContextVar("trace_names", default=())
+
+
+class Tracer:
+    """run → span 기록기"""
+
+    def __init__(self, db_path: str = None, enabled: bool = None, keep_runs: int = None):
+        if db_path is None or enabled is None or keep_runs is None:
+            try:
+                from config.settings import settings
+                db_path = settings.trace_path if db_path is None else db_path
+                enabled = settings.trace_enabled if enabled is None else enabled
+                keep_runs = settings.trace_keep_runs if keep_runs is None else keep_runs
+            except Exception:
+                db_path = db_path or str(DEFAULT_DB_PATH)
+                enabled = True if enabled is None else enabled
+                keep_runs = DEFAULT_KEEP_RUNS if keep_runs is None else keep_runs
+
+        self.db_path = Path(db_path)
+        self.enabled = bool(enabled)
+        self.keep_runs = keep_runs
+
+        self._lock = threading.Lock()
+        self._buffer: List[tuple] = []
+        self.run_id: Optional[str] = None
+        self.run_label = ""
+
+        # 프로파일링: 열린 스팬별 구간 최대 메모리 (span_id → bytes)
+        self.profiling = False
+        self.profile_memory = False
+        self._open_peaks: Dict[str, int] = {}
+
+        if self.enabled:
+            self._init_db()
+            atexit.register(self.flush)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _init_db(self):
+        """테이블 초기화 (실패 시 트레이싱 비활성화)"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._get_conn() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS runs (
+                        run_id TEXT PRIMARY KEY,
+                        label TEXT,
+                        pid INTEGER,
+                        started_at REAL,
+                        finished_at REAL
+                    )
+                """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS spans (
+                        run_id TEXT,
+                        span_id TEXT,
+                        parent_id TEXT,
+                        name TEXT,
+                        started_at REAL,
+                        duration REAL,  -- 초
+                        status TEXT,  -- ok / error:<예외 타입>
+                        attrs TEXT  -- JSON
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_spans_run ON spans(run_id)")
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Trace store init failed, tracing disabled: {e}")
+            self.enabled = False
+
+    # ------------------------------------------------------------
+    # 실행 (run)
+    # ------------------------------------------------------------
+
+    def start_run(self, label: str = "") -> Optional[str]:
+        """새 실행 시작 (이전 실행의 남은 스팬은 저장)"""
+        if not self.enabled:
+            return None
+        self.flush()
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        try:
+            with self._get_conn() as conn:
+                conn.execute(
+                    "INSERT INTO runs (run_id, label, pid, started_at) VALUES (?, ?, ?, ?)",
+                    (run_id, label, os.getpid(), time.time())
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Trace run start failed: {e}")
+        with self._lock:
+            self.run_id = run_id
+            self.run_label = label
+        self._prune()
+        return run_id
+
+    def end_run(self):
+        """현재 실행 종료 (스팬 저장)"""
+        if not self.enabled or not self.run_id:
+            return
+        self.flush()
+        try:
+            with self._get_conn() as conn:
+                conn.execute("UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id))
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Trace run end failed: {e}")
+        with self._lock:
+            self.run_id = None
+            self.run_label = ""
+
+    def _prune(self):
+        """keep_runs보다 오래된 실행 삭제"""
+        try:
+            with self._get_conn() as conn:
+                old = [row[0] for row in conn.execute(
+                    "SELECT run_id FROM runs ORDER BY started_at DESC LIMIT -1 OFFSET ?",
+                    (self.keep_runs,)
+                ).fetchall()]
+                if old:
+                    marks = ",".join("?" * len(old))
+                    conn.execute(f"DELETE FROM spans WHERE run_id IN ({marks})", old)
+                    conn.execute(f"DELETE FROM runs WHERE run_id IN ({marks})", old)
+                    conn.commit()
+        except Exception as e:
+            logger.debug(f"Trace prune failed: {e}")
+
+    # ------------------------------------------------------------
+    # 프로파일링
+    # ------------------------------------------------------------
+
+    def enable_profiling(self, memory: bool = True):
+        """
+        스팬별 CPU 시간 / 최대 메모리 기록 시작
+
+        Args:
+            memory: tracemalloc 메모리 추적 (할당이 많은 구간의 CPU 시간이 크게 부풀려짐)
+        """
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.profiling = True
+        self.profile_memory = memory
+
+    def disable_profiling(self):
+        self.profiling = False
+        self.profile_memory = False
+        with self._lock:
+            self._open_peaks.clear()
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _fold_peak(self):
+        """
+        마지막 경계 이후의 최대 메모리를 열린 스팬 전체에 반영하고 peak 초기화
+
+        스팬 시작/종료마다 호출되므로 각 스팬의 값은
+        해당 구간 동안의 프로세스 전체 최대 추적 메모리가 됨 (_lock 안에서 호출)
+        """
+        _, peak = tracemalloc.get_traced_memory()
+        for span_id, value in self._open_peaks.items():
+            if peak > value:
+                self._open_peaks[span_id] = peak
+        tracemalloc.reset_peak()
+
+    def _profile_start(self, span_id: str):
+        with self._lock:
+            self._fold_peak()
+            self._open_peaks[span_id] = tracemalloc.get_traced_memory()[0]
+
+    def _profile_end(self, span_id: str) -> int:
+        with self._lock:
+            self._fold_peak()
+            return self._open_peaks.pop(span_id, 0)
+
+    # ------------------------------------------------------------
+    # 스팬
+    # ------------------------------------------------------------
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        스팬 기록 컨텍스트
+
+        Args:
+            name: 단계 이름 (예: "news_crawl", "ai.call", "wp.upload_image")
+            **attrs: 함께 기록할 속성 (yield된 딕셔너리에 추가 가능)
+        """
+        names_token = _current_names.set(_current_names.get() + (name,))
+        try:
+            if not self.enabled:
+                yield attrs
+                return
+            yield from self._record_span(name, attrs)
+        finally:
+            _current_names.reset(names_token)
+
+    def _record_span(self, name: str, attrs: dict):
+        """span()의 기록 부분 (트레이싱이 켜져 있을 때)"""
+        if self.run_id is None:
+            self.start_run("adhoc")
+
+        span_id = uuid.uuid4().hex[:16]
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        attrs_token = _current_attrs.set(attrs)
+        profiling = self.profiling
+        memory = self.profile_memory
+        if profiling:
+            if memory:
+                self._profile_start(span_id)
+            cpu_started = time.thread_time()
+        started_at = time.time()
+        started = time.perf_counter()
+        status = "ok"
+        try:
+            yield attrs
+        except BaseException as e:
+            status = f"error:{type(e).__name__}"
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            _current_span.reset(token)
+            _current_attrs.reset(attrs_token)
+            if profiling:
+                attrs["cpu"] = round(time.thread_time() - cpu_started, 4)
+                if memory:
+                    attrs["mem_peak_kb"] = self._profile_end(span_id) // 1024
+            record = (self.run_id, span_id, parent_id, name, started_at, duration, status,
+                      json.dumps(attrs, ensure_ascii=False, default=str))
+            with self._lock:
+                self._buffer.append(record)
+                should_flush = len(self._buffer) >= FLUSH_THRESHOLD
+            if should_flush:
+                self.flush()
+
+    def annotate(self, **attrs):
+        """현재 스팬에 속성 추가 (스팬 밖이거나 비활성화 상태면 무시)"""
+        current = _current_attrs.get()
+        if current is not None:
+            current.update(attrs)
+
+    def current_stage(self, skip: tuple = ()) -> str:
+        """
+        가장 안쪽의 열린 스팬 이름 (skip에 있는 이름은 건너뜀, 스팬 밖이면 빈 문자열)
+
+        예: current_stage(skip=("ai.call",)) → ai.call을 감싼 "content.plan"
+        """
+        for name in reversed(_current_names.get()):
+            if name not in skip:
+                return name
+        return ""
+
+    def traced(self, name: str):
+        """함수 전체를 스팬으로 감싸는 데코레이터"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def flush(self):
+        """버퍼의 스팬 저장"""
+        with self._lock:
+            records, self._buffer = self._buffer, []
+        if not records or not self.enabled:
+            return
+        try:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    "INSERT INTO spans (run_id, span_id, parent_id, name, started_at, duration, status, attrs) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    records
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug(f"Trace flush failed ({len(records)} spans dropped): {e}")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+
+    def recent_runs(self, limit: int = 10, label: str = None) -> List[Dict]:
+        """최근 실행 목록 (최신순)"""
+        query = "SELECT run_id, label, started_at, finished_at FROM runs"
+        params: list = []
+        if label:
+            query += " WHERE label = ?"
+            params.append(label)
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
+        with self._get_conn() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            {"run_id": r[0], "label": r[1], "started_at": r[2], "finished_at": r[3]}
+            for r in rows
+        ]
+
+    def stage_durations(self, run_ids: List[str]) -> Dict[str, List[float]]:
+        """실행들의 스팬 이름별 소요 시간 목록"""
+        if not run_ids:
+            return {}
+        marks = ",".join("?" * len(run_ids))
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                f"SELECT name, duration FROM spans WHERE run_id IN ({marks})",
+                run_ids
+            ).fetchall()
+        durations: Dict[str, List[float]] = {}
+        for name, duration in rows:
+            durations.setdefault(name, []).append(duration)
+        return durations
+
+    def run_spans(self, run_id: str) -> List[Dict]:
+        """실행의 스팬 목록 (시작 순, attrs는 딕셔너리로)"""
+        self.flush()
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                "SELECT span_id, parent_id, name, started_at, duration, status, attrs "
+                "FROM spans WHERE run_id = ? ORDER BY started_at",
+                (run_id,)
+            ).fetchall()
+        return [
+            {
+                "span_id": r[0], "parent_id": r[1], "name": r[2], "started_at": r[3],
+                "duration": r[4], "status": r[5], "attrs": json.loads(r[6] or "{}"),
+            }
+            for r in rows
+        ]
+
+
+# 싱글톤 인스턴스 (프로세스 전체 공유)
+tracer = Tracer()
@@ -10,6 +10,7 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config.settings import settings
+from utils.http_client import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ class GoogleSearcher:
         }
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = get_session().get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -95,7 +96,7 @@ class GoogleSearcher:
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_session().get(url, headers=headers, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
 
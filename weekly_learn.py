@@ -61,6 +61,10 @@ def main():
 
     try:
         from utils.blog_learner import crawl_and_learn, BlogLearner
+        from utils.llm_governor import llm_governor, PRIORITY_BATCH
+
+        # 블로그 요약(Gemini)은 발행 / 대시보드 호출에 양보
+        llm_governor.set_default_priority(PRIORITY_BATCH)
 
         # 크롤링 + 학습
         total = crawl_and_learn(LEARNING_KEYWORDS, count_per_keyword=5)